@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""Measure how long it takes to analyze a large APIv2 protocol below apiLevel 2.14.
+
+Those protocols run against the legacy ProtocolContext, and every command they
+report gets inserted into the ProtocolEngine's state. This script generates a
+protocol with a lot of commands and times full analyses of it.
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from opentrons.cli.analyze import _do_analyze
+from opentrons.protocol_reader import ProtocolReader
+
+
+def _generate_protocol(transfers: int) -> str:
+    lines = [
+        "from opentrons import protocol_api",
+        "",
+        'metadata = {"protocolName": "Legacy simulation benchmark", "apiLevel": "2.13"}',
+        "",
+        "",
+        "def run(ctx: protocol_api.ProtocolContext) -> None:",
+        '    tips = ctx.load_labware("opentrons_96_tiprack_300ul", 1)',
+        '    source = ctx.load_labware("nest_96_wellplate_100ul_pcr_full_skirt", 2)',
+        '    dest = ctx.load_labware("nest_96_wellplate_100ul_pcr_full_skirt", 3)',
+        '    pipette = ctx.load_instrument("p300_single_gen2", "left", tip_racks=[tips])',
+        "    pipette.pick_up_tip()",
+        f"    for index in range({transfers}):",
+        "        well = index % 96",
+        "        pipette.aspirate(10 + index % 50, source.wells()[well])",
+        "        pipette.dispense(10 + index % 50, dest.wells()[well])",
+        "        pipette.blow_out(dest.wells()[well].top())",
+        '        ctx.comment("Transfer done.")',
+        "    pipette.drop_tip()",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def _benchmark(transfers: int, repeats: int) -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        protocol_file = Path(temp_dir) / "protocol.py"
+        protocol_file.write_text(_generate_protocol(transfers))
+
+        async def analyze() -> int:
+            source = await ProtocolReader().read_saved(
+                files=[protocol_file], directory=None
+            )
+            result = await _do_analyze(source, {}, {})
+            return len(result.commands)
+
+        timings = []
+        command_count = 0
+        for _ in range(repeats):
+            start = time.perf_counter()
+            command_count = asyncio.run(analyze())
+            timings.append((time.perf_counter() - start) * 1000)
+
+    median = statistics.median(timings)
+    print(f"Analyzed {command_count} commands.")
+    print(f"{'median (ms)':>12} {'min (ms)':>12} {'us/command':>12}")
+    print(
+        f"{median:>12.1f} {min(timings):>12.1f}"
+        f" {median * 1000 / command_count:>12.1f}"
+    )
+
+
+def _run_cmdline() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--transfers",
+        type=int,
+        default=1000,
+        help="How many transfers the generated protocol should do.",
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=3,
+        help="How many times to analyze the protocol. The median is reported.",
+    )
+    args = parser.parse_args()
+    _benchmark(args.transfers, args.repeats)
+
+
+if __name__ == "__main__":
+    _run_cmdline()
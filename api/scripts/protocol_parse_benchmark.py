@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+"""Measure what the compiled-protocol cache saves when re-analyzing a protocol.
+
+Every analysis of a Python protocol parses its file at least twice: once to
+identify it and once to run it. This script generates a large protocol and times
+repeated parses and full analyses of it, first with an empty cache and then with a
+warm one.
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from opentrons.cli.analyze import _do_analyze
+from opentrons.protocol_reader import ProtocolReader
+from opentrons.protocols import bytecode_cache, parse
+
+
+def _generate_protocol(transfers: int) -> str:
+    """Generate a protocol that spells out each transfer, like designer-made ones do."""
+    lines = [
+        "from opentrons import protocol_api",
+        "",
+        'metadata = {"protocolName": "Parse benchmark"}',
+        'requirements = {"robotType": "OT-2", "apiLevel": "2.15"}',
+        "",
+        "",
+        "def run(ctx: protocol_api.ProtocolContext) -> None:",
+        '    tips = ctx.load_labware("opentrons_96_tiprack_300ul", 1)',
+        '    source = ctx.load_labware("nest_96_wellplate_100ul_pcr_full_skirt", 2)',
+        '    dest = ctx.load_labware("nest_96_wellplate_100ul_pcr_full_skirt", 3)',
+        '    pipette = ctx.load_instrument("p300_single_gen2", "left", tip_racks=[tips])',
+        "    pipette.pick_up_tip()",
+    ]
+    for index in range(transfers):
+        well = f"{'ABCDEFGH'[index % 8]}{index // 8 % 12 + 1}"
+        lines += [
+            f'    pipette.aspirate({10 + index % 50}, source["{well}"].bottom(z=1))',
+            f'    pipette.dispense({10 + index % 50}, dest["{well}"].top(z=-2))',
+            f'    pipette.blow_out(dest["{well}"].top())',
+        ]
+    lines.append("    pipette.drop_tip()")
+    return "\n".join(lines) + "\n"
+
+
+def _time(operation: Callable[[], object], repeats: int) -> List[float]:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        operation()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def _analyze(protocol_file: Path) -> None:
+    async def analyze() -> None:
+        source = await ProtocolReader().read_saved(
+            files=[protocol_file], directory=None
+        )
+        await _do_analyze(source, {}, {})
+
+    asyncio.run(analyze())
+
+
+def _benchmark(transfers: int, repeats: int) -> None:
+    contents = _generate_protocol(transfers)
+    print(
+        f"Generated a protocol of {len(contents.splitlines())} lines"
+        f" ({len(contents) / 1024:.0f} KiB)."
+    )
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        protocol_file = Path(temp_dir) / "protocol.py"
+        protocol_file.write_text(contents)
+
+        def parse_once() -> None:
+            parse.parse(contents, filename=protocol_file.name)
+
+        def cold(operation: Callable[[], None]) -> Callable[[], None]:
+            def run_cold() -> None:
+                bytecode_cache._bytecode_cache = bytecode_cache.BytecodeCache(
+                    directory=None
+                )
+                operation()
+
+            return run_cold
+
+        def warm_from_disk(operation: Callable[[], None]) -> Callable[[], None]:
+            def run_warm_from_disk() -> None:
+                # A fresh in-memory cache, like in a new process.
+                bytecode_cache._bytecode_cache = bytecode_cache.BytecodeCache(
+                    directory=Path(temp_dir) / "cache"
+                )
+                operation()
+
+            return run_warm_from_disk
+
+        def analyze_once() -> None:
+            _analyze(protocol_file)
+
+        rows = [
+            ("parse, cold", cold(parse_once)),
+            ("parse, warm from disk", warm_from_disk(parse_once)),
+            ("parse, warm in memory", parse_once),
+            ("analysis, cold", cold(analyze_once)),
+            ("analysis, warm in memory", analyze_once),
+        ]
+        # Populate the on-disk cache before timing reads of it.
+        warm_from_disk(parse_once)()
+
+        print(f"{'':<32} {'median (ms)':>12} {'min (ms)':>12}")
+        for label, operation in rows:
+            timings = _time(operation, repeats)
+            print(
+                f"{label:<32} {statistics.median(timings):>12.2f}"
+                f" {min(timings):>12.2f}"
+            )
+
+
+def _run_cmdline() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--transfers",
+        type=int,
+        default=1000,
+        help="How many spelled-out transfers the generated protocol should have.",
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=5,
+        help="How many times to repeat each measurement. The median is reported.",
+    )
+    args = parser.parse_args()
+    _benchmark(args.transfers, args.repeats)
+
+
+if __name__ == "__main__":
+    _run_cmdline()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+"""Measure how long it takes to look up a calibrated tip length on pick-up.
+
+Every tip pick-up asks for the tip length that was calibrated for the pipette and
+tip rack. This script saves a tip length calibration file like a robot's, and
+then times that lookup with the file read fresh each time, like it used to be,
+and served from memory.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from typing import Callable, List
+
+from opentrons import config
+from opentrons.calibration_storage import ot2 as calibration_storage
+from opentrons.calibration_storage.ot2 import tip_length
+from opentrons.protocol_api.labware import get_labware_definition
+from opentrons.protocol_engine.resources import LabwareDataProvider
+from opentrons.protocols.models import LabwareDefinition
+
+_PIPETTE_SERIAL = "P300SV2020230101A01"
+
+_TIP_RACKS = [
+    "opentrons_96_tiprack_10ul",
+    "opentrons_96_tiprack_20ul",
+    "opentrons_96_tiprack_300ul",
+    "opentrons_96_tiprack_1000ul",
+    "opentrons_96_filtertiprack_10ul",
+    "opentrons_96_filtertiprack_20ul",
+    "opentrons_96_filtertiprack_200ul",
+    "opentrons_96_filtertiprack_1000ul",
+]
+
+
+def _time(operation: Callable[[], object], repeats: int) -> List[float]:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        operation()
+        timings.append((time.perf_counter() - start) * 1_000_000)
+    return timings
+
+
+def _save_calibrations() -> None:
+    for index, load_name in enumerate(_TIP_RACKS):
+        calibration_storage.save_tip_length_calibration(
+            _PIPETTE_SERIAL,
+            calibration_storage.create_tip_length_data(
+                get_labware_definition(load_name), 50.0 + index
+            ),
+        )
+    # Backdate the file, like one calibrated some time ago, so it can be cached.
+    path = config.get_tip_length_cal_path() / f"{_PIPETTE_SERIAL}.json"
+    an_hour_ago = time.time() - 60 * 60
+    os.utime(path, (an_hour_ago, an_hour_ago))
+
+
+def _benchmark(repeats: int) -> None:
+    definition = LabwareDefinition.parse_obj(
+        get_labware_definition("opentrons_96_tiprack_300ul")
+    )
+    loop = asyncio.new_event_loop()
+
+    def sync_lookup() -> None:
+        LabwareDataProvider._get_calibrated_tip_length_sync(
+            _PIPETTE_SERIAL, definition, 0
+        )
+
+    def lookup() -> None:
+        loop.run_until_complete(
+            LabwareDataProvider.get_calibrated_tip_length(
+                _PIPETTE_SERIAL, definition, 0
+            )
+        )
+
+    def cold(operation: Callable[[], None]) -> Callable[[], None]:
+        def run_cold() -> None:
+            tip_length._tip_length_cache.clear()
+            operation()
+
+        return run_cold
+
+    def old_definition_conversion() -> None:
+        # What looking up a tip length used to do with the tip rack's definition,
+        # on top of reading the file.
+        definition.dict(exclude_none=True, exclude_unset=True)
+
+    rows = [
+        ("lookup, reading the file", cold(lookup)),
+        ("lookup, from memory", lookup),
+        ("lookup without thread hop, reading the file", cold(sync_lookup)),
+        ("lookup without thread hop, from memory", sync_lookup),
+        ("definition to dict, no longer done", old_definition_conversion),
+    ]
+    print(f"{'':<46} {'median (us)':>12} {'min (us)':>12}")
+    for label, operation in rows:
+        operation()
+        timings = _time(operation, repeats)
+        print(f"{label:<46} {statistics.median(timings):>12.1f} {min(timings):>12.1f}")
+    loop.close()
+
+
+def _run_cmdline() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=1000,
+        help="How many times to repeat each measurement. The median is reported.",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.environ["OT_API_CONFIG_DIR"] = temp_dir
+        config.reload()
+        _save_calibrations()
+        _benchmark(args.repeats)
+
+
+if __name__ == "__main__":
+    _run_cmdline()
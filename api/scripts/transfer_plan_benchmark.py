@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+"""Measure how long it takes to plan large transfers.
+
+`InstrumentContext.transfer()`, `.distribute()`, and `.consolidate()` turn their
+arguments into a `TransferPlan`, and then carry it out step by step. This script
+times how long just planning the steps of some large transfers takes, without
+carrying any of them out.
+"""
+
+import argparse
+import statistics
+import time
+from typing import Callable, Dict, List
+
+from opentrons import simulate
+from opentrons.protocol_api import InstrumentContext, Labware, ProtocolContext, Well
+from opentrons.protocols.advanced_control import transfers
+from opentrons.types import TransferTipPolicy
+
+
+def _plan_factories(
+    ctx: ProtocolContext,
+    pipette: InstrumentContext,
+    source_plate: Labware,
+    dest_plate: Labware,
+) -> Dict[str, Callable[[], transfers.TransferPlan]]:
+    def plan(
+        mode: str,
+        volume: float,
+        sources: List[Well],
+        dests: List[Well],
+        **kwargs: object,
+    ) -> transfers.TransferPlan:
+        options = transfers.TransferOptions(
+            transfer=transfers.Transfer(**kwargs)  # type: ignore[arg-type]
+        )
+        return transfers.TransferPlan(
+            volume,
+            sources,
+            dests,
+            pipette,
+            pipette.max_volume,
+            ctx.api_version,
+            mode,
+            options,
+        )
+
+    source_wells = source_plate.wells()
+    dest_wells = dest_plate.wells()
+    return {
+        "transfer 96 -> 384, new tips": lambda: plan(
+            "transfer",
+            50,
+            source_wells,
+            dest_wells,
+            new_tip=TransferTipPolicy.ALWAYS,
+        ),
+        "transfer 384 -> 384, air gap": lambda: plan(
+            "transfer", 35, dest_wells, dest_wells, air_gap=2
+        ),
+        "distribute 1 -> 384, 0.05 uL": lambda: plan(
+            "distribute", 0.05, [source_wells[0]], dest_wells, disposal_volume=1
+        ),
+        "consolidate 384 -> 1, 0.05 uL": lambda: plan(
+            "consolidate", 0.05, dest_wells, [source_wells[0]]
+        ),
+    }
+
+
+def _benchmark(repeats: int) -> None:
+    ctx = simulate.get_protocol_api("2.15")
+    source_plate = ctx.load_labware("corning_96_wellplate_360ul_flat", 1)
+    dest_plate = ctx.load_labware("corning_384_wellplate_112ul_flat", 2)
+    tip_rack = ctx.load_labware("opentrons_96_tiprack_20ul", 3)
+    pipette = ctx.load_instrument("p20_single_gen2", "left", tip_racks=[tip_rack])
+
+    print(f"{'':<34} {'steps':>8} {'median (ms)':>12} {'us/step':>9}")
+    for label, make_plan in _plan_factories(
+        ctx, pipette, source_plate, dest_plate
+    ).items():
+        timings = []
+        step_count = 0
+        for _ in range(repeats):
+            start = time.perf_counter()
+            step_count = sum(1 for _ in make_plan())
+            timings.append((time.perf_counter() - start) * 1000)
+        median = statistics.median(timings)
+        print(
+            f"{label:<34} {step_count:>8} {median:>12.2f}"
+            f" {median * 1000 / step_count:>9.2f}"
+        )
+
+
+def _run_cmdline() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=10,
+        help="How many times to plan each transfer. The median time is reported.",
+    )
+    args = parser.parse_args()
+    _benchmark(args.repeats)
+
+
+if __name__ == "__main__":
+    _run_cmdline()
@@ -15,6 +15,7 @@ from .tip_length import (
     save_tip_length_calibration,
     tip_lengths_for_pipette,
     load_tip_length_calibration,
+    load_tip_length_calibration_by_uri,
     delete_tip_length_calibration,
 )
 
@@ -30,5 +31,6 @@ __all__ = [
     "save_tip_length_calibration",
     "tip_lengths_for_pipette",
     "load_tip_length_calibration",
+    "load_tip_length_calibration_by_uri",
     "delete_tip_length_calibration",
 ]
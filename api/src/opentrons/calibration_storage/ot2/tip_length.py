@@ -1,6 +1,10 @@
 import json
+import os
+import threading
+import time
 import typing
 import logging
+from pathlib import Path
 from pydantic import ValidationError
 from dataclasses import asdict
 
@@ -34,15 +38,46 @@ def _convert_tip_length_model_to_dict(
     return dict_of_tip_lengths
 
 
-def tip_lengths_for_pipette(
-    pipette_id: str,
-) -> typing.Dict[LabwareUri, v1.TipLengthModel]:
+class _CachedTipLengths(typing.NamedTuple):
+    file_version: typing.Tuple[int, int, int]
+    tip_lengths: typing.Dict[LabwareUri, v1.TipLengthModel]
+
+
+# Every pick-up looks up a tip length, so keep each pipette's parsed file in
+# memory instead of reading it again every time. Entries are checked against the
+# file's modification time, size, and inode before they're used, and the
+# functions in this module that write files drop them.
+_tip_length_cache: typing.Dict[Path, _CachedTipLengths] = {}
+_tip_length_cache_lock = threading.Lock()
+
+# Some filesystems only store modification times to the nearest couple of
+# seconds, so a file changed again that soon could still look the same. Files
+# modified more recently than this are read every time until they've settled.
+_MIN_CACHEABLE_AGE_NS = 3 * 1_000_000_000
+
+
+def _file_version(stat: os.stat_result) -> typing.Tuple[int, int, int]:
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def _forget_tip_lengths(pipette_id: typing.Optional[str] = None) -> None:
+    with _tip_length_cache_lock:
+        if pipette_id is None:
+            _tip_length_cache.clear()
+        else:
+            _tip_length_cache.pop(
+                config.get_tip_length_cal_path() / f"{pipette_id}.json", None
+            )
+
+
+def _read_tip_lengths_for_pipette(
+    pipette_id: str, tip_length_filepath: Path
+) -> typing.Optional[typing.Dict[LabwareUri, v1.TipLengthModel]]:
     try:
-        tip_length_filepath = config.get_tip_length_cal_path() / f"{pipette_id}.json"
         all_tip_lengths_for_pipette = io.read_cal_file(tip_length_filepath)
     except FileNotFoundError:
         log.debug(f"Tip length calibrations not found for {pipette_id}")
-        return {}
+        return None
     except json.JSONDecodeError:
         log.warning(
             f"Tip length calibration is malformed for {pipette_id}", exc_info=True
@@ -76,21 +111,74 @@ def tip_lengths_for_pipette(
     return tip_lengths
 
 
-def load_tip_length_calibration(
-    pip_id: str, definition: "LabwareDefinition"
+def _copy_tip_length(tip_length: v1.TipLengthModel) -> v1.TipLengthModel:
+    # The status is the only field that isn't immutable. This is much quicker
+    # than a deep copy.
+    return tip_length.copy(update={"status": tip_length.status.copy()})
+
+
+def _cached_tip_lengths_for_pipette(
+    pipette_id: str,
+) -> typing.Dict[LabwareUri, v1.TipLengthModel]:
+    """Get a pipette's tip lengths, without copying them.
+
+    The returned dict and models are shared with the cache, so callers must not
+    modify them.
+    """
+    tip_length_filepath = config.get_tip_length_cal_path() / f"{pipette_id}.json"
+    try:
+        stat = tip_length_filepath.stat()
+    except FileNotFoundError:
+        log.debug(f"Tip length calibrations not found for {pipette_id}")
+        with _tip_length_cache_lock:
+            _tip_length_cache.pop(tip_length_filepath, None)
+        return {}
+
+    file_version = _file_version(stat)
+    with _tip_length_cache_lock:
+        cached = _tip_length_cache.get(tip_length_filepath)
+    if cached is not None and cached.file_version == file_version:
+        return cached.tip_lengths
+
+    tip_lengths = _read_tip_lengths_for_pipette(pipette_id, tip_length_filepath)
+    if tip_lengths is None:
+        return {}
+    if time.time_ns() - stat.st_mtime_ns >= _MIN_CACHEABLE_AGE_NS:
+        with _tip_length_cache_lock:
+            _tip_length_cache[tip_length_filepath] = _CachedTipLengths(
+                file_version=file_version, tip_lengths=tip_lengths
+            )
+    return tip_lengths
+
+
+def tip_lengths_for_pipette(
+    pipette_id: str,
+) -> typing.Dict[LabwareUri, v1.TipLengthModel]:
+    return {
+        tiprack_uri: _copy_tip_length(tip_length)
+        for tiprack_uri, tip_length in _cached_tip_lengths_for_pipette(
+            pipette_id
+        ).items()
+    }
+
+
+def load_tip_length_calibration_by_uri(
+    pip_id: str, tiprack_uri: LabwareUri
 ) -> v1.TipLengthModel:
     """
     Function used to grab the current tip length associated
-    with a particular tiprack.
+    with a particular tiprack, by the tiprack's URI.
+
+    Use this instead of :py:meth:`load_tip_length_calibration` when you
+    don't already have the tiprack's definition as a dict.
 
     :param pip_id: pipette you are using
-    :param definition: full definition of the tiprack
+    :param tiprack_uri: URI of the tiprack
     """
-    labware_uri = helpers.uri_from_definition(definition)
-    load_name = definition["parameters"]["loadName"]
     try:
-        return tip_lengths_for_pipette(pip_id)[labware_uri]
+        return _copy_tip_length(_cached_tip_lengths_for_pipette(pip_id)[tiprack_uri])
     except KeyError as e:
+        load_name = helpers.details_from_uri(tiprack_uri).load_name
         raise local_types.TipLengthCalNotFound(
             f"Tip length of {load_name} has not been "
             f"calibrated for this pipette: {pip_id} and cannot"
@@ -98,6 +186,21 @@ def load_tip_length_calibration(
         ) from e
 
 
+def load_tip_length_calibration(
+    pip_id: str, definition: "LabwareDefinition"
+) -> v1.TipLengthModel:
+    """
+    Function used to grab the current tip length associated
+    with a particular tiprack.
+
+    :param pip_id: pipette you are using
+    :param definition: full definition of the tiprack
+    """
+    return load_tip_length_calibration_by_uri(
+        pip_id, helpers.uri_from_definition(definition)
+    )
+
+
 def get_all_tip_length_calibrations() -> typing.List[v1.TipLengthCalibration]:
     """
     A helper function that will list all of the tip length calibrations.
@@ -175,6 +278,7 @@ def delete_tip_length_calibration(
             io.save_to_file(tip_length_dir, pipette_id, dict_of_tip_lengths)
         else:
             io.delete_file(tip_length_dir / f"{pipette_id}.json")
+        _forget_tip_lengths(pipette_id)
     elif tiprack_hash and any(tiprack_hash in v.dict() for v in tip_lengths.values()):
         # NOTE this is for backwards compatibilty only
         # TODO delete this check once the tip_length DELETE router
@@ -187,6 +291,7 @@ def delete_tip_length_calibration(
             io.save_to_file(tip_length_dir, pipette_id, dict_of_tip_lengths)
         else:
             io.delete_file(tip_length_dir / f"{pipette_id}.json")
+        _forget_tip_lengths(pipette_id)
     else:
         raise local_types.TipLengthCalNotFound(
             f"Tip length for uri {tiprack_uri} and hash {tiprack_hash} has not been "
@@ -204,6 +309,7 @@ def clear_tip_length_calibration() -> None:
         io._remove_json_files_in_directories(offset_dir)
     except FileNotFoundError:
         pass
+    _forget_tip_lengths()
 
 
 # Save Tip Length Calibration
@@ -276,3 +382,4 @@ def save_tip_length_calibration(
 
     dict_of_tip_lengths = _convert_tip_length_model_to_dict(all_tip_lengths)
     io.save_to_file(tip_length_dir_path, pip_id, dict_of_tip_lengths)
+    _forget_tip_lengths(pip_id)
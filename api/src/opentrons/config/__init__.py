@@ -291,6 +291,13 @@ CONFIG_ELEMENTS = (
         ConfigElementType.DIR,
         "The dir where performance metrics are stored",
     ),
+    ConfigElement(
+        "protocol_bytecode_cache_dir",
+        "Protocol Bytecode Cache Directory",
+        Path("protocol_bytecode_cache"),
+        ConfigElementType.DIR,
+        "The dir where compiled Python protocols are cached",
+    ),
 )
 #: The available configuration file elements to modify. All of these can be
 #: changed by editing opentrons.json, where the keys are the name elements,
@@ -613,3 +620,7 @@ def get_custom_tiprack_def_path() -> Path:
 
 def get_performance_metrics_data_dir() -> Path:
     return get_opentrons_path("performance_metrics_dir")
+
+
+def get_protocol_bytecode_cache_dir() -> Path:
+    return get_opentrons_path("protocol_bytecode_cache_dir")
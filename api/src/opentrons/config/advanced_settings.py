@@ -147,6 +147,16 @@ settings = [
         robot_type=[RobotTypeEnum.OT2],
         default_true_on_robot_types=[RobotTypeEnum.FLEX],
     ),
+    SettingDefinition(
+        _id="enableSmoothieStreaming",
+        title="Stream gantry moves",
+        description="Send consecutive gantry moves to the motor controller"
+        " without waiting for each one to finish, so they run back to back."
+        " The robot still waits for motion to finish before pipette actions,"
+        " homing, and reading its position.",
+        robot_type=[RobotTypeEnum.OT2],
+        restart_required=True,
+    ),
     SettingDefinition(
         _id="enableOT3HardwareController",
         title="Enable experimental OT-3 hardware controller",
@@ -736,6 +746,16 @@ def _migrate35to36(previous: SettingsMap) -> SettingsMap:
     return newmap
 
 
+def _migrate36to37(previous: SettingsMap) -> SettingsMap:
+    """Migrate to version 37 of the feature flags file.
+
+    - Adds the enableSmoothieStreaming config element.
+    """
+    newmap = {k: v for k, v in previous.items()}
+    newmap["enableSmoothieStreaming"] = None
+    return newmap
+
+
 _MIGRATIONS = [
     _migrate0to1,
     _migrate1to2,
@@ -773,6 +793,7 @@ _MIGRATIONS = [
     _migrate33to34,
     _migrate34to35,
     _migrate35to36,
+    _migrate36to37,
 ]
 """
 List of all migrations to apply, indexed by (version - 1). See _migrate below
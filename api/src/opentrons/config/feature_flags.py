@@ -20,6 +20,13 @@ def use_old_aspiration_functions() -> bool:
     )
 
 
+def enable_smoothie_streaming() -> bool:
+    """Whether the OT-2 should stream gantry moves to the Smoothie."""
+    return advs.get_setting_with_env_overload(
+        "enableSmoothieStreaming", RobotTypeEnum.OT2
+    )
+
+
 def enable_door_safety_switch(robot_type: RobotTypeEnum) -> bool:
     return advs.get_setting_with_env_overload("enableDoorSafetySwitch", robot_type)
 
@@ -92,6 +92,7 @@ class SmoothieDriver:
         port: str,
         config: RobotConfig,
         gpio_chardev: Optional[GPIODriverLike] = None,
+        streaming: bool = False,
     ) -> SmoothieDriver:
         """
         Build a smoothie driver
@@ -100,6 +101,7 @@ class SmoothieDriver:
             port: The port
             config: Robot configuration
             gpio_chardev: Optional GPIO driver
+            streaming: Whether to stream gantry moves. See the constructor.
 
         Returns:
             A SmoothieDriver instance.
@@ -114,7 +116,12 @@ class SmoothieDriver:
         )
         gpio_chardev = gpio_chardev or SimulatingGPIOCharDev("simulated")
 
-        instance = cls(config=config, connection=connection, gpio_chardev=gpio_chardev)
+        instance = cls(
+            config=config,
+            connection=connection,
+            gpio_chardev=gpio_chardev,
+            streaming=streaming,
+        )
         await instance._setup()
         return instance
 
@@ -123,6 +130,7 @@ class SmoothieDriver:
         config: RobotConfig,
         gpio_chardev: GPIODriverLike,
         connection: Optional[SerialConnection] = None,
+        streaming: bool = False,
     ):
         """
         Constructor
@@ -131,6 +139,10 @@ class SmoothieDriver:
             config: The robot configuration
             gpio_chardev: GPIO device.
             connection: The serial connection.
+            streaming: If True, gantry moves are queued on the Smoothie without
+                waiting for each one to finish, so consecutive moves run back
+                to back. The driver waits for them to finish before sending
+                anything else, like a pipette move, a home, or a position read.
         """
         self.run_flag = asyncio.Event()
         self.run_flag.set()
@@ -202,6 +214,12 @@ class SmoothieDriver:
         #: Cache of currently configured splits from callers
         self._axes_moved_at = AxisMoveTimestamp(AXES)
 
+        self._streaming = streaming
+        # The axis currents that streamed moves were sent with, while any of
+        # them might still be running. None when the Smoothie's queue is known
+        # to be empty.
+        self._streamed_currents: Optional[Dict[str, float]] = None
+
     @property
     def gpio_chardev(self) -> GPIODriverLike:
         return self._gpio_chardev
@@ -824,6 +842,7 @@ class SmoothieDriver:
         suppress_error_msg: bool = False,
         ack_timeout: float = DEFAULT_ACK_TIMEOUT,
         suppress_home_after_error: bool = False,
+        streamed: bool = False,
     ) -> str:
         """
         Submit a GCODE command to the robot, followed by M400 to block until
@@ -859,14 +878,23 @@ class SmoothieDriver:
             like home, it should be long enough to allow the command to
             complete in the worst case. If this is None, the timeout will
             be infinite. This is almost certainly not what you want.
+        :param streamed: if True, don't follow the command with M400, so it
+            stays queued on the Smoothie while later commands are sent. Only
+            use this for moves. The next command that isn't streamed waits
+            for it, and an alarm while it runs is handled like an alarm
+            during the command that waits for it.
         """
         if self.simulating:
             return ""
+        moves_were_streamed = self._streamed_currents is not None
         try:
             return await self._send_command_unsynchronized(
-                command, ack_timeout, timeout
+                command, ack_timeout, timeout, streamed
             )
         except SmoothieError as se:
+            # An error flushes the Smoothie's queue, and resetting from it
+            # must not wait for moves that will never run.
+            self._streamed_currents = None
             # XXX: This is a reentrancy error because another command could
             # swoop in here. We're already resetting though and errors (should
             # be) rare so it's probably fine, but the actual solution to this
@@ -876,7 +904,7 @@ class SmoothieDriver:
             if not suppress_error_msg:
                 log.warning(f"alarm/error: command={command}, resp={se.ret_code}")
             if (
-                GCODE.MOVE in command or GCODE.PROBE in command
+                GCODE.MOVE in command or GCODE.PROBE in command or moves_were_streamed
             ) and not suppress_home_after_error:
                 if error_axis not in "XYZABC":
                     error_axis = AXES
@@ -885,20 +913,46 @@ class SmoothieDriver:
             raise SmoothieError(se.ret_code, str(command))
 
     async def _send_command_unsynchronized(
-        self, command: CommandBuilder, ack_timeout: float, execute_timeout: float
+        self,
+        command: CommandBuilder,
+        ack_timeout: float,
+        execute_timeout: float,
+        streamed: bool = False,
     ) -> str:
         assert self._connection, "There is no connection."
         command_result = ""
+        wait_command = CommandBuilder(terminator=SMOOTHIE_COMMAND_TERMINATOR).add_gcode(
+            gcode=GCODE.WAIT
+        )
         try:
-            command_result = await self._connection.send_command(
-                command=command, retries=DEFAULT_COMMAND_RETRIES, timeout=ack_timeout
-            )
-            wait_command = CommandBuilder(
-                terminator=SMOOTHIE_COMMAND_TERMINATOR
-            ).add_gcode(gcode=GCODE.WAIT)
-            await self._connection.send_command(
-                command=wait_command, retries=0, timeout=execute_timeout
-            )
+            if self._streamed_currents is not None and (
+                not streamed or self._streamed_currents != self.current
+            ):
+                # Let the streamed moves finish before anything else happens.
+                # That includes a move with different currents, because the
+                # Smoothie changes currents as soon as it reads the command.
+                await self._connection.send_command(
+                    command=wait_command, retries=0, timeout=execute_timeout
+                )
+                self._streamed_currents = None
+            if streamed:
+                # The Smoothie doesn't ack a move until there's room for it in
+                # its queue, which can take as long as the moves ahead of it.
+                command_result = await self._connection.send_command(
+                    command=command,
+                    retries=DEFAULT_COMMAND_RETRIES,
+                    timeout=max(ack_timeout, execute_timeout),
+                )
+                self._streamed_currents = self.current.copy()
+            else:
+                command_result = await self._connection.send_command(
+                    command=command,
+                    retries=DEFAULT_COMMAND_RETRIES,
+                    timeout=ack_timeout,
+                )
+                await self._connection.send_command(
+                    command=wait_command, retries=0, timeout=execute_timeout
+                )
         except AlarmResponse as e:
             self._handle_return(ret_code=e.response, is_alarm=True)
         except ErrorResponse as e:
@@ -1230,6 +1284,10 @@ class SmoothieDriver:
 
         This command respects the run flag and will wait until it is set.
 
+        If the driver is streaming, a move that doesn't involve the plunger
+        axes and doesn't need splitting returns as soon as the Smoothie has
+        queued it, rather than when it's done.
+
         The function may issue up to 3 moves:
         - if move splitting is required, the split move
         - the actual move, plus a bit extra to give room to preload backlash
@@ -1322,7 +1380,17 @@ class SmoothieDriver:
         primary_command_string = create_coords_list(moving_target)
         backlash_command_string = create_coords_list(backlash_target)
 
-        self.dwell_axes("".join(non_moving_axes))
+        # Plunger moves and split moves change currents before and after they
+        # run, so they always wait for everything before them to finish.
+        stream = (
+            self._streaming
+            and not split_target
+            and not (set("BC") & set(target.keys()))
+        )
+        if not (stream and self._streamed_currents is not None):
+            # While moves are streaming, leave axes at their active currents
+            # so the next move doesn't have to wait for them to finish.
+            self.dwell_axes("".join(non_moving_axes))
         self.activate_axes("".join(moving_axes))
 
         checked_speed = speed or self._combined_speed
@@ -1372,8 +1440,10 @@ class SmoothieDriver:
         if split_command_string or (checked_speed != self._combined_speed):
             command.add_builder(builder=self._build_speed_command(checked_speed))
 
-        # introduce the standard currents
-        command.add_builder(builder=self._generate_current_command())
+        # introduce the standard currents, unless the Smoothie is already
+        # running streamed moves with them
+        if not (stream and self._streamed_currents == self.current):
+            command.add_builder(builder=self._generate_current_command())
 
         # move to target position, including any added backlash to B/C axes
         command.add_gcode(GCODE.MOVE).add_builder(builder=primary_command_string)
@@ -1404,7 +1474,9 @@ class SmoothieDriver:
             # TODO (hmg) a movement's timeout should be calculated by
             # how long the movement is expected to take.
             await _do_split()
-            await self._send_command(command, timeout=DEFAULT_EXECUTE_TIMEOUT)
+            await self._send_command(
+                command, timeout=DEFAULT_EXECUTE_TIMEOUT, streamed=stream
+            )
         finally:
             # dwell pipette motors because they get hot
             plunger_axis_moved = "".join(set("BC") & set(target.keys()))
@@ -1815,6 +1887,7 @@ class SmoothieDriver:
         if self.simulating:
             pass
         else:
+            self._streamed_currents = None
             self._gpio_chardev.set_reset_pin(False)
             self._gpio_chardev.set_isp_pin(True)
             await asyncio.sleep(0.25)
@@ -1842,6 +1915,8 @@ class SmoothieDriver:
         if self.simulating:
             pass
         else:
+            # Halting throws away whatever moves are still queued.
+            self._streamed_currents = None
             self._gpio_chardev.set_halt_pin(False)
             await asyncio.sleep(0.25)
             self._gpio_chardev.set_halt_pin(True)
@@ -195,7 +195,7 @@ class API(
             checked_config = config
         else:
             checked_config = robot_configs.load_ot2()
-        backend = await Controller.build(checked_config)
+        backend = await Controller.build(checked_config, feature_flags)
         backend.set_lights(button=None, rails=False)
 
         async def blink() -> None:
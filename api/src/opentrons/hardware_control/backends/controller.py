@@ -36,7 +36,13 @@ from opentrons.config.types import RobotConfig
 from opentrons.types import Mount
 
 from ..module_control import AttachedModulesControl
-from ..types import AionotifyEvent, BoardRevision, Axis, DoorState
+from ..types import (
+    AionotifyEvent,
+    BoardRevision,
+    Axis,
+    DoorState,
+    HardwareFeatureFlags,
+)
 from ..util import ot2_axis_to_string
 
 if TYPE_CHECKING:
@@ -57,21 +63,32 @@ class Controller:
     """
 
     @classmethod
-    async def build(cls, config: Optional[RobotConfig]) -> Controller:
+    async def build(
+        cls,
+        config: Optional[RobotConfig],
+        feature_flags: Optional[HardwareFeatureFlags] = None,
+    ) -> Controller:
         """Build a Controller instance.
 
         Use this factory method rather than the initializer to handle proper
         GPIO initialization.
 
         :param config: A loaded robot config.
+        :param feature_flags: Hardware feature flags. If not specified, the
+                              defaults are used.
         """
 
         gpio = build_gpio_chardev("gpiochip0")
         gpio.config_by_board_rev()
         await gpio.setup()
-        return cls(config, gpio)
+        return cls(config, gpio, feature_flags)
 
-    def __init__(self, config: Optional[RobotConfig], gpio: GPIODriverLike):
+    def __init__(
+        self,
+        config: Optional[RobotConfig],
+        gpio: GPIODriverLike,
+        feature_flags: Optional[HardwareFeatureFlags] = None,
+    ):
         """Build a Controller instance.
 
         Always prefer using :py:meth:`.build` to create an instance of this class. For
@@ -94,7 +111,9 @@ class Controller:
         self._board_revision: Final = self.gpio_chardev.board_rev
         # We handle our own locks in the hardware controller thank you
         self._smoothie_driver = SmoothieDriver(
-            config=self.config, gpio_chardev=self._gpio_chardev
+            config=self.config,
+            gpio_chardev=self._gpio_chardev,
+            streaming=(feature_flags or HardwareFeatureFlags()).smoothie_streaming,
         )
         self._cached_fw_version: Optional[str] = None
         self._module_controls: Optional[AttachedModulesControl] = None
@@ -59,6 +59,7 @@ except (OSError, ModuleNotFoundError):
     aionotify = None
 
 
+from opentrons_hardware import tracing
 from opentrons_hardware.drivers import SystemDrivers
 from opentrons_hardware.drivers.can_bus import CanMessenger, DriverSettings
 from opentrons_hardware.drivers.can_bus.abstract_driver import AbstractCanDriver
@@ -500,6 +501,7 @@ class OT3Controller(FlexBackend):
         """Update the hardware feature flags used by the hardware controller."""
         self._feature_flags = feature_flags
 
+    @tracing.traced(category="encoder")
     async def update_motor_status(self) -> None:
         """Retreieve motor and encoder status and position from all present nodes"""
         motor_nodes = self._motor_nodes()
@@ -507,6 +509,7 @@ class OT3Controller(FlexBackend):
         response = await get_motor_position(self._messenger, motor_nodes)
         self._handle_motor_status_response(response)
 
+    @tracing.traced(category="encoder")
     async def update_motor_estimation(self, axes: Sequence[Axis]) -> None:
         """Update motor position estimation for commanded nodes, and update cache of data."""
         nodes = set([axis_to_node(a) for a in axes])
@@ -622,6 +625,7 @@ class OT3Controller(FlexBackend):
 
     @requires_update
     @requires_estop
+    @tracing.traced(category="motion")
     async def move(
         self,
         origin: Dict[Axis, float],
@@ -756,6 +760,7 @@ class OT3Controller(FlexBackend):
 
     @requires_update
     @requires_estop
+    @tracing.traced(category="motion")
     async def home(
         self, axes: Sequence[Axis], gantry_load: GantryLoad
     ) -> OT3AxisMap[float]:
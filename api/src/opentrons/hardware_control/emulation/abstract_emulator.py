@@ -10,6 +10,11 @@ class AbstractEmulator(ABC):
         """Handle a command and return a response."""
         ...
 
+    @abstractmethod
+    def reset(self) -> None:
+        """Put the emulator back in the state it started in."""
+        ...
+
     @staticmethod
     def get_terminator() -> bytes:
         """Get the command terminator for messages coming from PI."""
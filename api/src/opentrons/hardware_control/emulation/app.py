@@ -39,6 +39,15 @@ class Application:
             self._settings.heatershaker_proxy,
         )
 
+    async def wait_idle(self) -> None:
+        """Wait until no driver is connected to any module emulator."""
+        await asyncio.gather(
+            self._magdeck.wait_idle(),
+            self._temperature.wait_idle(),
+            self._thermocycler.wait_idle(),
+            self._heatershaker.wait_idle(),
+        )
+
     async def run(self) -> None:
         """Run the application."""
         await asyncio.gather(
@@ -6,7 +6,7 @@ import uuid
 import socket
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
 from opentrons.hardware_control.emulation.settings import ProxySettings
 
@@ -59,12 +59,29 @@ class Proxy:
         self._settings = settings
         self._event_listener = listener
         self._cons: List[Connection] = []
+        self._driver_count = 0
+        self._idle: Optional[asyncio.Event] = None
 
     @property
     def name(self) -> str:
         """Return the name of the proxy."""
         return self._name
 
+    async def wait_idle(self) -> None:
+        """Wait until no driver is connected to an emulator through the proxy.
+
+        Once it returns, every emulator connection is back in the pool, so the
+        next driver to connect will get one.
+        """
+        await self._get_idle_event().wait()
+
+    def _get_idle_event(self) -> asyncio.Event:
+        if self._idle is None:
+            self._idle = asyncio.Event()
+            if self._driver_count == 0:
+                self._idle.set()
+        return self._idle
+
     async def run(self) -> None:
         """Run the server."""
         await asyncio.gather(
@@ -164,20 +181,26 @@ class Proxy:
             f" connected to {connection.writer.transport.get_extra_info('socket')}."
         )
 
-        await self._handle_proxy(
-            driver=Connection(
-                reader=reader, writer=writer, identifier=connection.identifier
-            ),
-            server=connection,
-        )
-
-        # Return the emulator connection to the pool.
-        if not connection.reader.at_eof():
-            log.info(f"{self._name} returning connection to pool")
-            self._cons.append(connection)
-        else:
-            log.info(f"{self._name} server connection terminated")
-            self._event_listener.on_server_disconnected(connection.identifier)
+        self._driver_count += 1
+        self._get_idle_event().clear()
+        try:
+            await self._handle_proxy(
+                driver=Connection(
+                    reader=reader, writer=writer, identifier=connection.identifier
+                ),
+                server=connection,
+            )
+        finally:
+            # Return the emulator connection to the pool.
+            if not connection.reader.at_eof():
+                log.info(f"{self._name} returning connection to pool")
+                self._cons.append(connection)
+            else:
+                log.info(f"{self._name} server connection terminated")
+                self._event_listener.on_server_disconnected(connection.identifier)
+            self._driver_count -= 1
+            if self._driver_count == 0:
+                self._get_idle_event().set()
 
     async def _handle_proxy(self, driver: Connection, server: Connection) -> None:
         """Connect the driver to the emulator.
@@ -122,16 +122,18 @@ def load_tip_length_for_pipette(
     pipette_id: str, tiprack: typing.Union["TypeDictLabwareDef", LabwareDefinition]
 ) -> TipLengthCalibration:
     if isinstance(tiprack, LabwareDefinition):
-        tiprack = typing.cast(
-            "TypeDictLabwareDef", tiprack.dict(exclude_none=True, exclude_unset=True)
+        tiprack_uri = helpers.uri_from_details(
+            namespace=tiprack.namespace,
+            load_name=tiprack.parameters.loadName,
+            version=tiprack.version,
         )
+    else:
+        tiprack_uri = helpers.uri_from_definition(tiprack)
 
-    tip_length_data = calibration_storage.load_tip_length_calibration(
-        pipette_id, tiprack
+    tip_length_data = calibration_storage.load_tip_length_calibration_by_uri(
+        pipette_id, tiprack_uri
     )
 
-    tiprack_uri = helpers.uri_from_definition(tiprack)
-
     return TipLengthCalibration(
         tip_length=tip_length_data.tipLength,
         source=tip_length_data.source,
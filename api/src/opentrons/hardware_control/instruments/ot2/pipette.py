@@ -5,7 +5,7 @@ import functools
 """ Classes and functions for pipette state tracking
 """
 import logging
-from typing import Any, Dict, Optional, Set, Tuple, Union, cast
+from typing import Any, Dict, List, Optional, Set, Tuple, Union, cast
 
 from opentrons_shared_data.pipette.pipette_definition import (
     PipetteConfigurations,
@@ -28,7 +28,7 @@ from opentrons_shared_data.errors.exceptions import (
     CommandPreconditionViolated,
 )
 from opentrons_shared_data.pipette.ul_per_mm import (
-    piecewise_volume_conversion,
+    PiecewiseVolumeConversion,
     PIPETTING_FUNCTION_FALLBACK_VERSION,
     PIPETTING_FUNCTION_LATEST_VERSION,
 )
@@ -170,6 +170,10 @@ class Pipette(AbstractInstrument[PipetteConfigurations]):
             self._pipetting_function_version = PIPETTING_FUNCTION_FALLBACK_VERSION
         else:
             self._pipetting_function_version = PIPETTING_FUNCTION_LATEST_VERSION
+        self._ul_per_mm_conversions: Dict[
+            UlPerMmAction,
+            Tuple[List[Tuple[float, float, float]], PiecewiseVolumeConversion],
+        ] = {}
 
     @property
     def push_out_volume(self) -> float:
@@ -598,7 +602,18 @@ class Pipette(AbstractInstrument[PipetteConfigurations]):
             sequence = self._active_tip_settings.dispense.default.get(
                 self._pipetting_function_version, fallback
             )
-        return piecewise_volume_conversion(ul, sequence)
+        return self._compiled_ul_per_mm(action, sequence)(ul)
+
+    def _compiled_ul_per_mm(
+        self, action: UlPerMmAction, sequence: List[Tuple[float, float, float]]
+    ) -> PiecewiseVolumeConversion:
+        # The active tip settings change with the tip, so make sure what we
+        # compiled last time is still for the same function.
+        compiled = self._ul_per_mm_conversions.get(action)
+        if compiled is None or compiled[0] is not sequence:
+            compiled = (sequence, PiecewiseVolumeConversion(sequence))
+            self._ul_per_mm_conversions[action] = compiled
+        return compiled[1]
 
     def __str__(self) -> str:
         return "{} current volume {}ul critical point: {} at {}".format(
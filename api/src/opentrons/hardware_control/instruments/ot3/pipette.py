@@ -1,7 +1,7 @@
 import logging
 import functools
 
-from typing import Any, Dict, Optional, Set, Tuple, Union, cast
+from typing import Any, Dict, List, Optional, Set, Tuple, Union, cast
 
 from opentrons.types import Point
 
@@ -27,7 +27,7 @@ from opentrons_shared_data.errors.exceptions import (
     InvalidInstrumentData,
 )
 from opentrons_shared_data.pipette.ul_per_mm import (
-    piecewise_volume_conversion,
+    PiecewiseVolumeConversion,
     PIPETTING_FUNCTION_FALLBACK_VERSION,
     PIPETTING_FUNCTION_LATEST_VERSION,
 )
@@ -156,6 +156,10 @@ class Pipette(AbstractInstrument[PipetteConfigurations]):
             self._pipetting_function_version = PIPETTING_FUNCTION_FALLBACK_VERSION
         else:
             self._pipetting_function_version = PIPETTING_FUNCTION_LATEST_VERSION
+        self._ul_per_mm_conversions: Dict[
+            UlPerMmAction,
+            Tuple[List[Tuple[float, float, float]], PiecewiseVolumeConversion],
+        ] = {}
 
     @property
     def config(self) -> PipetteConfigurations:
@@ -545,7 +549,18 @@ class Pipette(AbstractInstrument[PipetteConfigurations]):
             sequence = self._active_tip_settings.dispense.default.get(
                 self._pipetting_function_version, fallback
             )
-        return piecewise_volume_conversion(ul, sequence)
+        return self._compiled_ul_per_mm(action, sequence)(ul)
+
+    def _compiled_ul_per_mm(
+        self, action: UlPerMmAction, sequence: List[Tuple[float, float, float]]
+    ) -> PiecewiseVolumeConversion:
+        # The active tip settings change with the tip, so make sure what we
+        # compiled last time is still for the same function.
+        compiled = self._ul_per_mm_conversions.get(action)
+        if compiled is None or compiled[0] is not sequence:
+            compiled = (sequence, PiecewiseVolumeConversion(sequence))
+            self._ul_per_mm_conversions[action] = compiled
+        return compiled[1]
 
     def __str__(self) -> str:
         return "{} current volume {}ul critical point: {} at {}".format(
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Optional, Mapping
+from typing import Optional, Mapping, Union
 from typing_extensions import Final
 
 from opentrons.drivers.rpi_drivers.types import USBPort
@@ -11,7 +11,7 @@ from opentrons.drivers.heater_shaker.abstract import AbstractHeaterShakerDriver
 from opentrons.drivers.heater_shaker.simulator import SimulatingDriver
 from opentrons.drivers.types import Temperature, RPM, HeaterShakerLabwareLatchStatus
 from opentrons.hardware_control.execution_manager import ExecutionManager
-from opentrons.hardware_control.poller import Reader, Poller
+from opentrons.hardware_control.poller import Reader, Poller, PollPolicy
 from opentrons.hardware_control.modules import mod_abc, update
 from opentrons.hardware_control.modules.types import (
     ModuleDisconnectedCallback,
@@ -25,12 +25,15 @@ from opentrons.hardware_control.modules.types import (
 
 log = logging.getLogger(__name__)
 
-POLL_PERIOD = 1.0
+# Poll quickly while the module is changing temperature or speed, or something is
+# waiting on it, and back off to the idle period once it's idle or holding.
+POLL_PERIOD = 0.5
+IDLE_POLL_PERIOD = 5.0
 
 # TODO(mc, 2022-06-14): this techinque copied from temperature module
 # to speed up simulation of heater-shaker protocols, but it's pretty silly
 # module simulation in PAPIv2 needs to be seriously rethought
-SIMULATING_POLL_PERIOD = POLL_PERIOD / 20.0
+SIMULATING_POLL_PERIOD = 0.05
 
 DFU_PID = "df11"
 
@@ -71,15 +74,20 @@ class HeaterShaker(mod_abc.AbstractModule):
             HeaterShaker instance
         """
         driver: AbstractHeaterShakerDriver
+        poll_interval: Union[float, PollPolicy]
         if not simulating:
             driver = await HeaterShakerDriver.create(port=port, loop=hw_control_loop)
-            poll_interval_seconds = poll_interval_seconds or POLL_PERIOD
+            active_interval = poll_interval_seconds or POLL_PERIOD
+            poll_interval = PollPolicy(
+                active_interval=active_interval,
+                idle_interval=max(active_interval, IDLE_POLL_PERIOD),
+            )
         else:
             driver = SimulatingDriver(serial_number=sim_serial_number)
-            poll_interval_seconds = poll_interval_seconds or SIMULATING_POLL_PERIOD
+            poll_interval = poll_interval_seconds or SIMULATING_POLL_PERIOD
 
         reader = HeaterShakerReader(driver=driver)
-        poller = Poller(reader=reader, interval=poll_interval_seconds)
+        poller = Poller(reader=reader, interval=poll_interval)
         module = cls(
             port=port,
             usb_port=usb_port,
@@ -282,6 +290,7 @@ class HeaterShaker(mod_abc.AbstractModule):
         await self.wait_for_is_running()
         await self._driver.set_temperature(celsius)
         await self._reader.read_temperature()
+        self._poller.wake()
 
     # TODO(mc, 2022-10-10): remove `awaiting_temperature` argument,
     # and instead, wait until status is holding
@@ -358,6 +367,7 @@ class HeaterShaker(mod_abc.AbstractModule):
             await self.wait_for_is_running()
         await self._driver.deactivate_heater()
         await self._reader.read_temperature()
+        self._poller.wake()
 
     async def deactivate_shaker(self, must_be_running: bool = True) -> None:
         """Stop shaking and home the plate"""
@@ -405,6 +415,20 @@ class HeaterShakerReader(Reader):
     def on_error(self, exception: Exception) -> None:
         self._set_error(exception)
 
+    def is_settled(self) -> bool:
+        """Whether the module is idle or holding, and its labware latch isn't moving."""
+        return (
+            HeaterShaker._get_temperature_status(self.temperature)
+            in (TemperatureStatus.IDLE, TemperatureStatus.HOLDING)
+            and HeaterShaker._get_speed_status(self.rpm)
+            in (SpeedStatus.IDLE, SpeedStatus.HOLDING)
+            and self.labware_latch
+            not in (
+                HeaterShakerLabwareLatchStatus.OPENING,
+                HeaterShakerLabwareLatchStatus.CLOSING,
+            )
+        )
+
     async def read_temperature(self) -> None:
         self.temperature = await self._driver.get_temperature()
 
@@ -2,13 +2,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
 
 from opentrons.hardware_control.modules.types import (
     ModuleDisconnectedCallback,
     TemperatureStatus,
 )
-from opentrons.hardware_control.poller import Reader, Poller
+from opentrons.hardware_control.poller import Reader, Poller, PollPolicy
 from typing_extensions import Final
 from opentrons.drivers.types import Temperature
 from opentrons.drivers.temp_deck import (
@@ -22,8 +22,11 @@ from opentrons.hardware_control.modules import update, mod_abc, types, errors
 
 log = logging.getLogger(__name__)
 
-TEMP_POLL_INTERVAL_SECS = 1.0
-SIM_TEMP_POLL_INTERVAL_SECS = TEMP_POLL_INTERVAL_SECS / 20.0
+# Poll quickly while the module is heating or cooling, or something is waiting
+# on it, and back off to the idle interval once it's idle or holding at target.
+TEMP_POLL_INTERVAL_SECS = 0.5
+TEMP_IDLE_POLL_INTERVAL_SECS = 5.0
+SIM_TEMP_POLL_INTERVAL_SECS = 0.05
 
 
 class TempDeck(mod_abc.AbstractModule):
@@ -62,17 +65,22 @@ class TempDeck(mod_abc.AbstractModule):
             Tempdeck instance
         """
         driver: AbstractTempDeckDriver
+        poll_interval: Union[float, PollPolicy]
         if not simulating:
             driver = await TempDeckDriver.create(port=port, loop=hw_control_loop)
-            poll_interval_seconds = poll_interval_seconds or TEMP_POLL_INTERVAL_SECS
+            active_interval = poll_interval_seconds or TEMP_POLL_INTERVAL_SECS
+            poll_interval = PollPolicy(
+                active_interval=active_interval,
+                idle_interval=max(active_interval, TEMP_IDLE_POLL_INTERVAL_SECS),
+            )
         else:
             driver = SimulatingDriver(
                 sim_model=sim_model, serial_number=sim_serial_number
             )
-            poll_interval_seconds = poll_interval_seconds or SIM_TEMP_POLL_INTERVAL_SECS
+            poll_interval = poll_interval_seconds or SIM_TEMP_POLL_INTERVAL_SECS
 
         reader = TempDeckReader(driver=driver)
-        poller = Poller(reader=reader, interval=poll_interval_seconds)
+        poller = Poller(reader=reader, interval=poll_interval)
         module = cls(
             port=port,
             usb_port=usb_port,
@@ -148,6 +156,7 @@ class TempDeck(mod_abc.AbstractModule):
         await self.wait_for_is_running()
         await self._driver.set_temperature(celsius)
         await self._reader.read()
+        self._poller.wake()
 
     async def await_temperature(self, awaiting_temperature: Optional[float]) -> None:
         """Await a target temperature in degrees Celsius.
@@ -188,6 +197,7 @@ class TempDeck(mod_abc.AbstractModule):
             await self.wait_for_is_running()
         await self._driver.deactivate()
         await self._reader.read()
+        self._poller.wake()
 
     @property
     def device_info(self) -> Dict[str, str]:
@@ -293,3 +303,10 @@ class TempDeckReader(Reader):
     async def read(self) -> None:
         """Read the module's current and target temperatures."""
         self.temperature = await self._driver.get_temperature()
+
+    def is_settled(self) -> bool:
+        """Whether the module is idle or holding at its target temperature."""
+        return TempDeck._get_status(self.temperature) in (
+            TemperatureStatus.IDLE,
+            TemperatureStatus.HOLDING,
+        )
@@ -68,6 +68,7 @@ from .instruments.ot3.instrument_calibration import (
 )
 
 from .execution_manager import ExecutionManagerProvider
+from . import tracing
 from .pause_manager import PauseManager
 from .module_control import AttachedModulesControl
 from .types import (
@@ -1001,6 +1002,7 @@ class OT3API(
             OT3Mount.from_mount(mount), self._current_position, critical_point
         )
 
+    @tracing.traced(category="encoder")
     async def refresh_positions(self, acquire_lock: bool = True) -> None:
         """Request and update both the motor and encoder positions from backend."""
         async with contextlib.AsyncExitStack() as stack:
@@ -1412,6 +1414,7 @@ class OT3API(
         return self._gripper_handler.is_ready_for_jaw_home()
 
     @ExecutionManagerProvider.wait_for_running
+    @tracing.traced(category="motion")
     async def _move(
         self,
         target_position: "OrderedDict[Axis, float]",
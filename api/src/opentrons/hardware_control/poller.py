@@ -2,7 +2,8 @@ import asyncio
 import contextlib
 import logging
 from abc import ABC, abstractmethod
-from typing import AsyncGenerator, List, Optional
+from dataclasses import dataclass
+from typing import AsyncGenerator, List, Optional, Union
 from opentrons.hardware_control.modules.errors import AbsorbanceReaderDisconnectedError
 from opentrons_shared_data.errors.exceptions import ModuleCommunicationError
 
@@ -18,24 +19,63 @@ class Reader(ABC):
     def on_error(self, exception: Exception) -> None:
         """Handle an error from calling `read`."""
 
+    def is_settled(self) -> bool:
+        """Whether the last read found the device idle or holding steady.
+
+        A `Poller` with a `PollPolicy` backs off while this is true.
+        """
+        return False
+
+
+@dataclass(frozen=True)
+class PollPolicy:
+    """How often a `Poller` should read, depending on what the device is doing.
+
+    Attributes:
+        active_interval: The poll interval, in seconds, while the reader is not
+            settled or while something is waiting for the next poll.
+        idle_interval: The longest poll interval, in seconds, while the reader
+            is settled.
+        backoff: How much to lengthen the interval after each settled read,
+            until it reaches `idle_interval`.
+    """
+
+    active_interval: float
+    idle_interval: float
+    backoff: float = 2.0
+
 
 class Poller:
     """A poller to call a given reader on an interval.
 
+    Polls are aligned to multiples of the active interval on the event loop's
+    clock, so pollers with the same policy read their devices together instead
+    of each waking up at its own time.
+
     Args:
         reader: An interface to read data.
-        interval: The poll interval, in seconds.
+        interval: The poll interval in seconds, or a `PollPolicy` to adapt the
+            interval to what the device is doing.
     """
 
-    interval: float
-
-    def __init__(self, reader: Reader, interval: float) -> None:
-        self.interval = interval
+    def __init__(self, reader: Reader, interval: Union[float, PollPolicy]) -> None:
+        self._policy = (
+            interval
+            if isinstance(interval, PollPolicy)
+            else PollPolicy(active_interval=interval, idle_interval=interval)
+        )
+        self._interval = self._policy.active_interval
         self._reader = reader
         self._read_lock: Optional["asyncio.Lock"] = None
+        self._wake_event: Optional["asyncio.Event"] = None
         self._poll_waiters: List["asyncio.Future[None]"] = []
         self._poll_forever_task: Optional["asyncio.Task[None]"] = None
 
+    @property
+    def interval(self) -> float:
+        """The current poll interval, in seconds."""
+        return self._interval
+
     async def start(self) -> None:
         if self._poll_forever_task is None:
             self._poll_forever_task = asyncio.create_task(self._poll_forever())
@@ -64,8 +104,19 @@ class Poller:
 
         poll_future = asyncio.get_running_loop().create_future()
         self._poll_waiters.append(poll_future)
+        self.wake()
         await poll_future
 
+    def wake(self) -> None:
+        """Go back to polling at the active interval.
+
+        Call this after telling the device to do something, so the poller
+        doesn't sleep through the change. Waiting for the next poll does this
+        automatically.
+        """
+        self._wake_event = self._wake_event or asyncio.Event()
+        self._wake_event.set()
+
     @contextlib.asynccontextmanager
     async def _use_read_lock(self) -> AsyncGenerator[None, None]:
         self._read_lock = self._read_lock or asyncio.Lock()
@@ -76,8 +127,50 @@ class Poller:
     async def _poll_forever(self) -> None:
         """Polling loop."""
         while True:
+            # Anything that wakes the poller during this read should also shorten
+            # the wait for the next one, so only clear wakes from before the read.
+            self._wake_event = self._wake_event or asyncio.Event()
+            self._wake_event.clear()
             await self._poll_once()
-            await asyncio.sleep(self.interval)
+            self._update_interval()
+            await self._sleep_until_next_poll()
+
+    def _update_interval(self) -> None:
+        """Back off if the device is settled, otherwise poll at the active interval."""
+        if self._reader.is_settled() and not self._poll_waiters:
+            self._interval = min(
+                self._interval * self._policy.backoff, self._policy.idle_interval
+            )
+        else:
+            self._interval = self._policy.active_interval
+
+    def _next_poll_time(self, target: float) -> float:
+        """Snap a poll time to the nearest point on the active interval's grid."""
+        grid = self._policy.active_interval
+        return round(target / grid) * grid
+
+    async def _sleep_until_next_poll(self) -> None:
+        """Sleep for the current interval, or less if woken."""
+        assert self._wake_event is not None
+        loop = asyncio.get_running_loop()
+        sleep_start = loop.time()
+        # Not asyncio.wait_for(), which can swallow a cancellation from stop()
+        # if the wake comes at the same moment.
+        wake = asyncio.ensure_future(self._wake_event.wait())
+        try:
+            woken, _ = await asyncio.wait(
+                {wake},
+                timeout=self._next_poll_time(sleep_start + self._interval)
+                - sleep_start,
+            )
+        finally:
+            wake.cancel()
+        if not woken:
+            return
+        self._interval = self._policy.active_interval
+        await asyncio.sleep(
+            self._next_poll_time(sleep_start + self._interval) - loop.time()
+        )
 
     @staticmethod
     def _set_waiter_complete(
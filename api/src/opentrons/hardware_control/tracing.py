@@ -0,0 +1,23 @@
+"""Span tracing for hardware control, when opentrons_hardware is installed.
+
+The tracer itself lives in `opentrons_hardware.tracing`. That package is an
+optional dependency, so without it, `traced` leaves functions unchanged.
+"""
+from typing import Any, Callable, Optional, TypeVar
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def traced(
+    name: Optional[str] = None, category: str = "hardware"
+) -> Callable[[_F], _F]:
+    """Decorate a function so each call is a span on the hardware tracer."""
+    try:
+        from opentrons_hardware import tracing
+    except ImportError:
+
+        def _untraced(func: _F) -> _F:
+            return func
+
+        return _untraced
+    return tracing.traced(name, category)
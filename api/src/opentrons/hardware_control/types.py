@@ -669,6 +669,7 @@ class HardwareFeatureFlags:
     require_estop: bool = True
     stall_detection_enabled: bool = True
     overpressure_detection_enabled: bool = True
+    smoothie_streaming: bool = False
 
     @classmethod
     def build_from_ff(cls) -> "HardwareFeatureFlags":
@@ -684,6 +685,7 @@ class HardwareFeatureFlags:
             require_estop=feature_flags.require_estop(),
             stall_detection_enabled=feature_flags.stall_detection_enabled(),
             overpressure_detection_enabled=feature_flags.overpressure_detection_enabled(),
+            smoothie_streaming=feature_flags.enable_smoothie_streaming(),
         )
 
 
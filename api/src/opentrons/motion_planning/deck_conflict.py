@@ -1,8 +1,21 @@
 """Check a deck layout for conflicts."""
 from __future__ import annotations
 
+import functools
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import List, Mapping, NamedTuple, Optional, Set, Union
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    Union,
+)
 from typing_extensions import Final
 
 from opentrons_shared_data.labware.types import LabwareUri
@@ -197,19 +210,25 @@ def check(
     Raises:
         DeckConflictError: Adding this item should not be allowed.
     """
-    restrictions: List[_DeckRestriction] = []
-    # build restrictions driven by existing items
-    for location, item in existing_items.items():
-        restrictions += _create_restrictions(
-            item=item, location=location, robot_type=robot_type
-        )
+    # An existing item in a location that it can't be in makes the whole layout
+    # invalid. Only staging slots have rules like that.
+    for location in existing_items:
+        if isinstance(location, StagingSlotName):
+            _validate_location(existing_items[location], location, robot_type)
 
     # check new item against existing restrictions
-    for r in restrictions:
-        if r.location == new_location and not r.is_allowed(new_item):
-            raise DeckConflictError(
-                _create_deck_conflict_error_message(restriction=r, new_item=new_item)
+    conflicting_restriction = _find_existing_restriction_conflict(
+        existing_items=existing_items,
+        new_item=new_item,
+        new_location=new_location,
+        robot_type=robot_type,
+    )
+    if conflicting_restriction is not None:
+        raise DeckConflictError(
+            _create_deck_conflict_error_message(
+                restriction=conflicting_restriction, new_item=new_item
             )
+        )
 
     # check new restrictions required by new item
     # do not interfere with existing items
@@ -228,12 +247,143 @@ def check(
             )
 
 
-def _create_ot2_restrictions(  # noqa: C901
+class LazyDeckItems(Mapping[Union[DeckSlotName, StagingSlotName], DeckItem]):
+    """Existing deck items for `check()`, mapped to `DeckItem`s only as they're needed.
+
+    `check()` only looks at the items near the new item, so callers whose items are
+    expensive to map, like ones that need to work out their heights, can use this
+    to skip mapping the rest of the deck.
+    """
+
+    def __init__(
+        self,
+        map_items: Mapping[
+            Union[DeckSlotName, StagingSlotName], Callable[[], DeckItem]
+        ],
+    ) -> None:
+        """Initialize the mapping.
+
+        Args:
+            map_items: For each occupied location, a function that maps the item
+                there to a `DeckItem`. Each is called at most once.
+        """
+        self._map_items = map_items
+        self._mapped_items: Dict[Union[DeckSlotName, StagingSlotName], DeckItem] = {}
+
+    def __getitem__(self, location: Union[DeckSlotName, StagingSlotName]) -> DeckItem:
+        """Get the item in a location, mapping it if it hasn't been already."""
+        mapped_item = self._mapped_items.get(location)
+        if mapped_item is None:
+            mapped_item = self._map_items[location]()
+            self._mapped_items[location] = mapped_item
+        return mapped_item
+
+    def __iter__(self) -> Iterator[Union[DeckSlotName, StagingSlotName]]:
+        """Iterate over the occupied locations, without mapping their items."""
+        return iter(self._map_items)
+
+    def __len__(self) -> int:
+        """Get the number of occupied locations."""
+        return len(self._map_items)
+
+
+def _find_existing_restriction_conflict(
+    existing_items: Mapping[Union[DeckSlotName, StagingSlotName], DeckItem],
+    new_item: DeckItem,
+    new_location: Union[DeckSlotName, StagingSlotName],
+    robot_type: str,
+) -> Optional[_DeckRestriction]:
+    # Only items in a few nearby slots can restrict the new location, so only
+    # look at those, instead of building restrictions for the whole deck.
+    restriction_sources = _get_restriction_sources(robot_type).get(
+        new_location, frozenset()
+    )
+    conflicts: Dict[Union[DeckSlotName, StagingSlotName], _DeckRestriction] = {}
+    for source_location in restriction_sources:
+        source_item = existing_items.get(source_location)
+        if source_item is None:
+            continue
+        for r in _create_restrictions(
+            item=source_item, location=source_location, robot_type=robot_type
+        ):
+            if r.location == new_location and not r.is_allowed(new_item):
+                conflicts[source_location] = r
+                break
+
+    if not conflicts:
+        return None
+    # Report the same conflict as checking every existing item, in order, would.
+    return next(
+        conflicts[location] for location in existing_items if location in conflicts
+    )
+
+
+def _validate_location(
+    item: DeckItem, location: Union[DeckSlotName, StagingSlotName], robot_type: str
+) -> None:
+    if robot_type == "OT-2 Standard":
+        if isinstance(location, StagingSlotName):
+            raise DeckConflictError(
+                f"OT-2 does not support staging slots ({location.id})."
+            )
+    elif isinstance(item, (HeaterShakerModule, OtherModule)) and isinstance(
+        location, StagingSlotName
+    ):
+        raise DeckConflictError("Cannot have a module loaded on a staging area slot.")
+
+
+# One item of every kind that restricts different slots. Which slots an item
+# restricts depends only on its kind and location, never on things like its height.
+_ITEMS_OF_EVERY_RESTRICTING_KIND: Final[List[DeckItem]] = [
+    Labware(name_for_errors="", highest_z=0, uri=LabwareUri(""), is_fixed_trash=False),
+    Labware(name_for_errors="", highest_z=0, uri=LabwareUri(""), is_fixed_trash=True),
+    TrashBin(name_for_errors="", highest_z=0),
+    HeaterShakerModule(name_for_errors="", highest_z_including_labware=0),
+    MagneticBlockModule(name_for_errors="", highest_z_including_labware=0),
+    ThermocyclerModule(
+        name_for_errors="", highest_z_including_labware=0, is_semi_configuration=False
+    ),
+    ThermocyclerModule(
+        name_for_errors="", highest_z_including_labware=0, is_semi_configuration=True
+    ),
+    OtherModule(name_for_errors="", highest_z_including_labware=0),
+]
+
+
+@functools.lru_cache(maxsize=None)
+def _get_restriction_sources(
+    robot_type: str,
+) -> Mapping[
+    Union[DeckSlotName, StagingSlotName],
+    FrozenSet[Union[DeckSlotName, StagingSlotName]],
+]:
+    """Index, for every location, the locations whose items might restrict it."""
+    sources: Dict[
+        Union[DeckSlotName, StagingSlotName], Set[Union[DeckSlotName, StagingSlotName]]
+    ] = defaultdict(set)
+    locations: List[Union[DeckSlotName, StagingSlotName]] = [
+        *DeckSlotName,
+        *StagingSlotName,
+    ]
+    for source_location in locations:
+        for item in _ITEMS_OF_EVERY_RESTRICTING_KIND:
+            try:
+                restrictions = _create_restrictions(
+                    item=item, location=source_location, robot_type=robot_type
+                )
+            except DeckConflictError:
+                continue
+            for r in restrictions:
+                sources[r.location].add(source_location)
+    return {location: frozenset(s) for location, s in sources.items()}
+
+
+def _create_ot2_restrictions(
     item: DeckItem, location: Union[DeckSlotName, StagingSlotName]
 ) -> List[_DeckRestriction]:
     restrictions: List[_DeckRestriction] = []
-    if isinstance(location, StagingSlotName):
-        raise DeckConflictError(f"OT-2 does not support staging slots ({location.id}).")
+    _validate_location(item, location, "OT-2 Standard")
+    assert isinstance(location, DeckSlotName)
 
     if location not in _FIXED_TRASH_SLOT:
         # Disallow a different item from overlapping this item in this deck slot.
@@ -305,10 +455,8 @@ def _create_flex_restrictions(
     ]
 
     if isinstance(item, (HeaterShakerModule, OtherModule)):
-        if isinstance(location, StagingSlotName):
-            raise DeckConflictError(
-                "Cannot have a module loaded on a staging area slot."
-            )
+        _validate_location(item, location, "OT-3 Standard")
+        assert isinstance(location, DeckSlotName)
         adjacent_staging_slot = get_adjacent_staging_slot(location)
         if adjacent_staging_slot is not None:
             # You can't have anything on a staging area slot next to a heater-shaker or
@@ -1,8 +1,9 @@
 """A Protocol-Engine-friendly wrapper for opentrons.motion_planning.deck_conflict."""
 from __future__ import annotations
-import itertools
+import functools
 import logging
 from typing import (
+    Callable,
     Collection,
     Dict,
     Optional,
@@ -149,39 +150,66 @@ def check(
 
     new_location, new_item = new_location_and_item
 
-    all_existing_labware = (
-        _map_labware(engine_state, labware_id) for labware_id in existing_labware_ids
-    )
-    mapped_existing_labware = (m for m in all_existing_labware if m is not None)
-
-    all_existing_modules = (
-        _map_module(engine_state, module_id) for module_id in existing_module_ids
+    wrapped_deck_conflict.check(
+        existing_items=wrapped_deck_conflict.LazyDeckItems(
+            _locate_existing_items(
+                engine_state=engine_state,
+                existing_labware_ids=existing_labware_ids,
+                existing_module_ids=existing_module_ids,
+                existing_disposal_locations=existing_disposal_locations,
+            )
+        ),
+        new_item=new_item,
+        new_location=new_location,
+        robot_type=engine_state.config.robot_type,
     )
-    mapped_existing_modules = (m for m in all_existing_modules if m is not None)
 
-    all_exisiting_disposal_locations = (
-        _map_disposal_location(disposal_location)
-        for disposal_location in existing_disposal_locations
-    )
-    mapped_disposal_locations = (
-        m for m in all_exisiting_disposal_locations if m is not None
-    )
 
+def _locate_existing_items(
+    engine_state: StateView,
+    existing_labware_ids: Collection[str],
+    existing_module_ids: Collection[str],
+    existing_disposal_locations: Collection[Union[Labware, WasteChute, TrashBin]],
+) -> Dict[
+    Union[DeckSlotName, StagingSlotName], Callable[[], wrapped_deck_conflict.DeckItem]
+]:
+    # Finding where each existing item is is cheap, but mapping it to a
+    # wrapped_deck_conflict.DeckItem means working out its height. Deck conflict
+    # checking only looks at the items near the new one, so defer that until it does.
     existing_items: Dict[
-        Union[DeckSlotName, StagingSlotName], wrapped_deck_conflict.DeckItem
+        Union[DeckSlotName, StagingSlotName],
+        Callable[[], wrapped_deck_conflict.DeckItem],
     ] = {}
-    for existing_location, existing_item in itertools.chain(
-        mapped_existing_labware, mapped_existing_modules, mapped_disposal_locations
-    ):
-        assert existing_location not in existing_items
-        existing_items[existing_location] = existing_item
 
-    wrapped_deck_conflict.check(
-        existing_items=existing_items,
-        new_item=new_item,
-        new_location=new_location,
-        robot_type=engine_state.config.robot_type,
-    )
+    for labware_id in existing_labware_ids:
+        labware_slot = _get_labware_slot(engine_state, labware_id)
+        if labware_slot is not None:
+            assert labware_slot not in existing_items
+            existing_items[labware_slot] = functools.partial(
+                _map_labware_item, engine_state, labware_id
+            )
+
+    for module_id in existing_module_ids:
+        module_slot = engine_state.modules.get_location(module_id=module_id).slotName
+        assert module_slot not in existing_items
+        existing_items[module_slot] = functools.partial(
+            _map_module_item, engine_state, module_id
+        )
+
+    for disposal_location in existing_disposal_locations:
+        mapped_disposal_location = _map_disposal_location(disposal_location)
+        if mapped_disposal_location is not None:
+            disposal_slot, disposal_item = mapped_disposal_location
+            assert disposal_slot not in existing_items
+            existing_items[disposal_slot] = functools.partial(_identity, disposal_item)
+
+    return existing_items
+
+
+def _identity(
+    item: wrapped_deck_conflict.DeckItem,
+) -> wrapped_deck_conflict.DeckItem:
+    return item
 
 
 def _map_labware(
@@ -190,6 +218,16 @@ def _map_labware(
 ) -> Optional[
     Tuple[Union[DeckSlotName, StagingSlotName], wrapped_deck_conflict.DeckItem]
 ]:
+    slot = _get_labware_slot(engine_state, labware_id)
+    if slot is None:
+        return None
+    return slot, _map_labware_item(engine_state, labware_id)
+
+
+def _get_labware_slot(
+    engine_state: StateView,
+    labware_id: str,
+) -> Optional[Union[DeckSlotName, StagingSlotName]]:
     location_from_engine = engine_state.labware.get_location(labware_id=labware_id)
 
     if isinstance(location_from_engine, AddressableAreaLocation):
@@ -201,40 +239,11 @@ def _map_labware(
             slot = StagingSlotName.from_primitive(
                 location_from_engine.addressableAreaName
             )
-        return (
-            slot,
-            wrapped_deck_conflict.Labware(
-                name_for_errors=engine_state.labware.get_load_name(
-                    labware_id=labware_id
-                ),
-                highest_z=engine_state.geometry.get_labware_highest_z(
-                    labware_id=labware_id
-                ),
-                uri=engine_state.labware.get_definition_uri(labware_id=labware_id),
-                is_fixed_trash=engine_state.labware.is_fixed_trash(
-                    labware_id=labware_id
-                ),
-            ),
-        )
+        return slot
 
     elif isinstance(location_from_engine, DeckSlotLocation):
         # This labware is loaded directly into a deck slot.
-        # Map it to a wrapped_deck_conflict.Labware.
-        return (
-            location_from_engine.slotName,
-            wrapped_deck_conflict.Labware(
-                name_for_errors=engine_state.labware.get_load_name(
-                    labware_id=labware_id
-                ),
-                highest_z=engine_state.geometry.get_labware_highest_z(
-                    labware_id=labware_id
-                ),
-                uri=engine_state.labware.get_definition_uri(labware_id=labware_id),
-                is_fixed_trash=engine_state.labware.is_fixed_trash(
-                    labware_id=labware_id
-                ),
-            ),
-        )
+        return location_from_engine.slotName
 
     elif isinstance(location_from_engine, ModuleLocation):
         # This labware is loaded atop a module. Don't map it to anything here;
@@ -251,13 +260,34 @@ def _map_labware(
         return None
 
 
+def _map_labware_item(
+    engine_state: StateView,
+    labware_id: str,
+) -> wrapped_deck_conflict.DeckItem:
+    # This labware directly occupies a slot.
+    # Map it to a wrapped_deck_conflict.Labware.
+    return wrapped_deck_conflict.Labware(
+        name_for_errors=engine_state.labware.get_load_name(labware_id=labware_id),
+        highest_z=engine_state.geometry.get_labware_highest_z(labware_id=labware_id),
+        uri=engine_state.labware.get_definition_uri(labware_id=labware_id),
+        is_fixed_trash=engine_state.labware.is_fixed_trash(labware_id=labware_id),
+    )
+
+
 def _map_module(
     engine_state: StateView,
     module_id: str,
 ) -> Optional[Tuple[DeckSlotName, wrapped_deck_conflict.DeckItem]]:
+    mapped_location = engine_state.modules.get_location(module_id=module_id).slotName
+    return mapped_location, _map_module_item(engine_state, module_id)
+
+
+def _map_module_item(
+    engine_state: StateView,
+    module_id: str,
+) -> wrapped_deck_conflict.DeckItem:
     module_model = engine_state.modules.get_connected_model(module_id=module_id)
     module_type = module_model.as_type()
-    mapped_location = engine_state.modules.get_location(module_id=module_id).slotName
 
     # Use the module model (e.g. "temperatureModuleV1") as the name for error messages
     # because it's convenient for us. Unfortunately, this won't necessarily match
@@ -270,39 +300,27 @@ def _map_module(
     )
 
     if module_type == ModuleType.HEATER_SHAKER:
-        return (
-            mapped_location,
-            wrapped_deck_conflict.HeaterShakerModule(
-                name_for_errors=name_for_errors,
-                highest_z_including_labware=highest_z_including_labware,
-            ),
+        return wrapped_deck_conflict.HeaterShakerModule(
+            name_for_errors=name_for_errors,
+            highest_z_including_labware=highest_z_including_labware,
         )
     elif module_type == ModuleType.MAGNETIC_BLOCK:
-        return (
-            mapped_location,
-            wrapped_deck_conflict.MagneticBlockModule(
-                name_for_errors=name_for_errors,
-                highest_z_including_labware=highest_z_including_labware,
-            ),
+        return wrapped_deck_conflict.MagneticBlockModule(
+            name_for_errors=name_for_errors,
+            highest_z_including_labware=highest_z_including_labware,
         )
     elif module_type == ModuleType.THERMOCYCLER:
-        return (
-            mapped_location,
-            wrapped_deck_conflict.ThermocyclerModule(
-                name_for_errors=name_for_errors,
-                highest_z_including_labware=highest_z_including_labware,
-                # Python Protocol API >=v2.14 never allows loading a Thermocycler in
-                # its semi configuration.
-                is_semi_configuration=False,
-            ),
+        return wrapped_deck_conflict.ThermocyclerModule(
+            name_for_errors=name_for_errors,
+            highest_z_including_labware=highest_z_including_labware,
+            # Python Protocol API >=v2.14 never allows loading a Thermocycler in
+            # its semi configuration.
+            is_semi_configuration=False,
         )
     else:
-        return (
-            mapped_location,
-            wrapped_deck_conflict.OtherModule(
-                name_for_errors=name_for_errors,
-                highest_z_including_labware=highest_z_including_labware,
-            ),
+        return wrapped_deck_conflict.OtherModule(
+            name_for_errors=name_for_errors,
+            highest_z_including_labware=highest_z_including_labware,
         )
 
 
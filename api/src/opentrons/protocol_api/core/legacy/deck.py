@@ -3,7 +3,7 @@
 import functools
 import logging
 from collections import UserDict
-from typing import Dict, Optional, List, Union, Mapping
+from typing import Dict, Optional, List, Union
 from typing_extensions import Protocol, Final
 
 from opentrons_shared_data.deck import load as load_deck
@@ -20,7 +20,6 @@ from opentrons.types import (
     Mount,
     Point,
     DeckSlotName,
-    StagingSlotName,
 )
 
 from opentrons.protocol_api.core.labware import AbstractLabware
@@ -174,13 +173,15 @@ class Deck(UserDict):  # type: ignore[type-arg]
 
     def __setitem__(self, key: DeckLocation, val: DeckItem) -> None:
         slot_key_int = self._check_name(key)
-        existing_items: Mapping[
-            Union[DeckSlotName, StagingSlotName], deck_conflict.DeckItem
-        ] = {
-            DeckSlotName.from_primitive(slot): self._map_to_conflict_checker_item(item)
-            for slot, item in self.data.items()
-            if item is not None
-        }
+        existing_items = deck_conflict.LazyDeckItems(
+            {
+                DeckSlotName.from_primitive(slot): functools.partial(
+                    self._map_to_conflict_checker_item, item
+                )
+                for slot, item in self.data.items()
+                if item is not None
+            }
+        )
 
         # will raise DeckConflictError if items conflict
         deck_conflict.check(
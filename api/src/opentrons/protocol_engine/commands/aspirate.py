@@ -156,6 +156,11 @@ class AspirateImplementation(AbstractCommandImpl[AspirateParams, _ExecuteReturn]
                 state_update=state_update,
             )
         else:
+            state_update.mark_liquid_operated(
+                labware_id=labware_id,
+                well_name=well_name,
+                volume_added=-volume_aspirated,
+            )
             return SuccessData(
                 public=AspirateResult(
                     volume=volume_aspirated,
@@ -14,6 +14,7 @@ from .pipetting_common import (
     FlowRateMixin,
     BaseLiquidHandlingResult,
     OverpressureError,
+    mark_liquid_operated_in_place,
 )
 from .command import (
     AbstractCommandImpl,
@@ -24,6 +25,7 @@ from .command import (
 )
 from ..errors.error_occurrence import ErrorOccurrence
 from ..errors.exceptions import PipetteNotReadyToAspirateError
+from ..state.update_types import StateUpdate
 
 if TYPE_CHECKING:
     from ..execution import PipettingHandler, GantryMover
@@ -91,6 +93,8 @@ class AspirateInPlaceImplementation(
                 " The first aspirate following a blow-out must be from a specific well"
                 " so the plunger can be reset in a known safe position."
             )
+
+        state_update = StateUpdate()
         try:
             current_position = await self._gantry_mover.get_position(params.pipetteId)
             volume = await self._pipetting.aspirate_in_place(
@@ -121,10 +125,19 @@ class AspirateInPlaceImplementation(
                         }
                     ),
                 ),
+                state_update=state_update,
             )
         else:
+            mark_liquid_operated_in_place(
+                state_update=state_update,
+                state_view=self._state_view,
+                pipette_id=params.pipetteId,
+                volume_added=-volume,
+            )
             return SuccessData(
-                public=AspirateInPlaceResult(volume=volume), private=None
+                public=AspirateInPlaceResult(volume=volume),
+                private=None,
+                state_update=state_update,
             )
 
 
@@ -5,7 +5,7 @@ from opentrons_shared_data.errors.exceptions import PipetteOverpressureError
 from typing_extensions import Literal
 
 
-from ..state.update_types import StateUpdate
+from ..state.update_types import CLEAR, StateUpdate
 from ..types import DeckPoint
 from .pipetting_common import (
     OverpressureError,
@@ -88,6 +88,10 @@ class BlowOutImplementation(AbstractCommandImpl[BlowOutParams, _ExecuteReturn]):
             new_well_name=params.wellName,
             new_deck_point=deck_point,
         )
+        # We don't know how much liquid a blow-out adds.
+        state_update.mark_liquid_operated(
+            labware_id=params.labwareId, well_name=params.wellName, volume_added=CLEAR
+        )
         try:
             await self._pipetting.blow_out_in_place(
                 pipette_id=params.pipetteId, flow_rate=params.flowRate
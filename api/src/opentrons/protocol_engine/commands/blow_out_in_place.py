@@ -10,6 +10,7 @@ from .pipetting_common import (
     OverpressureError,
     PipetteIdMixin,
     FlowRateMixin,
+    mark_liquid_operated_in_place,
 )
 from .command import (
     AbstractCommandImpl,
@@ -19,6 +20,7 @@ from .command import (
     SuccessData,
 )
 from ..errors.error_occurrence import ErrorOccurrence
+from ..state.update_types import CLEAR, StateUpdate
 
 from opentrons.hardware_control import HardwareControlAPI
 
@@ -72,6 +74,14 @@ class BlowOutInPlaceImplementation(
 
     async def execute(self, params: BlowOutInPlaceParams) -> _ExecuteReturn:
         """Blow-out without moving the pipette."""
+        state_update = StateUpdate()
+        # We don't know how much liquid a blow-out adds.
+        mark_liquid_operated_in_place(
+            state_update=state_update,
+            state_view=self._state_view,
+            pipette_id=params.pipetteId,
+            volume_added=CLEAR,
+        )
         try:
             current_position = await self._gantry_mover.get_position(params.pipetteId)
             await self._pipetting.blow_out_in_place(
@@ -99,7 +109,9 @@ class BlowOutInPlaceImplementation(
                 ),
             )
         else:
-            return SuccessData(public=BlowOutInPlaceResult(), private=None)
+            return SuccessData(
+                public=BlowOutInPlaceResult(), private=None, state_update=state_update
+            )
 
 
 class BlowOutInPlace(
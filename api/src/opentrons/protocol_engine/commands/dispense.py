@@ -8,7 +8,7 @@ from opentrons_shared_data.errors.exceptions import PipetteOverpressureError
 from pydantic import Field
 
 from ..types import DeckPoint
-from ..state.update_types import StateUpdate
+from ..state.update_types import CLEAR, StateUpdate
 from .pipetting_common import (
     PipetteIdMixin,
     DispenseVolumeMixin,
@@ -107,6 +107,10 @@ class DispenseImplementation(AbstractCommandImpl[DispenseParams, _ExecuteReturn]
                 push_out=params.pushOut,
             )
         except PipetteOverpressureError as e:
+            # Some of the volume might have been dispensed before the error.
+            state_update.mark_liquid_operated(
+                labware_id=labware_id, well_name=well_name, volume_added=CLEAR
+            )
             return DefinedErrorData(
                 public=OverpressureError(
                     id=self._model_utils.generate_id(),
@@ -123,6 +127,9 @@ class DispenseImplementation(AbstractCommandImpl[DispenseParams, _ExecuteReturn]
                 state_update=state_update,
             )
         else:
+            state_update.mark_liquid_operated(
+                labware_id=labware_id, well_name=well_name, volume_added=volume
+            )
             return SuccessData(
                 public=DispenseResult(volume=volume, position=deck_point),
                 private=None,
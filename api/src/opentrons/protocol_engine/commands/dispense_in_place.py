@@ -12,6 +12,7 @@ from .pipetting_common import (
     FlowRateMixin,
     BaseLiquidHandlingResult,
     OverpressureError,
+    mark_liquid_operated_in_place,
 )
 from .command import (
     AbstractCommandImpl,
@@ -21,10 +22,12 @@ from .command import (
     DefinedErrorData,
 )
 from ..errors.error_occurrence import ErrorOccurrence
+from ..state.update_types import CLEAR, StateUpdate
 
 if TYPE_CHECKING:
     from ..execution import PipettingHandler, GantryMover
     from ..resources import ModelUtils
+    from ..state.state import StateView
 
 
 DispenseInPlaceCommandType = Literal["dispenseInPlace"]
@@ -59,16 +62,19 @@ class DispenseInPlaceImplementation(
     def __init__(
         self,
         pipetting: PipettingHandler,
+        state_view: StateView,
         gantry_mover: GantryMover,
         model_utils: ModelUtils,
         **kwargs: object,
     ) -> None:
         self._pipetting = pipetting
+        self._state_view = state_view
         self._gantry_mover = gantry_mover
         self._model_utils = model_utils
 
     async def execute(self, params: DispenseInPlaceParams) -> _ExecuteReturn:
         """Dispense without moving the pipette."""
+        state_update = StateUpdate()
         try:
             current_position = await self._gantry_mover.get_position(params.pipetteId)
             volume = await self._pipetting.dispense_in_place(
@@ -78,6 +84,13 @@ class DispenseInPlaceImplementation(
                 push_out=params.pushOut,
             )
         except PipetteOverpressureError as e:
+            # Some of the volume might have been dispensed before the error.
+            mark_liquid_operated_in_place(
+                state_update=state_update,
+                state_view=self._state_view,
+                pipette_id=params.pipetteId,
+                volume_added=CLEAR,
+            )
             return DefinedErrorData(
                 public=OverpressureError(
                     id=self._model_utils.generate_id(),
@@ -99,10 +112,19 @@ class DispenseInPlaceImplementation(
                         }
                     ),
                 ),
+                state_update=state_update,
             )
         else:
+            mark_liquid_operated_in_place(
+                state_update=state_update,
+                state_view=self._state_view,
+                pipette_id=params.pipetteId,
+                volume_added=volume,
+            )
             return SuccessData(
-                public=DispenseInPlaceResult(volume=volume), private=None
+                public=DispenseInPlaceResult(volume=volume),
+                private=None,
+                state_update=state_update,
             )
 
 
@@ -9,6 +9,7 @@ from pydantic import Field
 from opentrons.protocol_engine.state import update_types
 from opentrons.protocol_engine.errors.exceptions import (
     MustHomeError,
+    OperationLocationNotInWellError,
     PipetteNotReadyToAspirateError,
     TipNotEmptyError,
 )
@@ -17,7 +18,7 @@ from opentrons_shared_data.errors.exceptions import (
     PipetteLiquidNotFoundError,
 )
 
-from ..types import DeckPoint
+from ..types import DeckPoint, WellLocation, WellOffset, WellOrigin
 from .pipetting_common import (
     LiquidNotFoundError,
     PipetteIdMixin,
@@ -48,7 +49,21 @@ TryLiquidProbeCommandType = Literal["tryLiquidProbe"]
 # But we need two separate parameter model classes because
 # `command_unions.CREATE_TYPES_BY_PARAMS_TYPE` needs to be a 1:1 mapping.
 class _CommonParams(PipetteIdMixin, WellLocationMixin):
-    pass
+    knownLiquidHeightMargin: Optional[float] = Field(
+        None,
+        description=(
+            "If set, and this well's liquid height is known from an earlier probe,"
+            " start probing this many mm above that height instead of at"
+            " `wellLocation`, so less of the well has to be searched."
+            " The height is adjusted for liquid aspirated from or dispensed into the"
+            " well since the earlier probe. If that can't be predicted, like after"
+            " a blow-out, probing starts at `wellLocation`."
+            " If no liquid is found from there, the whole search is done again"
+            " from `wellLocation`."
+            " If omitted, probing always starts at `wellLocation`."
+        ),
+        gt=0,
+    )
 
 
 class LiquidProbeParams(_CommonParams):
@@ -135,36 +150,94 @@ async def _execute_common(
             message="Current position of pipette is invalid. Please home."
         )
 
-    # liquid_probe process start position
-    position = await movement.move_to_well(
-        pipette_id=pipette_id,
-        labware_id=labware_id,
-        well_name=well_name,
-        well_location=params.wellLocation,
-    )
-    deck_point = DeckPoint.construct(x=position.x, y=position.y, z=position.z)
-    state_update.set_pipette_location(
-        pipette_id=pipette_id,
-        new_labware_id=labware_id,
-        new_well_name=well_name,
-        new_deck_point=deck_point,
-    )
+    well_locations = [params.wellLocation]
+    location_above_liquid = _get_location_above_known_liquid(state_view, params)
+    if location_above_liquid is not None:
+        # Try the shorter search first, and fall back to the full one.
+        well_locations.insert(0, location_above_liquid)
 
-    try:
-        z_pos = await pipetting.liquid_probe_in_place(
+    for well_location in well_locations:
+        # liquid_probe process start position
+        position = await movement.move_to_well(
             pipette_id=pipette_id,
             labware_id=labware_id,
             well_name=well_name,
-            well_location=params.wellLocation,
+            well_location=well_location,
         )
-    except PipetteLiquidNotFoundError as exception:
-        return _ExecuteCommonResult(
-            z_pos_or_error=exception, state_update=state_update, deck_point=deck_point
+        deck_point = DeckPoint.construct(x=position.x, y=position.y, z=position.z)
+        state_update.set_pipette_location(
+            pipette_id=pipette_id,
+            new_labware_id=labware_id,
+            new_well_name=well_name,
+            new_deck_point=deck_point,
         )
-    else:
-        return _ExecuteCommonResult(
-            z_pos_or_error=z_pos, state_update=state_update, deck_point=deck_point
+
+        try:
+            z_pos = await pipetting.liquid_probe_in_place(
+                pipette_id=pipette_id,
+                labware_id=labware_id,
+                well_name=well_name,
+                well_location=well_location,
+            )
+        except PipetteLiquidNotFoundError as exception:
+            z_pos_or_error: float | PipetteLiquidNotFoundError = exception
+        else:
+            z_pos_or_error = z_pos
+            break
+
+    return _ExecuteCommonResult(
+        z_pos_or_error=z_pos_or_error, state_update=state_update, deck_point=deck_point
+    )
+
+
+def _get_location_above_known_liquid(
+    state_view: StateView, params: _CommonParams
+) -> Optional[WellLocation]:
+    """Get a probe start location just above the well's predicted liquid height.
+
+    Returns None if the caller didn't ask for one, if the liquid height can't be
+    predicted, or if starting there wouldn't be any lower than starting at
+    `params.wellLocation`.
+    """
+    if params.knownLiquidHeightMargin is None:
+        return None
+    measured_height = state_view.wells.get_last_measured_liquid_height(
+        labware_id=params.labwareId, well_name=params.wellName
+    )
+    predicted_height = state_view.geometry.get_predicted_liquid_height(
+        labware_id=params.labwareId, well_name=params.wellName
+    )
+    if measured_height is None or predicted_height is None:
+        return None
+
+    # A meniscus location is relative to the last measured height.
+    well_location = WellLocation(
+        origin=WellOrigin.MENISCUS,
+        offset=WellOffset(
+            x=params.wellLocation.offset.x,
+            y=params.wellLocation.offset.y,
+            z=predicted_height - measured_height + params.knownLiquidHeightMargin,
+        ),
+    )
+    try:
+        start_position = state_view.geometry.get_well_position(
+            labware_id=params.labwareId,
+            well_name=params.wellName,
+            well_location=well_location,
+            pipette_id=params.pipetteId,
         )
+    except OperationLocationNotInWellError:
+        # Too close to the bottom of the well to leave any room to search.
+        return None
+    requested_position = state_view.geometry.get_well_position(
+        labware_id=params.labwareId,
+        well_name=params.wellName,
+        well_location=params.wellLocation,
+        pipette_id=params.pipetteId,
+    )
+    if start_position.z >= requested_position.z:
+        return None
+    return well_location
 
 
 class LiquidProbeImplementation(
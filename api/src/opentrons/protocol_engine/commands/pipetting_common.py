@@ -1,11 +1,15 @@
 """Common pipetting command base models."""
 from opentrons_shared_data.errors import ErrorCodes
 from pydantic import BaseModel, Field
-from typing import Literal, Optional, Tuple, TypedDict
+from typing import TYPE_CHECKING, Literal, Optional, Tuple, TypedDict
 
 from opentrons.protocol_engine.errors.error_occurrence import ErrorOccurrence
 
-from ..types import WellLocation, LiquidHandlingWellLocation, DeckPoint
+from ..state.update_types import CLEAR, ClearType, StateUpdate
+from ..types import WellLocation, LiquidHandlingWellLocation, DeckPoint, CurrentWell
+
+if TYPE_CHECKING:
+    from ..state.state import StateView
 
 
 class PipetteIdMixin(BaseModel):
@@ -201,3 +205,27 @@ class TipPhysicallyAttachedError(ErrorOccurrence):
 
     errorCode: str = ErrorCodes.TIP_DROP_FAILED.value.code
     detail: str = ErrorCodes.TIP_DROP_FAILED.value.detail
+
+
+def mark_liquid_operated_in_place(
+    state_update: StateUpdate,
+    state_view: "StateView",
+    pipette_id: str,
+    volume_added: float | ClearType,
+) -> None:
+    """Mark the liquid in the well that the pipette is currently in as operated on.
+
+    If we don't know where the pipette is, it could be in any well. Removing liquid
+    from an unknown well is left unmarked, because it can only lower a well's
+    liquid, so every measured height is still an upper bound.
+    """
+    current_location = state_view.pipettes.get_current_location()
+    if current_location is None or current_location.pipette_id != pipette_id:
+        if volume_added == CLEAR or volume_added > 0:
+            state_update.mark_unknown_liquid_operated()
+    elif isinstance(current_location, CurrentWell):
+        state_update.mark_liquid_operated(
+            labware_id=current_location.labware_id,
+            well_name=current_location.well_name,
+            volume_added=volume_added,
+        )
@@ -179,13 +179,22 @@ class HardwarePipettingHandler(PipettingHandler):
             attached_pipettes=self._hardware_api.attached_instruments,
         )
         well_def = self._state_view.labware.get_well_definition(labware_id, well_name)
-        well_depth = well_def.depth
+        # The height of the probe start above the well bottom, whatever its origin.
+        start_height = (
+            self._state_view.geometry.get_well_offset_adjustment(
+                labware_id=labware_id,
+                well_name=well_name,
+                well_location=well_location,
+                well_depth=well_def.depth,
+            )
+            + well_location.offset.z
+        )
         lld_min_height = self._state_view.pipettes.get_current_tip_lld_settings(
             pipette_id=pipette_id
         )
         z_pos = await self._hardware_api.liquid_probe(
             mount=hw_pipette.mount,
-            max_z_dist=well_depth - lld_min_height + well_location.offset.z,
+            max_z_dist=start_height - lld_min_height,
         )
         labware_pos = self._state_view.geometry.get_labware_position(labware_id)
         relative_height = z_pos - labware_pos.z - well_def.z
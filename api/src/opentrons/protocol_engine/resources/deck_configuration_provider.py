@@ -1,7 +1,16 @@
 """Deck configuration resource provider."""
-from typing import List, Set, Tuple
-
-from opentrons_shared_data.deck.types import DeckDefinitionV5, CutoutFixture
+import copy
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Set, Tuple
+
+from opentrons_shared_data.deck.types import (
+    DeckDefinitionV5,
+    CutoutFixture,
+    AddressableArea as AddressableAreaDefinition,
+)
 
 from opentrons.types import DeckSlotName
 
@@ -20,13 +29,111 @@ from ..errors import (
 )
 
 
+@dataclass(frozen=True)
+class DeckDefinitionIndex:
+    """The parts of a deck definition, keyed by the names they are looked up by.
+
+    Where a name appears more than once in the definition, the first one wins,
+    like a scan through the definition would find.
+    """
+
+    addressable_areas: Mapping[str, AddressableAreaDefinition]
+    cutout_positions: Mapping[str, DeckPoint]
+    cutout_fixtures: Mapping[str, CutoutFixture]
+    potential_cutout_fixtures: Mapping[str, Tuple[PotentialCutoutFixture, ...]]
+    """Every cutout and fixture combination that provides each addressable area."""
+
+    source: DeckDefinitionV5
+    """A copy of the deck definition this index was built from."""
+
+    @classmethod
+    def build(cls, deck_definition: DeckDefinitionV5) -> "DeckDefinitionIndex":
+        """Index a copy of a deck definition."""
+        deck_definition = copy.deepcopy(deck_definition)
+        addressable_areas: Dict[str, AddressableAreaDefinition] = {}
+        for addressable_area in deck_definition["locations"]["addressableAreas"]:
+            addressable_areas.setdefault(addressable_area["id"], addressable_area)
+
+        cutout_positions: Dict[str, DeckPoint] = {}
+        for cutout in deck_definition["locations"]["cutouts"]:
+            position = cutout["position"]
+            cutout_positions.setdefault(
+                cutout["id"], DeckPoint(x=position[0], y=position[1], z=position[2])
+            )
+
+        cutout_fixtures: Dict[str, CutoutFixture] = {}
+        potential_cutout_fixtures: Dict[str, List[PotentialCutoutFixture]] = {}
+        for cutout_fixture in deck_definition["cutoutFixtures"]:
+            cutout_fixtures.setdefault(cutout_fixture["id"], cutout_fixture)
+            for cutout_id, provided_areas in cutout_fixture[
+                "providesAddressableAreas"
+            ].items():
+                potential_fixture = PotentialCutoutFixture(
+                    cutout_id=cutout_id,
+                    cutout_fixture_id=cutout_fixture["id"],
+                    provided_addressable_areas=frozenset(provided_areas),
+                )
+                for (
+                    addressable_area_name
+                ) in potential_fixture.provided_addressable_areas:
+                    potential_cutout_fixtures.setdefault(
+                        addressable_area_name, []
+                    ).append(potential_fixture)
+
+        return cls(
+            addressable_areas=MappingProxyType(addressable_areas),
+            cutout_positions=MappingProxyType(cutout_positions),
+            cutout_fixtures=MappingProxyType(cutout_fixtures),
+            potential_cutout_fixtures=MappingProxyType(
+                {
+                    name: tuple(fixtures)
+                    for name, fixtures in potential_cutout_fixtures.items()
+                }
+            ),
+            source=deck_definition,
+        )
+
+
+# Deck definitions are loaded fresh for every engine, so indexes are shared by
+# deck ID and contents. The definitions most recently looked up are also kept
+# by identity, so repeat lookups don't have to compare contents.
+_MAX_RECENT_DECK_DEFINITIONS = 8
+_index_lock = threading.Lock()
+_indexes_by_deck_id: Dict[str, DeckDefinitionIndex] = {}
+_recent_indexes: "OrderedDict[int, Tuple[DeckDefinitionV5, DeckDefinitionIndex]]" = (
+    OrderedDict()
+)
+
+
+def get_deck_definition_index(deck_definition: DeckDefinitionV5) -> DeckDefinitionIndex:
+    """Get the index of a deck definition, building it if it hasn't been yet.
+
+    The deck definition must not be changed after this is called with it.
+    """
+    with _index_lock:
+        recent = _recent_indexes.get(id(deck_definition))
+        if recent is not None and recent[0] is deck_definition:
+            _recent_indexes.move_to_end(id(deck_definition))
+            return recent[1]
+
+        deck_id = deck_definition["otId"]
+        index = _indexes_by_deck_id.get(deck_id)
+        if index is None or index.source != deck_definition:
+            index = DeckDefinitionIndex.build(deck_definition)
+            _indexes_by_deck_id[deck_id] = index
+
+        _recent_indexes[id(deck_definition)] = (deck_definition, index)
+        if len(_recent_indexes) > _MAX_RECENT_DECK_DEFINITIONS:
+            _recent_indexes.popitem(last=False)
+        return index
+
+
 def get_cutout_position(cutout_id: str, deck_definition: DeckDefinitionV5) -> DeckPoint:
     """Get the base position of a cutout on the deck."""
-    for cutout in deck_definition["locations"]["cutouts"]:
-        if cutout_id == cutout["id"]:
-            position = cutout["position"]
-            return DeckPoint(x=position[0], y=position[1], z=position[2])
-    else:
+    index = get_deck_definition_index(deck_definition)
+    try:
+        return index.cutout_positions[cutout_id]
+    except KeyError:
         raise CutoutDoesNotExistError(f"Could not find cutout with name {cutout_id}")
 
 
@@ -34,12 +141,13 @@ def get_cutout_fixture(
     cutout_fixture_id: str, deck_definition: DeckDefinitionV5
 ) -> CutoutFixture:
     """Gets cutout fixture from deck that matches the cutout fixture ID provided."""
-    for cutout_fixture in deck_definition["cutoutFixtures"]:
-        if cutout_fixture["id"] == cutout_fixture_id:
-            return cutout_fixture
-    raise FixtureDoesNotExistError(
-        f"Could not find cutout fixture with name {cutout_fixture_id}"
-    )
+    index = get_deck_definition_index(deck_definition)
+    try:
+        return index.cutout_fixtures[cutout_fixture_id]
+    except KeyError:
+        raise FixtureDoesNotExistError(
+            f"Could not find cutout fixture with name {cutout_fixture_id}"
+        )
 
 
 def get_provided_addressable_area_names(
@@ -53,35 +161,34 @@ def get_provided_addressable_area_names(
         return []
 
 
+def get_addressable_area_definition(
+    addressable_area_name: str, deck_definition: DeckDefinitionV5
+) -> AddressableAreaDefinition:
+    """Get the definition of an addressable area from the deck definition."""
+    index = get_deck_definition_index(deck_definition)
+    try:
+        return index.addressable_areas[addressable_area_name]
+    except KeyError:
+        raise AddressableAreaDoesNotExistError(
+            f"Could not find addressable area with name {addressable_area_name}"
+        )
+
+
 def get_addressable_area_display_name(
     addressable_area_name: str, deck_definition: DeckDefinitionV5
 ) -> str:
     """Get the display name for an addressable area name."""
-    for addressable_area in deck_definition["locations"]["addressableAreas"]:
-        if addressable_area["id"] == addressable_area_name:
-            return addressable_area["displayName"]
-    raise AddressableAreaDoesNotExistError(
-        f"Could not find addressable area with name {addressable_area_name}"
-    )
+    return get_addressable_area_definition(addressable_area_name, deck_definition)[
+        "displayName"
+    ]
 
 
 def get_potential_cutout_fixtures(
     addressable_area_name: str, deck_definition: DeckDefinitionV5
 ) -> Tuple[str, Set[PotentialCutoutFixture]]:
     """Given an addressable area name, gets the cutout ID associated with it and a set of potential fixtures."""
-    potential_fixtures = []
-    for cutout_fixture in deck_definition["cutoutFixtures"]:
-        for cutout_id, provided_areas in cutout_fixture[
-            "providesAddressableAreas"
-        ].items():
-            if addressable_area_name in provided_areas:
-                potential_fixtures.append(
-                    PotentialCutoutFixture(
-                        cutout_id=cutout_id,
-                        cutout_fixture_id=cutout_fixture["id"],
-                        provided_addressable_areas=frozenset(provided_areas),
-                    )
-                )
+    index = get_deck_definition_index(deck_definition)
+    potential_fixtures = index.potential_cutout_fixtures.get(addressable_area_name, ())
     # This following logic is making the assumption that every addressable area can only go on one cutout, though
     # it may have multiple cutout fixtures that supply it on that cutout. If this assumption changes, some of the
     # following logic will have to be readjusted
@@ -102,31 +209,27 @@ def get_addressable_area_from_name(
     deck_definition: DeckDefinitionV5,
 ) -> AddressableArea:
     """Given a name and a cutout position, get an addressable area on the deck."""
-    for addressable_area in deck_definition["locations"]["addressableAreas"]:
-        if addressable_area["id"] == addressable_area_name:
-            area_offset = addressable_area["offsetFromCutoutFixture"]
-            position = AddressableOffsetVector(
-                x=area_offset[0] + cutout_position.x,
-                y=area_offset[1] + cutout_position.y,
-                z=area_offset[2] + cutout_position.z,
-            )
-            bounding_box = Dimensions(
-                x=addressable_area["boundingBox"]["xDimension"],
-                y=addressable_area["boundingBox"]["yDimension"],
-                z=addressable_area["boundingBox"]["zDimension"],
-            )
+    addressable_area = get_addressable_area_definition(
+        addressable_area_name, deck_definition
+    )
+    area_offset = addressable_area["offsetFromCutoutFixture"]
+    position = AddressableOffsetVector(
+        x=area_offset[0] + cutout_position.x,
+        y=area_offset[1] + cutout_position.y,
+        z=area_offset[2] + cutout_position.z,
+    )
+    bounding_box = Dimensions(
+        x=addressable_area["boundingBox"]["xDimension"],
+        y=addressable_area["boundingBox"]["yDimension"],
+        z=addressable_area["boundingBox"]["zDimension"],
+    )
 
-            return AddressableArea(
-                area_name=addressable_area["id"],
-                area_type=AreaType(addressable_area["areaType"]),
-                base_slot=base_slot,
-                display_name=addressable_area["displayName"],
-                bounding_box=bounding_box,
-                position=position,
-                compatible_module_types=addressable_area.get(
-                    "compatibleModuleTypes", []
-                ),
-            )
-    raise AddressableAreaDoesNotExistError(
-        f"Could not find addressable area with name {addressable_area_name}"
+    return AddressableArea(
+        area_name=addressable_area["id"],
+        area_type=AreaType(addressable_area["areaType"]),
+        base_slot=base_slot,
+        display_name=addressable_area["displayName"],
+        bounding_box=bounding_box,
+        position=position,
+        compatible_module_types=addressable_area.get("compatibleModuleTypes", []),
     )
@@ -56,8 +56,9 @@ class LabwareDataProvider:
     ) -> float:
         """Get the calibrated tip length of a tip rack / pipette pair.
 
-        Note: this method hits the filesystem, which will have performance
-        implications if it is called often.
+        Note: the first call for each pipette reads its calibration file from the
+        filesystem. Later calls are served from memory, but still check that the
+        file hasn't changed.
         """
         return await to_thread.run_sync(
             LabwareDataProvider._get_calibrated_tip_length_sync,
@@ -504,20 +504,18 @@ class AddressableAreaView(HasState[AddressableAreaState]):
         addressable_area_name: str,
     ) -> Point:
         """Get the offset form cutout fixture of an addressable area."""
-        for addressable_area in self.state.deck_definition["locations"][
-            "addressableAreas"
-        ]:
-            if addressable_area["id"] == addressable_area_name:
-                area_offset = addressable_area["offsetFromCutoutFixture"]
-                position = Point(
-                    x=area_offset[0],
-                    y=area_offset[1],
-                    z=area_offset[2],
+        try:
+            addressable_area = (
+                deck_configuration_provider.get_addressable_area_definition(
+                    addressable_area_name, self.state.deck_definition
                 )
-                return Point(x=position.x, y=position.y, z=position.z)
-        raise ValueError(
-            f"No matching addressable area named {addressable_area_name} identified."
-        )
+            )
+        except AddressableAreaDoesNotExistError:
+            raise ValueError(
+                f"No matching addressable area named {addressable_area_name} identified."
+            )
+        area_offset = addressable_area["offsetFromCutoutFixture"]
+        return Point(x=area_offset[0], y=area_offset[1], z=area_offset[2])
 
     def get_addressable_area_bounding_box(
         self,
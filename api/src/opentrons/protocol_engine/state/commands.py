@@ -229,6 +229,9 @@ class CommandState:
     error_recovery_policy: ErrorRecoveryPolicy
     """See `CommandView.get_error_recovery_policy()`."""
 
+    version: int
+    """See `CommandView.get_version()`."""
+
 
 class CommandStore(HasState[CommandState], HandlesActions):
     """Command state container for run-level command concerns."""
@@ -261,10 +264,12 @@ class CommandStore(HasState[CommandState], HandlesActions):
             failed_command_errors=[],
             error_recovery_policy=error_recovery_policy,
             has_entered_error_recovery=False,
+            version=0,
         )
 
     def handle_action(self, action: Action) -> None:
         """Modify state in reaction to an action."""
+        self._state.version += 1
         match action:
             case QueueCommandAction():
                 self._handle_queue_command_action(action)
@@ -682,6 +687,16 @@ class CommandView(HasState[CommandState]):
         else:
             return run_error or finish_error
 
+    def get_version(self) -> int:
+        """Get a number that increases whenever engine state might have changed.
+
+        Every action that the engine handles increments this, even ones that
+        don't touch command state, so clients can compare versions to tell
+        whether anything in the run (commands, errors, labware, status...)
+        could be different since they last looked.
+        """
+        return self._state.version
+
     def get_all_errors(self) -> List[ErrorOccurrence]:
         """Get the run's full error list, if there was none, returns an empty list."""
         return self._state.failed_command_errors
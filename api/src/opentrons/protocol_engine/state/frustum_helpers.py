@@ -1,6 +1,12 @@
 """Helper functions for liquid-level related calculations inside a given frustum."""
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from threading import Lock
 from typing import List, Tuple
+
+import numpy as np
 from numpy import pi, iscomplex, roots, real
+from numpy.typing import ArrayLike, NDArray
 from math import isclose
 
 from ..errors.exceptions import InvalidLiquidHeightFound
@@ -262,8 +268,8 @@ def height_at_volume_within_section(
         case ConicalFrustum():
             return _height_from_volume_circular(
                 volume=target_volume_relative,
-                top_radius=(section.bottomDiameter / 2),
-                bottom_radius=(section.topDiameter / 2),
+                bottom_radius=(section.bottomDiameter / 2),
+                top_radius=(section.topDiameter / 2),
                 total_frustum_height=section_height,
             )
         case CuboidalFrustum():
@@ -317,100 +323,297 @@ def volume_at_height_within_section(
             )
 
 
-def _find_volume_in_partial_frustum(
-    sorted_well: List[WellSegment],
-    target_height: float,
-) -> float:
-    """Look through a sorted list of frusta for a target height, and find the volume at that height."""
-    for segment in sorted_well:
-        if segment.bottomHeight < target_height < segment.topHeight:
-            relative_target_height = target_height - segment.bottomHeight
-            section_height = segment.topHeight - segment.bottomHeight
-            return volume_at_height_within_section(
-                section=segment,
-                target_height_relative=relative_target_height,
-                section_height=section_height,
+def _segment_volume_polynomial(segment: WellSegment) -> Tuple[float, float, float]:
+    """Coefficients (a, b, c) of a segment's volume a*h^3 + b*h^2 + c*h at relative height h."""
+    section_height = segment.topHeight - segment.bottomHeight
+    match segment:
+        case SphericalSegment():
+            return -1 * pi / 3, pi * segment.radiusOfCurvature, 0.0
+        case CuboidalFrustum():
+            return _rectangular_frustum_polynomial_roots(
+                bottom_length=segment.bottomYDimension,
+                bottom_width=segment.bottomXDimension,
+                top_length=segment.topYDimension,
+                top_width=segment.topXDimension,
+                total_frustum_height=section_height,
+            )
+        case ConicalFrustum():
+            return _circular_frustum_polynomial_roots(
+                bottom_radius=(segment.bottomDiameter / 2),
+                top_radius=(segment.topDiameter / 2),
+                total_frustum_height=section_height,
+            )
+        case _:
+            raise NotImplementedError(
+                f"volume calculation for shape: {segment.shape} not yet implemented."
             )
-    # if we've looked through all sections and can't find the target volume, raise an error
-    raise InvalidLiquidHeightFound(
-        f"Unable to find volume at given well-height {target_height}."
-    )
 
 
-def find_volume_at_well_height(
-    target_height: float, well_geometry: InnerWellGeometry
+# Stop refining a height once a step moves it by less than this, in mm.
+_HEIGHT_TOLERANCE = 1e-9
+# Enough for bisection alone to reach _HEIGHT_TOLERANCE in any real well.
+_MAX_HEIGHT_ITERATIONS = 100
+
+
+def _solve_section_height(
+    coefficients: Tuple[float, float, float],
+    relative_volume: float,
+    section_height: float,
 ) -> float:
-    """Find the volume within a well, at a known height."""
-    volumetric_capacity = get_well_volumetric_capacity(well_geometry)
-    max_height = volumetric_capacity[-1][0]
-    if target_height < 0 or target_height > max_height:
-        raise InvalidLiquidHeightFound("Invalid target height.")
-    # volumes in volumetric_capacity are relative to each frustum,
-    # so we have to find the volume of all the full sections enclosed
-    # beneath the target height
-    closed_section_volume = 0.0
-    for boundary_height, section_volume in volumetric_capacity:
-        if boundary_height > target_height:
-            break
-        closed_section_volume += section_volume
-        # if target height is a boundary cross-section, we already know the volume
-        if target_height == boundary_height:
-            return closed_section_volume
-    # find the section the target height is in and compute the volume
+    """Find the relative height at which a section holds a volume.
+
+    A section's volume only grows with height, so this is safeguarded Newton's
+    method: any step that would leave the bracket around the root bisects instead.
+    """
+    a, b, c = coefficients
+    low, high = 0.0, section_height
+    height = section_height / 2
+    for _ in range(_MAX_HEIGHT_ITERATIONS):
+        error = a * height**3 + b * height**2 + c * height - relative_volume
+        if error > 0:
+            high = height
+        else:
+            low = height
+        slope = 3 * a * height**2 + 2 * b * height + c
+        next_height = (low + high) / 2
+        if slope > 0 and low <= height - error / slope <= high:
+            next_height = height - error / slope
+        if abs(next_height - height) < _HEIGHT_TOLERANCE:
+            return next_height
+        height = next_height
+    return height
 
-    sorted_well = sorted(well_geometry.sections, key=lambda section: section.topHeight)
-    partial_volume = _find_volume_in_partial_frustum(
-        sorted_well=sorted_well,
-        target_height=target_height,
-    )
-    return partial_volume + closed_section_volume
+
+def _solve_section_heights(
+    a: NDArray[np.float64],
+    b: NDArray[np.float64],
+    c: NDArray[np.float64],
+    relative_volumes: NDArray[np.float64],
+    section_heights: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """Like `_solve_section_height()`, for many volumes in their own sections at once."""
+    low = np.zeros_like(relative_volumes)
+    high = section_heights.copy()
+    heights = section_heights / 2
+    # Newton steps that divide by a zero slope are discarded below.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for _ in range(_MAX_HEIGHT_ITERATIONS):
+            errors = ((a * heights + b) * heights + c) * heights - relative_volumes
+            too_high = errors > 0
+            high = np.where(too_high, heights, high)
+            low = np.where(too_high, low, heights)
+            slopes = (3 * a * heights + 2 * b) * heights + c
+            next_heights = heights - errors / slopes
+            next_heights = np.where(
+                (slopes > 0) & (next_heights >= low) & (next_heights <= high),
+                next_heights,
+                (low + high) / 2,
+            )
+            converged = np.all(np.abs(next_heights - heights) < _HEIGHT_TOLERANCE)
+            heights = next_heights
+            if converged:
+                break
+    return heights
 
 
-def _find_height_in_partial_frustum(
-    sorted_well: List[WellSegment],
-    volumetric_capacity: List[Tuple[float, float]],
-    target_volume: float,
-) -> float:
-    """Look through a sorted list of frusta for a target volume, and find the height at that volume."""
-    bottom_section_volume = 0.0
-    for section, capacity in zip(sorted_well, volumetric_capacity):
-        section_top_height, section_volume = capacity
-        if (
-            bottom_section_volume
-            < target_volume
-            < (bottom_section_volume + section_volume)
+class WellVolumeTable:
+    """A well's inner geometry, compiled for converting between heights and volumes.
+
+    The well's sections are sorted once, and the volume enclosed beneath each
+    section is summed once, so a conversion only has to look up its section and
+    evaluate or invert that section's volume polynomial.
+
+    Use `get_well_volume_table()` instead of building these directly, so that each
+    well geometry is only compiled once.
+    """
+
+    def __init__(self, well_geometry: InnerWellGeometry) -> None:
+        """Compile a well geometry."""
+        sorted_well = sorted(
+            well_geometry.sections, key=lambda section: section.topHeight
+        )
+        self._bottom_heights = [section.bottomHeight for section in sorted_well]
+        self._top_heights = [section.topHeight for section in sorted_well]
+        self._coefficients = [
+            _segment_volume_polynomial(section) for section in sorted_well
+        ]
+        # _enclosed_volumes[i] is the volume of all sections beneath section i.
+        # The last entry is the volume of the whole well.
+        self._enclosed_volumes = [0.0]
+        for section in sorted_well:
+            self._enclosed_volumes.append(
+                self._enclosed_volumes[-1] + _get_segment_capacity(section)
+            )
+
+        self._bottom_heights_array = np.array(self._bottom_heights, dtype=np.float64)
+        self._top_heights_array = np.array(self._top_heights, dtype=np.float64)
+        self._enclosed_volumes_array = np.array(
+            self._enclosed_volumes, dtype=np.float64
+        )
+        coefficients = np.array(self._coefficients, dtype=np.float64)
+        self._a, self._b, self._c = (
+            coefficients[:, 0],
+            coefficients[:, 1],
+            coefficients[:, 2],
+        )
+
+    @property
+    def max_height(self) -> float:
+        """The height of the top of the well."""
+        return self._top_heights[-1]
+
+    @property
+    def max_volume(self) -> float:
+        """The volume of the whole well."""
+        return self._enclosed_volumes[-1]
+
+    def volume_at_height(self, target_height: float) -> float:
+        """Find the volume within the well, at a known height."""
+        if target_height < 0 or target_height > self.max_height:
+            raise InvalidLiquidHeightFound("Invalid target height.")
+        index = bisect_right(self._top_heights, target_height)
+        # if target height is a boundary cross-section, we already know the volume
+        if index > 0 and self._top_heights[index - 1] == target_height:
+            return self._enclosed_volumes[index]
+        if index < len(self._top_heights) and (
+            self._bottom_heights[index] < target_height
         ):
-            relative_target_volume = target_volume - bottom_section_volume
-            section_height = section.topHeight - section.bottomHeight
-            partial_height = height_at_volume_within_section(
-                section=section,
-                target_volume_relative=relative_target_volume,
-                section_height=section_height,
+            a, b, c = self._coefficients[index]
+            relative_height = target_height - self._bottom_heights[index]
+            partial_volume = (
+                a * relative_height**3
+                + b * relative_height**2
+                + c * relative_height
             )
-            return partial_height + section.bottomHeight
-        # bottom section volume should always be the volume enclosed in the previously
-        # viewed section
-        bottom_section_volume += section_volume
-
-    # if we've looked through all sections and can't find the target volume, raise an error
-    raise InvalidLiquidHeightFound(
-        f"Unable to find height at given volume {target_volume}."
-    )
+            return partial_volume + self._enclosed_volumes[index]
+        raise InvalidLiquidHeightFound(
+            f"Unable to find volume at given well-height {target_height}."
+        )
+
+    def height_at_volume(self, target_volume: float) -> float:
+        """Find the height within the well, at a known volume."""
+        if target_volume < 0 or target_volume > self.max_volume:
+            raise InvalidLiquidHeightFound("Invalid target volume.")
+        index = bisect_left(self._enclosed_volumes, target_volume) - 1
+        if index < 0 or target_volume >= self._enclosed_volumes[index + 1]:
+            raise InvalidLiquidHeightFound(
+                f"Unable to find height at given volume {target_volume}."
+            )
+        bottom_height = self._bottom_heights[index]
+        partial_height = _solve_section_height(
+            coefficients=self._coefficients[index],
+            relative_volume=target_volume - self._enclosed_volumes[index],
+            section_height=self._top_heights[index] - bottom_height,
+        )
+        return round(partial_height, 4) + bottom_height
+
+    def volumes_at_heights(self, target_heights: ArrayLike) -> NDArray[np.float64]:
+        """Like `volume_at_height()`, for many heights at once."""
+        heights = np.asarray(target_heights, dtype=np.float64)
+        if np.any((heights < 0) | (heights > self.max_height)):
+            raise InvalidLiquidHeightFound("Invalid target height.")
+        index = np.searchsorted(self._top_heights_array, heights, side="right")
+        on_boundary = (index > 0) & (self._top_heights_array[index - 1] == heights)
+        section = np.minimum(index, len(self._top_heights) - 1)
+        inside = (index < len(self._top_heights)) & (
+            self._bottom_heights_array[section] < heights
+        )
+        not_found = ~(on_boundary | inside)
+        if np.any(not_found):
+            raise InvalidLiquidHeightFound(
+                f"Unable to find volume at given well-height {heights[not_found][0]}."
+            )
+        relative_heights = heights - self._bottom_heights_array[section]
+        partial_volumes = (
+            self._a[section] * relative_heights**3
+            + self._b[section] * relative_heights**2
+            + self._c[section] * relative_heights
+        )
+        volumes: NDArray[np.float64] = (
+            np.where(on_boundary, 0.0, partial_volumes)
+            + self._enclosed_volumes_array[index]
+        )
+        return volumes
+
+    def heights_at_volumes(self, target_volumes: ArrayLike) -> NDArray[np.float64]:
+        """Like `height_at_volume()`, for many volumes at once."""
+        volumes = np.asarray(target_volumes, dtype=np.float64)
+        if np.any((volumes < 0) | (volumes > self.max_volume)):
+            raise InvalidLiquidHeightFound("Invalid target volume.")
+        index = np.searchsorted(self._enclosed_volumes_array, volumes, side="left") - 1
+        section = np.maximum(index, 0)
+        found = (index >= 0) & (volumes < self._enclosed_volumes_array[section + 1])
+        if not np.all(found):
+            raise InvalidLiquidHeightFound(
+                f"Unable to find height at given volume {volumes[~found][0]}."
+            )
+        bottom_heights = self._bottom_heights_array[section]
+        partial_heights = _solve_section_heights(
+            a=self._a[section],
+            b=self._b[section],
+            c=self._c[section],
+            relative_volumes=volumes - self._enclosed_volumes_array[section],
+            section_heights=self._top_heights_array[section] - bottom_heights,
+        )
+        heights: NDArray[np.float64] = np.round(partial_heights, 4) + bottom_heights
+        return heights
+
+
+# Labware definitions each have a handful of well geometries, and a protocol only
+# loads so many definitions, so this comfortably holds every well a protocol uses.
+_WELL_VOLUME_TABLE_CACHE_SIZE = 128
+
+_well_volume_tables: "OrderedDict[int, Tuple[InnerWellGeometry, WellVolumeTable]]" = (
+    OrderedDict()
+)
+_well_volume_tables_lock = Lock()
+
+
+def get_well_volume_table(well_geometry: InnerWellGeometry) -> WellVolumeTable:
+    """Get the compiled `WellVolumeTable` for a well geometry.
+
+    Tables are cached by the identity of the well geometry object. That works
+    because well geometries belong to labware definitions, which are loaded once
+    and never modified. Each cache entry keeps its well geometry alive, so its
+    identity can't be reused by another object.
+    """
+    key = id(well_geometry)
+    with _well_volume_tables_lock:
+        cached = _well_volume_tables.get(key)
+        if cached is not None:
+            _well_volume_tables.move_to_end(key)
+            return cached[1]
+    table = WellVolumeTable(well_geometry)
+    with _well_volume_tables_lock:
+        _well_volume_tables[key] = (well_geometry, table)
+        if len(_well_volume_tables) > _WELL_VOLUME_TABLE_CACHE_SIZE:
+            _well_volume_tables.popitem(last=False)
+    return table
+
+
+def find_volume_at_well_height(
+    target_height: float, well_geometry: InnerWellGeometry
+) -> float:
+    """Find the volume within a well, at a known height."""
+    return get_well_volume_table(well_geometry).volume_at_height(target_height)
 
 
 def find_height_at_well_volume(
     target_volume: float, well_geometry: InnerWellGeometry
 ) -> float:
     """Find the height within a well, at a known volume."""
-    volumetric_capacity = get_well_volumetric_capacity(well_geometry)
-    max_volume = sum(row[1] for row in volumetric_capacity)
-    if target_volume < 0 or target_volume > max_volume:
-        raise InvalidLiquidHeightFound("Invalid target volume.")
+    return get_well_volume_table(well_geometry).height_at_volume(target_volume)
 
-    sorted_well = sorted(well_geometry.sections, key=lambda section: section.topHeight)
-    # find the section the target volume is in and compute the height
-    return _find_height_in_partial_frustum(
-        sorted_well=sorted_well,
-        volumetric_capacity=volumetric_capacity,
-        target_volume=target_volume,
-    )
+
+def find_volumes_at_well_heights(
+    target_heights: ArrayLike, well_geometry: InnerWellGeometry
+) -> NDArray[np.float64]:
+    """Find the volumes within a well, at many known heights at once."""
+    return get_well_volume_table(well_geometry).volumes_at_heights(target_heights)
+
+
+def find_heights_at_well_volumes(
+    target_volumes: ArrayLike, well_geometry: InnerWellGeometry
+) -> NDArray[np.float64]:
+    """Find the heights within a well, at many known volumes at once."""
+    return get_well_volume_table(well_geometry).heights_at_volumes(target_volumes)
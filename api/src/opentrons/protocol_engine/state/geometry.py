@@ -1411,6 +1411,47 @@ class GeometryView:
         else:
             return meniscus_height
 
+    def get_predicted_liquid_height(
+        self,
+        labware_id: str,
+        well_name: str,
+    ) -> Optional[float]:
+        """Return the liquid height in a well, predicted from its last measured height.
+
+        The measured height is adjusted by the volume added to or removed from the
+        well since it was measured. Like the measured height, the prediction is with
+        reference to the well bottom.
+
+        Returns None if the liquid height can't be predicted. If it can't be predicted
+        exactly, but the well's liquid can only have gone down since it was measured,
+        returns the measured height as an upper bound.
+        """
+        measured_height = self._wells.get_last_measured_liquid_height(
+            labware_id=labware_id, well_name=well_name
+        )
+        volume_added = self._wells.get_volume_added_since_measured(
+            labware_id=labware_id, well_name=well_name
+        )
+        if measured_height is None or volume_added is None:
+            return None
+        if volume_added == 0:
+            return measured_height
+        try:
+            well_geometry = self._labware.get_well_geometry(labware_id, well_name)
+            return self.get_well_height_after_volume(
+                well_geometry=well_geometry,
+                initial_height=measured_height,
+                volume=volume_added,
+            )
+        except (
+            errors.IncompleteLabwareDefinitionError,
+            errors.IncompleteWellDefinitionError,
+            errors.InvalidLiquidHeightFound,
+            # Not every well shape's volume can be calculated yet.
+            NotImplementedError,
+        ):
+            return measured_height if volume_added < 0 else None
+
     def get_well_handling_height(
         self,
         labware_id: str,
@@ -175,6 +175,21 @@ class TipsUsedUpdate:
     """
 
 
+@dataclasses.dataclass
+class LiquidOperatedUpdate:
+    """Represents an update that marks a well's liquid as added to or removed from."""
+
+    labware_id: str
+
+    well_name: str
+
+    volume_added: float | ClearType
+    """The volume added to the well, in µL. Negative if liquid was removed.
+
+    `CLEAR` means an unknown volume was added.
+    """
+
+
 @dataclasses.dataclass
 class StateUpdate:
     """Represents an update to perform on engine state."""
@@ -195,6 +210,12 @@ class StateUpdate:
 
     tips_used: TipsUsedUpdate | NoChangeType = NO_CHANGE
 
+    liquid_operated: LiquidOperatedUpdate | NoChangeType | ClearType = NO_CHANGE
+    """A well whose liquid was operated on.
+
+    `CLEAR` means the well is unknown, so any well might have been operated on.
+    """
+
     # These convenience functions let the caller avoid the boilerplate of constructing a
     # complicated dataclass tree.
 
@@ -330,3 +351,15 @@ class StateUpdate:
         self.tips_used = TipsUsedUpdate(
             pipette_id=pipette_id, labware_id=labware_id, well_name=well_name
         )
+
+    def mark_liquid_operated(
+        self, labware_id: str, well_name: str, volume_added: float | ClearType
+    ) -> None:
+        """Mark a well's liquid as operated on. See `LiquidOperatedUpdate`."""
+        self.liquid_operated = LiquidOperatedUpdate(
+            labware_id=labware_id, well_name=well_name, volume_added=volume_added
+        )
+
+    def mark_unknown_liquid_operated(self) -> None:
+        """Mark that liquid was operated on in an unknown well."""
+        self.liquid_operated = CLEAR
@@ -6,10 +6,12 @@ from opentrons.protocol_engine.actions.actions import (
     FailCommandAction,
     SucceedCommandAction,
 )
+from opentrons.protocol_engine.actions.get_state_update import get_state_update
 from opentrons.protocol_engine.commands.liquid_probe import LiquidProbeResult
 from opentrons.protocol_engine.commands.pipetting_common import LiquidNotFoundError
 from opentrons.protocol_engine.types import LiquidHeightInfo, LiquidHeightSummary
 
+from . import update_types
 from ._abstract_store import HasState, HandlesActions
 from ..actions import Action
 from ..commands import Command
@@ -20,6 +22,11 @@ class WellState:
     """State of all wells."""
 
     measured_liquid_heights: Dict[str, Dict[str, LiquidHeightInfo]]
+    volume_added_since_measured: Dict[str, Dict[str, Optional[float]]]
+    """The net µL added to each measured well since it was measured, by labware ID.
+
+    `None` if an unknown volume was added. Wells with nothing added are left out.
+    """
 
 
 class WellStore(HasState[WellState], HandlesActions):
@@ -29,7 +36,9 @@ class WellStore(HasState[WellState], HandlesActions):
 
     def __init__(self) -> None:
         """Initialize a well store and its state."""
-        self._state = WellState(measured_liquid_heights={})
+        self._state = WellState(
+            measured_liquid_heights={}, volume_added_since_measured={}
+        )
 
     def handle_action(self, action: Action) -> None:
         """Modify state in reaction to an action."""
@@ -38,6 +47,10 @@ class WellStore(HasState[WellState], HandlesActions):
         if isinstance(action, FailCommandAction):
             self._handle_failed_command(action)
 
+        state_update = get_state_update(action)
+        if state_update is not None:
+            self._handle_liquid_operated(state_update)
+
     def _handle_succeeded_command(self, command: Command) -> None:
         if isinstance(command.result, LiquidProbeResult):
             self._set_liquid_height(
@@ -56,6 +69,31 @@ class WellStore(HasState[WellState], HandlesActions):
                 time=action.failed_at,
             )
 
+    def _handle_liquid_operated(self, state_update: update_types.StateUpdate) -> None:
+        liquid_operated_update = state_update.liquid_operated
+        if liquid_operated_update == update_types.NO_CHANGE:
+            return
+        elif liquid_operated_update == update_types.CLEAR:
+            for labware_id, wells in self._state.measured_liquid_heights.items():
+                self._state.volume_added_since_measured.setdefault(
+                    labware_id, {}
+                ).update(dict.fromkeys(wells.keys()))
+        else:
+            labware_id = liquid_operated_update.labware_id
+            well_name = liquid_operated_update.well_name
+            if well_name not in self._state.measured_liquid_heights.get(labware_id, {}):
+                return
+            volumes_added = self._state.volume_added_since_measured.setdefault(
+                labware_id, {}
+            )
+            previous_volume = volumes_added.get(well_name, 0.0)
+            volume_added = liquid_operated_update.volume_added
+            volumes_added[well_name] = (
+                None
+                if previous_volume is None or volume_added == update_types.CLEAR
+                else previous_volume + volume_added
+            )
+
     def _set_liquid_height(
         self, labware_id: str, well_name: str, height: float, time: datetime
     ) -> None:
@@ -64,6 +102,7 @@ class WellStore(HasState[WellState], HandlesActions):
         if labware_id not in self._state.measured_liquid_heights:
             self._state.measured_liquid_heights[labware_id] = {}
         self._state.measured_liquid_heights[labware_id][well_name] = lhi
+        self._state.volume_added_since_measured.get(labware_id, {}).pop(well_name, None)
 
 
 class WellView(HasState[WellState]):
@@ -119,6 +158,18 @@ class WellView(HasState[WellState]):
         except KeyError:
             return None
 
+    def get_volume_added_since_measured(
+        self, labware_id: str, well_name: str
+    ) -> Optional[float]:
+        """Returns the net volume added to the well since its most recent liquid level probe.
+
+        The volume is in µL, and negative if liquid was removed.
+        Returns None if an unknown volume was added, like by a blow-out.
+        """
+        return self._state.volume_added_since_measured.get(labware_id, {}).get(
+            well_name, 0.0
+        )
+
     def has_measured_liquid_height(self, labware_id: str, well_name: str) -> bool:
         """Returns True if the well has been liquid level probed previously."""
         try:
@@ -1,5 +1,5 @@
 """Translation of JSON protocol commands into ProtocolEngine commands."""
-from typing import cast, List, Union, Iterator
+from typing import cast, List, Optional, Sequence, Set, Union, Iterator
 from pydantic import parse_obj_as, ValidationError as PydanticValidationError
 
 from opentrons_shared_data.pipette.types import PipetteNameType
@@ -214,6 +214,64 @@ class JsonTranslator:
             for liquid_id, liquid in protocol_liquids.items()
         ]
 
+    def validate_commands(
+        self,
+        commands: Sequence[pe_commands.CommandCreate],
+        liquids: Sequence[Liquid],
+    ) -> None:
+        """Look ahead through translated commands for references to unloaded things.
+
+        Each command is already valid on its own, but one that refers to a pipette,
+        module, or liquid that no earlier command loads would fail partway through
+        a run, after the robot has already done part of the protocol. Checking the
+        whole list up front fails the protocol before anything has moved.
+
+        Labware references are not checked, because some labware, like the OT-2's
+        fixed trash, is loaded without any command.
+
+        Raises:
+            InvalidProtocolData: A command refers to a pipette, module, or liquid
+                that isn't loaded before it.
+        """
+        # None if a load command didn't specify an ID, so we can't know the
+        # ID that the engine will give it.
+        pipette_ids: Optional[Set[str]] = set()
+        module_ids: Optional[Set[str]] = set()
+        liquid_ids = {liquid.id for liquid in liquids}
+
+        for index, command in enumerate(commands):
+            if isinstance(command, pe_commands.LoadPipetteCreate):
+                pipette_id = command.params.pipetteId
+                if pipette_ids is not None and pipette_id is not None:
+                    pipette_ids.add(pipette_id)
+                else:
+                    pipette_ids = None
+            elif isinstance(command, pe_commands.LoadModuleCreate):
+                module_id = command.params.moduleId
+                if module_ids is not None and module_id is not None:
+                    module_ids.add(module_id)
+                else:
+                    module_ids = None
+            elif isinstance(command, pe_commands.LoadLiquidCreate):
+                _check_reference(
+                    index, command, "liquid", command.params.liquidId, liquid_ids
+                )
+            else:
+                _check_reference(
+                    index,
+                    command,
+                    "pipette",
+                    getattr(command.params, "pipetteId", None),
+                    pipette_ids,
+                )
+                _check_reference(
+                    index,
+                    command,
+                    "module",
+                    getattr(command.params, "moduleId", None),
+                    module_ids,
+                )
+
     def translate_commands(
         self,
         protocol: Union[ProtocolSchemaV8, ProtocolSchemaV7, ProtocolSchemaV6],
@@ -284,3 +342,21 @@ class JsonTranslator:
                     )
 
         return list(translate_all_commands())
+
+
+def _check_reference(
+    index: int,
+    command: pe_commands.CommandCreate,
+    kind: str,
+    referenced_id: Optional[str],
+    loaded_ids: Optional[Set[str]],
+) -> None:
+    if referenced_id is None or loaded_ids is None or referenced_id in loaded_ids:
+        return
+    raise InvalidProtocolData(
+        message=(
+            f'The protocol is invalid because command {index + 1}, "{command.commandType}",'
+            f' uses {kind} "{referenced_id}", which is not loaded before it.'
+        ),
+        detail={"kind": f"unknown-{kind}", "commandIndex": str(index)},
+    )
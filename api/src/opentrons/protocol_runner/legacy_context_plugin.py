@@ -2,9 +2,12 @@
 from __future__ import annotations
 
 import asyncio
+import threading
+from collections import deque
 from contextlib import ExitStack
-from typing import Optional
+from typing import Deque, List, Optional
 
+from opentrons.legacy_commands import types as legacy_command_types
 from opentrons.legacy_commands.types import CommandMessage as LegacyCommand
 from opentrons.legacy_broker import LegacyBroker
 from opentrons.protocol_api.core.legacy.load_info import LoadInfo
@@ -27,6 +30,11 @@ class LegacyContextPlugin(AbstractPlugin):
     This plugin allows a ProtocolEngine to subscribe to what is being done with the
     legacy ProtocolContext, and insert matching commands into ProtocolEngine state for
     purely progress-tracking purposes.
+
+    The APIv2 protocol doesn't wait for each of those commands to be inserted.
+    They're queued up, in order, and the engine loop inserts them in batches. If
+    inserting one fails, the APIv2 protocol raises the error the next time it
+    reports something. The queue is flushed at pauses and when the run ends.
     """
 
     def __init__(
@@ -45,6 +53,12 @@ class LegacyContextPlugin(AbstractPlugin):
 
         self._subscription_exit_stack: Optional[ExitStack] = None
 
+        # Actions mapped in the APIv2 protocol's thread, waiting for the engine loop.
+        self._pending_actions: Deque[pe_actions.Action] = deque()
+        self._pending_actions_lock = threading.Lock()
+        self._dispatch_scheduled = False
+        self._dispatch_error: Optional[Exception] = None
+
     def setup(self) -> None:
         """Set up the plugin.
 
@@ -80,6 +94,7 @@ class LegacyContextPlugin(AbstractPlugin):
         Called by Protocol Engine.
         At this point, the APIv2 protocol script must have exited.
         """
+        self._dispatch_pending_actions()
         if self._subscription_exit_stack is not None:
             self._subscription_exit_stack.close()
             self._subscription_exit_stack = None
@@ -89,16 +104,29 @@ class LegacyContextPlugin(AbstractPlugin):
         # TODO(jbl 2022-07-06) handle_action stub should be completely removed
         pass
 
+    def flush(self) -> None:
+        """Insert every command that the APIv2 protocol has reported so far.
+
+        Must be called from the engine loop. Call this once the APIv2 protocol
+        has exited, so it isn't left with commands that haven't been inserted.
+
+        Raises:
+            Exception: Inserting a command failed, and the APIv2 protocol
+                hasn't raised the error itself yet.
+        """
+        self._dispatch_pending_actions()
+        self._raise_dispatch_error()
+
     def _handle_legacy_command(self, command: LegacyCommand) -> None:
         """Handle a command reported by the legacy APIv2 protocol.
 
         Used as a broker callback, so this will run in the APIv2 protocol's thread.
         """
         pe_actions = self._legacy_command_mapper.map_command(command=command)
-        future = asyncio.run_coroutine_threadsafe(
-            self._dispatch_action_list(pe_actions), self._engine_loop
-        )
-        future.result()
+        self._enqueue_action_list(pe_actions)
+        if command["name"] == legacy_command_types.PAUSE:
+            # Make sure the run shows the pause before the protocol waits on it.
+            self._flush_from_protocol_thread()
 
     def _handle_equipment_loaded(self, load_info: LoadInfo) -> None:
         """Handle an equipment load reported by the legacy APIv2 protocol.
@@ -106,11 +134,49 @@ class LegacyContextPlugin(AbstractPlugin):
         Used as a broker callback, so this will run in the APIv2 protocol's thread.
         """
         pe_actions = self._legacy_command_mapper.map_equipment_load(load_info=load_info)
+        self._enqueue_action_list(pe_actions)
+
+    def _enqueue_action_list(self, actions: List[pe_actions.Action]) -> None:
+        """Queue actions to be dispatched by the engine loop, from the APIv2 thread."""
+        self._raise_dispatch_error()
+        if not actions:
+            return
+        with self._pending_actions_lock:
+            self._pending_actions.extend(actions)
+            schedule_dispatch = not self._dispatch_scheduled
+            self._dispatch_scheduled = True
+        if schedule_dispatch:
+            self._engine_loop.call_soon_threadsafe(self._dispatch_pending_actions)
+
+    def _flush_from_protocol_thread(self) -> None:
+        """Wait for the engine loop to dispatch every queued action."""
         future = asyncio.run_coroutine_threadsafe(
-            self._dispatch_action_list(pe_actions), self._engine_loop
+            self._dispatch_pending_actions_async(), self._engine_loop
         )
         future.result()
+        self._raise_dispatch_error()
+
+    async def _dispatch_pending_actions_async(self) -> None:
+        self._dispatch_pending_actions()
 
-    async def _dispatch_action_list(self, actions: list[pe_actions.Action]) -> None:
+    def _dispatch_pending_actions(self) -> None:
+        """Dispatch every queued action, in order. Runs in the engine loop."""
+        with self._pending_actions_lock:
+            actions = list(self._pending_actions)
+            self._pending_actions.clear()
+            self._dispatch_scheduled = False
         for action in actions:
-            self.dispatch(action)
+            if self._dispatch_error is not None:
+                # The APIv2 protocol would have stopped at the failed command if it
+                # had waited for it, so it's as if the rest were never reported.
+                return
+            try:
+                self.dispatch(action)
+            except Exception as e:
+                self._dispatch_error = e
+
+    def _raise_dispatch_error(self) -> None:
+        error = self._dispatch_error
+        if error is not None:
+            self._dispatch_error = None
+            raise error
@@ -216,16 +216,16 @@ class PythonAndLegacyRunner(AbstractRunner):
         else:
             run_time_parameters_with_overrides = None
         equipment_broker = None
+        legacy_context_plugin = None
 
         if protocol.api_level < LEGACY_PYTHON_API_VERSION_CUTOFF:
             equipment_broker = Broker[LoadInfo]()
-            self._protocol_engine.add_plugin(
-                LegacyContextPlugin(
-                    engine_loop=asyncio.get_running_loop(),
-                    broker=self._broker,
-                    equipment_broker=equipment_broker,
-                )
+            legacy_context_plugin = LegacyContextPlugin(
+                engine_loop=asyncio.get_running_loop(),
+                broker=self._broker,
+                equipment_broker=equipment_broker,
             )
+            self._protocol_engine.add_plugin(legacy_context_plugin)
             self._hardware_api.should_taskify_movement_execution(taskify=True)
         else:
             self._hardware_api.should_taskify_movement_execution(taskify=False)
@@ -249,6 +249,9 @@ class PythonAndLegacyRunner(AbstractRunner):
                 context=context,
                 run_time_parameters_with_overrides=run_time_parameters_with_overrides,
             )
+            if legacy_context_plugin is not None:
+                # Record the protocol's last few commands before the run finishes.
+                legacy_context_plugin.flush()
 
         self._task_queue.set_run_func(run_func)
 
@@ -333,6 +336,14 @@ class JsonRunner(AbstractRunner):
             self._json_translator.translate_commands,
             protocol,
         )
+        liquids = await anyio.to_thread.run_sync(
+            self._json_translator.translate_liquids, protocol
+        )
+        # Surface bad references now, before the run has moved anything,
+        # instead of when the run reaches the command that makes them.
+        await anyio.to_thread.run_sync(
+            self._json_translator.validate_commands, commands, liquids
+        )
 
         # Add commands and liquids to the ProtocolEngine.
         #
@@ -343,9 +354,6 @@ class JsonRunner(AbstractRunner):
         # It wouldn't be safe to do this in a worker thread because each addition
         # invokes the ProtocolEngine's ChangeNotifier machinery, which is not
         # thread-safe.
-        liquids = await anyio.to_thread.run_sync(
-            self._json_translator.translate_liquids, protocol
-        )
         for liquid in liquids:
             self._protocol_engine.add_liquid(
                 id=liquid.id,
@@ -304,6 +304,10 @@ class RunOrchestrator:
         """Get all run command errors."""
         return self._protocol_engine.state_view.commands.get_all_errors()
 
+    def get_state_version(self) -> int:
+        """Get a number that increases whenever the engine's state might have changed."""
+        return self._protocol_engine.state_view.commands.get_version()
+
     def get_run_status(self) -> EngineStatus:
         """Get the current execution status of the engine."""
         return self._protocol_engine.state_view.commands.get_status()
@@ -539,31 +539,50 @@ class TransferPlan:
             air_gap=self._strategy.air_gap,
             max_volume=self._instr.max_volume,
         )
-        plan_iter = self._expand_for_volume_constraints(
-            self._volumes,
-            zip(sources, dests),
-            self._instr.max_volume
-            - self._strategy.disposal_volume
-            - self._strategy.air_gap,
+        # Work out every pairing and aspirate up front. Only the steps themselves
+        # are left to iteration, because some of them depend on the state of the
+        # pipette as the plan is carried out.
+        split_xfers = list(
+            self._expand_for_volume_constraints(
+                self._volumes,
+                range(len(sources)),
+                self._instr.max_volume
+                - self._strategy.disposal_volume
+                - self._strategy.air_gap,
+            )
         )
-        for step_vol, (src, dest) in plan_iter:
+        aspirate_volumes = self._split_into_aspirates(
+            [step_vol for step_vol, _ in split_xfers],
+            self._max_volume - self._strategy.disposal_volume - self._strategy.air_gap,
+        )
+        for vols, (_, pair_index) in zip(aspirate_volumes, split_xfers):
+            src = sources[pair_index]
+            dest = dests[pair_index]
             if self._strategy.new_tip == types.TransferTipPolicy.ALWAYS:
                 yield self._format_dict("pick_up_tip", kwargs=self._tip_opts)
-            max_vol = (
-                self._max_volume
-                - self._strategy.disposal_volume
-                - self._strategy.air_gap
-            )
-            xferred_vol = 0.0
-            while xferred_vol < step_vol:
+            for vol in vols:
                 # TODO: account for unequal length sources, dests
                 # TODO: ensure last transfer is > min_vol
-                vol = min(max_vol, step_vol - xferred_vol)
                 yield from self._aspirate_actions(vol, src)
                 yield from self._dispense_actions(vol=vol, dest=dest, src=src)
-                xferred_vol += vol
             yield from self._new_tip_action()
 
+    @staticmethod
+    def _split_into_aspirates(
+        step_volumes: Sequence[float], max_volume: float
+    ) -> List[List[float]]:
+        """Split each transfer step's volume into the volumes of its aspirates."""
+        aspirate_volumes = []
+        for step_vol in step_volumes:
+            vols = []
+            xferred_vol = 0.0
+            while xferred_vol < step_vol:
+                vol = min(max_volume, step_vol - xferred_vol)
+                vols.append(vol)
+                xferred_vol += vol
+            aspirate_volumes.append(vols)
+        return aspirate_volumes
+
     @staticmethod
     def _extend_source_target_lists(
         sources: List[Union[Well, types.Location]],
@@ -637,52 +656,35 @@ class TransferPlan:
         # recommend users to specify a disposal vol when using distribute.
         # First method keeps distribute consistent with current behavior while
         # the other maintains consistency in default behaviors of all functions
-        plan_iter = self._expand_for_volume_constraints(
-            self._volumes,
-            self._dests,
-            # todo(mm, 2021-03-09): Is it right for this to be
-            # _instr_.max_volume? Does/should this take the tip maximum volume
-            # into account?
-            self._instr.max_volume
-            - self._strategy.disposal_volume
-            - self._strategy.air_gap,
+        asp_groups = self._group_for_aspirates(
+            list(
+                self._expand_for_volume_constraints(
+                    self._volumes,
+                    self._dests,
+                    # todo(mm, 2021-03-09): Is it right for this to be
+                    # _instr_.max_volume? Does/should this take the tip maximum
+                    # volume into account?
+                    self._instr.max_volume
+                    - self._strategy.disposal_volume
+                    - self._strategy.air_gap,
+                )
+            ),
+            air_gap_per_aspirate=False,
         )
 
-        done = False
-        current_xfer = next(plan_iter)
         if self._strategy.new_tip == types.TransferTipPolicy.ALWAYS:
             yield self._format_dict("pick_up_tip", kwargs=self._tip_opts)
-        while not done:
-            asp_grouped: List[Tuple[float, Well | types.Location]] = []
-            try:
-                while (
-                    sum(a[0] for a in asp_grouped)
-                    + self._strategy.disposal_volume
-                    + self._strategy.air_gap
-                    + current_xfer[0]
-                ) <= self._max_volume:
-                    append_xfer = self._check_volume_not_zero(
-                        self._api_version, current_xfer[0]
-                    )
-                    if append_xfer:
-                        asp_grouped.append(current_xfer)
-                    current_xfer = next(plan_iter)
-            except StopIteration:
-                done = True
-            if not asp_grouped:
-                break
-
+        for asp_grouped in asp_groups:
             yield from self._aspirate_actions(
                 sum(a[0] for a in asp_grouped) + self._strategy.disposal_volume,
                 self._sources[0],
             )
-            for step in asp_grouped:
-
+            for index, step in enumerate(asp_grouped):
                 yield from self._dispense_actions(
                     vol=step[0],
                     src=self._sources[0],
                     dest=step[1],
-                    is_disp_next=step is not asp_grouped[-1],
+                    is_disp_next=index < len(asp_grouped) - 1,
                 )
         yield from self._new_tip_action()
 
@@ -752,37 +754,23 @@ class TransferPlan:
         #     air_gap=self._strategy.air_gap,
         #     max_volume=self._instr.max_volume,
         # )
-        plan_iter = self._expand_for_volume_constraints(
-            # todo(mm, 2021-03-09): Is it right to use _instr.max_volume here?
-            # Why don't we account for tip max volume, disposal volume, or air
-            # gap?
-            self._volumes,
-            self._sources,
-            self._instr.max_volume,
+        asp_groups = self._group_for_aspirates(
+            list(
+                self._expand_for_volume_constraints(
+                    # todo(mm, 2021-03-09): Is it right to use _instr.max_volume
+                    # here? Why don't we account for tip max volume, disposal
+                    # volume, or air gap?
+                    self._volumes,
+                    self._sources,
+                    self._instr.max_volume,
+                )
+            ),
+            air_gap_per_aspirate=True,
         )
-        current_xfer = next(plan_iter)
+
         if self._strategy.new_tip == types.TransferTipPolicy.ALWAYS:
             yield self._format_dict("pick_up_tip", kwargs=self._tip_opts)
-        done = False
-        while not done:
-            asp_grouped: List[Tuple[float, Union[Well, types.Location]]] = []
-            try:
-                while (
-                    sum([a[0] for a in asp_grouped])
-                    + self._strategy.disposal_volume
-                    + self._strategy.air_gap * len(asp_grouped)
-                    + current_xfer[0]
-                ) <= self._max_volume:
-                    append_xfer = self._check_volume_not_zero(
-                        self._api_version, current_xfer[0]
-                    )
-                    if append_xfer:
-                        asp_grouped.append(current_xfer)
-                    current_xfer = next(plan_iter)
-            except StopIteration:
-                done = True
-            if not asp_grouped:
-                break
+        for asp_grouped in asp_groups:
             # Q: What accounts as disposal volume in a consolidate action?
             # yield self._format_dict('aspirate',
             #                         self._strategy.disposal_volume, loc)
@@ -796,6 +784,48 @@ class TransferPlan:
             )
         yield from self._new_tip_action()
 
+    def _group_for_aspirates(
+        self,
+        xfers: List[Tuple[float, Union[Well, types.Location]]],
+        air_gap_per_aspirate: bool,
+    ) -> List[List[Tuple[float, Union[Well, types.Location]]]]:
+        """Group consecutive transfers into as few tipfuls as they'll fit in.
+
+        With ``air_gap_per_aspirate``, every transfer in a group needs its own air
+        gap, like when consolidating. Otherwise, a group needs just one.
+
+        Grouping stops at the first transfer that can't fit in an empty tip.
+        """
+        if not xfers:
+            raise RuntimeError("There are no transfers to plan.")
+        asp_groups = []
+        next_index = 0
+        while next_index < len(xfers):
+            asp_grouped: List[Tuple[float, Union[Well, types.Location]]] = []
+            # Kept as a running total, instead of re-summing the group for every
+            # transfer, so grouping many small transfers stays linear.
+            grouped_vol: float = 0
+            while next_index < len(xfers):
+                vol = xfers[next_index][0]
+                air_gap = (
+                    self._strategy.air_gap * len(asp_grouped)
+                    if air_gap_per_aspirate
+                    else self._strategy.air_gap
+                )
+                if (
+                    grouped_vol + self._strategy.disposal_volume + air_gap + vol
+                    > self._max_volume
+                ):
+                    break
+                if self._check_volume_not_zero(self._api_version, vol):
+                    asp_grouped.append(xfers[next_index])
+                    grouped_vol += vol
+                next_index += 1
+            if not asp_grouped:
+                break
+            asp_groups.append(asp_grouped)
+        return asp_groups
+
     def _aspirate_actions(
         self, vol: float, loc: Union[Well, types.Location]
     ) -> Generator[TransferStep, None, None]:
@@ -0,0 +1,244 @@
+"""
+opentrons.protocols.bytecode_cache: a cache of compiled Python protocols
+
+Parsing a Python protocol runs it through ``ast.parse()`` and ``compile()``, which
+takes a noticeable amount of time for a large protocol. The same file gets parsed
+over and over: when it's uploaded, again for every analysis, and again for every
+run. This keeps the results in memory and on disk, so only the first parse of a
+given file pays for it.
+"""
+
+import hashlib
+import importlib.util
+import logging
+import marshal
+import os
+import sys
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from types import CodeType
+from typing import Callable, NamedTuple, Optional, Union
+
+from opentrons_shared_data.robot.types import RobotType
+
+from opentrons._version import version as opentrons_version
+from opentrons.config import get_protocol_bytecode_cache_dir
+
+from .api_support.types import APIVersion
+from .types import PythonProtocolMetadata, PythonProtocolRequirements
+
+MODULE_LOG = logging.getLogger(__name__)
+
+# Bump this whenever the format of cache entries changes, or whatever they were
+# computed from changes in a way that a software version bump might not catch.
+#
+# Version History
+#     * "1": initial
+_CACHE_FORMAT_VERSION = "1"
+
+_CACHE_FILE_SUFFIX = ".code"
+
+# Code objects can only be loaded by the Python that compiled them, and cache
+# entries by the software that wrote them.
+_CACHE_KEY_PREFIX = "\0".join(
+    [
+        _CACHE_FORMAT_VERSION,
+        opentrons_version,
+        sys.implementation.cache_tag or sys.implementation.name,
+        importlib.util.MAGIC_NUMBER.hex(),
+    ]
+).encode("utf-8")
+
+
+class CompiledPythonProtocol(NamedTuple):
+    """Everything that parsing a Python protocol learns from its source."""
+
+    code: CodeType
+    metadata: PythonProtocolMetadata
+    requirements: PythonProtocolRequirements
+    api_level: APIVersion
+    robot_type: RobotType
+
+
+def _cache_key(contents: Union[str, bytes], filename: str) -> str:
+    hasher = hashlib.sha256(_CACHE_KEY_PREFIX)
+    hasher.update(b"\0" + filename.encode("utf-8") + b"\0")
+    hasher.update(contents.encode("utf-8") if isinstance(contents, str) else contents)
+    return hasher.hexdigest()
+
+
+def _dump(compiled: CompiledPythonProtocol) -> bytes:
+    return marshal.dumps(
+        (
+            compiled.code,
+            compiled.metadata,
+            compiled.requirements,
+            (compiled.api_level.major, compiled.api_level.minor),
+            compiled.robot_type,
+        )
+    )
+
+
+def _load(data: bytes) -> CompiledPythonProtocol:
+    code, metadata, requirements, (major, minor), robot_type = marshal.loads(data)
+    if not isinstance(code, CodeType):
+        raise ValueError("Cache entry does not contain a code object.")
+    return CompiledPythonProtocol(
+        code=code,
+        metadata=metadata,
+        requirements=requirements,
+        api_level=APIVersion(major, minor),
+        robot_type=robot_type,
+    )
+
+
+class BytecodeCache:
+    """A bounded cache of `CompiledPythonProtocol`s.
+
+    Entries are keyed by a hash of the protocol's contents and filename, and by the
+    versions of Python and of this software. Only successful parses are cached, so
+    a protocol with an error is re-parsed, and re-reports it, every time.
+
+    Entries are kept in memory as marshalled bytes, so every hit gets its own copy
+    of the metadata dicts.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Path],
+        max_memory_entries: int = 16,
+        max_disk_entries: int = 64,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            directory: Where to store entries on disk, so that they outlive this
+                process. It's okay if this doesn't exist yet. `None` to only
+                cache in memory.
+            max_memory_entries: How many entries to keep in memory.
+            max_disk_entries: How many entries to keep on disk. The least
+                recently used ones are removed first.
+        """
+        self._directory = directory
+        self._max_memory_entries = max_memory_entries
+        self._max_disk_entries = max_disk_entries
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = Lock()
+
+    def get_or_compile(
+        self,
+        contents: Union[str, bytes],
+        filename: str,
+        compile_protocol: Callable[[], CompiledPythonProtocol],
+    ) -> CompiledPythonProtocol:
+        """Return the cached compilation of a protocol, compiling it if necessary.
+
+        Args:
+            contents: The protocol's source.
+            filename: The filename the protocol is compiled with.
+            compile_protocol: Compiles the protocol, for when it's not cached.
+                Anything this raises is propagated, and nothing is cached.
+        """
+        key = _cache_key(contents, filename)
+
+        data = self._get_from_memory(key) or self._get_from_disk(key)
+        if data is not None:
+            try:
+                compiled = _load(data)
+            except (EOFError, ValueError, TypeError):
+                MODULE_LOG.warning(
+                    f"Ignoring unreadable compiled protocol {key}.", exc_info=True
+                )
+            else:
+                self._put_in_memory(key, data)
+                return compiled
+
+        compiled = compile_protocol()
+        try:
+            data = _dump(compiled)
+        except ValueError:
+            # The metadata contains something marshal can't handle.
+            MODULE_LOG.debug(f"Not caching compiled protocol {filename}.")
+            return compiled
+        self._put_in_memory(key, data)
+        self._put_on_disk(key, data)
+        return compiled
+
+    def _get_from_memory(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+            return data
+
+    def _put_in_memory(self, key: str, data: bytes) -> None:
+        with self._lock:
+            self._memory[key] = data
+            self._memory.move_to_end(key)
+            while len(self._memory) > self._max_memory_entries:
+                self._memory.popitem(last=False)
+
+    def _get_from_disk(self, key: str) -> Optional[bytes]:
+        if self._directory is None:
+            return None
+        path = self._directory / f"{key}{_CACHE_FILE_SUFFIX}"
+        try:
+            data = path.read_bytes()
+            # Mark the entry as recently used, for eviction.
+            os.utime(path)
+        except OSError:
+            return None
+        return data
+
+    def _put_on_disk(self, key: str, data: bytes) -> None:
+        if self._directory is None:
+            return
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            _write_atomically(self._directory / f"{key}{_CACHE_FILE_SUFFIX}", data)
+            self._evict_from_disk()
+        except OSError:
+            # The cache is only an optimization, so losing it is not worth failing over.
+            MODULE_LOG.warning(
+                f"Could not write compiled protocol to {self._directory}.",
+                exc_info=True,
+            )
+
+    def _evict_from_disk(self) -> None:
+        assert self._directory is not None
+        entries = []
+        for path in self._directory.glob(f"*{_CACHE_FILE_SUFFIX}"):
+            try:
+                entries.append((path.stat().st_mtime_ns, path))
+            except OSError:
+                # Another process got to it first.
+                continue
+        entries.sort()
+        for _, path in entries[: max(len(entries) - self._max_disk_entries, 0)]:
+            path.unlink(missing_ok=True)
+
+
+def _write_atomically(path: Path, data: bytes) -> None:
+    # Several processes can share the cache directory, so write to a temporary file
+    # of our own and then rename it over the real one. Readers never see a
+    # half-written entry.
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        temp_path.write_bytes(data)
+        os.replace(temp_path, path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+_bytecode_cache: Optional[BytecodeCache] = None
+_bytecode_cache_lock = Lock()
+
+
+def get_bytecode_cache() -> BytecodeCache:
+    """Get the process-wide `BytecodeCache`, which is stored in the config dir."""
+    global _bytecode_cache
+    with _bytecode_cache_lock:
+        if _bytecode_cache is None:
+            _bytecode_cache = BytecodeCache(directory=get_protocol_bytecode_cache_dir())
+        return _bytecode_cache
@@ -1,18 +1,46 @@
 import csv
-from tempfile import NamedTemporaryFile
-from typing import Optional, TextIO, Any, List
+import io
+from typing import (
+    Optional,
+    TextIO,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    TypeVar,
+    Union,
+    overload,
+)
 
 from opentrons.protocols.api_support.types import APIVersion
+from opentrons.protocols.api_support.util import requires_version
 
 from .exceptions import ParameterValueError, RuntimeParameterRequired
 
 
+_T = TypeVar("_T")
+
+
+def _iter_lines(text: str) -> Iterator[str]:
+    """Yield the same lines as ``text.split("\\n")``, without making a list of them."""
+    start = 0
+    while True:
+        end = text.find("\n", start)
+        if end == -1:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
+
+
 # TODO(jbl 2024-08-02) This is a public facing class and as such should be moved to the protocol_api folder
 class CSVParameter:
     def __init__(self, contents: Optional[bytes], api_version: APIVersion) -> None:
         self._contents = contents
         self._api_version = api_version
         self._file: Optional[TextIO] = None
+        self._decoded_contents: Optional[str] = None
 
     @property
     def file(self) -> TextIO:
@@ -21,14 +49,12 @@ class CSVParameter:
         The file is treated as read-only, UTF-8-encoded text.
         """
         if self._file is None:
-            text = self.contents
-            temporary_file = NamedTemporaryFile("r+")
-            temporary_file.write(text)
-            temporary_file.flush()
-
-            # Open a new file handler for the temporary file with read-only permissions and close the other
-            self._file = open(temporary_file.name, "r")
-            temporary_file.close()
+            # A reader over the bytes in memory, so the file is read-only.
+            raw = io.BytesIO(self._get_contents_bytes())
+            self._file = io.TextIOWrapper(
+                io.BufferedReader(raw),  # type: ignore[arg-type]
+                encoding="utf-8",
+            )
         return self._file
 
     @property
@@ -39,11 +65,16 @@ class CSVParameter:
     @property
     def contents(self) -> str:
         """Returns the full contents of the CSV file as a single string."""
+        if self._decoded_contents is None:
+            self._decoded_contents = self._get_contents_bytes().decode("utf-8")
+        return self._decoded_contents
+
+    def _get_contents_bytes(self) -> bytes:
         if self._contents is None:
             raise RuntimeParameterRequired(
                 "CSV parameter needs to be set to a file for full analysis or run."
             )
-        return self._contents.decode("utf-8")
+        return self._contents
 
     def parse_as_csv(
         self, detect_dialect: bool = True, **kwargs: Any
@@ -65,30 +96,150 @@ class CSVParameter:
             `formatting parameters <https://docs.python.org/3/library/csv.html#csv-fmt-params>`_
             accepted by :py:func:`csv.reader` from the Python standard library.
         """
-        rows: List[List[str]] = []
+        reader = self._reader(
+            lambda text: text.split("\n"), detect_dialect=detect_dialect, **kwargs
+        )
+        return list(self._read_rows(reader))
+
+    @requires_version(2, 21)
+    def iter_rows(
+        self, detect_dialect: bool = True, **kwargs: Any
+    ) -> Iterator[List[str]]:
+        """Parses the CSV data one row at a time.
+
+        This returns the same rows as :py:meth:`parse_as_csv`, but as an iterator,
+        so a large CSV file never has to be held in memory as lists all at once.
+
+        :param detect_dialect: If ``True``, examine the file and try to assign it a
+            :py:class:`csv.Dialect` to improve parsing behavior.
+        :param kwargs: Any of the formatting parameters accepted by
+            :py:func:`csv.reader`, like for :py:meth:`parse_as_csv`.
+        """
+        reader = self._reader(_iter_lines, detect_dialect=detect_dialect, **kwargs)
+        return self._read_rows(reader)
+
+    @overload
+    def parse_column(
+        self,
+        column: Union[int, str],
+        *,
+        has_header: bool = True,
+        detect_dialect: bool = True,
+        **kwargs: Any,
+    ) -> List[str]:
+        ...
+
+    @overload
+    def parse_column(
+        self,
+        column: Union[int, str],
+        value_type: Callable[[str], _T],
+        *,
+        has_header: bool = True,
+        detect_dialect: bool = True,
+        **kwargs: Any,
+    ) -> List[_T]:
+        ...
+
+    @requires_version(2, 21)
+    def parse_column(
+        self,
+        column: Union[int, str],
+        value_type: Optional[Callable[[str], Any]] = None,
+        *,
+        has_header: bool = True,
+        detect_dialect: bool = True,
+        **kwargs: Any,
+    ) -> List[Any]:
+        """Parses a single column of the CSV data and returns its values as a list.
+
+        Empty rows are skipped. For example, ``.parse_column("volume", float)``
+        returns every value under the ``volume`` header as a floating point number.
+
+        :param column: The name of the column in the header row, or its index
+            counting from 0.
+        :param value_type: A function to convert each value with, such as ``int``
+            or ``float``. If not given, the values are strings.
+        :param has_header: If ``True``, the first row is the header, which is
+            used to find ``column`` by name and is not included in the values.
+        :param detect_dialect: If ``True``, examine the file and try to assign it a
+            :py:class:`csv.Dialect` to improve parsing behavior.
+        :param kwargs: Any of the formatting parameters accepted by
+            :py:func:`csv.reader`, like for :py:meth:`parse_as_csv`.
+        """
+        rows = self.iter_rows(detect_dialect=detect_dialect, **kwargs)
+        header = next(rows, []) if has_header else None
+        if isinstance(column, str):
+            if header is None or column not in header:
+                raise ParameterValueError(f'No column named "{column}" in the CSV.')
+            index = header.index(column)
+        else:
+            index = column
+
+        values = []
+        for row_number, row in enumerate(rows, start=2 if has_header else 1):
+            if not row:
+                continue
+            try:
+                value = row[index]
+            except IndexError:
+                raise ParameterValueError(f"Row {row_number} has no column {column}.")
+            values.append(
+                value
+                if value_type is None
+                else self._convert(value, value_type, row_number, column)
+            )
+        return values
+
+    @staticmethod
+    def _convert(
+        value: str,
+        value_type: Callable[[str], _T],
+        row_number: int,
+        column: Union[int, str],
+    ) -> _T:
+        try:
+            return value_type(value)
+        except ValueError:
+            type_name = getattr(value_type, "__name__", repr(value_type))
+            raise ParameterValueError(
+                f'Cannot convert "{value}" in row {row_number}'
+                f" of column {column} with {type_name}."
+            )
+
+    def _reader(
+        self,
+        split_lines: Callable[[str], Iterable[str]],
+        detect_dialect: bool,
+        **kwargs: Any,
+    ) -> Iterator[List[str]]:
+        """Get a csv.reader for the contents, split into lines with split_lines."""
         if detect_dialect:
             try:
                 dialect = csv.Sniffer().sniff(self.contents[:1024])
-                reader = csv.reader(self.contents.split("\n"), dialect, **kwargs)
+                return csv.reader(split_lines(self.contents), dialect, **kwargs)
             except (UnicodeDecodeError, csv.Error):
                 raise ParameterValueError(
                     "Cannot parse dialect or contents from provided CSV contents."
                 )
-        else:
-            try:
-                reader = csv.reader(self.contents.split("\n"), **kwargs)
-            except (UnicodeDecodeError, csv.Error):
-                raise ParameterValueError("Cannot parse provided CSV contents.")
         try:
-            for row in reader:
-                rows.append(row)
+            return csv.reader(split_lines(self.contents), **kwargs)
         except (UnicodeDecodeError, csv.Error):
             raise ParameterValueError("Cannot parse provided CSV contents.")
-        return self._remove_trailing_empty_rows(rows)
 
     @staticmethod
-    def _remove_trailing_empty_rows(rows: List[List[str]]) -> List[List[str]]:
-        """Removes any trailing empty rows."""
-        while rows and rows[-1] == []:
-            rows.pop()
-        return rows
+    def _read_rows(reader: Iterator[List[str]]) -> Iterator[List[str]]:
+        """Yields the rows from reader, leaving out any trailing empty rows."""
+        empty_rows = 0
+        try:
+            for row in reader:
+                if row == []:
+                    # Only pass empty rows on once there's a row after them.
+                    empty_rows += 1
+                    continue
+                for _ in range(empty_rows):
+                    yield []
+                empty_rows = 0
+                yield row
+        except (UnicodeDecodeError, csv.Error):
+            raise ParameterValueError("Cannot parse provided CSV contents.")
@@ -39,6 +39,7 @@ from .types import (
     ApiDeprecationError,
 )
 from .bundle import extract_bundle
+from .bytecode_cache import CompiledPythonProtocol, get_bytecode_cache
 
 if TYPE_CHECKING:
     from opentrons_shared_data.labware.types import LabwareDefinition
@@ -209,27 +210,10 @@ def _parse_json(
     )
 
 
-def _parse_python(
-    protocol_contents: Union[str, bytes],
-    python_parse_mode: PythonParseMode,
-    filename: Optional[str] = None,
-    bundled_labware: Optional[Dict[str, "LabwareDefinition"]] = None,
-    bundled_data: Optional[Dict[str, bytes]] = None,
-    bundled_python: Optional[Dict[str, str]] = None,
-    extra_labware: Optional[Dict[str, "LabwareDefinition"]] = None,
-) -> PythonProtocol:
-    """Parse a protocol known or at least suspected to be python"""
-    if filename is None:
-        # The fallback "<protocol>" needs to match what opentrons.protocols.execution.execute_python
-        # looks for when it extracts tracebacks.
-        ast_filename = "<protocol>"
-    elif filename.endswith(".zip"):
-        # The extension ".zip" and the fallback "protocol.ot2.py" need to match what
-        # opentrons.protocols.execution.execute_python looks for when it extracts tracebacks.
-        ast_filename = "protocol.ot2.py"
-    else:
-        ast_filename = filename
-
+def _compile_python(
+    protocol_contents: Union[str, bytes], ast_filename: str
+) -> CompiledPythonProtocol:
+    """Compile a Python protocol and check everything that doesn't depend on the parse mode."""
     # todo(mm, 2021-09-13): By default, ast.parse will inherit compiler options
     # and future features from this module. This may not be appropriate.
     # Investigate switching to compile() with dont_inherit=True.
@@ -256,19 +240,63 @@ def _parse_python(
 
     if version >= APIVersion(2, 0):
         _validate_v2_ast(parsed)
-        if python_parse_mode != PythonParseMode.ALLOW_LEGACY_METADATA_AND_REQUIREMENTS:
-            _validate_v2_static_info(static_info)
-            _validate_robot_type_at_version(robot_type, version)
     else:
         raise ApiDeprecationError(version)
 
-    result = PythonProtocol(
-        text=protocol_contents,
-        filename=filename,
-        contents=protocol,
+    return CompiledPythonProtocol(
+        code=protocol,
         metadata=static_info.metadata,
+        requirements=static_info.requirements,
         api_level=version,
         robot_type=robot_type,
+    )
+
+
+def _parse_python(
+    protocol_contents: Union[str, bytes],
+    python_parse_mode: PythonParseMode,
+    filename: Optional[str] = None,
+    bundled_labware: Optional[Dict[str, "LabwareDefinition"]] = None,
+    bundled_data: Optional[Dict[str, bytes]] = None,
+    bundled_python: Optional[Dict[str, str]] = None,
+    extra_labware: Optional[Dict[str, "LabwareDefinition"]] = None,
+) -> PythonProtocol:
+    """Parse a protocol known or at least suspected to be python"""
+    if filename is None:
+        # The fallback "<protocol>" needs to match what opentrons.protocols.execution.execute_python
+        # looks for when it extracts tracebacks.
+        ast_filename = "<protocol>"
+    elif filename.endswith(".zip"):
+        # The extension ".zip" and the fallback "protocol.ot2.py" need to match what
+        # opentrons.protocols.execution.execute_python looks for when it extracts tracebacks.
+        ast_filename = "protocol.ot2.py"
+    else:
+        ast_filename = filename
+
+    compiled = get_bytecode_cache().get_or_compile(
+        contents=protocol_contents,
+        filename=ast_filename,
+        compile_protocol=functools.partial(
+            _compile_python, protocol_contents, ast_filename
+        ),
+    )
+
+    # These checks depend on the parse mode, so they can't be cached with the rest.
+    if python_parse_mode != PythonParseMode.ALLOW_LEGACY_METADATA_AND_REQUIREMENTS:
+        _validate_v2_static_info(
+            StaticPythonInfo(
+                metadata=compiled.metadata, requirements=compiled.requirements
+            )
+        )
+        _validate_robot_type_at_version(compiled.robot_type, compiled.api_level)
+
+    result = PythonProtocol(
+        text=protocol_contents,
+        filename=filename,
+        contents=compiled.code,
+        metadata=compiled.metadata,
+        api_level=compiled.api_level,
+        robot_type=compiled.robot_type,
         bundled_labware=bundled_labware,
         bundled_data=bundled_data,
         bundled_python=bundled_python,
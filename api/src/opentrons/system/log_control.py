@@ -7,7 +7,7 @@ This is the implementation of the endpoints in
 import asyncio
 import logging
 import subprocess
-from typing import List
+from typing import AsyncIterator, List, Optional
 
 
 LOG = logging.getLogger(__name__)
@@ -15,6 +15,9 @@ LOG = logging.getLogger(__name__)
 MAX_RECORDS = 100000
 DEFAULT_RECORDS = 50000
 
+# How much journalctl output to read at once when streaming it.
+STREAM_CHUNK_SIZE = 64 * 1024
+
 UNIT_SELECTORS = [
     "opentrons-robot-server",
     "opentrons-update-server",
@@ -28,13 +31,13 @@ SERIAL_SELECTORS = [
 ]
 
 
-async def get_records_dumb(selector: str, records: int, mode: str) -> bytes:
-    """Dump the log files.
-
-    :param selector: The syslog selector to limit responses to
-    :param records: The maximum number of records to print
-    :param mode: A journalctl dump mode. Should be either "short-precise" or "json".
-    """
+def _journalctl_args(
+    selector: str,
+    records: int,
+    mode: str,
+    cursor: Optional[str] = None,
+    since: Optional[str] = None,
+) -> List[str]:
     selector_array: List[str] = []
     if selector == SERIAL_SPECIAL:
         for serial_selector in SERIAL_SELECTORS:
@@ -44,16 +47,85 @@ async def get_records_dumb(selector: str, records: int, mode: str) -> bytes:
     else:
         selector_array.extend(["-t", selector])
 
-    proc = await asyncio.create_subprocess_exec(
+    filter_array: List[str] = []
+    if cursor is not None:
+        filter_array.append(f"--after-cursor={cursor}")
+    if since is not None:
+        filter_array.append(f"--since={since}")
+
+    return [
         "journalctl",
         "--no-pager",
         *selector_array,
+        *filter_array,
         "-n",
         str(records),
         "-o",
         mode,
         "-a",
+    ]
+
+
+class JournalctlError(RuntimeError):
+    """journalctl exited with an error, for example because of a malformed cursor."""
+
+    def __init__(self, returncode: int, stderr: str) -> None:
+        super().__init__(stderr or f"journalctl exited with status {returncode}")
+        self.returncode = returncode
+        self.stderr = stderr
+
+
+async def stream_records(
+    selector: str,
+    records: int,
+    mode: str,
+    cursor: Optional[str] = None,
+    since: Optional[str] = None,
+) -> AsyncIterator[bytes]:
+    """Stream the log files as journalctl writes them out.
+
+    This never holds more than :py:data:`STREAM_CHUNK_SIZE` bytes of the output
+    at once. If the caller stops iterating early, journalctl is killed.
+
+    If journalctl exits with an error, like for a ``cursor`` or ``since`` that it
+    can't parse, iterating raises :py:class:`JournalctlError` once its output runs
+    out. journalctl rejects bad arguments before printing anything, so in that case
+    the error comes from the very first read.
+
+    In "short-precise" mode, the output ends with a ``-- cursor: ...`` line. In
+    "json" mode, every record has a ``__CURSOR`` field. Either cursor can be
+    passed back in to get only the records that came after it.
+
+    :param selector: The syslog selector to limit responses to
+    :param records: The maximum number of records to print
+    :param mode: A journalctl dump mode. Should be either "short-precise" or "json".
+    :param cursor: Only print records after the one with this journal cursor
+    :param since: Only print records from this time on, in any format
+                  journalctl's ``--since`` accepts
+    """
+    args = _journalctl_args(selector, records, mode, cursor, since)
+    if mode == "short-precise":
+        args.append("--show-cursor")
+    proc = await asyncio.create_subprocess_exec(
+        *args,
         stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
     )
-    stdout, _ = await proc.communicate()
-    return stdout
+    assert proc.stdout is not None
+    assert proc.stderr is not None
+    try:
+        while True:
+            chunk = await proc.stdout.read(STREAM_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+        stderr = await proc.stderr.read()
+        returncode = await proc.wait()
+        if returncode != 0:
+            message = stderr.decode(errors="replace").strip()
+            LOG.warning(f"journalctl exited with status {returncode}: {message}")
+            raise JournalctlError(returncode, message)
+    finally:
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
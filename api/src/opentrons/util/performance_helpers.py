@@ -1,5 +1,6 @@
 """Performance helpers for tracking robot activity."""
 
+import atexit
 import functools
 from pathlib import Path
 
@@ -59,6 +60,10 @@ class _StubbedTracker:
         """Do nothing."""
         pass
 
+    def close(self) -> None:
+        """Do nothing."""
+        pass
+
 
 # Ensure that _StubbedTracker implements SupportsTracking
 # but do not create a runtime dependency on performance_metrics
@@ -96,6 +101,8 @@ def _get_robot_activity_tracker() -> "SupportsTracking":
         _robot_activity_tracker = _package_to_use(
             get_performance_metrics_data_dir(), _should_track
         )
+        # Stores can hold unwritten data and background threads until closed.
+        atexit.register(_robot_activity_tracker.close)
     return _robot_activity_tracker
 
 
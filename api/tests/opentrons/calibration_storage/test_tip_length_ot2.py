@@ -1,5 +1,9 @@
+import os
+import time
+from pathlib import Path
+
 import pytest
-from typing import Any, TYPE_CHECKING
+from typing import Any, List, TYPE_CHECKING
 
 from opentrons import config
 from opentrons.calibration_storage import (
@@ -13,6 +17,7 @@ from opentrons.calibration_storage.ot2 import (
     save_tip_length_calibration,
     tip_lengths_for_pipette,
     load_tip_length_calibration,
+    load_tip_length_calibration_by_uri,
     delete_tip_length_calibration,
     clear_tip_length_calibration,
     models,
@@ -141,3 +146,100 @@ def test_uriless_calibrations_are_dropped(ot_config_tempdir: object) -> None:
         result[LabwareUri("opentrons/opentrons_96_filtertiprack_200ul/1")].tipLength
         == 456
     )
+
+
+def _age_tip_length_file(pipette_id: str, seconds_ago: float) -> None:
+    """Backdate a tip length file, so it's old enough to be cached."""
+    path = config.get_tip_length_cal_path() / f"{pipette_id}.json"
+    then = time.time() - seconds_ago
+    os.utime(path, (then, then))
+
+
+@pytest.fixture
+def read_cal_file_calls(monkeypatch: pytest.MonkeyPatch) -> List[Path]:
+    """Record every tip length file that gets read."""
+    calls: List[Path] = []
+    read_cal_file = io.read_cal_file
+
+    def recording_read_cal_file(file_path: Path, *args: Any, **kwargs: Any) -> Any:
+        calls.append(file_path)
+        return read_cal_file(file_path, *args, **kwargs)
+
+    monkeypatch.setattr(io, "read_cal_file", recording_read_cal_file)
+    return calls
+
+
+def test_tip_lengths_are_read_once(
+    ot_config_tempdir: Any,
+    minimal_labware_def: "LabwareDefinition",
+    read_cal_file_calls: List[Path],
+) -> None:
+    """A settled file should only be read again after it changes."""
+    tip_rack_uri = helpers.uri_from_definition(minimal_labware_def)
+    save_tip_length_calibration(
+        "pip1", create_tip_length_data(minimal_labware_def, 22.0)
+    )
+    _age_tip_length_file("pip1", seconds_ago=60)
+    read_cal_file_calls.clear()
+
+    for _ in range(3):
+        assert load_tip_length_calibration("pip1", minimal_labware_def).tipLength == 22
+    assert len(read_cal_file_calls) == 1
+
+    # Saving through this module replaces what's in memory.
+    save_tip_length_calibration(
+        "pip1", create_tip_length_data(minimal_labware_def, 25.0)
+    )
+    assert tip_lengths_for_pipette("pip1")[tip_rack_uri].tipLength == 25.0
+
+    # So does changing the file some other way.
+    data = {
+        tip_rack_uri: {
+            "tipLength": 27,
+            "lastModified": "2021-05-12T22:16:14.249567+00:00",
+            "source": "user",
+            "status": {"markedBad": False},
+            "definitionHash": "hash",
+        }
+    }
+    io.save_to_file(config.get_tip_length_cal_path(), "pip1", data)
+    _age_tip_length_file("pip1", seconds_ago=30)
+    assert load_tip_length_calibration("pip1", minimal_labware_def).tipLength == 27
+
+    delete_tip_length_calibration("pip1", tiprack_uri=tip_rack_uri)
+    with pytest.raises(cs_types.TipLengthCalNotFound):
+        load_tip_length_calibration("pip1", minimal_labware_def)
+
+
+def test_recently_modified_tip_lengths_are_not_cached(
+    ot_config_tempdir: Any,
+    minimal_labware_def: "LabwareDefinition",
+    read_cal_file_calls: List[Path],
+) -> None:
+    """A file that was just written could still change without looking different."""
+    save_tip_length_calibration(
+        "pip1", create_tip_length_data(minimal_labware_def, 22.0)
+    )
+    read_cal_file_calls.clear()
+
+    for _ in range(3):
+        load_tip_length_calibration("pip1", minimal_labware_def)
+    assert len(read_cal_file_calls) == 3
+
+
+def test_cached_tip_lengths_are_copied(
+    ot_config_tempdir: Any, minimal_labware_def: "LabwareDefinition"
+) -> None:
+    """Modifying a returned calibration should not affect later lookups."""
+    tip_rack_uri = helpers.uri_from_definition(minimal_labware_def)
+    save_tip_length_calibration(
+        "pip1", create_tip_length_data(minimal_labware_def, 22.0)
+    )
+    _age_tip_length_file("pip1", seconds_ago=60)
+
+    tip_lengths_for_pipette("pip1")[tip_rack_uri].tipLength = 0
+    load_tip_length_calibration("pip1", minimal_labware_def).status.markedBad = True
+
+    result = load_tip_length_calibration_by_uri("pip1", tip_rack_uri)
+    assert result.tipLength == 22.0
+    assert result.status.markedBad is False
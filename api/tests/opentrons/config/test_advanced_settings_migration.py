@@ -8,7 +8,7 @@ from opentrons.config.advanced_settings import _migrate, _ensure
 
 @pytest.fixture
 def migrated_file_version() -> int:
-    return 36
+    return 37
 
 
 # make sure to set a boolean value in default_file_settings only if
@@ -31,6 +31,7 @@ def default_file_settings() -> Dict[str, Any]:
         "enableOEMMode": None,
         "enablePerformanceMetrics": None,
         "allowLiquidClasses": None,
+        "enableSmoothieStreaming": None,
     }
 
 
@@ -432,6 +433,18 @@ def v36_config(v35_config: Dict[str, Any]) -> Dict[str, Any]:
     return r
 
 
+@pytest.fixture
+def v37_config(v36_config: Dict[str, Any]) -> Dict[str, Any]:
+    r = v36_config.copy()
+    r.update(
+        {
+            "_version": 37,
+            "enableSmoothieStreaming": None,
+        }
+    )
+    return r
+
+
 @pytest.fixture(
     scope="session",
     params=[
@@ -473,6 +486,7 @@ def v36_config(v35_config: Dict[str, Any]) -> Dict[str, Any]:
         lazy_fixture("v34_config"),
         lazy_fixture("v35_config"),
         lazy_fixture("v36_config"),
+        lazy_fixture("v37_config"),
     ],
 )
 def old_settings(request: SubRequest) -> Dict[str, Any]:
@@ -564,4 +578,5 @@ def test_ensures_config() -> None:
         "enableOEMMode": None,
         "enablePerformanceMetrics": None,
         "allowLiquidClasses": None,
+        "enableSmoothieStreaming": None,
     }
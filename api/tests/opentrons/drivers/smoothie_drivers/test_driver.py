@@ -45,6 +45,21 @@ def smoothie(
     return d
 
 
+@pytest.fixture
+def streaming_smoothie(
+    mock_connection: AsyncMock, sim_gpio: GPIODriverLike
+) -> driver_3_0.SmoothieDriver:
+    """The smoothie driver under test, streaming gantry moves."""
+    from opentrons.config import robot_configs
+
+    return driver_3_0.SmoothieDriver(
+        connection=mock_connection,
+        config=robot_configs.load_ot2(),
+        gpio_chardev=sim_gpio,
+        streaming=True,
+    )
+
+
 def position(
     x: float, y: float, z: float, a: float, b: float, c: float
 ) -> Dict[str, float]:
@@ -227,6 +242,50 @@ async def test_clear_limit_switch(
     ]
 
 
+async def test_clear_limit_switch_while_streaming(
+    streaming_smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
+) -> None:
+    """A limit-switch hit during streamed moves should be recovered from the
+    same way, even though it's reported to whichever command waits for them.
+    """
+    cmd_list = []
+
+    async def write_mock(command: CommandBuilder, retries: int, timeout: float) -> str:
+        cmd_list.append(command.build())
+        if [c.strip() for c in cmd_list[-2:]] == ["G0 X20", "M400"]:
+            raise AlarmResponse(port="", response="ALARM: Hard limit +X")
+        elif constants.GCODE.CURRENT_POSITION in command:
+            return "ok M114.2 X:10 Y:20 Z:30 A:40 B:50 C:60"
+        elif constants.GCODE.HOMING_STATUS in command:
+            return "X:1 Y:1 Z:1 A:1 B:1 C:1"
+        else:
+            return "ok"
+
+    mock_connection.send_command.side_effect = write_mock
+
+    await streaming_smoothie.move({"X": 10, "Y": 20})
+    await streaming_smoothie.move({"X": 20})
+    with pytest.raises(SmoothieError):
+        await streaming_smoothie.update_position()
+
+    assert [c.strip() for c in cmd_list[:7]] == [
+        # stream the moves, only setting currents for the first one
+        "M907 A0.1 B0.05 C0.05 X1.25 Y1.25 Z0.1 G4 P0.005 G0 X10 Y20",
+        "G0 X20",
+        # wait for them before reading the position, and fail
+        "M400",
+        # recover from failure
+        "M999",
+        "M400",
+        "G28.6",
+        "M400",
+    ]
+    # home the failed axis (X), waiting for each step as usual
+    homing = [c.strip() for c in cmd_list[7:]]
+    assert any(c.endswith("G28.2 X") for c in homing)
+    assert all(c == "M400" for c in homing[1::2])
+
+
 async def test_unstick_axes(
     smoothie: driver_3_0.SmoothieDriver, mock_connection: AsyncMock
 ) -> None:
@@ -192,3 +192,30 @@ async def test_emulator_disconnects(
 
     driver[1].write(b"123\n")
     assert b"" == await driver[0].readline()
+
+
+async def test_wait_idle(
+    subject: Proxy, setting: ProxySettings, proxy_listener: SimpleProxyListener
+) -> None:
+    """It should wait for drivers to give their emulators back to the pool."""
+    await asyncio.wait_for(subject.wait_idle(), timeout=1)
+
+    emulator = await asyncio.open_connection(
+        host="localhost", port=setting.emulator_port
+    )
+    await proxy_listener.wait_count(1)
+    driver = await asyncio.open_connection(host="localhost", port=setting.driver_port)
+    driver[1].write(b"abc\n")
+    assert b"abc\n" == await emulator[0].readline()
+
+    idle = asyncio.get_running_loop().create_task(subject.wait_idle())
+    await asyncio.sleep(0.1)
+    assert not idle.done()
+
+    driver[1].close()
+    await asyncio.wait_for(idle, timeout=1)
+
+    # The emulator is available to the next driver.
+    driver = await asyncio.open_connection(host="localhost", port=setting.driver_port)
+    emulator[1].write(b"abc\n")
+    assert b"abc\n" == await driver[0].readline()
@@ -91,17 +91,19 @@ def test_load_tip_length(
     )
 
     decoy.when(
-        calibration_storage.ot2.load_tip_length_calibration(
-            pip_id="abc123", definition=tip_rack_dict
+        calibration_storage.ot2.load_tip_length_calibration_by_uri(
+            pip_id="abc123", tiprack_uri=LabwareUri("def456")
         )
     ).then_return(tip_length_data)
 
-    decoy.when(calibration_storage.helpers.hash_labware_def(tip_rack_dict)).then_return(
-        "asdfghjk"
-    )
     decoy.when(
         calibration_storage.helpers.uri_from_definition(tip_rack_dict)
     ).then_return(LabwareUri("def456"))
+    decoy.when(
+        calibration_storage.helpers.uri_from_details(
+            namespace="test", load_name="cool-labware", version=1
+        )
+    ).then_return(LabwareUri("def456"))
 
     result = subject.load_tip_length_for_pipette(
         pipette_id="abc123", tiprack=tip_rack_definition
@@ -0,0 +1,29 @@
+"""Count the serial traffic between a module and its emulator."""
+from typing import Any, List
+
+from opentrons.hardware_control.modules import AbstractModule
+
+
+class SerialTrafficCounter:
+    """Records every line a module's driver sends to its emulator."""
+
+    def __init__(self, module: AbstractModule) -> None:
+        """Start counting the module's serial traffic."""
+        self.lines: List[str] = []
+        connection = module._driver._connection  # type: ignore[attr-defined]
+        send_data = connection.send_data
+
+        async def _counting_send_data(data: str, *args: Any, **kwargs: Any) -> str:
+            self.lines.append(data)
+            response: str = await send_data(data, *args, **kwargs)
+            return response
+
+        connection.send_data = _counting_send_data
+
+    def count(self, gcode: str) -> int:
+        """Count the lines sent so far that start with a G-code."""
+        return sum(1 for line in self.lines if line.startswith(gcode))
+
+    def reset(self) -> None:
+        """Forget the lines sent so far."""
+        self.lines.clear()
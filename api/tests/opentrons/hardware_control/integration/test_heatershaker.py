@@ -1,12 +1,15 @@
+import asyncio
 from typing import AsyncGenerator
 
 import pytest
+from opentrons.drivers.heater_shaker.driver import GCODE
 from opentrons.hardware_control import ExecutionManager
 from opentrons.hardware_control.emulation.settings import Settings
 from opentrons.hardware_control.emulation.util import TEMPERATURE_ROOM
 from opentrons.hardware_control.modules import HeaterShaker
 
 from .build_module import build_module
+from .serial_traffic import SerialTrafficCounter
 
 TEMP_ROOM_LOW = TEMPERATURE_ROOM - 0.7
 TEMP_ROOM_HIGH = TEMPERATURE_ROOM + 0.7
@@ -104,3 +107,16 @@ async def test_forcible_deactivate(
     await heatershaker.deactivate(must_be_running=False)
     await heatershaker.deactivate_heater(must_be_running=False)
     await heatershaker.deactivate_shaker(must_be_running=False)
+
+
+async def test_polling_backs_off_while_idle(
+    heatershaker: HeaterShaker, poll_interval_seconds: float
+) -> None:
+    """It should read less and less often while the module is idle."""
+    await heatershaker.deactivate()
+    traffic = SerialTrafficCounter(heatershaker)
+
+    await asyncio.sleep(poll_interval_seconds * 20)
+
+    # a fixed poll interval would have read the temperature 20 times
+    assert traffic.count(GCODE.GET_TEMPERATURE) < 10
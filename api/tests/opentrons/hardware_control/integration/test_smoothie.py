@@ -32,6 +32,29 @@ def spy(subject: SmoothieDriver) -> MagicMock:
     return spy
 
 
+@pytest.fixture
+async def streaming_subject(
+    emulator_settings: Settings,
+) -> AsyncGenerator[SmoothieDriver, None]:
+    """Smoothie driver connected to emulator, streaming gantry moves."""
+    d = await SmoothieDriver.build(
+        port=f"socket://127.0.0.1:{emulator_settings.smoothie.port}",
+        config=build_config_ot2({}),
+        streaming=True,
+    )
+    yield d
+    await d.disconnect()
+
+
+@pytest.fixture
+def streaming_spy(streaming_subject: SmoothieDriver) -> MagicMock:
+    """Attach a spy to the streaming driver's gcode sender."""
+    assert streaming_subject._connection is not None
+    spy = MagicMock(wraps=streaming_subject._connection.send_data)
+    streaming_subject._connection.send_data = spy  # type: ignore[method-assign]
+    return spy
+
+
 async def test_dwell_and_activate_axes(subject: SmoothieDriver, spy: MagicMock) -> None:
     subject.activate_axes("X")
     await subject._set_saved_current()
@@ -440,3 +463,65 @@ async def test_do_relative_splits_during_home_for(
         "G90 M52 M54 M92 B1.0 C1.0 G4 P0.01 G0 F24000",
         "M400",
     ]
+
+
+async def test_streamed_moves(
+    streaming_subject: SmoothieDriver, streaming_spy: MagicMock
+) -> None:
+    await streaming_subject.home()
+    streaming_spy.reset_mock()
+
+    await streaming_subject.move({"X": 0, "Y": 1.123456, "Z": 2, "A": 3})
+    await streaming_subject.move({"X": 10, "Y": 20, "Z": 2, "A": 3})
+    await streaming_subject.move({"X": 10, "Y": 20, "Z": 5, "A": 3}, speed=50)
+    await streaming_subject.move({"B": 2})
+    await streaming_subject.update_position()
+    expected = [
+        # gantry moves are queued back to back, only setting currents once
+        "M907 A0.8 B0.05 C0.05 X1.25 Y1.25 Z0.8 G4 P0.005 G0 A3 X0 Y1.123 Z2",
+        "G0 X10 Y20",
+        "G0 F3000 G0 Z5 G0 F24000",
+        # plunger moves wait for them
+        "M400",
+        "M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005 G0 B2",
+        "M400",
+        "M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005",
+        "M400",
+        "M114.2",
+        "M400",
+    ]
+    command_log = [x.kwargs["data"].strip() for x in streaming_spy.call_args_list]
+    assert command_log == expected
+    assert streaming_subject.position == {
+        "X": 10,
+        "Y": 20,
+        "Z": 5,
+        "A": 3,
+        "B": 2,
+        "C": streaming_subject.homed_position["C"],
+    }
+
+
+async def test_streamed_moves_wait_for_position_and_home(
+    streaming_subject: SmoothieDriver, streaming_spy: MagicMock
+) -> None:
+    await streaming_subject.home()
+    streaming_spy.reset_mock()
+
+    await streaming_subject.move({"X": 10, "Y": 20})
+    await streaming_subject.update_position()
+    await streaming_subject.move({"X": 20})
+    await streaming_subject.home("X")
+    command_log = [x.kwargs["data"].strip() for x in streaming_spy.call_args_list]
+    assert command_log[:5] == [
+        "M907 A0.1 B0.05 C0.05 X1.25 Y1.25 Z0.1 G4 P0.005 G0 X10 Y20",
+        "M400",
+        "M114.2",
+        "M400",
+        # the first streamed move after a wait sets currents again
+        "M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.1 G4 P0.005 G0 X20",
+    ]
+    # homing waits for the streamed move, then goes on as usual
+    assert command_log[5] == "M400"
+    assert "G28.2" in command_log[6]
+    assert command_log[7] == "M400"
@@ -1,11 +1,14 @@
+import asyncio
 from typing import AsyncGenerator
 
 import pytest
+from opentrons.drivers.temp_deck.driver import GCODE
 from opentrons.hardware_control import ExecutionManager
 from opentrons.hardware_control.emulation.settings import Settings
 from opentrons.hardware_control.modules import TempDeck
 
 from .build_module import build_module
+from .serial_traffic import SerialTrafficCounter
 
 
 @pytest.fixture
@@ -105,3 +108,30 @@ async def test_forcible_deactivate(
     """Can override wait_for_is_running."""
     await execution_manager.pause()
     await tempdeck.deactivate(must_be_running=False)
+
+
+async def test_polling_backs_off_while_idle(
+    tempdeck: TempDeck, poll_interval_seconds: float
+) -> None:
+    """It should read less and less often while the module is idle."""
+    await tempdeck.deactivate()
+    traffic = SerialTrafficCounter(tempdeck)
+
+    await asyncio.sleep(poll_interval_seconds * 20)
+
+    # a fixed poll interval would have read the temperature 20 times
+    assert traffic.count(GCODE.GET_TEMP) < 10
+
+
+async def test_polling_speeds_up_while_changing(
+    tempdeck: TempDeck, poll_interval_seconds: float
+) -> None:
+    """It should go back to reading at the poll interval when given a target."""
+    await tempdeck.deactivate()
+    await asyncio.sleep(poll_interval_seconds * 20)
+    traffic = SerialTrafficCounter(tempdeck)
+
+    await tempdeck.start_set_temperature(tempdeck.temperature + 20)
+    await asyncio.sleep(poll_interval_seconds * 5)
+
+    assert traffic.count(GCODE.GET_TEMP) >= 4
@@ -1195,6 +1195,133 @@ async def test_liquid_not_found(
     assert mock_move_to_plunger_bottom.call_count == 5
 
 
+# Speeds to simulate motion time with, in mm/s, from the low throughput max speeds.
+_SIMULATED_AXIS_SPEEDS = {Axis.Z_L: 100.0, Axis.P_L: 70.0}
+
+
+async def test_liquid_probe_sequence_simulated_time(
+    ot3_hardware: ThreadManager[OT3API],
+    hardware_backend: OT3Simulator,
+    fake_liquid_settings: LiquidProbeSettings,
+) -> None:
+    """Probing the same well over and over should be faster near the last height.
+
+    The liquid in a 40 mm deep well drops by 4 mm between probes. Each sequence of
+    probes either always starts at the top of the well, or starts just above the
+    height the last probe found. Time is simulated from the distance each axis moves,
+    whether that's probing or not.
+    """
+    instr_data = AttachedPipette(
+        config=load_pipette_data.load_definition(
+            PipetteModelType("p1000"), PipetteChannelType(1), PipetteVersionType(3, 4)
+        ),
+        id="fakepip",
+    )
+    await ot3_hardware.cache_pipette(OT3Mount.LEFT, instr_data, None)
+    await ot3_hardware.add_tip(OT3Mount.LEFT, 100)
+    await ot3_hardware.home()
+
+    well_top = 100.0
+    well_depth = 40.0
+    lld_min_height = 0.5
+
+    # Find how deck heights map onto the simulated z axis.
+    await ot3_hardware.move_to(OT3Mount.LEFT, Point(10, 10, well_top))
+    machine_top = hardware_backend._position[Axis.Z_L]
+    await ot3_hardware.move_to(OT3Mount.LEFT, Point(10, 10, well_top - 10))
+    machine_per_deck = (hardware_backend._position[Axis.Z_L] - machine_top) / -10
+
+    simulated_time = 0.0
+    probe_passes = 0
+    liquid_height = 0.0
+    original_move = hardware_backend.move
+
+    async def _timed_move(
+        origin: Dict[Axis, float],
+        target: Dict[Axis, float],
+        speed: Optional[float] = None,
+        stop_condition: HWStopCondition = HWStopCondition.none,
+        nodes_in_moves_only: bool = True,
+    ) -> None:
+        nonlocal simulated_time
+        simulated_time += max(
+            abs(target[axis] - origin.get(axis, target[axis])) / axis_speed
+            for axis, axis_speed in _SIMULATED_AXIS_SPEEDS.items()
+            if axis in target
+        )
+        await original_move(origin, target, speed, stop_condition, nodes_in_moves_only)
+
+    async def _fake_liquid_probe(
+        self: OT3Simulator,
+        mount: OT3Mount,
+        max_p_distance: float,
+        mount_speed: float,
+        plunger_speed: float,
+        threshold_pascals: float,
+        plunger_impulse_time: float,
+        num_baseline_reads: int,
+        output_format: OutputOptions = OutputOptions.can_bus_only,
+        data_files: Optional[Dict[InstrumentProbeType, str]] = None,
+        probe: InstrumentProbeType = InstrumentProbeType.PRIMARY,
+        force_both_sensors: bool = False,
+    ) -> float:
+        nonlocal simulated_time, probe_passes
+        probe_passes += 1
+        # Work in deck heights, which the simulated z axis runs opposite to.
+        start = well_top + (self._position[Axis.Z_L] - machine_top) / machine_per_deck
+        surface = well_top - well_depth + liquid_height
+        travel = mount_speed * abs(max_p_distance / plunger_speed)
+        found = start >= surface > start - travel
+        end = surface if found else start - travel
+        simulated_time += (start - end) / mount_speed
+        machine_end = machine_top + (end - well_top) * machine_per_deck
+        self._position[Axis.Z_L] = machine_end
+        self._encoder_position[Axis.Z_L] = machine_end
+        if not found:
+            raise PipetteLiquidNotFoundError()
+        return machine_end
+
+    hardware_backend.liquid_probe = types.MethodType(  # type: ignore[method-assign]
+        _fake_liquid_probe, hardware_backend
+    )
+    hardware_backend.move = _timed_move  # type: ignore[method-assign]
+
+    async def _probe_sequence(
+        margin_above_last_height: Optional[float],
+    ) -> Tuple[List[float], int, float]:
+        nonlocal simulated_time, probe_passes, liquid_height
+        simulated_time = 0.0
+        probe_passes = 0
+        liquid_height = 36.0
+        found_heights: List[float] = []
+        for _ in range(8):
+            if margin_above_last_height is None or not found_heights:
+                start_height = well_depth
+            else:
+                start_height = found_heights[-1] + margin_above_last_height
+            await ot3_hardware.move_to(
+                OT3Mount.LEFT, Point(10, 10, well_top - well_depth + start_height)
+            )
+            found_z = await ot3_hardware.liquid_probe(
+                OT3Mount.LEFT, start_height - lld_min_height, fake_liquid_settings
+            )
+            found_heights.append(found_z - (well_top - well_depth))
+            liquid_height -= 4
+        return found_heights, probe_passes, simulated_time
+
+    from_top = await _probe_sequence(margin_above_last_height=None)
+    from_last_height = await _probe_sequence(margin_above_last_height=2.0)
+
+    expected_heights = pytest.approx([36, 32, 28, 24, 20, 16, 12, 8])
+    assert from_top[0] == expected_heights
+    assert from_last_height[0] == expected_heights
+    # Searching from the top takes more passes as the liquid gets lower...
+    assert from_top[1] == 11
+    # ...but starting near the last height, every probe takes just one.
+    assert from_last_height[1] == 8
+    assert from_last_height[2] < 0.6 * from_top[2]
+
+
 @pytest.mark.parametrize(
     "mount,moving",
     [
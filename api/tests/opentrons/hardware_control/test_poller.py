@@ -1,9 +1,9 @@
 import asyncio
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Tuple
 
 import pytest
 from decoy import Decoy, matchers
-from opentrons.hardware_control.poller import Poller, Reader
+from opentrons.hardware_control.poller import Poller, PollPolicy, Reader
 
 
 POLLING_INTERVAL = 0.1
@@ -179,3 +179,87 @@ async def test_poller_cancelled_wait(
 
     await asyncio.sleep(2 * subject.interval)
     assert wait_task_2.done() is True
+
+
+class _CountingReader(Reader):
+    """A reader that counts its reads and can pretend to be settled."""
+
+    def __init__(self) -> None:
+        self.read_count = 0
+        self.settled = True
+
+    async def read(self) -> None:
+        self.read_count += 1
+
+    def is_settled(self) -> bool:
+        return self.settled
+
+
+@pytest.fixture
+async def adaptive_subject() -> AsyncGenerator[Tuple[Poller, _CountingReader], None]:
+    """Create a poller that backs off, with a counting reader."""
+    reader = _CountingReader()
+    poller = Poller(
+        reader=reader,
+        interval=PollPolicy(
+            active_interval=POLLING_INTERVAL / 10,
+            idle_interval=POLLING_INTERVAL * 4,
+        ),
+    )
+    yield poller, reader
+    await poller.stop()
+
+
+async def test_poller_backs_off_while_settled(
+    adaptive_subject: Tuple[Poller, _CountingReader]
+) -> None:
+    """It should poll less and less often while the reader is settled."""
+    subject, reader = adaptive_subject
+    await subject.start()
+    await asyncio.sleep(POLLING_INTERVAL * 8)
+
+    # a fixed interval would have read 80 times by now
+    assert reader.read_count < 15
+    assert subject.interval == POLLING_INTERVAL * 4
+
+
+async def test_poller_speeds_up_while_unsettled(
+    adaptive_subject: Tuple[Poller, _CountingReader]
+) -> None:
+    """It should poll at the active interval while the reader isn't settled."""
+    subject, reader = adaptive_subject
+    reader.settled = False
+    await subject.start()
+    await asyncio.sleep(POLLING_INTERVAL * 4)
+
+    assert reader.read_count > 20
+    assert subject.interval == POLLING_INTERVAL / 10
+
+
+async def test_poller_wakes_for_waiters(
+    adaptive_subject: Tuple[Poller, _CountingReader]
+) -> None:
+    """Waiting for a poll should cut short an idle interval."""
+    subject, reader = adaptive_subject
+    await subject.start()
+    await asyncio.sleep(POLLING_INTERVAL * 8)
+    assert subject.interval == POLLING_INTERVAL * 4
+
+    # without waking, the next poll would be up to 4 intervals away
+    await asyncio.wait_for(subject.wait_next_poll(), timeout=POLLING_INTERVAL)
+
+
+async def test_poller_wakes_on_request(
+    adaptive_subject: Tuple[Poller, _CountingReader]
+) -> None:
+    """Waking the poller should cut short an idle interval."""
+    subject, reader = adaptive_subject
+    await subject.start()
+    await asyncio.sleep(POLLING_INTERVAL * 8)
+    read_count = reader.read_count
+
+    reader.settled = False
+    subject.wake()
+    await asyncio.sleep(POLLING_INTERVAL)
+
+    assert reader.read_count > read_count + 5
@@ -0,0 +1,28 @@
+"""Tests for opentrons.hardware_control.tracing."""
+import sys
+
+import pytest
+
+from opentrons.hardware_control import tracing
+
+
+def test_traced_without_opentrons_hardware(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Without opentrons_hardware, it should leave functions unchanged."""
+    monkeypatch.setitem(sys.modules, "opentrons_hardware", None)
+
+    def func() -> int:
+        return 1
+
+    assert tracing.traced(category="motion")(func) is func
+
+
+def test_traced_records_spans() -> None:
+    """With opentrons_hardware, it should record a span on the hardware tracer."""
+    hardware_tracing = pytest.importorskip("opentrons_hardware.tracing")
+
+    @tracing.traced(name="traced-func", category="motion")
+    def func() -> int:
+        return 1
+
+    assert func() == 1
+    assert hardware_tracing.get_tracer().records()[-1].name == "traced-func"
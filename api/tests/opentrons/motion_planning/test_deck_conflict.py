@@ -1,8 +1,10 @@
 """Tests for opentrons.protocols.geometry.deck_conflict."""
-from typing import ContextManager
+import functools
+from typing import ContextManager, Dict, List, Mapping, Optional, Union
 from contextlib import nullcontext
 
 import pytest
+from hypothesis import given, settings, strategies
 
 from opentrons_shared_data.labware.types import LabwareUri
 from opentrons_shared_data.robot.types import RobotType
@@ -644,3 +646,169 @@ def test_no_staging_slot_adjacent_to_module(
         new_location=deck_slot_name,
         robot_type="OT-3 Standard",
     )
+
+
+def _check_every_item(
+    existing_items: Mapping[
+        Union[DeckSlotName, StagingSlotName], deck_conflict.DeckItem
+    ],
+    new_item: deck_conflict.DeckItem,
+    new_location: Union[DeckSlotName, StagingSlotName],
+    robot_type: RobotType,
+) -> None:
+    """Check for conflicts by building restrictions for every item on the deck.
+
+    This is how check() used to work, before it only looked at nearby items.
+    """
+    restrictions: List[deck_conflict._DeckRestriction] = []
+    for location, item in existing_items.items():
+        restrictions += deck_conflict._create_restrictions(
+            item=item, location=location, robot_type=robot_type
+        )
+
+    for r in restrictions:
+        if r.location == new_location and not r.is_allowed(new_item):
+            raise deck_conflict.DeckConflictError(
+                deck_conflict._create_deck_conflict_error_message(
+                    restriction=r, new_item=new_item
+                )
+            )
+
+    for r in deck_conflict._create_restrictions(
+        item=new_item, location=new_location, robot_type=robot_type
+    ):
+        existing_item = existing_items.get(r.location)
+        if existing_item is not None and not r.is_allowed(existing_item):
+            raise deck_conflict.DeckConflictError(
+                deck_conflict._create_deck_conflict_error_message(
+                    restriction=r, existing_item=existing_item
+                )
+            )
+
+
+def _identity(item: deck_conflict.DeckItem) -> deck_conflict.DeckItem:
+    return item
+
+
+_locations = strategies.sampled_from([*DeckSlotName, *StagingSlotName])
+_heights = strategies.floats(min_value=0, max_value=100)
+_deck_items = strategies.one_of(
+    strategies.builds(
+        deck_conflict.Labware,
+        name_for_errors=strategies.sampled_from(["labware_a", "labware_b"]),
+        highest_z=_heights,
+        uri=strategies.sampled_from(
+            deck_conflict.HS_ALLOWED_ADJACENT_TALL_LABWARE
+            + [LabwareUri("opentrons/some_plate/1")]
+        ),
+        is_fixed_trash=strategies.booleans(),
+    ),
+    strategies.builds(
+        deck_conflict.TrashBin,
+        name_for_errors=strategies.just("trash"),
+        highest_z=_heights,
+    ),
+    strategies.builds(
+        deck_conflict.HeaterShakerModule,
+        name_for_errors=strategies.just("heater_shaker"),
+        highest_z_including_labware=_heights,
+    ),
+    strategies.builds(
+        deck_conflict.MagneticBlockModule,
+        name_for_errors=strategies.just("magnetic_block"),
+        highest_z_including_labware=_heights,
+    ),
+    strategies.builds(
+        deck_conflict.ThermocyclerModule,
+        name_for_errors=strategies.just("thermocycler"),
+        highest_z_including_labware=_heights,
+        is_semi_configuration=strategies.booleans(),
+    ),
+    strategies.builds(
+        deck_conflict.OtherModule,
+        name_for_errors=strategies.just("other_module"),
+        highest_z_including_labware=_heights,
+    ),
+)
+
+
+@pytest.mark.parametrize("robot_type", ["OT-2 Standard", "OT-3 Standard"])
+@settings(max_examples=500, deadline=None)
+@given(
+    existing_items=strategies.dictionaries(_locations, _deck_items, max_size=12),
+    new_item=_deck_items,
+    new_location=_locations,
+)
+def test_matches_checking_every_item(
+    robot_type: RobotType,
+    existing_items: Dict[Union[DeckSlotName, StagingSlotName], deck_conflict.DeckItem],
+    new_item: deck_conflict.DeckItem,
+    new_location: Union[DeckSlotName, StagingSlotName],
+) -> None:
+    """It should find the same conflicts as checking every item on the deck."""
+    expected_error: Optional[str] = None
+    try:
+        _check_every_item(existing_items, new_item, new_location, robot_type)
+    except deck_conflict.DeckConflictError as e:
+        expected_error = str(e)
+
+    for items in [
+        existing_items,
+        deck_conflict.LazyDeckItems(
+            {
+                location: functools.partial(_identity, item)
+                for location, item in existing_items.items()
+            }
+        ),
+    ]:
+        error: Optional[str] = None
+        try:
+            deck_conflict.check(
+                existing_items=items,
+                new_item=new_item,
+                new_location=new_location,
+                robot_type=robot_type,
+            )
+        except deck_conflict.DeckConflictError as e:
+            error = str(e)
+        assert error == expected_error
+
+
+def test_lazy_deck_items_only_maps_nearby_items() -> None:
+    """It should only map the items that could conflict with the new item."""
+    mapped_locations: List[DeckSlotName] = []
+
+    def map_labware(location: DeckSlotName) -> deck_conflict.DeckItem:
+        mapped_locations.append(location)
+        return deck_conflict.Labware(
+            name_for_errors=f"labware_{location}",
+            highest_z=10,
+            uri=LabwareUri("opentrons/some_plate/1"),
+            is_fixed_trash=False,
+        )
+
+    existing_items = deck_conflict.LazyDeckItems(
+        {
+            DeckSlotName.from_primitive(slot): functools.partial(
+                map_labware, DeckSlotName.from_primitive(slot)
+            )
+            for slot in range(1, 12)
+            if slot != 5
+        }
+    )
+
+    deck_conflict.check(
+        existing_items=existing_items,
+        new_item=deck_conflict.HeaterShakerModule(
+            name_for_errors="heater_shaker", highest_z_including_labware=100
+        ),
+        new_location=DeckSlotName.SLOT_5,
+        robot_type="OT-2 Standard",
+    )
+
+    assert sorted(mapped_locations, key=DeckSlotName.as_int) == [
+        DeckSlotName.SLOT_2,
+        DeckSlotName.SLOT_4,
+        DeckSlotName.SLOT_6,
+        DeckSlotName.SLOT_8,
+    ]
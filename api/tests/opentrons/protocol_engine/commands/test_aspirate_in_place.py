@@ -19,7 +19,9 @@ from opentrons.protocol_engine.commands.command import SuccessData, DefinedError
 from opentrons.protocol_engine.errors.exceptions import PipetteNotReadyToAspirateError
 from opentrons.protocol_engine.notes import CommandNoteAdder
 from opentrons.protocol_engine.resources import ModelUtils
+from opentrons.protocol_engine.state import update_types
 from opentrons.protocol_engine.state.state import StateStore
+from opentrons.protocol_engine.types import CurrentWell
 from opentrons.protocol_engine.commands.pipetting_common import OverpressureError
 
 
@@ -81,6 +83,11 @@ async def test_aspirate_in_place_implementation(
             pipette_id="pipette-id-abc",
         )
     ).then_return(True)
+    decoy.when(state_store.pipettes.get_current_location()).then_return(
+        CurrentWell(
+            pipette_id="pipette-id-abc", labware_id="labware-id", well_name="A1"
+        )
+    )
 
     decoy.when(
         await pipetting.aspirate_in_place(
@@ -93,7 +100,15 @@ async def test_aspirate_in_place_implementation(
 
     result = await subject.execute(params=data)
 
-    assert result == SuccessData(public=AspirateInPlaceResult(volume=123), private=None)
+    assert result == SuccessData(
+        public=AspirateInPlaceResult(volume=123),
+        private=None,
+        state_update=update_types.StateUpdate(
+            liquid_operated=update_types.LiquidOperatedUpdate(
+                labware_id="labware-id", well_name="A1", volume_added=-123
+            )
+        ),
+    )
 
 
 async def test_handle_aspirate_in_place_request_not_ready_to_aspirate(
@@ -201,4 +216,5 @@ async def test_overpressure_error(
             wrappedErrors=[matchers.Anything()],
             errorInfo={"retryLocation": (position.x, position.y, position.z)},
         ),
+        state_update=update_types.StateUpdate(),
     )
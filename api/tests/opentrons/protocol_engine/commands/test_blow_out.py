@@ -85,7 +85,10 @@ async def test_blow_out_implementation(
                     well_name="C6",
                 ),
                 new_deck_point=DeckPoint(x=1, y=2, z=3),
-            )
+            ),
+            liquid_operated=update_types.LiquidOperatedUpdate(
+                labware_id="labware-id", well_name="C6", volume_added=update_types.CLEAR
+            ),
         ),
     )
 
@@ -6,6 +6,7 @@ from opentrons.protocol_engine.commands.pipetting_common import OverpressureErro
 from opentrons.protocol_engine.execution.gantry_mover import GantryMover
 from opentrons.protocol_engine.resources.model_utils import ModelUtils
 from opentrons.protocol_engine.state.state import StateView
+from opentrons.protocol_engine.types import CurrentAddressableArea
 from opentrons.protocol_engine.commands.blow_out_in_place import (
     BlowOutInPlaceParams,
     BlowOutInPlaceResult,
@@ -42,6 +43,7 @@ def subject(
 async def test_blow_out_in_place_implementation(
     decoy: Decoy,
     subject: BlowOutInPlaceImplementation,
+    state_view: StateView,
     pipetting: PipettingHandler,
 ) -> None:
     """Test BlowOut command execution."""
@@ -49,6 +51,12 @@ async def test_blow_out_in_place_implementation(
         pipetteId="pipette-id",
         flowRate=1.234,
     )
+    # Over a trash bin, so no well's liquid is affected.
+    decoy.when(state_view.pipettes.get_current_location()).then_return(
+        CurrentAddressableArea(
+            pipette_id="pipette-id", addressable_area_name="movableTrashA3"
+        )
+    )
 
     result = await subject.execute(data)
 
@@ -92,6 +92,9 @@ async def test_dispense_implementation(
                 ),
                 new_deck_point=DeckPoint.construct(x=1, y=2, z=3),
             ),
+            liquid_operated=update_types.LiquidOperatedUpdate(
+                labware_id="labware-id-abc123", well_name="A3", volume_added=42
+            ),
         ),
     )
 
@@ -161,5 +164,10 @@ async def test_overpressure_error(
                 ),
                 new_deck_point=DeckPoint.construct(x=1, y=2, z=3),
             ),
+            liquid_operated=update_types.LiquidOperatedUpdate(
+                labware_id="labware-id",
+                well_name="well-name",
+                volume_added=update_types.CLEAR,
+            ),
         ),
     )
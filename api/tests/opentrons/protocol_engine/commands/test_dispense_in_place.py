@@ -16,17 +16,24 @@ from opentrons.protocol_engine.commands.dispense_in_place import (
 )
 from opentrons.protocol_engine.commands.pipetting_common import OverpressureError
 from opentrons.protocol_engine.resources import ModelUtils
+from opentrons.protocol_engine.state import update_types
+from opentrons.protocol_engine.state.state import StateView
+from opentrons.protocol_engine.types import CurrentWell
 
 
 async def test_dispense_in_place_implementation(
     decoy: Decoy,
     pipetting: PipettingHandler,
+    state_view: StateView,
     gantry_mover: GantryMover,
     model_utils: ModelUtils,
 ) -> None:
     """It should dispense in place."""
     subject = DispenseInPlaceImplementation(
-        pipetting=pipetting, gantry_mover=gantry_mover, model_utils=model_utils
+        pipetting=pipetting,
+        state_view=state_view,
+        gantry_mover=gantry_mover,
+        model_utils=model_utils,
     )
 
     data = DispenseInPlaceParams(
@@ -40,21 +47,38 @@ async def test_dispense_in_place_implementation(
             pipette_id="pipette-id-abc", volume=123, flow_rate=456, push_out=None
         )
     ).then_return(42)
+    decoy.when(state_view.pipettes.get_current_location()).then_return(
+        CurrentWell(
+            pipette_id="pipette-id-abc", labware_id="labware-id", well_name="A1"
+        )
+    )
 
     result = await subject.execute(data)
 
-    assert result == SuccessData(public=DispenseInPlaceResult(volume=42), private=None)
+    assert result == SuccessData(
+        public=DispenseInPlaceResult(volume=42),
+        private=None,
+        state_update=update_types.StateUpdate(
+            liquid_operated=update_types.LiquidOperatedUpdate(
+                labware_id="labware-id", well_name="A1", volume_added=42
+            )
+        ),
+    )
 
 
 async def test_overpressure_error(
     decoy: Decoy,
     gantry_mover: GantryMover,
     pipetting: PipettingHandler,
+    state_view: StateView,
     model_utils: ModelUtils,
 ) -> None:
     """It should return an overpressure error if the hardware API indicates that."""
     subject = DispenseInPlaceImplementation(
-        pipetting=pipetting, gantry_mover=gantry_mover, model_utils=model_utils
+        pipetting=pipetting,
+        state_view=state_view,
+        gantry_mover=gantry_mover,
+        model_utils=model_utils,
     )
 
     pipette_id = "pipette-id"
@@ -93,4 +117,6 @@ async def test_overpressure_error(
             wrappedErrors=[matchers.Anything()],
             errorInfo={"retryLocation": (position.x, position.y, position.z)},
         ),
+        # The pipette's location is unknown, so it could be in any well.
+        state_update=update_types.StateUpdate(liquid_operated=update_types.CLEAR),
     )
@@ -1,6 +1,6 @@
 """Test LiquidProbe commands."""
 from datetime import datetime
-from typing import Type, Union
+from typing import Optional, Type, Union
 
 from opentrons.protocol_engine.errors.exceptions import (
     MustHomeError,
@@ -234,6 +234,281 @@ async def test_liquid_not_found_error(
         )
 
 
+async def test_liquid_probe_above_known_liquid_height(
+    decoy: Decoy,
+    movement: MovementHandler,
+    state_view: StateView,
+    pipetting: PipettingHandler,
+    subject: EitherImplementation,
+    params_type: EitherParamsType,
+    result_type: EitherResultType,
+) -> None:
+    """It should start probing just above the liquid height it predicts."""
+    location = WellLocation(origin=WellOrigin.TOP, offset=WellOffset(x=1, y=0, z=-1))
+    # 3 mm below the last measured height, plus the 2 mm margin.
+    location_above_liquid = WellLocation(
+        origin=WellOrigin.MENISCUS, offset=WellOffset(x=1, y=0, z=-1)
+    )
+
+    data = params_type(
+        pipetteId="abc",
+        labwareId="123",
+        wellName="A3",
+        wellLocation=location,
+        knownLiquidHeightMargin=2,
+    )
+
+    decoy.when(state_view.pipettes.get_aspirated_volume(pipette_id="abc")).then_return(
+        0
+    )
+    decoy.when(
+        state_view.wells.get_last_measured_liquid_height(
+            labware_id="123", well_name="A3"
+        )
+    ).then_return(10)
+    decoy.when(
+        state_view.geometry.get_predicted_liquid_height(
+            labware_id="123", well_name="A3"
+        )
+    ).then_return(7)
+    decoy.when(
+        state_view.geometry.get_well_position(
+            labware_id="123",
+            well_name="A3",
+            well_location=location_above_liquid,
+            pipette_id="abc",
+        )
+    ).then_return(Point(x=1, y=2, z=13))
+    decoy.when(
+        state_view.geometry.get_well_position(
+            labware_id="123", well_name="A3", well_location=location, pipette_id="abc"
+        )
+    ).then_return(Point(x=1, y=2, z=40))
+
+    decoy.when(
+        await movement.move_to_well(
+            pipette_id="abc",
+            labware_id="123",
+            well_name="A3",
+            well_location=location_above_liquid,
+        ),
+    ).then_return(Point(x=1, y=2, z=13))
+    decoy.when(
+        await pipetting.liquid_probe_in_place(
+            pipette_id="abc",
+            labware_id="123",
+            well_name="A3",
+            well_location=location_above_liquid,
+        ),
+    ).then_return(8.0)
+
+    result = await subject.execute(data)
+
+    assert result == SuccessData(
+        public=result_type(z_position=8.0, position=DeckPoint(x=1, y=2, z=13)),
+        private=None,
+        state_update=update_types.StateUpdate(
+            pipette_location=update_types.PipetteLocationUpdate(
+                pipette_id="abc",
+                new_location=update_types.Well(labware_id="123", well_name="A3"),
+                new_deck_point=DeckPoint(x=1, y=2, z=13),
+            )
+        ),
+    )
+    decoy.verify(
+        await movement.move_to_well(
+            pipette_id="abc",
+            labware_id="123",
+            well_name="A3",
+            well_location=location,
+        ),
+        times=0,
+    )
+
+
+async def test_liquid_probe_above_known_liquid_height_falls_back(
+    decoy: Decoy,
+    movement: MovementHandler,
+    state_view: StateView,
+    pipetting: PipettingHandler,
+    subject: EitherImplementation,
+    params_type: EitherParamsType,
+    result_type: EitherResultType,
+) -> None:
+    """It should search the whole well if there's no liquid below the last height."""
+    location = WellLocation(origin=WellOrigin.TOP, offset=WellOffset(x=0, y=0, z=-1))
+    location_above_liquid = WellLocation(
+        origin=WellOrigin.MENISCUS, offset=WellOffset(x=0, y=0, z=0.5)
+    )
+
+    data = params_type(
+        pipetteId="abc",
+        labwareId="123",
+        wellName="A3",
+        wellLocation=location,
+        knownLiquidHeightMargin=0.5,
+    )
+
+    decoy.when(state_view.pipettes.get_aspirated_volume(pipette_id="abc")).then_return(
+        0
+    )
+    decoy.when(
+        state_view.wells.get_last_measured_liquid_height(
+            labware_id="123", well_name="A3"
+        )
+    ).then_return(10)
+    decoy.when(
+        state_view.geometry.get_predicted_liquid_height(
+            labware_id="123", well_name="A3"
+        )
+    ).then_return(10)
+    decoy.when(
+        state_view.geometry.get_well_position(
+            labware_id="123",
+            well_name="A3",
+            well_location=location_above_liquid,
+            pipette_id="abc",
+        )
+    ).then_return(Point(x=1, y=2, z=11.5))
+    decoy.when(
+        state_view.geometry.get_well_position(
+            labware_id="123", well_name="A3", well_location=location, pipette_id="abc"
+        )
+    ).then_return(Point(x=1, y=2, z=40))
+
+    decoy.when(
+        await movement.move_to_well(
+            pipette_id="abc",
+            labware_id="123",
+            well_name="A3",
+            well_location=location_above_liquid,
+        ),
+    ).then_return(Point(x=1, y=2, z=11.5))
+    decoy.when(
+        await pipetting.liquid_probe_in_place(
+            pipette_id="abc",
+            labware_id="123",
+            well_name="A3",
+            well_location=location_above_liquid,
+        ),
+    ).then_raise(PipetteLiquidNotFoundError())
+    decoy.when(
+        await movement.move_to_well(
+            pipette_id="abc",
+            labware_id="123",
+            well_name="A3",
+            well_location=location,
+        ),
+    ).then_return(Point(x=1, y=2, z=40))
+    decoy.when(
+        await pipetting.liquid_probe_in_place(
+            pipette_id="abc",
+            labware_id="123",
+            well_name="A3",
+            well_location=location,
+        ),
+    ).then_return(20.0)
+
+    result = await subject.execute(data)
+
+    assert result == SuccessData(
+        public=result_type(z_position=20.0, position=DeckPoint(x=1, y=2, z=40)),
+        private=None,
+        state_update=update_types.StateUpdate(
+            pipette_location=update_types.PipetteLocationUpdate(
+                pipette_id="abc",
+                new_location=update_types.Well(labware_id="123", well_name="A3"),
+                new_deck_point=DeckPoint(x=1, y=2, z=40),
+            )
+        ),
+    )
+
+
+@pytest.mark.parametrize("predicted_height", [None, 39.0])
+async def test_liquid_probe_above_unhelpful_liquid_height(
+    decoy: Decoy,
+    movement: MovementHandler,
+    state_view: StateView,
+    pipetting: PipettingHandler,
+    subject: EitherImplementation,
+    params_type: EitherParamsType,
+    result_type: EitherResultType,
+    predicted_height: Optional[float],
+) -> None:
+    """It should start at the requested location if the liquid height doesn't help."""
+    location = WellLocation(origin=WellOrigin.TOP, offset=WellOffset(x=0, y=0, z=-1))
+    location_above_liquid = WellLocation(
+        origin=WellOrigin.MENISCUS, offset=WellOffset(x=0, y=0, z=2)
+    )
+
+    data = params_type(
+        pipetteId="abc",
+        labwareId="123",
+        wellName="A3",
+        wellLocation=location,
+        knownLiquidHeightMargin=2,
+    )
+
+    decoy.when(state_view.pipettes.get_aspirated_volume(pipette_id="abc")).then_return(
+        0
+    )
+    decoy.when(
+        state_view.wells.get_last_measured_liquid_height(
+            labware_id="123", well_name="A3"
+        )
+    ).then_return(39.0)
+    decoy.when(
+        state_view.geometry.get_predicted_liquid_height(
+            labware_id="123", well_name="A3"
+        )
+    ).then_return(predicted_height)
+    decoy.when(
+        state_view.geometry.get_well_position(
+            labware_id="123",
+            well_name="A3",
+            well_location=location_above_liquid,
+            pipette_id="abc",
+        )
+    ).then_return(Point(x=1, y=2, z=41))
+    decoy.when(
+        state_view.geometry.get_well_position(
+            labware_id="123", well_name="A3", well_location=location, pipette_id="abc"
+        )
+    ).then_return(Point(x=1, y=2, z=40))
+
+    decoy.when(
+        await movement.move_to_well(
+            pipette_id="abc",
+            labware_id="123",
+            well_name="A3",
+            well_location=location,
+        ),
+    ).then_return(Point(x=1, y=2, z=40))
+    decoy.when(
+        await pipetting.liquid_probe_in_place(
+            pipette_id="abc",
+            labware_id="123",
+            well_name="A3",
+            well_location=location,
+        ),
+    ).then_return(38.0)
+
+    result = await subject.execute(data)
+
+    assert result.public == result_type(
+        z_position=38.0, position=DeckPoint(x=1, y=2, z=40)
+    )
+    decoy.verify(
+        await movement.move_to_well(
+            pipette_id="abc",
+            labware_id="123",
+            well_name="A3",
+            well_location=location_above_liquid,
+        ),
+        times=0,
+    )
+
+
 async def test_liquid_probe_tip_checking(
     decoy: Decoy,
     state_view: StateView,
@@ -4,13 +4,20 @@ from typing import cast
 import pytest
 from decoy import Decoy
 
-from opentrons.types import Mount
+from opentrons_shared_data.labware.labware_definition import WellDefinition
+
+from opentrons.types import Mount, Point
 from opentrons.hardware_control import API as HardwareAPI
 from opentrons.hardware_control.dev_types import PipetteDict
 
 from opentrons.protocol_engine.state.state import StateView
 from opentrons.protocol_engine.state.pipettes import HardwarePipette
-from opentrons.protocol_engine.types import TipGeometry
+from opentrons.protocol_engine.types import (
+    TipGeometry,
+    WellLocation,
+    WellOffset,
+    WellOrigin,
+)
 from opentrons.protocol_engine.execution.pipetting import (
     HardwarePipettingHandler,
     VirtualPipettingHandler,
@@ -270,6 +277,73 @@ async def test_hw_aspirate_in_place(
     )
 
 
+@pytest.mark.parametrize(
+    ("well_location", "start_height", "expected_max_z_dist"),
+    [
+        (WellLocation(origin=WellOrigin.TOP, offset=WellOffset(z=2)), 40, 41.5),
+        (WellLocation(origin=WellOrigin.MENISCUS, offset=WellOffset(z=2)), 12, 13.5),
+    ],
+)
+async def test_hw_liquid_probe_in_place(
+    decoy: Decoy,
+    mock_state_view: StateView,
+    mock_hardware_api: HardwareAPI,
+    hardware_subject: HardwarePipettingHandler,
+    well_location: WellLocation,
+    start_height: float,
+    expected_max_z_dist: float,
+) -> None:
+    """It should probe down from the start location to the lowest detectable height."""
+    decoy.when(mock_hardware_api.attached_instruments).then_return({})
+    decoy.when(
+        mock_state_view.pipettes.get_hardware_pipette(
+            pipette_id="pipette-id",
+            attached_pipettes={},
+        )
+    ).then_return(HardwarePipette(mount=Mount.LEFT, config=cast(PipetteDict, {})))
+    decoy.when(
+        mock_state_view.labware.get_well_definition("labware-id", "A1")
+    ).then_return(
+        WellDefinition(
+            depth=40,
+            x=10,
+            y=20,
+            z=3,
+            totalLiquidVolume=100,
+            diameter=5,
+            shape="circular",
+        )
+    )
+    decoy.when(
+        mock_state_view.geometry.get_well_offset_adjustment(
+            labware_id="labware-id",
+            well_name="A1",
+            well_location=well_location,
+            well_depth=40,
+        )
+    ).then_return(start_height)
+    decoy.when(
+        mock_state_view.pipettes.get_current_tip_lld_settings(pipette_id="pipette-id")
+    ).then_return(0.5)
+    decoy.when(
+        await mock_hardware_api.liquid_probe(
+            mount=Mount.LEFT, max_z_dist=expected_max_z_dist
+        )
+    ).then_return(109)
+    decoy.when(mock_state_view.geometry.get_labware_position("labware-id")).then_return(
+        Point(x=100, y=200, z=100)
+    )
+
+    result = await hardware_subject.liquid_probe_in_place(
+        pipette_id="pipette-id",
+        labware_id="labware-id",
+        well_name="A1",
+        well_location=well_location,
+    )
+
+    assert result == 6
+
+
 async def test_virtual_blow_out_in_place(
     decoy: Decoy,
     mock_state_view: StateView,
@@ -1,10 +1,11 @@
 """Test deck configuration provider."""
+import copy
 from typing import List, Set
 
 import pytest
 from pytest_lazyfixture import lazy_fixture  # type: ignore[import-untyped]
 
-from opentrons_shared_data.deck import load as load_deck
+from opentrons_shared_data.deck import load as load_deck, list_names
 from opentrons_shared_data.deck.types import DeckDefinitionV5
 
 from opentrons.types import DeckSlotName
@@ -332,3 +333,73 @@ def test_get_addressable_area_from_name_raises(
             DeckSlotName.SLOT_A1,
             ot3_standard_deck_def,
         )
+
+
+@pytest.mark.parametrize("deck_name", list_names(5))
+def test_index_matches_deck_definition(deck_name: str) -> None:
+    """Lookups should find the same things as a scan through the deck definition."""
+    deck_def = load_deck(deck_name, 5)
+    index = subject.DeckDefinitionIndex.build(deck_def)
+
+    for cutout in deck_def["locations"]["cutouts"]:
+        position = cutout["position"]
+        assert subject.get_cutout_position(cutout["id"], deck_def) == DeckPoint(
+            x=position[0], y=position[1], z=position[2]
+        )
+    assert len(index.cutout_positions) == len(deck_def["locations"]["cutouts"])
+
+    for cutout_fixture in deck_def["cutoutFixtures"]:
+        assert (
+            subject.get_cutout_fixture(cutout_fixture["id"], deck_def) == cutout_fixture
+        )
+    assert len(index.cutout_fixtures) == len(deck_def["cutoutFixtures"])
+
+    for area in deck_def["locations"]["addressableAreas"]:
+        assert subject.get_addressable_area_definition(area["id"], deck_def) == area
+        assert (
+            subject.get_addressable_area_display_name(area["id"], deck_def)
+            == area["displayName"]
+        )
+        expected_fixtures = {
+            PotentialCutoutFixture(
+                cutout_id=cutout_id,
+                cutout_fixture_id=cutout_fixture["id"],
+                provided_addressable_areas=frozenset(provided_areas),
+            )
+            for cutout_fixture in deck_def["cutoutFixtures"]
+            for cutout_id, provided_areas in cutout_fixture[
+                "providesAddressableAreas"
+            ].items()
+            if area["id"] in provided_areas
+        }
+        if expected_fixtures:
+            assert subject.get_potential_cutout_fixtures(area["id"], deck_def) == (
+                next(iter(expected_fixtures)).cutout_id,
+                expected_fixtures,
+            )
+        else:
+            with pytest.raises(AddressableAreaDoesNotExistError):
+                subject.get_potential_cutout_fixtures(area["id"], deck_def)
+    assert len(index.addressable_areas) == len(
+        deck_def["locations"]["addressableAreas"]
+    )
+
+
+def test_index_shared_between_equal_deck_definitions(
+    ot3_standard_deck_def: DeckDefinitionV5,
+) -> None:
+    """It should only index deck definitions with the same contents once."""
+    index = subject.get_deck_definition_index(ot3_standard_deck_def)
+
+    assert subject.get_deck_definition_index(ot3_standard_deck_def) is index
+    assert subject.get_deck_definition_index(load_deck(STANDARD_OT3_DECK, 5)) is index
+
+    changed_deck_def = copy.deepcopy(ot3_standard_deck_def)
+    changed_deck_def["cutoutFixtures"][0]["height"] += 1
+    changed_index = subject.get_deck_definition_index(changed_deck_def)
+
+    assert changed_index is not index
+    assert (
+        changed_index.cutout_fixtures[changed_deck_def["cutoutFixtures"][0]["id"]]
+        == changed_deck_def["cutoutFixtures"][0]
+    )
@@ -993,3 +993,23 @@ def test_set_and_get_error_recovery_policy() -> None:
     assert subject_view.get_error_recovery_policy() is initial_policy
     subject.handle_action(SetErrorRecoveryPolicyAction(sentinel.new_policy))
     assert subject_view.get_error_recovery_policy() is new_policy
+
+
+def test_version() -> None:
+    """The version should increase with every action, even ones that don't touch command state."""
+    subject = CommandStore(
+        config=_make_config(),
+        error_recovery_policy=_placeholder_error_recovery_policy,
+        is_door_open=False,
+    )
+    subject_view = CommandView(subject.state)
+    initial_version = subject_view.get_version()
+
+    subject.handle_action(PlayAction(requested_at=datetime.now()))
+    after_play = subject_view.get_version()
+    assert after_play > initial_version
+
+    subject.handle_action(
+        actions.SetPipetteMovementSpeedAction(pipette_id="pipette-id", speed=None)
+    )
+    assert subject_view.get_version() > after_play
@@ -340,6 +340,7 @@ def test_command_store_handles_pause_action(pause_source: PauseSource) -> None:
         failed_command_errors=[],
         error_recovery_policy=matchers.Anything(),
         has_entered_error_recovery=False,
+        version=1,
     )
 
 
@@ -370,6 +371,7 @@ def test_command_store_handles_play_action(pause_source: PauseSource) -> None:
         failed_command_errors=[],
         error_recovery_policy=matchers.Anything(),
         has_entered_error_recovery=False,
+        version=1,
     )
     assert subject.state.command_history.get_running_command() is None
     assert subject.state.command_history.get_all_ids() == []
@@ -405,6 +407,7 @@ def test_command_store_handles_finish_action() -> None:
         failed_command_errors=[],
         error_recovery_policy=matchers.Anything(),
         has_entered_error_recovery=False,
+        version=2,
     )
     assert subject.state.command_history.get_running_command() is None
     assert subject.state.command_history.get_all_ids() == []
@@ -460,6 +463,7 @@ def test_command_store_handles_stop_action(
         failed_command_errors=[],
         error_recovery_policy=matchers.Anything(),
         has_entered_error_recovery=False,
+        version=2,
     )
     assert subject.state.command_history.get_running_command() is None
     assert subject.state.command_history.get_all_ids() == []
@@ -498,6 +502,7 @@ def test_command_store_handles_stop_action_when_awaiting_recovery() -> None:
         failed_command_errors=[],
         error_recovery_policy=matchers.Anything(),
         has_entered_error_recovery=False,
+        version=2,
     )
     assert subject.state.command_history.get_running_command() is None
     assert subject.state.command_history.get_all_ids() == []
@@ -532,6 +537,7 @@ def test_command_store_cannot_restart_after_should_stop() -> None:
         failed_command_errors=[],
         error_recovery_policy=matchers.Anything(),
         has_entered_error_recovery=False,
+        version=2,
     )
     assert subject.state.command_history.get_running_command() is None
     assert subject.state.command_history.get_all_ids() == []
@@ -679,6 +685,7 @@ def test_command_store_wraps_unknown_errors() -> None:
         failed_command_errors=[],
         error_recovery_policy=matchers.Anything(),
         has_entered_error_recovery=False,
+        version=2,
     )
     assert subject.state.command_history.get_running_command() is None
     assert subject.state.command_history.get_all_ids() == []
@@ -749,6 +756,7 @@ def test_command_store_preserves_enumerated_errors() -> None:
         failed_command_errors=[],
         error_recovery_policy=matchers.Anything(),
         has_entered_error_recovery=False,
+        version=2,
     )
     assert subject.state.command_history.get_running_command() is None
     assert subject.state.command_history.get_all_ids() == []
@@ -785,6 +793,7 @@ def test_command_store_ignores_stop_after_graceful_finish() -> None:
         failed_command_errors=[],
         error_recovery_policy=matchers.Anything(),
         has_entered_error_recovery=False,
+        version=3,
     )
     assert subject.state.command_history.get_running_command() is None
     assert subject.state.command_history.get_all_ids() == []
@@ -821,6 +830,7 @@ def test_command_store_ignores_finish_after_non_graceful_stop() -> None:
         failed_command_errors=[],
         error_recovery_policy=matchers.Anything(),
         has_entered_error_recovery=False,
+        version=3,
     )
     assert subject.state.command_history.get_running_command() is None
     assert subject.state.command_history.get_all_ids() == []
@@ -857,6 +867,7 @@ def test_handles_hardware_stopped() -> None:
         failed_command_errors=[],
         error_recovery_policy=matchers.Anything(),
         has_entered_error_recovery=False,
+        version=1,
     )
     assert subject.state.command_history.get_running_command() is None
     assert subject.state.command_history.get_all_ids() == []
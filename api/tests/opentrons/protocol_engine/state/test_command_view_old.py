@@ -75,6 +75,7 @@ def get_command_view(  # noqa: C901
     latest_command_hash: Optional[str] = None,
     failed_command_errors: Optional[List[ErrorOccurrence]] = None,
     has_entered_error_recovery: bool = False,
+    version: int = 0,
 ) -> CommandView:
     """Get a command view test subject."""
     command_history = CommandHistory()
@@ -115,6 +116,7 @@ def get_command_view(  # noqa: C901
         failed_command_errors=failed_command_errors or [],
         has_entered_error_recovery=has_entered_error_recovery,
         error_recovery_policy=_placeholder_error_recovery_policy,
+        version=version,
     )
 
     return CommandView(state=state)
@@ -1694,6 +1694,72 @@ def test_get_well_position_with_meniscus_and_float_volume_offset(
     )
 
 
+@pytest.mark.parametrize(
+    argnames=["measured_height", "volume_added", "expected_height"],
+    argvalues=[
+        (45.0, 0.0, 45.0),
+        (45.0, -1245.833, 20.0),
+        (45.0, None, None),
+        (None, 0.0, None),
+    ],
+)
+def test_get_predicted_liquid_height(
+    decoy: Decoy,
+    mock_labware_view: LabwareView,
+    mock_well_view: WellView,
+    subject: GeometryView,
+    measured_height: Optional[float],
+    volume_added: Optional[float],
+    expected_height: Optional[float],
+) -> None:
+    """It should adjust the last measured liquid height by the volume added since."""
+    labware_def = _load_labware_definition_data()
+    assert labware_def.innerLabwareGeometry is not None
+    inner_well_def = labware_def.innerLabwareGeometry["welldefinition1111"]
+    decoy.when(mock_labware_view.get_well_geometry("labware-id", "B2")).then_return(
+        inner_well_def
+    )
+    decoy.when(
+        mock_well_view.get_last_measured_liquid_height("labware-id", "B2")
+    ).then_return(measured_height)
+    decoy.when(
+        mock_well_view.get_volume_added_since_measured("labware-id", "B2")
+    ).then_return(volume_added)
+
+    result = subject.get_predicted_liquid_height("labware-id", "B2")
+
+    if expected_height is None:
+        assert result is None
+    else:
+        assert result == pytest.approx(expected_height, abs=1e-3)
+
+
+@pytest.mark.parametrize(
+    argnames=["volume_added", "expected_height"],
+    argvalues=[(-10.0, 45.0), (10.0, None)],
+)
+def test_get_predicted_liquid_height_without_well_geometry(
+    decoy: Decoy,
+    mock_labware_view: LabwareView,
+    mock_well_view: WellView,
+    subject: GeometryView,
+    volume_added: float,
+    expected_height: Optional[float],
+) -> None:
+    """Without the well's geometry, it should only predict that the liquid hasn't risen."""
+    decoy.when(mock_labware_view.get_well_geometry("labware-id", "B2")).then_raise(
+        errors.IncompleteLabwareDefinitionError()
+    )
+    decoy.when(
+        mock_well_view.get_last_measured_liquid_height("labware-id", "B2")
+    ).then_return(45.0)
+    decoy.when(
+        mock_well_view.get_volume_added_since_measured("labware-id", "B2")
+    ).then_return(volume_added)
+
+    assert subject.get_predicted_liquid_height("labware-id", "B2") == expected_height
+
+
 def test_get_well_position_raises_validation_error(
     decoy: Decoy,
     well_plate_def: LabwareDefinition,
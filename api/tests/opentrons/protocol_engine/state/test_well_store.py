@@ -1,9 +1,16 @@
 """Well state store tests."""
 import pytest
-from opentrons.protocol_engine.state.wells import WellStore
+from opentrons.protocol_engine.state import update_types
+from opentrons.protocol_engine.state.wells import WellStore, WellView
 from opentrons.protocol_engine.actions.actions import SucceedCommandAction
 
-from .command_fixtures import create_liquid_probe_command
+from .command_fixtures import (
+    create_aspirate_command,
+    create_blow_out_command,
+    create_dispense_command,
+    create_dispense_in_place_command,
+    create_liquid_probe_command,
+)
 
 
 @pytest.fixture
@@ -26,3 +33,181 @@ def test_handles_liquid_probe_success(subject: WellStore) -> None:
     assert len(subject.state.measured_liquid_heights) == 1
 
     assert subject.state.measured_liquid_heights[labware_id][well_name].height == 0.5
+
+
+def test_handles_pipetting_between_liquid_probes(subject: WellStore) -> None:
+    """It should add up the volumes pipetted into a probed well until it's probed again."""
+    labware_id = "labware-id"
+    well_name = "well-name"
+    aspirate_state_update = update_types.StateUpdate()
+    aspirate_state_update.mark_liquid_operated(
+        labware_id=labware_id, well_name=well_name, volume_added=-20
+    )
+    dispense_state_update = update_types.StateUpdate()
+    dispense_state_update.mark_liquid_operated(
+        labware_id=labware_id, well_name=well_name, volume_added=100
+    )
+
+    subject.handle_action(
+        SucceedCommandAction(private_result=None, command=create_liquid_probe_command())
+    )
+    assert (
+        WellView(subject.state).get_volume_added_since_measured(labware_id, well_name)
+        == 0
+    )
+
+    subject.handle_action(
+        SucceedCommandAction(
+            private_result=None,
+            command=create_aspirate_command(
+                pipette_id="pipette-id",
+                volume=20,
+                flow_rate=1,
+                labware_id=labware_id,
+                well_name=well_name,
+            ),
+            state_update=aspirate_state_update,
+        )
+    )
+    assert (
+        WellView(subject.state).get_volume_added_since_measured(labware_id, well_name)
+        == -20
+    )
+
+    subject.handle_action(
+        SucceedCommandAction(
+            private_result=None,
+            command=create_dispense_command(
+                pipette_id="pipette-id",
+                volume=100,
+                flow_rate=1,
+                labware_id=labware_id,
+                well_name=well_name,
+            ),
+            state_update=dispense_state_update,
+        )
+    )
+    view = WellView(subject.state)
+    assert view.get_volume_added_since_measured(labware_id, well_name) == 80
+    assert view.get_last_measured_liquid_height(labware_id, well_name) == 0.5
+
+    subject.handle_action(
+        SucceedCommandAction(private_result=None, command=create_liquid_probe_command())
+    )
+    assert (
+        WellView(subject.state).get_volume_added_since_measured(labware_id, well_name)
+        == 0
+    )
+
+
+def test_handles_unknown_volume_between_liquid_probes(subject: WellStore) -> None:
+    """An unknown volume added to a probed well should stay unknown until it's probed again."""
+    labware_id = "labware-id"
+    well_name = "well-name"
+    blow_out_state_update = update_types.StateUpdate()
+    blow_out_state_update.mark_liquid_operated(
+        labware_id=labware_id, well_name=well_name, volume_added=update_types.CLEAR
+    )
+    dispense_state_update = update_types.StateUpdate()
+    dispense_state_update.mark_liquid_operated(
+        labware_id=labware_id, well_name=well_name, volume_added=100
+    )
+
+    subject.handle_action(
+        SucceedCommandAction(private_result=None, command=create_liquid_probe_command())
+    )
+    subject.handle_action(
+        SucceedCommandAction(
+            private_result=None,
+            command=create_blow_out_command(
+                pipette_id="pipette-id",
+                flow_rate=1,
+                labware_id=labware_id,
+                well_name=well_name,
+            ),
+            state_update=blow_out_state_update,
+        )
+    )
+    subject.handle_action(
+        SucceedCommandAction(
+            private_result=None,
+            command=create_dispense_command(
+                pipette_id="pipette-id",
+                volume=100,
+                flow_rate=1,
+                labware_id=labware_id,
+                well_name=well_name,
+            ),
+            state_update=dispense_state_update,
+        )
+    )
+    assert (
+        WellView(subject.state).get_volume_added_since_measured(labware_id, well_name)
+        is None
+    )
+
+    subject.handle_action(
+        SucceedCommandAction(private_result=None, command=create_liquid_probe_command())
+    )
+    assert (
+        WellView(subject.state).get_volume_added_since_measured(labware_id, well_name)
+        == 0
+    )
+
+
+def test_handles_liquid_operated_elsewhere(subject: WellStore) -> None:
+    """Operating on a different well should not affect a probed well."""
+    other_well_state_update = update_types.StateUpdate()
+    other_well_state_update.mark_liquid_operated(
+        labware_id="labware-id", well_name="other-well-name", volume_added=100
+    )
+
+    subject.handle_action(
+        SucceedCommandAction(private_result=None, command=create_liquid_probe_command())
+    )
+    subject.handle_action(
+        SucceedCommandAction(
+            private_result=None,
+            command=create_dispense_command(
+                pipette_id="pipette-id",
+                volume=100,
+                flow_rate=1,
+                labware_id="labware-id",
+                well_name="other-well-name",
+            ),
+            state_update=other_well_state_update,
+        )
+    )
+
+    assert (
+        WellView(subject.state).get_volume_added_since_measured(
+            "labware-id", "well-name"
+        )
+        == 0
+    )
+
+
+def test_handles_liquid_operated_in_unknown_well(subject: WellStore) -> None:
+    """Operating on an unknown well should add an unknown volume to every measured well."""
+    unknown_well_state_update = update_types.StateUpdate()
+    unknown_well_state_update.mark_unknown_liquid_operated()
+
+    subject.handle_action(
+        SucceedCommandAction(private_result=None, command=create_liquid_probe_command())
+    )
+    subject.handle_action(
+        SucceedCommandAction(
+            private_result=None,
+            command=create_dispense_in_place_command(
+                pipette_id="pipette-id", volume=100, flow_rate=1
+            ),
+            state_update=unknown_well_state_update,
+        )
+    )
+
+    assert (
+        WellView(subject.state).get_volume_added_since_measured(
+            "labware-id", "well-name"
+        )
+        is None
+    )
@@ -11,7 +11,18 @@ def subject() -> WellView:
     labware_id = "labware-id"
     well_name = "well-name"
     height_info = LiquidHeightInfo(height=0.5, last_measured=datetime.now())
-    state = WellState(measured_liquid_heights={labware_id: {well_name: height_info}})
+    state = WellState(
+        measured_liquid_heights={
+            labware_id: {
+                well_name: height_info,
+                "operated-well-name": height_info,
+                "blown-out-well-name": height_info,
+            }
+        },
+        volume_added_since_measured={
+            labware_id: {"operated-well-name": -20, "blown-out-well-name": None}
+        },
+    )
 
     return WellView(state)
 
@@ -49,3 +60,16 @@ def test_has_measured_liquid_height(subject: WellView) -> None:
         is False
     )
     assert subject.has_measured_liquid_height(labware_id, well_name) is True
+
+
+def test_get_volume_added_since_measured(subject: WellView) -> None:
+    """Should return the net volume added since the well's last measurement."""
+    assert subject.get_volume_added_since_measured("labware-id", "well-name") == 0
+    assert (
+        subject.get_volume_added_since_measured("labware-id", "operated-well-name")
+        == -20
+    )
+    assert (
+        subject.get_volume_added_since_measured("labware-id", "blown-out-well-name")
+        is None
+    )
@@ -32,6 +32,7 @@ from opentrons_shared_data.protocol.models import (
     Pipette,
     Robot,
 )
+from opentrons_shared_data.errors.exceptions import InvalidProtocolData
 from opentrons_shared_data.pipette.types import PipetteNameType
 from opentrons.types import DeckSlotName, MountType
 from opentrons.protocol_runner.json_translator import JsonTranslator
@@ -50,7 +51,7 @@ from opentrons.protocol_engine import (
     ModuleLocation,
     Liquid as PE_Liquid,
 )
-from opentrons.protocol_engine.types import HexColor
+from opentrons.protocol_engine.types import HexColor, MovementAxis
 
 VALID_TEST_PARAMS = [
     (
@@ -876,3 +877,75 @@ def test_load_liquid(
             displayColor=HexColor(__root__="#F00"),
         )
     ]
+
+
+_LOAD_PIPETTE = pe_commands.LoadPipetteCreate(
+    params=pe_commands.LoadPipetteParams(
+        pipetteName=PipetteNameType.P300_SINGLE,
+        mount=MountType.LEFT,
+        pipetteId="pipette-id",
+    )
+)
+_LOAD_MODULE = pe_commands.LoadModuleCreate(
+    params=pe_commands.LoadModuleParams(
+        model=ModuleModel.TEMPERATURE_MODULE_V2,
+        location=DeckSlotLocation(slotName=DeckSlotName.SLOT_1),
+        moduleId="module-id",
+    )
+)
+_MOVE_PIPETTE = pe_commands.MoveRelativeCreate(
+    params=pe_commands.MoveRelativeParams(
+        pipetteId="pipette-id", axis=MovementAxis.Z, distance=1
+    )
+)
+_DEACTIVATE_MODULE = pe_commands.temperature_module.DeactivateTemperatureCreate(
+    params=pe_commands.temperature_module.DeactivateTemperatureParams(
+        moduleId="module-id"
+    )
+)
+_LOAD_LIQUID = pe_commands.LoadLiquidCreate(
+    params=pe_commands.LoadLiquidParams(
+        liquidId="liquid-id",
+        labwareId="labware-id",
+        volumeByWell={"A1": 10},
+    )
+)
+_LIQUID = PE_Liquid(id="liquid-id", displayName="water", description="")
+
+
+def test_validate_commands(subject: JsonTranslator) -> None:
+    """It should accept commands that only use things loaded before them."""
+    subject.validate_commands(
+        [_LOAD_PIPETTE, _LOAD_MODULE, _MOVE_PIPETTE, _DEACTIVATE_MODULE, _LOAD_LIQUID],
+        [_LIQUID],
+    )
+
+
+@pytest.mark.parametrize(
+    ("commands", "liquids", "kind"),
+    [
+        ([_MOVE_PIPETTE, _LOAD_PIPETTE], [], "unknown-pipette"),
+        ([_DEACTIVATE_MODULE, _LOAD_MODULE], [], "unknown-module"),
+        ([_LOAD_LIQUID], [], "unknown-liquid"),
+    ],
+)
+def test_validate_commands_unloaded_reference(
+    subject: JsonTranslator,
+    commands: List[pe_commands.CommandCreate],
+    liquids: List[PE_Liquid],
+    kind: str,
+) -> None:
+    """It should raise if a command uses something that isn't loaded before it."""
+    with pytest.raises(InvalidProtocolData) as exc_info:
+        subject.validate_commands(commands, liquids)
+    assert exc_info.value.detail == {"kind": kind, "commandIndex": "0"}
+
+
+def test_validate_commands_unknown_loaded_id(subject: JsonTranslator) -> None:
+    """It should not check pipette references once it can't know every pipette ID."""
+    load_pipette_without_id = pe_commands.LoadPipetteCreate(
+        params=pe_commands.LoadPipetteParams(
+            pipetteName=PipetteNameType.P300_SINGLE, mount=MountType.RIGHT
+        )
+    )
+    subject.validate_commands([load_pipette_without_id, _MOVE_PIPETTE], [])
@@ -1,10 +1,11 @@
 """Tests for the PythonAndLegacyRunner's LegacyContextPlugin."""
 import asyncio
+import threading
 import pytest
 from anyio import to_thread
 from decoy import Decoy, matchers
 from datetime import datetime
-from typing import Callable
+from typing import Callable, List
 
 from opentrons.legacy_commands.types import (
     CommandMessage as LegacyCommand,
@@ -235,3 +236,198 @@ async def test_equipment_broker_messages(
             pe_actions.SucceedCommandAction(command=engine_command, private_result=None)
         ),
     )
+
+
+def _custom_command(message: str) -> pe_commands.Custom:
+    return pe_commands.Custom(
+        id=f"{message}-id",
+        key=f"{message}-key",
+        status=pe_commands.CommandStatus.RUNNING,
+        createdAt=datetime(year=2021, month=1, day=1),
+        params=pe_commands.CustomParams(message=message),  # type: ignore[call-arg]
+    )
+
+
+def _comment(message: str) -> LegacyCommand:
+    return {
+        "$": "before",
+        "id": f"{message}-message-id",
+        "name": "command.COMMENT",
+        "payload": {"text": message},
+        "error": None,
+    }
+
+
+def _run_while_engine_loop_is_blocked(func: Callable[[], None]) -> None:
+    """Run `func` in another thread, without letting the engine loop run meanwhile.
+
+    This would deadlock if `func` waited on the engine loop.
+    """
+    thread = threading.Thread(target=func)
+    thread.start()
+    thread.join(timeout=5)
+    assert not thread.is_alive(), "Blocked waiting for the engine loop."
+
+
+@pytest.fixture
+def command_handler(
+    decoy: Decoy,
+    mock_legacy_broker: LegacyBroker,
+    mock_equipment_broker: ReadOnlyBroker[LoadInfo],
+    subject: LegacyContextPlugin,
+) -> Callable[[LegacyCommand], None]:
+    """Set up the subject, and get the handler it subscribes to commands with."""
+    command_handler_captor = matchers.Captor()
+    decoy.when(
+        mock_legacy_broker.subscribe(topic="command", handler=command_handler_captor)
+    ).then_return(decoy.mock(name="command_broker_unsubscribe"))
+    decoy.when(
+        mock_equipment_broker.subscribed(callback=matchers.Anything())
+    ).then_enter_with(None)
+    subject.setup()
+    handler: Callable[[LegacyCommand], None] = command_handler_captor.value
+    return handler
+
+
+async def test_command_broker_messages_are_batched_in_order(
+    decoy: Decoy,
+    mock_legacy_command_mapper: LegacyCommandMapper,
+    mock_action_dispatcher: pe_actions.ActionDispatcher,
+    subject: LegacyContextPlugin,
+    command_handler: Callable[[LegacyCommand], None],
+) -> None:
+    """It should dispatch actions in order, without waiting for each to finish."""
+    dispatched: List[pe_actions.Action] = []
+    decoy.when(mock_action_dispatcher.dispatch(matchers.Anything())).then_do(
+        dispatched.append
+    )
+    expected: List[pe_actions.Action] = []
+    for message in ["a", "b", "c"]:
+        actions: List[pe_actions.Action] = [
+            pe_actions.SucceedCommandAction(
+                _custom_command(f"{message}-{index}"), private_result=None
+            )
+            for index in range(2)
+        ]
+        decoy.when(
+            mock_legacy_command_mapper.map_command(command=_comment(message))
+        ).then_return(actions)
+        expected += actions
+
+    def report_commands() -> None:
+        for message in ["a", "b", "c"]:
+            command_handler(_comment(message))
+
+    _run_while_engine_loop_is_blocked(report_commands)
+    assert dispatched == []
+
+    subject.flush()
+    assert dispatched == expected
+
+    await subject.teardown()
+
+
+async def test_pause_waits_for_dispatch(
+    decoy: Decoy,
+    mock_legacy_command_mapper: LegacyCommandMapper,
+    mock_action_dispatcher: pe_actions.ActionDispatcher,
+    subject: LegacyContextPlugin,
+    command_handler: Callable[[LegacyCommand], None],
+) -> None:
+    """It should finish dispatching everything before the protocol pauses."""
+    dispatched: List[pe_actions.Action] = []
+    decoy.when(mock_action_dispatcher.dispatch(matchers.Anything())).then_do(
+        dispatched.append
+    )
+    pause_message: PauseMessage = {
+        "$": "before",
+        "id": "message-id",
+        "name": "command.PAUSE",
+        "payload": {"userMessage": "hello", "text": "hello"},
+        "error": None,
+    }
+    comment_action = pe_actions.SucceedCommandAction(
+        _custom_command("comment"), private_result=None
+    )
+    pause_action = pe_actions.SucceedCommandAction(
+        _custom_command("pause"), private_result=None
+    )
+    decoy.when(
+        mock_legacy_command_mapper.map_command(command=_comment("hello"))
+    ).then_return([comment_action])
+    decoy.when(
+        mock_legacy_command_mapper.map_command(command=pause_message)
+    ).then_return([pause_action])
+
+    def pause() -> List[pe_actions.Action]:
+        command_handler(_comment("hello"))
+        command_handler(pause_message)
+        return list(dispatched)
+
+    assert await to_thread.run_sync(pause) == [comment_action, pause_action]
+
+    await subject.teardown()
+
+
+async def test_dispatch_errors_are_raised_in_protocol(
+    decoy: Decoy,
+    mock_legacy_command_mapper: LegacyCommandMapper,
+    mock_action_dispatcher: pe_actions.ActionDispatcher,
+    subject: LegacyContextPlugin,
+    command_handler: Callable[[LegacyCommand], None],
+) -> None:
+    """A failed dispatch should raise from the protocol's next report."""
+    failing_action = pe_actions.SucceedCommandAction(
+        _custom_command("a"), private_result=None
+    )
+    dropped_action = pe_actions.SucceedCommandAction(
+        _custom_command("b"), private_result=None
+    )
+    decoy.when(
+        mock_legacy_command_mapper.map_command(command=_comment("a"))
+    ).then_return([failing_action])
+    decoy.when(
+        mock_legacy_command_mapper.map_command(command=_comment("b"))
+    ).then_return([dropped_action])
+    decoy.when(mock_action_dispatcher.dispatch(failing_action)).then_raise(
+        RuntimeError("oh no")
+    )
+
+    def report_commands() -> None:
+        command_handler(_comment("a"))
+        command_handler(_comment("b"))
+
+    _run_while_engine_loop_is_blocked(report_commands)
+    await asyncio.sleep(0)
+    with pytest.raises(RuntimeError, match="oh no"):
+        await to_thread.run_sync(command_handler, _comment("c"))
+
+    subject.flush()
+    decoy.verify(mock_action_dispatcher.dispatch(dropped_action), times=0)
+
+    await subject.teardown()
+
+
+async def test_flush_raises_dispatch_errors(
+    decoy: Decoy,
+    mock_legacy_command_mapper: LegacyCommandMapper,
+    mock_action_dispatcher: pe_actions.ActionDispatcher,
+    subject: LegacyContextPlugin,
+    command_handler: Callable[[LegacyCommand], None],
+) -> None:
+    """A failed dispatch after the protocol's last report should raise from flush."""
+    failing_action = pe_actions.SucceedCommandAction(
+        _custom_command("a"), private_result=None
+    )
+    decoy.when(
+        mock_legacy_command_mapper.map_command(command=_comment("a"))
+    ).then_return([failing_action])
+    decoy.when(mock_action_dispatcher.dispatch(failing_action)).then_raise(
+        RuntimeError("oh no")
+    )
+
+    await to_thread.run_sync(command_handler, _comment("a"))
+    with pytest.raises(RuntimeError, match="oh no"):
+        subject.flush()
+
+    await subject.teardown()
@@ -8,6 +8,7 @@ from decoy import Decoy, matchers
 from pathlib import Path
 from typing import List, cast, Union, Type
 
+from opentrons_shared_data.errors.exceptions import InvalidProtocolData
 from opentrons_shared_data.labware.labware_definition import LabwareDefinition
 from opentrons_shared_data.labware.types import (
     LabwareDefinition as LabwareDefinitionTypedDict,
@@ -441,6 +442,51 @@ async def test_run_json_runner_stop_requested_stops_enqueuing(
         await run_func()
 
 
+async def test_load_json_runner_validates_commands(
+    decoy: Decoy,
+    json_file_reader: JsonFileReader,
+    json_translator: JsonTranslator,
+    protocol_engine: ProtocolEngine,
+    task_queue: TaskQueue,
+    json_runner_subject: JsonRunner,
+) -> None:
+    """It should not load anything into the engine if the commands are invalid."""
+    json_protocol = ProtocolSchemaV6.construct()  # type: ignore[call-arg]
+    json_protocol_source = ProtocolSource(
+        directory=Path("/dev/null"),
+        main_file=Path("/dev/null/abc.json"),
+        files=[],
+        metadata={},
+        robot_type="OT-2 Standard",
+        config=JsonProtocolConfig(schema_version=6),
+        content_hash="abc123",
+    )
+    commands: List[pe_commands.CommandCreate] = [
+        pe_commands.WaitForResumeCreate(
+            params=pe_commands.WaitForResumeParams(message="hello")
+        ),
+    ]
+
+    decoy.when(
+        await protocol_reader.extract_labware_definitions(json_protocol_source)
+    ).then_return([])
+    decoy.when(json_file_reader.read(json_protocol_source)).then_return(json_protocol)
+    decoy.when(json_translator.translate_commands(json_protocol)).then_return(commands)
+    decoy.when(json_translator.translate_liquids(json_protocol)).then_return([])
+    decoy.when(json_translator.validate_commands(commands, [])).then_raise(
+        InvalidProtocolData(message="oh no")
+    )
+
+    with pytest.raises(InvalidProtocolData, match="oh no"):
+        await json_runner_subject.load(json_protocol_source)
+
+    decoy.verify(
+        protocol_engine.add_command(request=matchers.Anything()),
+        times=0,
+    )
+    decoy.verify(task_queue.set_run_func(func=matchers.Anything()), times=0)
+
+
 @pytest.mark.parametrize(
     "schema_version, json_protocol",
     [
@@ -1,14 +1,14 @@
 """ Test the Transfer class and its functions """
 import pytest
-from typing import TypedDict
+from typing import Any, Generator, List, Optional, Sequence, Tuple, TypedDict, Union
 
-from opentrons.types import Mount, TransferTipPolicy
+from opentrons.types import Location, Mount, TransferTipPolicy
 from opentrons.protocols.advanced_control import transfers as tx
 from opentrons.protocols.api_support.types import APIVersion
 from opentrons.hardware_control import ThreadManagedHardware
 from opentrons.protocol_api.protocol_context import ProtocolContext
 from opentrons.protocol_api.instrument_context import InstrumentContext
-from opentrons.protocol_api.labware import Labware
+from opentrons.protocol_api.labware import Labware, Well
 
 import opentrons.protocol_api as papi
 
@@ -1655,3 +1655,249 @@ def test_blowout_to_dest(_instr_labware: InstrLabware) -> None:
     ]
     for step, expected in zip(consd_plan, exp):
         assert step == expected
+
+
+class _ReferenceTransferPlan(tx.TransferPlan):
+    """The transfer planner from before aspirates were planned up front.
+
+    Kept to check that the current planner plans exactly the same steps.
+    """
+
+    def _plan_transfer(self) -> Generator[tx.TransferStep, None, None]:
+        """The step generator from before plans were computed up front."""
+        # reform source target lists
+        sources, dests = self._extend_source_target_lists(self._sources, self._dests)
+        self._check_valid_volume_parameters(
+            disposal_volume=self._strategy.disposal_volume,
+            air_gap=self._strategy.air_gap,
+            max_volume=self._instr.max_volume,
+        )
+        plan_iter = self._expand_for_volume_constraints(
+            self._volumes,
+            zip(sources, dests),
+            self._instr.max_volume
+            - self._strategy.disposal_volume
+            - self._strategy.air_gap,
+        )
+        for step_vol, (src, dest) in plan_iter:
+            if self._strategy.new_tip == TransferTipPolicy.ALWAYS:
+                yield self._format_dict("pick_up_tip", kwargs=self._tip_opts)
+            max_vol = (
+                self._max_volume
+                - self._strategy.disposal_volume
+                - self._strategy.air_gap
+            )
+            xferred_vol = 0.0
+            while xferred_vol < step_vol:
+                # TODO: account for unequal length sources, dests
+                # TODO: ensure last transfer is > min_vol
+                vol = min(max_vol, step_vol - xferred_vol)
+                yield from self._aspirate_actions(vol, src)
+                yield from self._dispense_actions(vol=vol, dest=dest, src=src)
+                xferred_vol += vol
+            yield from self._new_tip_action()
+
+    def _plan_distribute(self) -> Generator[tx.TransferStep, None, None]:
+        """The step generator from before plans were computed up front."""
+
+        self._check_valid_volume_parameters(
+            disposal_volume=self._strategy.disposal_volume,
+            air_gap=self._strategy.air_gap,
+            max_volume=self._instr.max_volume,
+        )
+
+        # TODO: decide whether default disposal vol for distribute should be
+        # pipette min_vol or should we leave it to being 0 by default and
+        # recommend users to specify a disposal vol when using distribute.
+        # First method keeps distribute consistent with current behavior while
+        # the other maintains consistency in default behaviors of all functions
+        plan_iter = self._expand_for_volume_constraints(
+            self._volumes,
+            self._dests,
+            # todo(mm, 2021-03-09): Is it right for this to be
+            # _instr_.max_volume? Does/should this take the tip maximum volume
+            # into account?
+            self._instr.max_volume
+            - self._strategy.disposal_volume
+            - self._strategy.air_gap,
+        )
+
+        done = False
+        current_xfer = next(plan_iter)
+        if self._strategy.new_tip == TransferTipPolicy.ALWAYS:
+            yield self._format_dict("pick_up_tip", kwargs=self._tip_opts)
+        while not done:
+            asp_grouped: List[Tuple[float, Union[Well, Location]]] = []
+            try:
+                while (
+                    sum(a[0] for a in asp_grouped)
+                    + self._strategy.disposal_volume
+                    + self._strategy.air_gap
+                    + current_xfer[0]
+                ) <= self._max_volume:
+                    append_xfer = self._check_volume_not_zero(
+                        self._api_version, current_xfer[0]
+                    )
+                    if append_xfer:
+                        asp_grouped.append(current_xfer)
+                    current_xfer = next(plan_iter)
+            except StopIteration:
+                done = True
+            if not asp_grouped:
+                break
+
+            yield from self._aspirate_actions(
+                sum(a[0] for a in asp_grouped) + self._strategy.disposal_volume,
+                self._sources[0],
+            )
+            for step in asp_grouped:
+
+                yield from self._dispense_actions(
+                    vol=step[0],
+                    src=self._sources[0],
+                    dest=step[1],
+                    is_disp_next=step is not asp_grouped[-1],
+                )
+        yield from self._new_tip_action()
+
+    def _plan_consolidate(self) -> Generator[tx.TransferStep, None, None]:
+        """The step generator from before plans were computed up front."""
+        # TODO: verify if _check_valid_volume_parameters should be re-enabled here
+        # self._check_valid_volume_parameters(
+        #     disposal_volume=self._strategy.disposal_volume,
+        #     air_gap=self._strategy.air_gap,
+        #     max_volume=self._instr.max_volume,
+        # )
+        plan_iter = self._expand_for_volume_constraints(
+            # todo(mm, 2021-03-09): Is it right to use _instr.max_volume here?
+            # Why don't we account for tip max volume, disposal volume, or air
+            # gap?
+            self._volumes,
+            self._sources,
+            self._instr.max_volume,
+        )
+        current_xfer = next(plan_iter)
+        if self._strategy.new_tip == TransferTipPolicy.ALWAYS:
+            yield self._format_dict("pick_up_tip", kwargs=self._tip_opts)
+        done = False
+        while not done:
+            asp_grouped: List[Tuple[float, Union[Well, Location]]] = []
+            try:
+                while (
+                    sum([a[0] for a in asp_grouped])
+                    + self._strategy.disposal_volume
+                    + self._strategy.air_gap * len(asp_grouped)
+                    + current_xfer[0]
+                ) <= self._max_volume:
+                    append_xfer = self._check_volume_not_zero(
+                        self._api_version, current_xfer[0]
+                    )
+                    if append_xfer:
+                        asp_grouped.append(current_xfer)
+                    current_xfer = next(plan_iter)
+            except StopIteration:
+                done = True
+            if not asp_grouped:
+                break
+            # Q: What accounts as disposal volume in a consolidate action?
+            # yield self._format_dict('aspirate',
+            #                         self._strategy.disposal_volume, loc)
+            for step in asp_grouped:
+                yield from self._aspirate_actions(step[0], step[1])
+            yield from self._dispense_actions(
+                vol=sum([a[0] + self._strategy.air_gap for a in asp_grouped])
+                - self._strategy.air_gap,
+                src=None,
+                dest=self._dests[0],
+            )
+        yield from self._new_tip_action()
+
+
+_EQUIVALENCE_OPTIONS = [
+    tx.Transfer(),
+    tx.Transfer(
+        new_tip=TransferTipPolicy.ALWAYS,
+        air_gap=10,
+        touch_tip_strategy=tx.TouchTipStrategy.ALWAYS,
+    ),
+    tx.Transfer(
+        new_tip=TransferTipPolicy.NEVER,
+        disposal_volume=20,
+        blow_out_strategy=tx.BlowOutStrategy.TRASH,
+    ),
+    tx.Transfer(
+        mix_strategy=tx.MixStrategy.BOTH,
+        blow_out_strategy=tx.BlowOutStrategy.DEST,
+        drop_tip_strategy=tx.DropTipStrategy.RETURN,
+    ),
+    tx.Transfer(
+        new_tip=TransferTipPolicy.ALWAYS,
+        air_gap=15,
+        disposal_volume=5,
+        blow_out_strategy=tx.BlowOutStrategy.SOURCE,
+    ),
+]
+
+
+def _plan_steps(plan: tx.TransferPlan) -> Tuple[List[Any], Optional[type]]:
+    steps: List[Any] = []
+    try:
+        for step in plan:
+            # Compare volume types too, since they show up in run logs.
+            steps.append((step, [type(arg) for arg in step["args"] or []]))
+    except Exception as e:
+        return steps, type(e)
+    return steps, None
+
+
+@pytest.mark.parametrize("mode", ["transfer", "distribute", "consolidate"])
+@pytest.mark.parametrize("options", _EQUIVALENCE_OPTIONS)
+@pytest.mark.parametrize("max_volume", [300, 200])
+@pytest.mark.parametrize("api_version", [APIVersion(2, 7), APIVersion(2, 15)])
+def test_plan_matches_reference_planner(
+    _instr_labware: InstrLabware,
+    mode: str,
+    options: tx.Transfer,
+    max_volume: float,
+    api_version: APIVersion,
+) -> None:
+    """It should plan exactly the same steps as the step-by-step planner did."""
+    _instr_labware["ctx"].home()
+    lw1 = _instr_labware["lw1"]
+    lw2 = _instr_labware["lw2"]
+
+    srcs: Sequence[Union[Well, Location]]
+    dsts: Sequence[Union[Well, Location]]
+    if mode == "transfer":
+        cases = [(lw1.wells()[:24], lw2.wells()[:24]), (lw1.wells()[:8], lw2.wells())]
+    elif mode == "distribute":
+        cases = [([lw1.wells()[0]], lw2.wells())]
+    else:
+        cases = [(lw2.wells(), [lw1.wells()[0]])]
+
+    for srcs, dsts in cases:
+        total_xfers = max(len(srcs), len(dsts))
+        volumes: List[Union[float, Sequence[float]]] = [
+            3,
+            30.5,
+            250,
+            700,
+            [float((i * 37) % 320) for i in range(total_xfers)],
+            [(i * 7) % 90 for i in range(total_xfers)],
+        ]
+        for volume in volumes:
+            transfer_options = tx.TransferOptions(transfer=options)
+            plans = [
+                plan_class(
+                    volume,
+                    list(srcs),
+                    list(dsts),
+                    _instr_labware["instr"],
+                    max_volume=max_volume,
+                    api_version=api_version,
+                    mode=mode,
+                    options=transfer_options,
+                )
+                for plan_class in [tx.TransferPlan, _ReferenceTransferPlan]
+            ]
+            assert _plan_steps(plans[0]) == _plan_steps(plans[1])
@@ -2,9 +2,12 @@ import pytest
 from math import pi, isclose
 from typing import Any, List
 
+from hypothesis import given, strategies
+
 from opentrons_shared_data.labware.labware_definition import (
     ConicalFrustum,
     CuboidalFrustum,
+    InnerWellGeometry,
     SphericalSegment,
 )
 from opentrons.protocol_engine.state.frustum_helpers import (
@@ -20,7 +23,14 @@ from opentrons.protocol_engine.state.frustum_helpers import (
     _height_from_volume_rectangular,
     _height_from_volume_spherical,
     height_at_volume_within_section,
+    volume_at_height_within_section,
     _get_segment_capacity,
+    get_well_volumetric_capacity,
+    get_well_volume_table,
+    find_volume_at_well_height,
+    find_height_at_well_volume,
+    find_volumes_at_well_heights,
+    find_heights_at_well_volumes,
 )
 from opentrons.protocol_engine.errors.exceptions import InvalidLiquidHeightFound
 
@@ -338,3 +348,156 @@ def test_height_at_volume_within_section(well: List[Any]) -> None:
             segment, _get_segment_capacity(segment), segment_height
         )
         assert isclose(height, segment_height)
+
+
+def _reference_volume_at_height(
+    target_height: float, well_geometry: InnerWellGeometry
+) -> float:
+    """Find a volume section by section, without a compiled table."""
+    volume = 0.0
+    for top_height, capacity in get_well_volumetric_capacity(well_geometry):
+        if top_height > target_height:
+            break
+        volume += capacity
+        if top_height == target_height:
+            return volume
+    for segment in sorted(well_geometry.sections, key=lambda s: s.topHeight):
+        if segment.bottomHeight < target_height < segment.topHeight:
+            return volume + volume_at_height_within_section(
+                section=segment,
+                target_height_relative=target_height - segment.bottomHeight,
+                section_height=segment.topHeight - segment.bottomHeight,
+            )
+    raise InvalidLiquidHeightFound("Unable to find volume.")
+
+
+def _reference_height_at_volume(
+    target_volume: float, well_geometry: InnerWellGeometry
+) -> float:
+    """Find a height section by section, by solving for polynomial roots."""
+    sorted_well = sorted(well_geometry.sections, key=lambda s: s.topHeight)
+    enclosed_volume = 0.0
+    for segment in sorted_well:
+        capacity = _get_segment_capacity(segment)
+        if enclosed_volume < target_volume < enclosed_volume + capacity:
+            return segment.bottomHeight + height_at_volume_within_section(
+                section=segment,
+                target_volume_relative=target_volume - enclosed_volume,
+                section_height=segment.topHeight - segment.bottomHeight,
+            )
+        enclosed_volume += capacity
+    raise InvalidLiquidHeightFound("Unable to find height.")
+
+
+@pytest.mark.parametrize("well", fake_frusta())
+@given(fraction=strategies.floats(min_value=0, max_value=1))
+def test_find_volume_at_well_height(well: List[Any], fraction: float) -> None:
+    """The compiled table should find the same volumes as section-by-section math."""
+    well_geometry = InnerWellGeometry(sections=well)
+    target_height = fraction * max(segment.topHeight for segment in well)
+    try:
+        expected_volume = _reference_volume_at_height(target_height, well_geometry)
+    except InvalidLiquidHeightFound:
+        with pytest.raises(InvalidLiquidHeightFound):
+            find_volume_at_well_height(target_height, well_geometry)
+        with pytest.raises(InvalidLiquidHeightFound):
+            find_volumes_at_well_heights([target_height], well_geometry)
+    else:
+        found_volume = find_volume_at_well_height(target_height, well_geometry)
+        assert isclose(found_volume, expected_volume, rel_tol=1e-9, abs_tol=1e-9)
+        (batched_volume,) = find_volumes_at_well_heights([target_height], well_geometry)
+        assert isclose(batched_volume, found_volume, rel_tol=1e-9, abs_tol=1e-9)
+
+
+@pytest.mark.parametrize("well", fake_frusta())
+@given(fraction=strategies.floats(min_value=0, max_value=1))
+def test_find_height_at_well_volume(well: List[Any], fraction: float) -> None:
+    """The compiled table should find the same heights as solving for polynomial roots."""
+    well_geometry = InnerWellGeometry(sections=well)
+    target_volume = fraction * sum(_get_segment_capacity(s) for s in well)
+    try:
+        expected_height = _reference_height_at_volume(target_volume, well_geometry)
+    except InvalidLiquidHeightFound:
+        with pytest.raises(InvalidLiquidHeightFound):
+            find_height_at_well_volume(target_volume, well_geometry)
+        with pytest.raises(InvalidLiquidHeightFound):
+            find_heights_at_well_volumes([target_volume], well_geometry)
+    else:
+        found_height = find_height_at_well_volume(target_volume, well_geometry)
+        assert isclose(found_height, expected_height, abs_tol=1e-4)
+        (batched_height,) = find_heights_at_well_volumes([target_volume], well_geometry)
+        assert isclose(batched_height, found_height, abs_tol=1e-4)
+
+
+@pytest.mark.parametrize("well", fake_frusta())
+def test_batched_conversions_match_scalar(well: List[Any]) -> None:
+    """Converting many heights or volumes at once should match one at a time."""
+    well_geometry = InnerWellGeometry(sections=well)
+    max_height = max(segment.topHeight for segment in well)
+    max_volume = sum(_get_segment_capacity(segment) for segment in well)
+    # stay off of section boundaries, where there's no height for a volume,
+    # and out of any gaps between sections, where there's no volume for a height
+    heights = [
+        height
+        for height in (max_height * (i + 0.5) / 96 for i in range(96))
+        if any(s.bottomHeight < height < s.topHeight for s in well)
+    ]
+    volumes = [max_volume * (i + 0.5) / 96 for i in range(96)]
+
+    batched_volumes = find_volumes_at_well_heights(heights, well_geometry)
+    batched_heights = find_heights_at_well_volumes(volumes, well_geometry)
+
+    for height, batched_volume in zip(heights, batched_volumes):
+        assert isclose(
+            batched_volume, find_volume_at_well_height(height, well_geometry)
+        )
+    for volume, batched_height in zip(volumes, batched_heights):
+        assert isclose(
+            batched_height,
+            find_height_at_well_volume(volume, well_geometry),
+            abs_tol=1e-4,
+        )
+
+
+def test_find_height_at_well_volume_in_cone() -> None:
+    """A cone that narrows toward the bottom should fill up from its narrow end."""
+    well_geometry = InnerWellGeometry(
+        sections=[
+            ConicalFrustum(
+                shape="conical",
+                topDiameter=10.0,
+                bottomDiameter=2.0,
+                topHeight=10.0,
+                bottomHeight=0.0,
+            )
+        ]
+    )
+    half_full_volume = find_volume_at_well_height(5.0, well_geometry)
+    assert half_full_volume == pytest.approx(pi * 5 * (1 + 1 * 3 + 3**2) / 3)
+    assert find_height_at_well_volume(half_full_volume, well_geometry) == 5.0
+    assert height_at_volume_within_section(
+        well_geometry.sections[0], half_full_volume, 10.0
+    ) == pytest.approx(5.0)
+
+
+def test_find_conversions_out_of_range() -> None:
+    """Heights and volumes outside of the well should be rejected."""
+    well_geometry = InnerWellGeometry(sections=fake_frusta()[0])
+    with pytest.raises(InvalidLiquidHeightFound, match="Invalid target height"):
+        find_volume_at_well_height(10.1, well_geometry)
+    with pytest.raises(InvalidLiquidHeightFound, match="Invalid target height"):
+        find_volumes_at_well_heights([1.0, -0.1], well_geometry)
+    with pytest.raises(InvalidLiquidHeightFound, match="Invalid target volume"):
+        find_height_at_well_volume(-1.0, well_geometry)
+    with pytest.raises(InvalidLiquidHeightFound, match="Invalid target volume"):
+        find_heights_at_well_volumes([1.0, 1e9], well_geometry)
+
+
+def test_get_well_volume_table_is_cached() -> None:
+    """Each well geometry should only be compiled once."""
+    well_geometry = InnerWellGeometry(sections=fake_frusta()[0])
+    table = get_well_volume_table(well_geometry)
+    assert get_well_volume_table(well_geometry) is table
+    assert get_well_volume_table(InnerWellGeometry(sections=fake_frusta()[0])) is not (
+        table
+    )
@@ -1,12 +1,13 @@
-from typing import List, Tuple
+from typing import Callable, List, Tuple, Union
 import pytest
-import platform
 from decoy import Decoy
 from pytest_lazyfixture import lazy_fixture  # type: ignore[import-untyped]
 
 from opentrons.protocols.api_support.types import APIVersion
 from opentrons.protocols.api_support.definitions import MAX_SUPPORTED_VERSION
+from opentrons.protocols.api_support.util import APIVersionError
 from opentrons.protocols.parameters.csv_parameter_interface import CSVParameter
+from opentrons.protocols.parameters.exceptions import ParameterValueError
 
 
 @pytest.fixture
@@ -87,21 +88,22 @@ def test_csv_parameter(
     """It should load the CSV parameter and provide access to the file, contents, and rows."""
     subject = CSVParameter(csv_file_basic, api_version)
 
-    # On Windows, you can't open a NamedTemporaryFile a second time, which breaks the code under test.
-    # Because of the way CSV analysis works this code will only ever be run on the actual OT-2/Flex hardware,
-    # so we skip testing and instead assert that we get a PermissionError on Windows (to ensure this
-    # test gets fixed in case we ever refactor the file opening.)
-    if platform.system() != "Windows":
-        assert subject.file.readable()
-        assert not subject.file.writable()
-        assert subject.file.read() == '"x","y","z"\n"a",1,2\n"b",3,4\n"c",5,6'
-    else:
-        with pytest.raises(PermissionError):
-            subject.file
+    assert subject.file.readable()
+    assert not subject.file.writable()
+    assert subject.file.read() == '"x","y","z"\n"a",1,2\n"b",3,4\n"c",5,6'
     assert subject.contents == '"x","y","z"\n"a",1,2\n"b",3,4\n"c",5,6'
     assert subject.parse_as_csv()[0] == ["x", "y", "z"]
 
 
+def test_csv_parameter_contents_decoded_once(
+    api_version: APIVersion, csv_file_basic: bytes
+) -> None:
+    """It should only decode the contents the first time they're accessed."""
+    subject = CSVParameter(csv_file_basic, api_version)
+
+    assert subject.contents is subject.contents
+
+
 @pytest.mark.parametrize(
     "csv_file",
     [
@@ -194,3 +196,70 @@ def test_csv_parameter_trailing_empties(
     assert len(parsed_csv) == len(
         expected_output
     ), f"Expected {len(expected_output)} rows, but got {len(parsed_csv)}"
+    assert list(subject.iter_rows()) == expected_output
+
+
+@pytest.mark.parametrize(
+    ("column", "value_type", "expected"),
+    [
+        ("x", str, ["a", "b", "c"]),
+        ("y", int, [1, 3, 5]),
+        ("z", float, [2.0, 4.0, 6.0]),
+        (1, int, [1, 3, 5]),
+    ],
+)
+def test_csv_parameter_parse_column(
+    api_version: APIVersion,
+    csv_file_basic: bytes,
+    column: Union[int, str],
+    value_type: Callable[[str], object],
+    expected: List[object],
+) -> None:
+    """It should get every value in a column, converted if asked to."""
+    subject = CSVParameter(csv_file_basic, api_version)
+
+    assert subject.parse_column(column, value_type) == expected
+
+
+def test_csv_parameter_parse_column_no_header(
+    api_version: APIVersion,
+    csv_file_empty_row_and_trailing_empty: Tuple[bytes, List[List[str]]],
+) -> None:
+    """It should include the first row and skip empty rows without a header."""
+    csv_file, _ = csv_file_empty_row_and_trailing_empty
+    subject = CSVParameter(csv_file, api_version)
+
+    assert subject.parse_column(0, has_header=False) == ["x", "b", "c"]
+
+
+@pytest.mark.parametrize(
+    ("column", "value_type", "has_header"),
+    [
+        ("w", str, True),
+        ("x", str, False),
+        (3, str, True),
+        ("x", int, True),
+    ],
+)
+def test_csv_parameter_parse_column_raises(
+    api_version: APIVersion,
+    csv_file_basic: bytes,
+    column: Union[int, str],
+    value_type: Callable[[str], object],
+    has_header: bool,
+) -> None:
+    """It should raise if the column is missing or its values can't be converted."""
+    subject = CSVParameter(csv_file_basic, api_version)
+
+    with pytest.raises(ParameterValueError):
+        subject.parse_column(column, value_type, has_header=has_header)
+
+
+def test_csv_parameter_row_access_version(csv_file_basic: bytes) -> None:
+    """It should only allow iterating rows and parsing columns in newer versions."""
+    subject = CSVParameter(csv_file_basic, APIVersion(2, 20))
+
+    with pytest.raises(APIVersionError):
+        subject.iter_rows()
+    with pytest.raises(APIVersionError):
+        subject.parse_column("x")
@@ -0,0 +1,163 @@
+"""Tests for opentrons.protocols.bytecode_cache."""
+from pathlib import Path
+from textwrap import dedent
+from typing import Callable, List
+
+import pytest
+
+from opentrons.protocols.api_support.types import APIVersion
+from opentrons.protocols.bytecode_cache import BytecodeCache, CompiledPythonProtocol
+from opentrons.protocols.types import MalformedPythonProtocolError
+
+
+_PROTOCOL = dedent(
+    """
+    metadata = {"protocolName": "Cached"}
+    requirements = {"apiLevel": "2.15", "robotType": "Flex"}
+
+    def run(ctx):
+        pass
+    """
+)
+
+
+def _compiler(
+    contents: str, filename: str, calls: List[str]
+) -> Callable[[], CompiledPythonProtocol]:
+    def compile_protocol() -> CompiledPythonProtocol:
+        calls.append(filename)
+        return CompiledPythonProtocol(
+            code=compile(contents, filename=filename, mode="exec"),
+            metadata={"protocolName": "Cached"},
+            requirements={"apiLevel": "2.15", "robotType": "Flex"},
+            api_level=APIVersion(2, 15),
+            robot_type="OT-3 Standard",
+        )
+
+    return compile_protocol
+
+
+def test_hit_skips_compiling(tmp_path: Path) -> None:
+    """A protocol should only be compiled the first time it's seen."""
+    subject = BytecodeCache(directory=tmp_path)
+    calls: List[str] = []
+
+    first = subject.get_or_compile(
+        _PROTOCOL, "protocol.py", _compiler(_PROTOCOL, "protocol.py", calls)
+    )
+    second = subject.get_or_compile(
+        _PROTOCOL.encode("utf-8"),
+        "protocol.py",
+        _compiler(_PROTOCOL, "protocol.py", calls),
+    )
+
+    assert calls == ["protocol.py"]
+    assert second == first
+    assert second.code.co_filename == "protocol.py"
+    # Each hit gets its own copy, so callers can't corrupt the cache.
+    assert second.metadata is not first.metadata
+
+
+def test_filename_is_part_of_key(tmp_path: Path) -> None:
+    """The same source compiled under another filename should be a miss."""
+    subject = BytecodeCache(directory=tmp_path)
+    calls: List[str] = []
+
+    subject.get_or_compile(_PROTOCOL, "a.py", _compiler(_PROTOCOL, "a.py", calls))
+    result = subject.get_or_compile(
+        _PROTOCOL, "b.py", _compiler(_PROTOCOL, "b.py", calls)
+    )
+
+    assert calls == ["a.py", "b.py"]
+    assert result.code.co_filename == "b.py"
+
+
+def test_disk_cache_outlives_instance(tmp_path: Path) -> None:
+    """A new cache over the same directory should reuse what an old one compiled."""
+    calls: List[str] = []
+    first = BytecodeCache(directory=tmp_path).get_or_compile(
+        _PROTOCOL, "protocol.py", _compiler(_PROTOCOL, "protocol.py", calls)
+    )
+    second = BytecodeCache(directory=tmp_path).get_or_compile(
+        _PROTOCOL, "protocol.py", _compiler(_PROTOCOL, "protocol.py", calls)
+    )
+
+    assert calls == ["protocol.py"]
+    assert second == first
+
+
+def test_corrupt_entries_are_recompiled(tmp_path: Path) -> None:
+    """An unreadable cache file should be treated as a miss, and replaced."""
+    calls: List[str] = []
+    BytecodeCache(directory=tmp_path).get_or_compile(
+        _PROTOCOL, "protocol.py", _compiler(_PROTOCOL, "protocol.py", calls)
+    )
+    [cache_file] = tmp_path.iterdir()
+    cache_file.write_bytes(b"not marshalled")
+
+    result = BytecodeCache(directory=tmp_path).get_or_compile(
+        _PROTOCOL, "protocol.py", _compiler(_PROTOCOL, "protocol.py", calls)
+    )
+
+    assert calls == ["protocol.py", "protocol.py"]
+    assert result.api_level == APIVersion(2, 15)
+    assert cache_file.read_bytes() != b"not marshalled"
+
+
+def test_bounded(tmp_path: Path) -> None:
+    """The least recently used entries should be evicted from memory and disk."""
+    subject = BytecodeCache(
+        directory=tmp_path, max_memory_entries=2, max_disk_entries=3
+    )
+    calls: List[str] = []
+
+    for index in range(5):
+        filename = f"protocol_{index}.py"
+        subject.get_or_compile(
+            _PROTOCOL, filename, _compiler(_PROTOCOL, filename, calls)
+        )
+
+    assert len(list(tmp_path.iterdir())) == 3
+
+    # protocol_0.py fell out of both, so it's compiled again.
+    subject.get_or_compile(
+        _PROTOCOL, "protocol_0.py", _compiler(_PROTOCOL, "protocol_0.py", calls)
+    )
+    # protocol_4.py is still in memory, and protocol_3.py is still on disk.
+    for filename in ["protocol_4.py", "protocol_3.py"]:
+        subject.get_or_compile(
+            _PROTOCOL, filename, _compiler(_PROTOCOL, filename, calls)
+        )
+
+    assert calls == [f"protocol_{index}.py" for index in range(5)] + ["protocol_0.py"]
+
+
+def test_errors_are_not_cached(tmp_path: Path) -> None:
+    """A failed compile should propagate its error every time."""
+    subject = BytecodeCache(directory=tmp_path)
+    calls: List[str] = []
+
+    def fail() -> CompiledPythonProtocol:
+        calls.append("fail")
+        raise MalformedPythonProtocolError(short_message="oops")
+
+    for _ in range(2):
+        with pytest.raises(MalformedPythonProtocolError):
+            subject.get_or_compile("def run(", "protocol.py", fail)
+
+    assert calls == ["fail", "fail"]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_memory_only(tmp_path: Path) -> None:
+    """Without a directory, entries should only be cached in memory."""
+    subject = BytecodeCache(directory=None)
+    calls: List[str] = []
+
+    for _ in range(2):
+        subject.get_or_compile(
+            _PROTOCOL, "protocol.py", _compiler(_PROTOCOL, "protocol.py", calls)
+        )
+
+    assert calls == ["protocol.py"]
+    assert list(tmp_path.iterdir()) == []
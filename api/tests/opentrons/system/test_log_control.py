@@ -0,0 +1,156 @@
+"""Tests for opentrons.system.log_control, against a fake journalctl."""
+import json
+import os
+import stat
+import sys
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from opentrons.system import log_control
+
+_FAKE_JOURNALCTL = """#!{python}
+import json
+import sys
+import time
+
+with open({calls!r}, "a") as calls_file:
+    calls_file.write(json.dumps(sys.argv[1:]) + "\\n")
+for _ in range({repeats}):
+    sys.stdout.buffer.write(b"x" * 1024 + b"\\n")
+    sys.stdout.buffer.flush()
+# Like a journal being followed, don't exit on our own.
+if {hang}:
+    time.sleep(60)
+if {exit_status}:
+    sys.stderr.write("Failed to seek to cursor: Invalid argument\\n")
+    sys.exit({exit_status})
+"""
+
+
+def _install_journalctl(
+    directory: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    repeats: int,
+    hang: bool,
+    exit_status: int = 0,
+) -> Path:
+    calls = directory / "calls"
+    script = directory / "journalctl"
+    script.write_text(
+        _FAKE_JOURNALCTL.format(
+            python=sys.executable,
+            calls=str(calls),
+            repeats=repeats,
+            hang=hang,
+            exit_status=exit_status,
+        )
+    )
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{directory}{os.pathsep}{os.environ['PATH']}")
+    return calls
+
+
+def _read_calls(calls: Path) -> List[List[str]]:
+    return [json.loads(line) for line in calls.read_text().splitlines()]
+
+
+async def test_stream_records_in_chunks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls = _install_journalctl(tmp_path, monkeypatch, repeats=200, hang=False)
+
+    chunks = [
+        chunk
+        async for chunk in log_control.stream_records(
+            log_control.SERIAL_SPECIAL,
+            10,
+            "json",
+            cursor="s=abc;i=1",
+            since="-10min",
+        )
+    ]
+
+    assert b"".join(chunks) == (b"x" * 1024 + b"\n") * 200
+    assert all(len(chunk) <= log_control.STREAM_CHUNK_SIZE for chunk in chunks)
+    assert _read_calls(calls) == [
+        [
+            "--no-pager",
+            "-t",
+            "opentrons-api-serial",
+            "-t",
+            "opentrons-api-serial-can",
+            "-t",
+            "opentrons-api-serial-usbbin",
+            "--after-cursor=s=abc;i=1",
+            "--since=-10min",
+            "-n",
+            "10",
+            "-o",
+            "json",
+            "-a",
+        ]
+    ]
+
+
+async def test_stream_records_shows_cursor_in_text(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls = _install_journalctl(tmp_path, monkeypatch, repeats=1, hang=False)
+
+    async for _ in log_control.stream_records(
+        "opentrons-robot-server", 5, "short-precise"
+    ):
+        pass
+
+    assert _read_calls(calls) == [
+        [
+            "--no-pager",
+            "-u",
+            "opentrons-robot-server",
+            "-n",
+            "5",
+            "-o",
+            "short-precise",
+            "-a",
+            "--show-cursor",
+        ]
+    ]
+
+
+async def test_stream_records_stopped_early(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _install_journalctl(tmp_path, monkeypatch, repeats=1, hang=True)
+
+    records = log_control.stream_records("opentrons-api", 5, "json")
+    assert await records.__anext__() == b"x" * 1024 + b"\n"
+    # Closing the stream shouldn't wait for journalctl to finish on its own.
+    await records.aclose()  # type: ignore[attr-defined]
+
+
+async def test_stream_records_journalctl_fails(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _install_journalctl(tmp_path, monkeypatch, repeats=0, hang=False, exit_status=1)
+
+    records = log_control.stream_records("opentrons-api", 5, "json", cursor="bad")
+    with pytest.raises(
+        log_control.JournalctlError,
+        match="Failed to seek to cursor: Invalid argument",
+    ) as exc_info:
+        await records.__anext__()
+    assert exc_info.value.returncode == 1
+
+
+async def test_stream_records_journalctl_fails_after_output(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _install_journalctl(tmp_path, monkeypatch, repeats=1, hang=False, exit_status=1)
+
+    chunks: List[bytes] = []
+    with pytest.raises(log_control.JournalctlError):
+        async for chunk in log_control.stream_records("opentrons-api", 5, "json"):
+            chunks.append(chunk)
+    assert b"".join(chunks) == b"x" * 1024 + b"\n"
@@ -20,6 +20,7 @@ from typing import (
 
 from opentrons import APIVersion
 
+from g_code_parsing.emulator_pool import EmulatorEnvironment, EmulatorPool
 from g_code_parsing.errors import UnparsableCLICommandError
 from g_code_parsing.g_code_differ import GCodeDiffer
 from g_code_test_data.g_code_configuration import (
@@ -59,6 +60,7 @@ class GCodeCLI:
     FILE_PATH_2_KEY = "file_path_2"
     ERROR_ON_DIFFERENT_FILES = "error_on_different_files"
     ERROR_ON_MISSING_FILES = "error_on_missing_configuration_files"
+    WORKERS_KEY = "workers"
 
     CONFIGURATION_COMMAND = "configurations"
     CONFIGURATIONS = HTTP_CONFIGURATIONS + PROTOCOL_CONFIGURATIONS
@@ -94,6 +96,8 @@ class GCodeCLI:
         self._args = self.parse_args(sys.argv[1:])
         self.configurations = self._create_configuration_dict()
         self.respond_with_error_code = False
+        self._runnable_configurations: List[RunnableConfiguration] = []
+        self._outputs: Dict[RunnableConfiguration, str] = {}
 
     @classmethod
     async def create(cls) -> GCodeCLI:
@@ -109,16 +113,49 @@ class GCodeCLI:
         }
         return self
 
-    @staticmethod
-    async def _run(run_config: RunnableConfiguration) -> str:
-        """Execute G-Code Configuration."""
+    async def _execute(self, run_config: RunnableConfiguration) -> str:
+        """Execute G-Code Configuration.
+
+        With workers, every configuration being run is executed in parallel
+        the first time one of them is needed.
+        """
+        workers = self.args.get(self.WORKERS_KEY)
+        if workers is not None and run_config not in self._outputs:
+            self._outputs.update(
+                self._execute_in_pool(self._runnable_configurations, workers)
+            )
+        if run_config in self._outputs:
+            return self._outputs.pop(run_config)
+
         configuration = run_config.configuration
         version = run_config.version
-        return (
-            await configuration.execute(version)
-            if version is not None
-            else await configuration.execute()
-        )
+        if isinstance(configuration, HTTPGCodeConfirmConfig):
+            return configuration.execute()
+        return await configuration.execute(version)
+
+    @staticmethod
+    def _execute_in_pool(
+        run_configs: List[RunnableConfiguration], workers: int
+    ) -> Dict[RunnableConfiguration, str]:
+        """Execute G-Code Configurations in parallel on long-lived emulators."""
+
+        def job(run_config: RunnableConfiguration) -> Callable[..., str]:
+            configuration = run_config.configuration
+            version = run_config.version
+
+            def execute(environment: EmulatorEnvironment) -> str:
+                if isinstance(configuration, HTTPGCodeConfirmConfig):
+                    return configuration.execute(environment)
+                return asyncio.run(configuration.execute(version, environment))
+
+            return execute
+
+        outputs = EmulatorPool(workers).run([job(config) for config in run_configs])
+        return dict(zip(run_configs, outputs))
+
+    async def _run(self, run_config: RunnableConfiguration) -> str:
+        """Execute G-Code Configuration."""
+        return await self._execute(run_config)
 
     async def _diff(self, run_config: RunnableConfiguration) -> str:
         """Diff G-Code Configuration against stored comparison file."""
@@ -126,11 +163,10 @@ class GCodeCLI:
         version = run_config.version
         able_to_respond_with_error_code = self.args[self.ERROR_ON_DIFFERENT_FILES]
 
+        actual = await self._execute(run_config)
         if version is not None:
-            actual = await configuration.execute(version)
             expected = configuration.get_comparison_file(version)
         else:
-            actual = await configuration.execute()
             expected = configuration.get_comparison_file()
 
         differ = GCodeDiffer(actual, expected)
@@ -285,6 +321,7 @@ class GCodeCLI:
         runnable_configurations = self._parse_runnable_configs(
             self._get_config_matches(config_name)
         )
+        self._runnable_configurations = runnable_configurations
 
         def async_partial(f: callable, *args: Any) -> callable:
             """Make the partial async."""
@@ -318,6 +355,16 @@ class GCodeCLI:
                 out.append(command())
         return "\n".join(out)
 
+    @classmethod
+    def _add_workers_argument(cls, parser: argparse.ArgumentParser) -> None:
+        parser.add_argument(
+            f"--{cls.WORKERS_KEY}",
+            type=int,
+            default=None,
+            help="If set, run configurations this many at a time, against emulators "
+            "that stay up between them, instead of starting new emulators for each",
+        )
+
     @classmethod
     def parser(cls) -> argparse.ArgumentParser:
         """Generates argparse ArgumentParser class for parsing command line input."""
@@ -343,6 +390,7 @@ class GCodeCLI:
         run_parser.add_argument(
             "configuration_name", type=str, help="Name of configuration you want to run"
         )
+        cls._add_workers_argument(run_parser)
 
         diff_parser = subparsers.add_parser(
             cls.DIFF_FILES_COMMAND, help="Diff 2 G-Code files"
@@ -358,6 +406,7 @@ class GCodeCLI:
             type=str,
             help="Name of configuration you want to diff",
         )
+        cls._add_workers_argument(diff_parser)
 
         subparsers.add_parser(
             cls.CONFIGURATION_COMMAND, help="List of available configurations"
@@ -0,0 +1,244 @@
+"""Emulators that stay up between G-Code program runs.
+
+Starting the emulators is most of the time a short G-Code program takes to run.
+An EmulatorEnvironment keeps them running in a child process instead, and puts
+them back in their starting state between runs. An EmulatorPool runs programs in
+parallel worker processes, each with its own EmulatorEnvironment on its own ports.
+"""
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from types import TracebackType
+from typing import Callable, List, Optional, Sequence, Type
+
+from opentrons.hardware_control.emulation.app import Application
+from opentrons.hardware_control.emulation.module_server.helpers import (
+    ModuleStatusClient,
+    wait_emulators,
+)
+from opentrons.hardware_control.emulation.parser import Parser
+from opentrons.hardware_control.emulation.run_emulator import (
+    run_emulator_client,
+    run_emulator_server,
+)
+from opentrons.hardware_control.emulation.scripts.run_module_emulator import (
+    emulator_builder,
+    emulator_port,
+)
+from opentrons.hardware_control.emulation.settings import Settings
+from opentrons.hardware_control.emulation.smoothie import SmoothieEmulator
+
+# How far apart the ports of different environments are. The default ports are
+# all within 1011 of each other, and none of them are a multiple of 100 apart.
+PORT_STRIDE = 100
+MAX_WORKERS = 50
+
+# How long to wait for the emulators to start up or reset.
+READY_TIMEOUT_SECONDS = 10.0
+
+_READY = "ready"
+_RESET = "reset"
+
+
+def shift_ports(settings: Settings, offset: int) -> Settings:
+    """Get a copy of settings with every emulator port moved up by offset."""
+    shifted = settings.copy(deep=True)
+    shifted.smoothie.port += offset
+    shifted.module_server.port += offset
+    for proxy in [
+        shifted.heatershaker_proxy,
+        shifted.thermocycler_proxy,
+        shifted.temperature_proxy,
+        shifted.magdeck_proxy,
+    ]:
+        proxy.emulator_port += offset
+        proxy.driver_port += offset
+    return shifted
+
+
+def _serve_emulators(settings: Settings, control: Connection) -> None:
+    """Entry point for the emulator process."""
+    asyncio.run(_serve_emulators_async(settings, control))
+
+
+async def _serve_emulators_async(settings: Settings, control: Connection) -> None:
+    loop = asyncio.get_running_loop()
+    smoothie = SmoothieEmulator(parser=Parser(), settings=settings.smoothie)
+    modules = {m.value: emulator_builder[m.value](settings) for m in settings.modules}
+    app = Application(settings=settings)
+
+    tasks = [
+        loop.create_task(
+            run_emulator_server(
+                host=settings.smoothie.host,
+                port=settings.smoothie.port,
+                emulator=smoothie,
+            )
+        ),
+        loop.create_task(app.run()),
+    ]
+    tasks.extend(
+        loop.create_task(
+            run_emulator_client(
+                "localhost", emulator_port[name](settings).emulator_port, emulator
+            )
+        )
+        for name, emulator in modules.items()
+    )
+
+    client = await ModuleStatusClient.connect(
+        host="localhost", port=settings.module_server.port
+    )
+    await wait_emulators(client=client, modules=settings.modules, timeout=5)
+    client.close()
+
+    while True:
+        control.send(_READY)
+        await loop.run_in_executor(None, control.recv)
+        # A driver that's still connected could have commands in flight, which
+        # would land after the reset.
+        await app.wait_idle()
+        smoothie.reset()
+        for emulator in modules.values():
+            emulator.reset()
+
+
+class EmulatorEnvironment:
+    """A set of emulators that keeps running between G-Code program runs."""
+
+    def __init__(self, port_offset: int = 0) -> None:
+        """Create an EmulatorEnvironment. The emulators start on first use.
+
+        Args:
+            port_offset: How far to move every emulator port up from the one in
+                the settings it is prepared with, so several environments can
+                run side by side.
+        """
+        self._port_offset = port_offset
+        self._settings: Optional[Settings] = None
+        self._process: Optional[BaseProcess] = None
+        self._control: Optional[Connection] = None
+
+    def prepare(self, settings: Settings) -> Settings:
+        """Get emulators for settings running and in their starting state.
+
+        The emulators are reset if they were already running with the same
+        settings, and restarted otherwise.
+
+        Returns:
+            The settings, with the ports the emulators are actually on.
+        """
+        shifted = shift_ports(settings, self._port_offset)
+        if (
+            self._process is not None
+            and self._process.is_alive()
+            and self._control is not None
+            and shifted == self._settings
+        ):
+            self._control.send(_RESET)
+        else:
+            self.stop()
+            self._start(shifted)
+        self._wait_ready()
+        return shifted
+
+    def stop(self) -> None:
+        """Stop the emulators."""
+        if self._process is not None:
+            self._process.kill()
+            self._process.join()
+        if self._control is not None:
+            self._control.close()
+        self._process = None
+        self._control = None
+        self._settings = None
+
+    def _start(self, settings: Settings) -> None:
+        self._control, child_control = multiprocessing.Pipe()
+        self._process = multiprocessing.Process(
+            target=_serve_emulators, args=(settings, child_control), daemon=True
+        )
+        self._process.start()
+        child_control.close()
+        self._settings = settings
+
+    def _wait_ready(self) -> None:
+        assert self._control is not None
+        try:
+            ready = self._control.poll(READY_TIMEOUT_SECONDS)
+            message = self._control.recv() if ready else None
+        except EOFError:
+            message = None
+        if message != _READY:
+            self.stop()
+            raise RuntimeError("Emulators failed to get ready.")
+
+    def __enter__(self) -> EmulatorEnvironment:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        self.stop()
+
+
+Job = Callable[[EmulatorEnvironment], str]
+
+# Worker processes are forked, so they inherit the jobs rather than having them
+# pickled; not every configuration can be.
+_jobs: Sequence[Job] = []
+_environment: Optional[EmulatorEnvironment] = None
+
+
+def _start_worker(slots: "multiprocessing.Queue[int]") -> None:
+    global _environment
+    _environment = EmulatorEnvironment(port_offset=slots.get() * PORT_STRIDE)
+
+
+def _run_job(index: int) -> str:
+    assert _environment is not None
+    return _jobs[index](_environment)
+
+
+class EmulatorPool:
+    """Runs G-Code programs in parallel, each worker with its own emulators."""
+
+    def __init__(self, workers: int) -> None:
+        """Create an EmulatorPool.
+
+        Args:
+            workers: How many programs to run at once.
+        """
+        if not 0 < workers <= MAX_WORKERS:
+            raise ValueError(f"workers must be between 1 and {MAX_WORKERS}.")
+        self._workers = workers
+
+    def run(self, jobs: Sequence[Job]) -> List[str]:
+        """Run every job and return their outputs, in the same order.
+
+        Each job gets its worker's EmulatorEnvironment to run against.
+        """
+        global _jobs
+        _jobs = jobs
+        context = multiprocessing.get_context("fork")
+        slots: "multiprocessing.Queue[int]" = context.Queue()
+        # Slot 0 is left for an environment in this process.
+        for slot in range(1, self._workers + 1):
+            slots.put(slot)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=self._workers,
+                mp_context=context,
+                initializer=_start_worker,
+                initargs=(slots,),
+            ) as executor:
+                return list(executor.map(_run_job, range(len(jobs))))
+        finally:
+            _jobs = []
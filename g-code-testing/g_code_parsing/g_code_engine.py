@@ -1,8 +1,9 @@
 import asyncio
+import os
 from pathlib import Path
 import time
 from multiprocessing import Process
-from typing import AsyncGenerator, Callable, Iterator, Union
+from typing import AsyncGenerator, Callable, Iterator, List, Optional, Union
 from collections import namedtuple
 
 from opentrons import APIVersion
@@ -27,7 +28,9 @@ from opentrons.hardware_control.emulation.module_server.helpers import (
 )
 from opentrons.hardware_control.emulation.scripts import run_app, run_smoothie
 from opentrons.hardware_control import API, ThreadManager
+from opentrons.hardware_control.modules import AbstractModule
 from opentrons.hardware_control.types import HardwareFeatureFlags
+from g_code_parsing.emulator_pool import EmulatorEnvironment
 from g_code_parsing.g_code_program.g_code_program import (
     GCodeProgram,
 )
@@ -38,6 +41,11 @@ from opentrons_shared_data.robot.types import RobotType
 Protocol = namedtuple("Protocol", ["text", "filename", "filelike"])
 
 
+async def _clean_up_modules(modules: List[AbstractModule]) -> None:
+    # Closing each connection takes a while, so close them all at once.
+    await asyncio.gather(*(module.cleanup() for module in modules))
+
+
 class GCodeEngine:
     """
     Class for running a thing against the emulator.
@@ -50,17 +58,44 @@ class GCodeEngine:
         1. Instantiate GCodeEngine
         2. Call run_* method
         3. Gather parsed data from returned GCodeProgram
+
+    Pass an EmulatorEnvironment to run against emulators that are already up,
+    instead of starting new ones for every run.
     """
 
     URI_TEMPLATE = "socket://127.0.0.1:%s"
+    # The hardware controller finds the module server with settings from here.
+    MODULE_SERVER_ENV_VAR = "OT_EMULATOR_module_server"
+    MODULE_WAIT_TIMEOUT_SECONDS = 10.0
 
-    def __init__(self, emulator_settings: Settings) -> None:
+    def __init__(
+        self,
+        emulator_settings: Settings,
+        environment: Optional[EmulatorEnvironment] = None,
+    ) -> None:
+        self._settings = emulator_settings
+        # The settings of the emulators actually in use.
         self._config = emulator_settings
+        self._environment = environment
+
+    def _build_hardware(self) -> ThreadManager:
+        conf = build_config({})
+        return ThreadManager(
+            API.build_hardware_controller,
+            conf,
+            GCodeEngine.URI_TEMPLATE % self._config.smoothie.port,
+            feature_flags=HardwareFeatureFlags.build_from_ff(),
+        )
 
     @contextmanager
     def _emulate(self) -> Iterator[ThreadManager]:
         """Context manager that starts emulated OT-2 hardware environment. A
         hardware controller is returned."""
+        if self._environment is not None:
+            with self._emulate_in_environment(self._environment) as hardware:
+                yield hardware
+            return
+
         modules = self._config.modules
 
         # Entry point for the emulator app process
@@ -94,13 +129,7 @@ class GCodeEngine:
         ready_proc.join()
 
         # Hardware controller
-        conf = build_config({})
-        emulator = ThreadManager(
-            API.build_hardware_controller,
-            conf,
-            GCodeEngine.URI_TEMPLATE % self._config.smoothie.port,
-            feature_flags=HardwareFeatureFlags.build_from_ff(),
-        )
+        emulator = self._build_hardware()
         # Wait for modules to be present
         while len(emulator.attached_modules) != len(modules):
             time.sleep(0.1)
@@ -111,6 +140,40 @@ class GCodeEngine:
         proc.kill()
         proc.join()
 
+    @contextmanager
+    def _emulate_in_environment(
+        self, environment: EmulatorEnvironment
+    ) -> Iterator[ThreadManager]:
+        """Context manager that gets the emulators in environment ready for a
+        run. A hardware controller is returned."""
+        self._config = environment.prepare(self._settings)
+        previous_module_server = os.environ.get(self.MODULE_SERVER_ENV_VAR)
+        os.environ[self.MODULE_SERVER_ENV_VAR] = self._config.module_server.json()
+        try:
+            emulator = self._build_hardware()
+            try:
+                deadline = time.monotonic() + self.MODULE_WAIT_TIMEOUT_SECONDS
+                while len(emulator.attached_modules) != len(self._config.modules):
+                    if time.monotonic() > deadline:
+                        raise TimeoutError("Modules did not attach to the emulator.")
+                    time.sleep(0.01)
+
+                yield emulator
+            finally:
+                # Disconnect from the modules before the emulators get reset for
+                # the next run, so no command from this one lands after that.
+                modules = emulator.sync.attached_modules
+                if modules:
+                    asyncio.run_coroutine_threadsafe(
+                        _clean_up_modules(modules), modules[0].loop
+                    ).result()
+                emulator.clean_up()
+        finally:
+            if previous_module_server is None:
+                del os.environ[self.MODULE_SERVER_ENV_VAR]
+            else:
+                os.environ[self.MODULE_SERVER_ENV_VAR] = previous_module_server
+
     @staticmethod
     def _get_protocol(file_path: Path) -> Protocol:
         with open(file_path) as file:
@@ -16,6 +16,7 @@ from typing_extensions import (
 
 import pytest
 from _pytest.mark.structures import Mark
+from g_code_parsing.emulator_pool import EmulatorEnvironment
 from g_code_parsing.g_code_engine import GCodeEngine
 from g_code_parsing.g_code_program.supported_text_modes import SupportedTextModes
 from opentrons.hardware_control.emulation.settings import Settings, SmoothieSettings
@@ -86,8 +87,11 @@ class ProtocolGCodeConfirmConfig(BaseModel, SharedFunctionsMixin):
     def comparison_file_exists(self, version: APIVersion) -> bool:
         return os.path.exists(self._get_full_path(version))
 
-    async def execute(self, version: APIVersion):
-        async with GCodeEngine(self.settings).run_protocol(self.path, version) as program:
+    async def execute(
+        self, version: APIVersion, environment: Optional[EmulatorEnvironment] = None
+    ):
+        engine = GCodeEngine(self.settings, environment)
+        async with engine.run_protocol(self.path, version) as program:
             return program.get_text_explanation(SupportedTextModes.CONCISE)
 
 
@@ -127,6 +131,7 @@ class HTTPGCodeConfirmConfig(BaseModel, SharedFunctionsMixin):
             file.write(await self.execute())
         return "File uploaded successfully"
 
-    def execute(self):
-        with GCodeEngine(self.settings).run_http(self.executable) as program:
+    def execute(self, environment: Optional[EmulatorEnvironment] = None):
+        engine = GCodeEngine(self.settings, environment)
+        with engine.run_http(self.executable) as program:
             return program.get_text_explanation(SupportedTextModes.CONCISE)
@@ -0,0 +1,90 @@
+import asyncio
+import os
+from functools import partial
+
+from opentrons import APIVersion
+from opentrons.hardware_control.emulation.settings import (
+    Settings,
+    SmoothieSettings,
+    PipetteSettings,
+)
+
+from g_code_parsing.emulator_pool import (
+    PORT_STRIDE,
+    EmulatorEnvironment,
+    EmulatorPool,
+    shift_ports,
+)
+from g_code_parsing.g_code_engine import GCodeEngine
+from g_code_parsing.g_code_program.supported_text_modes import (
+    SupportedTextModes,
+)
+from g_code_parsing.utils import get_configuration_dir
+
+CONFIG = Settings(
+    smoothie=SmoothieSettings(
+        left=PipetteSettings(model="p20_single_v2.0", id="P20SV202020070101"),
+        right=PipetteSettings(model="p20_single_v2.0", id="P20SV202020070101"),
+    ),
+)
+
+PROTOCOL_PATH = os.path.join(
+    get_configuration_dir(), "protocol", "protocols", "fast", "smoothie_protocol.py"
+)
+
+
+async def _run_protocol(version: APIVersion, environment: EmulatorEnvironment) -> str:
+    async with GCodeEngine(CONFIG, environment).run_protocol(
+        PROTOCOL_PATH, version
+    ) as run:
+        return run.get_text_explanation(SupportedTextModes.G_CODE)
+
+
+def _run_protocol_sync(version: APIVersion, environment: EmulatorEnvironment) -> str:
+    return asyncio.run(_run_protocol(version, environment))
+
+
+def test_shift_ports() -> None:
+    """Every port should move, and nothing else should."""
+    shifted = shift_ports(CONFIG, 200)
+
+    assert shifted.smoothie.port == CONFIG.smoothie.port + 200
+    assert shifted.module_server.port == CONFIG.module_server.port + 200
+    assert shifted.magdeck_proxy.emulator_port == (
+        CONFIG.magdeck_proxy.emulator_port + 200
+    )
+    assert shifted.magdeck_proxy.driver_port == CONFIG.magdeck_proxy.driver_port + 200
+    assert shifted.smoothie.left == CONFIG.smoothie.left
+    assert shifted.modules == CONFIG.modules
+    assert shift_ports(CONFIG, 0) == CONFIG
+
+
+async def test_environment_matches_fresh_emulators() -> None:
+    """
+    Runs against an environment that is reset between them should send the
+    same G-Code as runs against newly started emulators
+    """
+    async with GCodeEngine(CONFIG).run_protocol(
+        PROTOCOL_PATH, APIVersion(2, 13)
+    ) as run:
+        expected = run.get_text_explanation(SupportedTextModes.G_CODE)
+
+    with EmulatorEnvironment(port_offset=PORT_STRIDE) as environment:
+        first = await _run_protocol(APIVersion(2, 13), environment)
+        second = await _run_protocol(APIVersion(2, 13), environment)
+
+    assert first == expected
+    assert second == expected
+
+
+def test_pool_matches_environment() -> None:
+    """Running in parallel should not change what each run sends."""
+    jobs = [
+        partial(_run_protocol_sync, APIVersion(2, 12)),
+        partial(_run_protocol_sync, APIVersion(2, 13)),
+        partial(_run_protocol_sync, APIVersion(2, 12)),
+    ]
+    with EmulatorEnvironment(port_offset=PORT_STRIDE) as environment:
+        expected = [job(environment) for job in jobs]
+
+    assert EmulatorPool(workers=2).run(jobs) == expected
@@ -1,9 +1,11 @@
 import pytest
 import os
+from typing import List
 
 from opentrons import APIVersion
 
 from g_code_parsing.g_code_engine import GCodeEngine
+from g_code_parsing.g_code_program.g_code_program import GCodeProgram
 from g_code_parsing.g_code_program.supported_text_modes import (
     SupportedTextModes,
 )
@@ -47,3 +49,36 @@ async def test_watcher_command_list_is_cleared(protocol_g_code_engine: GCodeEngi
         run_2_desc = run_2.get_text_explanation(SupportedTextModes.G_CODE)
 
     assert run_1_desc == run_2_desc
+
+
+def _smoothie_g_code_lines(program: GCodeProgram) -> List[str]:
+    return [
+        g_code.g_code_line
+        for g_code in program.g_codes
+        if g_code.device_name == "smoothie"
+    ]
+
+
+async def test_streaming_only_removes_waits(
+    protocol_g_code_engine: GCodeEngine, monkeypatch: pytest.MonkeyPatch
+):
+    """
+    Streaming gantry moves should send the same moves as not streaming,
+    just with fewer waits and current changes between them
+    """
+    async with protocol_g_code_engine.run_protocol(
+        PROTOCOL_PATH, APIVersion(2, 13)
+    ) as run:
+        synchronized = _smoothie_g_code_lines(run)
+
+    monkeypatch.setenv("OT_API_FF_enableSmoothieStreaming", "true")
+    async with protocol_g_code_engine.run_protocol(
+        PROTOCOL_PATH, APIVersion(2, 13)
+    ) as run:
+        streamed = _smoothie_g_code_lines(run)
+
+    def moves(lines: List[str]) -> List[str]:
+        return [line for line in lines if line.startswith("G0 ")]
+
+    assert moves(streamed) == moves(synchronized)
+    assert streamed.count("M400") < synchronized.count("M400")
@@ -2,8 +2,9 @@
 import asyncio
 import logging
 import concurrent.futures
-from functools import partial
-from typing import Optional, Type, Tuple
+import threading
+from collections import deque
+from typing import Deque, List, Optional, Type, Tuple, Union
 
 import serial  # type: ignore[import-untyped]
 from serial.tools.list_ports import comports  # type: ignore[import-untyped]
@@ -12,15 +13,16 @@ from opentrons_shared_data.errors.exceptions import InternalUSBCommunicationErro
 
 from opentrons_hardware.firmware_bindings.messages.binary_message_definitions import (
     BinaryMessageDefinition,
-    get_binary_definition,
 )
 
-
-from opentrons_hardware.firmware_bindings import utils
-from opentrons_hardware.firmware_bindings.binary_constants import BinaryMessageId
+from .framing import BinaryFrameParser
 
 log = logging.getLogger(__name__)
 
+# What the reader thread hands over each time it reads: the messages it
+# completed, or the error that stopped it.
+_ReadResult = Union[List[BinaryMessageDefinition], serial.SerialException]
+
 
 class SerialUsbDriver:
     """The usb binary protocol interface."""
@@ -34,6 +36,10 @@ class SerialUsbDriver:
         self._pid = 0
         self._baudrate = 0
         self._timeout = 0
+        self._reader: Optional[threading.Thread] = None
+        self._stop_reading = threading.Event()
+        self._results: "asyncio.Queue[_ReadResult]" = asyncio.Queue()
+        self._received: Deque[BinaryMessageDefinition] = deque()
 
     def find_and_connect(
         self, vid: int, pid: int, baudrate: int = 115200, timeout: int = 1
@@ -93,45 +99,96 @@ class SerialUsbDriver:
             return 0
 
     async def read(self) -> Optional[BinaryMessageDefinition]:
-        """Receive a binary message from the connected serial device."""
+        """Receive a binary message from the connected serial device.
+
+        Returns None if nothing arrived before the port's read timeout.
+        """
+        if self._received:
+            return self._next_received()
         if not self.connected():
             log.error("Unable to read message from unconnected device")
             return None
+        self._start_reader()
+        result = await self._results.get()
+        if isinstance(result, serial.SerialException):
+            log.error("Unable to read from port {err}".format(err=str(result)))
+            self._connected = False
+            return None
+        if not result:
+            return None
+        self._received.extend(result)
+        return self._next_received()
+
+    def _next_received(self) -> BinaryMessageDefinition:
+        message = self._received.popleft()
+        log.debug("binary read: %s", message)
+        return message
+
+    def _start_reader(self) -> None:
+        if self._reader is not None and self._reader.is_alive():
+            return
+        self._stop_reading.clear()
+        self._reader = threading.Thread(
+            target=self._read_port,
+            args=(self._port, self._stop_reading),
+            name="binary-usb-reader",
+            daemon=True,
+        )
+        self._reader.start()
+
+    def _read_port(self, port: serial.Serial, stop: threading.Event) -> None:
+        """Read everything that arrives on the port, in bulk, until stopped.
+
+        Runs in its own thread, and hands each batch of complete messages to
+        the event loop, or an empty batch if the read timed out.
+        """
+        parser = BinaryFrameParser()
+        while True:
+            result = self._read_batch(port, parser)
+            if stop.is_set():
+                return
+            if result is None:
+                continue
+            try:
+                self._loop.call_soon_threadsafe(self._deliver, result)
+            except RuntimeError:
+                # The event loop is closed, so nothing will read this.
+                return
+            if isinstance(result, serial.SerialException):
+                return
+
+    @staticmethod
+    def _read_batch(
+        port: serial.Serial, parser: BinaryFrameParser
+    ) -> Optional[_ReadResult]:
+        """Wait for bytes and read all of them, or None if no message is complete."""
         try:
-            header_data = await self._loop.run_in_executor(
-                self._executor, partial(self._port.read, size=4)
-            )  # read the message id and length
-            if len(header_data) < 4:
-                return None
-            message_type = BinaryMessageId(
-                int.from_bytes(utils.UInt16Field.build(header_data[0:2]).value, "big")  # type: ignore[arg-type]
-            )
-            message_def = get_binary_definition(message_type)
-            if message_def is not None:
-                message_length = int.from_bytes(
-                    utils.UInt16Field.build(header_data[2:4]).value, "big"  # type: ignore[arg-type]
-                )
-                message_data = await self._loop.run_in_executor(
-                    self._executor,
-                    partial(
-                        self._port.read,
-                        size=min(message_length, message_def.get_size()),
-                    ),
-                )
-                data = b"".join([header_data, message_data])
-                msg = message_def.build(data)
-                log.debug(f"binary read: {msg}")
-                return msg  # type: ignore[return-value]
-            else:
-                return None
+            data = port.read(1)
+            if data and port.in_waiting:
+                data += port.read(port.in_waiting)
         except serial.SerialException as e:
-            log.error("Unable to read from port {err}".format(err=str(e)))
-            self._connected = False
+            return e
+        except (OSError, TypeError, AttributeError) as e:
+            # Closing the port under a blocked read can fail like this.
+            return serial.SerialException(str(e))
+        messages = parser.feed(data)
+        if data and not messages:
             return None
+        return messages
+
+    def _deliver(self, result: _ReadResult) -> None:
+        if not result and not self._results.empty():
+            # A reader is already due to see a timeout or a batch.
+            return
+        self._results.put_nowait(result)
 
     def __exit__(self) -> None:
         self._connected = False
+        self._stop_reading.set()
         self._port.close()
+        if self._reader is not None:
+            self._reader.join(timeout=1)
+            self._reader = None
 
     def __aiter__(self) -> "SerialUsbDriver":
         """Enter iterator.
@@ -0,0 +1,66 @@
+"""Splitting a stream of bytes from the usb binary protocol into messages."""
+import logging
+from typing import Dict, List, Tuple, Type
+from typing_extensions import get_args
+
+from opentrons_hardware.firmware_bindings.messages.binary_message_definitions import (
+    BinaryMessageDefinition,
+)
+from opentrons_hardware.firmware_bindings.utils import BinarySerializableException
+
+log = logging.getLogger(__name__)
+
+HEADER_SIZE = 4
+"""The size of the message id and length that start every message."""
+
+# The definition and serialized size for each message id, so that framing a
+# message doesn't have to look either of them up.
+_DEFINITIONS: Dict[int, Tuple[Type[BinaryMessageDefinition], int]] = {
+    definition.message_id.value: (definition, definition.get_size())
+    for definition in get_args(BinaryMessageDefinition)
+}
+
+
+class BinaryFrameParser:
+    """Build messages out of bytes as they arrive, however they are split up."""
+
+    def __init__(self) -> None:
+        """Constructor."""
+        self._buffer = bytearray()
+
+    def feed(self, data: bytes) -> List[BinaryMessageDefinition]:
+        """Add some received bytes and get every message they complete.
+
+        Bytes that don't complete a message yet are held until the rest of it
+        arrives. Messages with an unknown id or bad contents are logged and
+        dropped.
+        """
+        buffer = self._buffer
+        buffer += data
+        messages: List[BinaryMessageDefinition] = []
+        start = 0
+        while len(buffer) - start >= HEADER_SIZE:
+            message_id = int.from_bytes(buffer[start : start + 2], "big")
+            length = int.from_bytes(buffer[start + 2 : start + HEADER_SIZE], "big")
+            end = start + HEADER_SIZE + length
+            if end > len(buffer):
+                break
+            entry = _DEFINITIONS.get(message_id)
+            if entry is None:
+                log.error(f"No binary message definition found for id {message_id}.")
+            else:
+                definition, size = entry
+                try:
+                    message = definition.build(
+                        bytes(buffer[start : start + HEADER_SIZE + min(length, size)])
+                    )
+                    messages.append(message)  # type: ignore[arg-type]
+                except BinarySerializableException:
+                    log.exception("Failed to build message")
+            start = end
+        del buffer[:start]
+        return messages
+
+    def clear(self) -> None:
+        """Drop any bytes held from an incomplete message."""
+        self._buffer.clear()
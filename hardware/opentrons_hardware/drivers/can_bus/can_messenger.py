@@ -22,6 +22,7 @@ from opentrons_shared_data.errors.exceptions import (
     EnumeratedError,
     PythonException,
 )
+from opentrons_hardware import tracing
 from opentrons_hardware.drivers.can_bus.abstract_driver import AbstractCanDriver
 from opentrons_hardware.firmware_bindings.arbitration_id import (
     ArbitrationId,
@@ -294,7 +295,14 @@ class CanMessenger:
             exclusive=exclusive,
         )
         try:
-            return await listener.send_and_verify_recieved()
+            with tracing.span(
+                "CanMessenger.ensure_send",
+                "can",
+                message=type(message).__name__,
+                node=node_id.name,
+                exclusive=exclusive,
+            ):
+                return await listener.send_and_verify_recieved()
         except EnumeratedError:
             raise
         except Exception as exc:
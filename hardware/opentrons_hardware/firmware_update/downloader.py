@@ -1,7 +1,9 @@
 """Firmware download."""
 import asyncio
 import binascii
+import itertools
 import logging
+from dataclasses import dataclass
 
 from opentrons_hardware.firmware_bindings import NodeId
 from opentrons_hardware.firmware_bindings.constants import ErrorCode
@@ -12,17 +14,34 @@ from opentrons_hardware.drivers.can_bus.can_messenger import (
     WaitableCallback,
 )
 from opentrons_hardware.firmware_update.errors import ErrorResponse, TimeoutResponse
-from opentrons_hardware.firmware_update.hex_file import HexRecordProcessor
+from opentrons_hardware.firmware_update.hex_file import Chunk, HexRecordProcessor
 from opentrons_hardware.firmware_bindings.messages import (
     message_definitions,
     payloads,
     fields,
 )
-from typing import AsyncIterator
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Optional
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _InFlightChunk:
+    """A chunk that has been sent in a windowed download."""
+
+    address: int
+    data: bytes
+    deadline: float
+
+
+class _WindowUnsupported(Exception):
+    """The node stopped acknowledging pipelined chunks."""
+
+    def __init__(self, remaining: List[_InFlightChunk]) -> None:
+        super().__init__()
+        self.remaining = remaining
+
+
 class FirmwareUpdateDownloader:
     """Class that downloads FW using CAN messages."""
 
@@ -30,63 +49,92 @@ class FirmwareUpdateDownloader:
         """Constructor."""
         self._messenger = messenger
 
-    async def run(
+    async def run(  # noqa: C901
         self,
         node_id: NodeId,
         hex_processor: HexRecordProcessor,
         ack_wait_seconds: float,
         retries: int = 3,
+        window_size: int = 1,
     ) -> AsyncIterator[float]:
         """Download hex record chunks to node.
 
+        With a window size of 1 each chunk is sent only after the previous one
+        was acknowledged. With a larger window, up to that many chunks are in
+        flight at once and acknowledgements are matched to chunks by address.
+        The checksum sent at the end covers chunks in the order they were
+        acknowledged, which is the order the node wrote them in. If a node
+        does not keep up with a windowed download (any ack times out), the
+        unacknowledged chunks are sent again and the rest of the download
+        falls back to stop-and-wait.
+
+        Hex records are parsed as the download proceeds unless the processor
+        cannot report the size of its input, in which case all chunks are
+        built up front so that progress can be reported.
+
         Args:
             node_id: The target node id.
             hex_processor: The producer of hex chunks.
             ack_wait_seconds: Number of seconds to wait for an ACK.
             retries: Number of attempts when sending a chunk.
+            window_size: Maximum number of unacknowledged chunks.
 
         Returns:
             None
         """
-        chunks = list(hex_processor.process(fields.FirmwareUpdateDataField.NUM_BYTES))
-        total_chunks = len(chunks)
+        chunk_iter: Iterator[Chunk] = iter(
+            hex_processor.process(fields.FirmwareUpdateDataField.NUM_BYTES)
+        )
+        progress: Callable[[int], float]
+        if hex_processor.total_size is None:
+            chunks = list(chunk_iter)
+            chunk_iter = iter(chunks)
+            total_chunks = len(chunks)
+
+            def progress(acked: int) -> float:
+                return acked / total_chunks
+
+        else:
+
+            def progress(acked: int) -> float:
+                return hex_processor.progress
+
+        num_messages = 0
+        crc32 = 0
         with WaitableCallback(self._messenger) as reader:
-            num_messages = 0
-            crc32 = 0
-            for chunk in chunks:
-                passed = False
-                for retry in range(retries):
-                    logger.debug(
-                        f"Sending chunk {num_messages} to address {chunk.address:x} retry: {retry}."
-                    )
-                    # Create and send message from this chunk
-                    data = bytes(chunk.data)
-                    data_message = message_definitions.FirmwareUpdateData(
-                        payload=payloads.FirmwareUpdateData.create(
-                            address=chunk.address, data=data
-                        )
+            remaining: List[_InFlightChunk] = []
+            if window_size > 1:
+                windowed = self._run_windowed(
+                    node_id, chunk_iter, reader, ack_wait_seconds, window_size
+                )
+                try:
+                    async for data in windowed:
+                        crc32 = binascii.crc32(data, crc32)
+                        num_messages += 1
+                        yield progress(num_messages)
+                except _WindowUnsupported as e:
+                    logger.warning(
+                        f"{node_id.name} did not keep up with a windowed download; "
+                        "falling back to stop-and-wait."
                     )
-                    await self._messenger.send(node_id=node_id, message=data_message)
-                    try:
-                        # Wait for ack.
-                        await asyncio.wait_for(
-                            self._wait_data_message_ack(node_id, reader),
-                            ack_wait_seconds,
-                        )
-                        passed = True
-                        break
-                    except asyncio.TimeoutError:
-                        logger.warning(
-                            f"Firmware update data ack timed out for chunk {num_messages}"
-                        )
-
-                # message was not successful
-                if not passed:
-                    raise TimeoutResponse(data_message, node_id)
+                    remaining = e.remaining
 
+            for address, data in itertools.chain(
+                ((c.address, c.data) for c in remaining),
+                ((c.address, bytes(c.data)) for c in chunk_iter),
+            ):
+                await self._send_and_wait(
+                    node_id,
+                    address,
+                    data,
+                    reader,
+                    ack_wait_seconds,
+                    retries,
+                    num_messages,
+                )
                 crc32 = binascii.crc32(data, crc32)
                 num_messages += 1
-                yield num_messages / total_chunks
+                yield progress(num_messages)
 
             # Create and send firmware update complete message.
             complete_message = message_definitions.FirmwareUpdateComplete(
@@ -103,17 +151,122 @@ class FirmwareUpdateDownloader:
             except asyncio.TimeoutError:
                 raise TimeoutResponse(complete_message, node_id)
 
+    async def _send_and_wait(
+        self,
+        node_id: NodeId,
+        address: int,
+        data: bytes,
+        reader: WaitableCallback,
+        ack_wait_seconds: float,
+        retries: int,
+        chunk_number: int,
+    ) -> None:
+        """Send one chunk and wait for its ack, retrying on timeout."""
+        for retry in range(retries):
+            logger.debug(
+                f"Sending chunk {chunk_number} to address {address:x} retry: {retry}."
+            )
+            # Create and send message from this chunk
+            data_message = self._data_message(address, data)
+            await self._messenger.send(node_id=node_id, message=data_message)
+            try:
+                # Wait for ack.
+                await asyncio.wait_for(
+                    self._wait_data_message_ack(node_id, reader, address),
+                    ack_wait_seconds,
+                )
+                return
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"Firmware update data ack timed out for chunk {chunk_number}"
+                )
+        # message was not successful
+        raise TimeoutResponse(data_message, node_id)
+
+    async def _run_windowed(
+        self,
+        node_id: NodeId,
+        chunks: Iterator[Chunk],
+        reader: WaitableCallback,
+        ack_wait_seconds: float,
+        window_size: int,
+    ) -> AsyncIterator[bytes]:
+        """Keep up to window_size chunks in flight.
+
+        Yields the data of each chunk as it is acknowledged. The node handles
+        chunks one at a time, so this is the order it wrote them in and the
+        order its checksum covers.
+
+        Raises _WindowUnsupported if an ack times out, carrying every chunk
+        that has been sent but not acknowledged, in the order they were sent.
+        """
+        loop = asyncio.get_running_loop()
+        # Insertion ordered: the order chunks were sent in.
+        in_flight: Dict[int, _InFlightChunk] = {}
+        exhausted = False
+        while True:
+            while not exhausted and len(in_flight) < window_size:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    exhausted = True
+                    break
+                data = bytes(chunk.data)
+                await self._messenger.send(
+                    node_id=node_id, message=self._data_message(chunk.address, data)
+                )
+                in_flight[chunk.address] = _InFlightChunk(
+                    address=chunk.address,
+                    data=data,
+                    deadline=loop.time() + ack_wait_seconds,
+                )
+            if not in_flight:
+                return
+
+            earliest = next(iter(in_flight.values())).deadline
+            try:
+                address = await asyncio.wait_for(
+                    self._wait_data_message_ack(node_id, reader),
+                    max(0.0, earliest - loop.time()),
+                )
+            except asyncio.TimeoutError:
+                raise _WindowUnsupported(list(in_flight.values()))
+            acked = in_flight.pop(address, None)
+            if acked is not None:
+                yield acked.data
+
     @staticmethod
-    async def _wait_data_message_ack(node_id: NodeId, reader: WaitableCallback) -> None:
-        """Wait for response to data."""
-        async for response, arbitration_id in reader:
+    def _data_message(
+        address: int, data: bytes
+    ) -> message_definitions.FirmwareUpdateData:
+        return message_definitions.FirmwareUpdateData(
+            payload=payloads.FirmwareUpdateData.create(address=address, data=data)
+        )
+
+    @staticmethod
+    async def _wait_data_message_ack(
+        node_id: NodeId, reader: WaitableCallback, address: Optional[int] = None
+    ) -> int:
+        """Wait for response to data.
+
+        Args:
+            node_id: The node the data was sent to.
+            reader: The message reader.
+            address: If set, ignore acks for other addresses.
+
+        Returns:
+            The address the ack is for.
+        """
+        while True:
+            response, arbitration_id = await reader.read()
             if arbitration_id.parts.originating_node_id == node_id:
                 if isinstance(
                     response, message_definitions.FirmwareUpdateDataAcknowledge
                 ):
                     if response.payload.error_code.value != ErrorCode.ok:
                         raise ErrorResponse(response, node_id)
-                    break
+                    ack_address = response.payload.address.value
+                    if address is None or ack_address == address:
+                        return ack_address
 
     @staticmethod
     async def _wait_update_complete_ack(
@@ -3,8 +3,9 @@ from __future__ import annotations
 from pathlib import Path
 from dataclasses import dataclass
 from enum import Enum
-from typing import Iterable, List, Generator, TextIO
+from typing import Iterable, List, Generator, Optional, TextIO
 import binascii
+import os
 import struct
 import logging
 
@@ -105,15 +106,25 @@ class BadChunkSizeException(FirmwareUpdateFailedError):
 def from_hex_file_path(file_path: Path) -> Iterable[HexRecord]:
     """A generator that processes a hex file at file_path."""
     with open(file_path) as hex_file:
-        return from_hex_file(hex_file)
+        yield from from_hex_file(hex_file)
 
 
 def from_hex_file(hex_file: TextIO) -> Iterable[HexRecord]:
-    """A generator that processes a hex file contents."""
-    for idx, line in enumerate(hex_file.readlines()):
+    """A generator that processes a hex file contents.
+
+    Lines are read and parsed one at a time as the generator is consumed.
+    """
+    for idx, line in enumerate(hex_file):
         yield process_line(line, idx, hex_file.name)
 
 
+def _file_size(hex_file: TextIO) -> Optional[int]:
+    try:
+        return os.fstat(hex_file.fileno()).st_size
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
 def process_line(
     line: str,
     line_no_for_error: int,
@@ -194,21 +205,41 @@ class HexRecordProcessor:
     Iterate through the process generator to get data chunks and start_address.
     """
 
-    def __init__(self, records: Iterable[HexRecord], filename: str) -> None:
-        """Constructor."""
+    def __init__(
+        self,
+        records: Iterable[HexRecord],
+        filename: str,
+        total_size: Optional[int] = None,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            records: The hex records to process.
+            filename: The name of the source, for error messages.
+            total_size: The size in bytes of the hex text the records come
+                from, if known. Used to report progress while streaming.
+        """
         self._records = records
         self._start_address: int = 0
         self._filename = filename
+        self._total_size = total_size
+        self._consumed = 0
 
     @classmethod
     def from_file_path(cls, file_path: Path) -> HexRecordProcessor:
         """Construct from file."""
-        return HexRecordProcessor(from_hex_file_path(file_path), str(file_path))
+        return HexRecordProcessor(
+            from_hex_file_path(file_path),
+            str(file_path),
+            total_size=os.path.getsize(file_path),
+        )
 
     @classmethod
     def from_file(cls, hex_file: TextIO) -> HexRecordProcessor:
         """Construct from file."""
-        return HexRecordProcessor(from_hex_file(hex_file), hex_file.name)
+        return HexRecordProcessor(
+            from_hex_file(hex_file), hex_file.name, total_size=_file_size(hex_file)
+        )
 
     @property
     def start_address(self) -> int:
@@ -218,6 +249,23 @@ class HexRecordProcessor:
         """
         return self._start_address
 
+    @property
+    def total_size(self) -> Optional[int]:
+        """The size of the hex text being processed, if known."""
+        return self._total_size
+
+    @property
+    def progress(self) -> float:
+        """The fraction of the hex text processed so far.
+
+        Estimated from the records parsed, which is exact for the usual
+        one-record-per-line files with single-character line endings. This is
+        always 0 if the total size is unknown.
+        """
+        if not self._total_size:
+            return 0.0
+        return min(1.0, self._consumed / self._total_size)
+
     def process(self, chunk_size: int) -> Generator[Chunk, None, None]:  # noqa: C901
         """Process the records.
 
@@ -239,6 +287,8 @@ class HexRecordProcessor:
         chunk_addr = 0
 
         for record in self._records:
+            # ':' + byte count, address and type (8) + data + checksum (2) + newline
+            self._consumed += 12 + 2 * record.byte_count
             if record.record_type == RecordType.Data:
                 addr = record.address + address_offset
                 if not buffer:
@@ -169,6 +169,7 @@ class RunUpdate:
         timeout_seconds: float,
         erase: Optional[bool] = True,
         erase_timeout_seconds: float = 60,
+        download_window_size: int = 1,
     ) -> None:
         """Initialize RunUpdate class.
 
@@ -178,6 +179,8 @@ class RunUpdate:
             retry_count: Number of times to retry.
             timeout_seconds: How much to wait for responses.
             erase: Whether to erase flash before updating.
+            download_window_size: How many CAN firmware chunks may be awaiting
+                an ack at once. 1 is stop-and-wait.
 
         Returns:
             None
@@ -189,6 +192,7 @@ class RunUpdate:
         self._timeout_seconds = timeout_seconds
         self._erase = erase
         self._erase_timeout_seconds = erase_timeout_seconds
+        self._download_window_size = download_window_size
         self._status_dict = {
             target: (FirmwareUpdateStatus.queued, 0) for target in update_details.keys()
         }
@@ -372,6 +376,7 @@ class RunUpdate:
                 hex_processor=hex_processor,
                 ack_wait_seconds=timeout_seconds,
                 retries=retry_count,
+                window_size=self._download_window_size,
             ):
                 await self._status_queue.put(
                     (
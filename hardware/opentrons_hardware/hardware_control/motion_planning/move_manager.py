@@ -1,6 +1,7 @@
 """Move manager."""
 import logging
 from typing import List, Tuple, Generic
+from opentrons_hardware import tracing
 from opentrons_hardware.hardware_control.motion_planning import move_utils
 from opentrons_hardware.hardware_control.motion_planning.types import (
     Coordinates,
@@ -57,6 +58,7 @@ class MoveManager(Generic[AxisKey]):
         end_move = Move.build_dummy(move_list[0].unit_vector.keys())
         return [start_move] + move_list + [end_move]
 
+    @tracing.traced(category="motion")
     def plan_motion(
         self,
         origin: Coordinates[AxisKey, CoordinateValue],
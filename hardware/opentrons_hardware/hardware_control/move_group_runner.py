@@ -16,6 +16,7 @@ from opentrons_shared_data.errors.exceptions import (
     MotorDriverError,
 )
 
+from opentrons_hardware import tracing
 from opentrons_hardware.firmware_bindings import ArbitrationId
 from opentrons_hardware.firmware_bindings.constants import (
     NodeId,
@@ -120,6 +121,7 @@ class MoveGroupRunner:
                     return True
         return False
 
+    @tracing.traced(category="motion")
     async def prep(self, can_messenger: CanMessenger) -> None:
         """Prepare the move group. The first thing that happens during run().
 
@@ -134,6 +136,7 @@ class MoveGroupRunner:
         await self._send_groups(can_messenger)
         self._is_prepped = True
 
+    @tracing.traced(category="motion")
     async def execute(
         self, can_messenger: CanMessenger
     ) -> NodeDict[MotorPositionStatus]:
@@ -153,6 +156,7 @@ class MoveGroupRunner:
         move_completion_data = await self._move(can_messenger, self._start_at_index)
         return self._accumulate_move_completions(move_completion_data)
 
+    @tracing.traced(category="motion")
     async def run(self, can_messenger: CanMessenger) -> NodeDict[MotorPositionStatus]:
         """Run the move group.
 
@@ -641,6 +645,7 @@ class MoveScheduler:
                 f"Recoverable firmware errors during {group_id}: {self._errors}"
             )
 
+    @tracing.traced(category="motion")
     async def _run_one_group(self, group_id: int, can_messenger: CanMessenger) -> None:
         self._event.clear()
 
@@ -703,6 +708,7 @@ class MoveScheduler:
             log.exception("canceling move group scheduler")
             raise PythonException(e) from e
 
+    @tracing.traced(category="motion")
     async def run(self, can_messenger: CanMessenger) -> _Completions:
         """Start each move group after the prior has completed."""
         for group_id in range(
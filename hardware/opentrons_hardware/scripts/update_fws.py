@@ -83,6 +83,7 @@ async def run(args: argparse.Namespace) -> None:
             retry_count=retry_count,
             timeout_seconds=timeout_seconds,
             erase=erase,
+            download_window_size=args.window_size,
         )
         async for progress in updater.run_updates():
             logger.info(f"{progress[0]} is {progress[1][0]} and {progress[1][1]} done")
@@ -110,6 +111,13 @@ def main() -> None:
     parser.add_argument(
         "--timeout-seconds", help="Number of seconds to wait.", type=float, default=10
     )
+    parser.add_argument(
+        "--window-size",
+        help="Number of firmware chunks to send before waiting for acks. "
+        "Nodes that don't keep up fall back to 1 (stop-and-wait).",
+        type=int,
+        default=1,
+    )
     parser.add_argument(
         "--no-erase",
         help="Don't erase existing application from flash.",
@@ -0,0 +1,335 @@
+"""Low-overhead span tracing for hardware control.
+
+Spans are timed with the monotonic clock and kept in a fixed-size ring
+buffer, so tracing can stay enabled on a running robot. The contents of the
+buffer can be exported on demand as Chrome trace-event JSON, which can be
+opened in chrome://tracing or https://ui.perfetto.dev. On a robot,
+robot-server serves it at ``GET /robot/hardwareTrace``.
+
+Tracing is enabled by default. It can be disabled by setting the
+``OT3_HARDWARE_TRACING`` environment variable to ``0``, and the number of spans
+kept can be set with ``OT3_HARDWARE_TRACE_CAPACITY``.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from types import TracebackType
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    IO,
+    List,
+    NamedTuple,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+DEFAULT_CAPACITY = 8192
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+_depth: contextvars.ContextVar[int] = contextvars.ContextVar(
+    "opentrons_hardware_trace_depth", default=0
+)
+
+
+class SpanRecord(NamedTuple):
+    """A completed span."""
+
+    name: str
+    category: str
+    start_ns: int
+    duration_ns: int
+    depth: int
+    thread_id: int
+    task_id: int
+    args: Optional[Dict[str, Any]]
+
+
+def _current_task_id() -> int:
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        return 0
+    return id(task) if task is not None else 0
+
+
+class _NullSpan:
+    """The span handed out while tracing is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> _NullSpan:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        return None
+
+    def set_arg(self, key: str, value: Any) -> None:
+        """Do nothing."""
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """A timed region of code; use as a context manager."""
+
+    __slots__ = ("_tracer", "_name", "_category", "_args", "_start", "_token")
+
+    def __init__(
+        self,
+        tracer: Tracer,
+        name: str,
+        category: str,
+        args: Optional[Dict[str, Any]],
+    ) -> None:
+        """Build a span. Prefer Tracer.span()."""
+        self._tracer = tracer
+        self._name = name
+        self._category = category
+        self._args = args
+        self._start = 0
+        self._token: Optional[contextvars.Token[int]] = None
+
+    def set_arg(self, key: str, value: Any) -> None:
+        """Attach an extra value to the span, e.g. a result computed inside it."""
+        if self._args is None:
+            self._args = {}
+        self._args[key] = value
+
+    def __enter__(self) -> Span:
+        self._token = _depth.set(_depth.get() + 1)
+        self._start = time.monotonic_ns()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        end = time.monotonic_ns()
+        depth = _depth.get() - 1
+        if self._token is not None:
+            _depth.reset(self._token)
+        if exc_type is not None:
+            self.set_arg("error", exc_type.__name__)
+        self._tracer._record(
+            SpanRecord(
+                name=self._name,
+                category=self._category,
+                start_ns=self._start,
+                duration_ns=end - self._start,
+                depth=depth,
+                thread_id=threading.get_ident(),
+                task_id=_current_task_id(),
+                args=self._args,
+            )
+        )
+
+
+class Tracer:
+    """Records nested spans into a fixed-size ring buffer."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, enabled: bool = True) -> None:
+        """Build a tracer.
+
+        Args:
+            capacity: The number of completed spans to keep. Older spans are
+                dropped once the buffer is full.
+            enabled: Whether spans are recorded.
+        """
+        if capacity <= 0:
+            raise ValueError("Trace capacity must be positive")
+        self._buffer: Deque[SpanRecord] = deque(maxlen=capacity)
+        self._enabled = enabled
+        self._dropped = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether spans are being recorded."""
+        return self._enabled
+
+    @property
+    def capacity(self) -> int:
+        """The maximum number of spans kept."""
+        return cast(int, self._buffer.maxlen)
+
+    @property
+    def dropped(self) -> int:
+        """The number of spans that have been pushed out of the buffer."""
+        return self._dropped
+
+    def configure(
+        self, enabled: Optional[bool] = None, capacity: Optional[int] = None
+    ) -> None:
+        """Change whether tracing is on or how many spans are kept.
+
+        Resizing keeps the most recent spans that still fit.
+        """
+        if enabled is not None:
+            self._enabled = enabled
+        if capacity is not None and capacity != self.capacity:
+            if capacity <= 0:
+                raise ValueError("Trace capacity must be positive")
+            self._buffer = deque(self._buffer, maxlen=capacity)
+
+    def span(
+        self, name: str, category: str = "hardware", **args: Any
+    ) -> Union[Span, _NullSpan]:
+        """Time the enclosed block as a span.
+
+        Keyword arguments are stored with the span and show up in the
+        exported trace.
+        """
+        if not self._enabled:
+            return _NULL_SPAN
+        return Span(self, name, category, args or None)
+
+    def traced(
+        self, name: Optional[str] = None, category: str = "hardware"
+    ) -> Callable[[_F], _F]:
+        """Decorate a function or coroutine function so each call is a span.
+
+        Args:
+            name: The span name. Defaults to the function's qualified name.
+            category: The span category.
+        """
+
+        def _decorator(func: _F) -> _F:
+            span_name = name or func.__qualname__
+
+            if inspect.iscoroutinefunction(func):
+
+                @functools.wraps(func)
+                async def _async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                    if not self._enabled:
+                        return await cast(Callable[..., Awaitable[Any]], func)(
+                            *args, **kwargs
+                        )
+                    with Span(self, span_name, category, None):
+                        return await cast(Callable[..., Awaitable[Any]], func)(
+                            *args, **kwargs
+                        )
+
+                return cast(_F, _async_wrapper)
+
+            @functools.wraps(func)
+            def _wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not self._enabled:
+                    return func(*args, **kwargs)
+                with Span(self, span_name, category, None):
+                    return func(*args, **kwargs)
+
+            return cast(_F, _wrapper)
+
+        return _decorator
+
+    def _record(self, record: SpanRecord) -> None:
+        buffer = self._buffer
+        if len(buffer) == buffer.maxlen:
+            self._dropped += 1
+        buffer.append(record)
+
+    def records(self) -> List[SpanRecord]:
+        """Get a snapshot of the recorded spans, oldest first."""
+        return list(self._buffer)
+
+    def clear(self) -> None:
+        """Drop all recorded spans."""
+        self._buffer.clear()
+        self._dropped = 0
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Build a Chrome trace-event document from the recorded spans.
+
+        Each span becomes a complete ("X") event. Spans from the same asyncio
+        task share a track so that nesting is shown; spans recorded outside
+        of a task are grouped by thread.
+        """
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = []
+        for record in sorted(self._buffer, key=lambda r: (r.start_ns, r.depth)):
+            event: Dict[str, Any] = {
+                "name": record.name,
+                "cat": record.category,
+                "ph": "X",
+                "ts": record.start_ns / 1000,
+                "dur": record.duration_ns / 1000,
+                "pid": pid,
+                "tid": record.task_id or record.thread_id,
+            }
+            if record.args:
+                event["args"] = record.args
+            events.append(event)
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"droppedSpans": self._dropped},
+        }
+
+    def dump_chrome_trace(self, destination: Union[str, Path, IO[str]]) -> None:
+        """Write the recorded spans as Chrome trace-event JSON.
+
+        Args:
+            destination: A path or an open text file.
+        """
+        trace = self.to_chrome_trace()
+        if isinstance(destination, (str, Path)):
+            with open(destination, "w") as f:
+                json.dump(trace, f, default=str)
+        else:
+            json.dump(trace, destination, default=str)
+
+
+def _capacity_from_env() -> int:
+    try:
+        capacity = int(os.environ.get("OT3_HARDWARE_TRACE_CAPACITY", DEFAULT_CAPACITY))
+    except ValueError:
+        return DEFAULT_CAPACITY
+    return capacity if capacity > 0 else DEFAULT_CAPACITY
+
+
+_tracer = Tracer(
+    capacity=_capacity_from_env(),
+    enabled=os.environ.get("OT3_HARDWARE_TRACING", "1") != "0",
+)
+
+
+def get_tracer() -> Tracer:
+    """Get the process-wide hardware tracer."""
+    return _tracer
+
+
+def span(name: str, category: str = "hardware", **args: Any) -> Union[Span, _NullSpan]:
+    """Time the enclosed block as a span on the process-wide tracer."""
+    return _tracer.span(name, category, **args)
+
+
+def traced(
+    name: Optional[str] = None, category: str = "hardware"
+) -> Callable[[_F], _F]:
+    """Decorate a function so each call is a span on the process-wide tracer."""
+    return _tracer.traced(name, category)
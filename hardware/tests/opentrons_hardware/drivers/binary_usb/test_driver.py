@@ -9,6 +9,7 @@ from selectors import DefaultSelector as Selector, EVENT_READ
 import tty
 import io
 from opentrons_hardware.drivers.binary_usb import SerialUsbDriver
+from opentrons_hardware.firmware_bindings import utils
 
 from typing import AsyncGenerator, List
 import pytest
@@ -17,6 +18,7 @@ from opentrons_hardware.firmware_bindings.messages.binary_message_definitions im
     Ack,
     AckFailed,
     EnterBootloaderRequest,
+    EstopStateChange,
 )
 
 
@@ -187,3 +189,51 @@ async def test_recv_iterator(
 
     assert type(messages[2]) is EnterBootloaderRequest
     assert messages[2] == EnterBootloaderRequest()
+
+
+async def test_recv_split(
+    subject: SerialUsbDriver, test_port_host: SerialEmulator
+) -> None:
+    """Test receiving a message that arrives in pieces."""
+    data = EstopStateChange(engaged=utils.UInt8Field(1)).serialize()
+    test_port_host.write(data[:3])
+    read = asyncio.get_running_loop().create_task(subject.read())
+    await asyncio.sleep(0.1)
+    assert not read.done()
+
+    test_port_host.write(data[3:])
+    assert await read == EstopStateChange(engaged=utils.UInt8Field(1))
+
+
+async def test_recv_skips_unknown(
+    subject: SerialUsbDriver, test_port_host: SerialEmulator
+) -> None:
+    """Test that an unknown message doesn't get in the way of the next one."""
+    test_port_host.write(b"\xff\xff\x00\x02ab" + b"\x00\x01\x00\x00")
+
+    assert await subject.read() == Ack()
+
+
+async def test_recv_throughput(
+    subject: SerialUsbDriver, test_port_host: SerialEmulator
+) -> None:
+    """Test receiving a burst of messages quickly and in order."""
+    sent = [
+        EstopStateChange(engaged=utils.UInt8Field(i % 2)) if i % 3 else Ack()
+        for i in range(3000)
+    ]
+    data = b"".join(m.serialize() for m in sent)
+    start = time.monotonic()
+    for i in range(0, len(data), 1024):
+        test_port_host.write(data[i : i + 1024])
+
+    received = []
+    async for message in subject:
+        assert message is not None
+        received.append(message)
+        if len(received) == len(sent):
+            break
+
+    assert received == sent
+    # Thousands of messages a second, even on a slow CI machine.
+    assert len(received) / (time.monotonic() - start) > 1000
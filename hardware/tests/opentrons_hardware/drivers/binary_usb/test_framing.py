@@ -0,0 +1,60 @@
+"""Tests for splitting usb binary protocol bytes into messages."""
+import pytest
+
+from opentrons_hardware.drivers.binary_usb.framing import BinaryFrameParser
+from opentrons_hardware.firmware_bindings import utils
+from opentrons_hardware.firmware_bindings.messages.binary_message_definitions import (
+    Ack,
+    DeviceInfoResponse,
+    EstopStateChange,
+)
+
+
+@pytest.fixture
+def subject() -> BinaryFrameParser:
+    """The parser under test."""
+    return BinaryFrameParser()
+
+
+def test_feed_many(subject: BinaryFrameParser) -> None:
+    """It should get every message out of one read."""
+    estop = EstopStateChange(engaged=utils.UInt8Field(1))
+    data = Ack().serialize() + estop.serialize() + Ack().serialize()
+
+    assert subject.feed(data) == [Ack(), estop, Ack()]
+
+
+def test_feed_split(subject: BinaryFrameParser) -> None:
+    """It should hold on to part of a message until the rest of it arrives."""
+    data = EstopStateChange(engaged=utils.UInt8Field(1)).serialize()
+
+    assert subject.feed(data[:1]) == []
+    assert subject.feed(data[1:4]) == []
+    assert subject.feed(data[4:] + data[:2]) == [
+        EstopStateChange(engaged=utils.UInt8Field(1))
+    ]
+    assert subject.feed(data[2:]) == [EstopStateChange(engaged=utils.UInt8Field(1))]
+
+
+def test_feed_unknown(subject: BinaryFrameParser) -> None:
+    """It should skip the whole of a message it doesn't know."""
+    assert subject.feed(b"\xff\xff\x00\x03abc" + Ack().serialize()) == [Ack()]
+
+
+def test_feed_short_message(subject: BinaryFrameParser) -> None:
+    """It should build a message from only as many bytes as its length says."""
+    response = DeviceInfoResponse(length=utils.UInt16Field(8))
+    data = response.serialize()[:12]
+
+    assert subject.feed(data + Ack().serialize()) == [
+        DeviceInfoResponse.build(data),
+        Ack(),
+    ]
+
+
+def test_clear(subject: BinaryFrameParser) -> None:
+    """It should drop part of a message when cleared."""
+    subject.feed(Ack().serialize()[:2])
+    subject.clear()
+
+    assert subject.feed(Ack().serialize()) == [Ack()]
@@ -0,0 +1,120 @@
+"""An emulated bootloader node for firmware download tests."""
+import asyncio
+import binascii
+from typing import Dict, List, Optional
+
+from opentrons_hardware.firmware_bindings import (
+    NodeId,
+    ArbitrationId,
+    ArbitrationIdParts,
+)
+from opentrons_hardware.firmware_bindings.constants import ErrorCode
+from opentrons_hardware.firmware_bindings.messages import MessageDefinition, payloads
+from opentrons_hardware.firmware_bindings.messages.fields import ErrorCodeField
+from opentrons_hardware.firmware_bindings.messages.message_definitions import (
+    FirmwareUpdateData,
+    FirmwareUpdateComplete,
+    FirmwareUpdateDataAcknowledge,
+    FirmwareUpdateCompleteAcknowledge,
+)
+from tests.conftest import MockCanMessageNotifier
+
+
+class EmulatedBootloader:
+    """A bootloader on the other end of a slow bus.
+
+    Every message takes latency / 2 to reach the node and every ack takes
+    latency / 2 to come back. The node handles data messages one at a time,
+    taking process_time for each, and can only hold rx_depth messages that it
+    has not acked yet; data messages arriving while it is full are dropped,
+    like frames overflowing a CAN receive FIFO.
+
+    Use send as the side effect of a mock messenger's send.
+    """
+
+    def __init__(
+        self,
+        notifier: MockCanMessageNotifier,
+        latency: float = 0.002,
+        process_time: float = 0.0,
+        rx_depth: int = 1,
+    ) -> None:
+        """Constructor."""
+        self._notifier = notifier
+        self._latency = latency
+        self._process_time = process_time
+        self._rx_depth = rx_depth
+        self._pending = 0
+        self._busy_until = 0.0
+        self._crc32 = 0
+        self.written: Dict[int, bytes] = {}
+        self.received: List[int] = []
+        self.data_messages_sent = 0
+        self.dropped = 0
+
+    @property
+    def crc32(self) -> int:
+        """The crc32 of all data the node has written, in order."""
+        return self._crc32
+
+    def send(self, node_id: NodeId, message: MessageDefinition) -> None:
+        """Receive a message from the host."""
+        loop = asyncio.get_running_loop()
+        arrival = loop.time() + self._latency / 2
+        if isinstance(message, FirmwareUpdateData):
+            self.data_messages_sent += 1
+            if self._pending >= self._rx_depth:
+                self.dropped += 1
+                return
+            self._pending += 1
+            self._busy_until = max(arrival, self._busy_until) + self._process_time
+            loop.call_at(
+                self._busy_until + self._latency / 2, self._ack_data, node_id, message
+            )
+        elif isinstance(message, FirmwareUpdateComplete):
+            loop.call_at(
+                max(arrival, self._busy_until) + self._latency / 2,
+                self._ack_complete,
+                node_id,
+                message,
+            )
+
+    def _ack_data(self, node_id: NodeId, message: FirmwareUpdateData) -> None:
+        self._pending -= 1
+        address = message.payload.address.value
+        if address not in self.written:
+            data = message.payload.data.value[: message.payload.num_bytes.value]
+            self.written[address] = data
+            self.received.append(address)
+            self._crc32 = binascii.crc32(data, self._crc32)
+        payload = payloads.FirmwareUpdateDataAcknowledge(
+            address=message.payload.address,
+            error_code=ErrorCodeField(ErrorCode.ok),
+        )
+        payload.message_index = message.payload.message_index
+        self._notify(node_id, FirmwareUpdateDataAcknowledge(payload=payload))
+
+    def _ack_complete(self, node_id: NodeId, message: FirmwareUpdateComplete) -> None:
+        error: Optional[ErrorCode] = None
+        if message.payload.num_messages.value != len(self.written):
+            error = ErrorCode.invalid_size
+        elif message.payload.crc32.value != self._crc32:
+            error = ErrorCode.bad_checksum
+        payload = payloads.FirmwareUpdateAcknowledge(
+            error_code=ErrorCodeField(error or ErrorCode.ok)
+        )
+        payload.message_index = message.payload.message_index
+        self._notify(node_id, FirmwareUpdateCompleteAcknowledge(payload=payload))
+
+    def _notify(self, node_id: NodeId, message: MessageDefinition) -> None:
+        self._notifier.notify(
+            message,
+            ArbitrationId(
+                parts=ArbitrationIdParts(
+                    message_id=message.message_id,
+                    node_id=NodeId.host,
+                    function_code=0,
+                    originating_node_id=node_id,
+                )
+            ),
+        )
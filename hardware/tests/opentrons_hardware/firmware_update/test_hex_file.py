@@ -1,4 +1,6 @@
 """Tests for hex file processing."""
+import io
+from pathlib import Path
 from typing import Iterable, List
 
 import pytest
@@ -257,3 +259,49 @@ def test_process_failure_zero_size(hex_records: Iterable[hex_file.HexRecord]) ->
     subject = hex_file.HexRecordProcessor(records=hex_records, filename="dummy-name")
     with pytest.raises(hex_file.BadChunkSizeException):
         list(subject.process(0))
+
+
+HEX_TEXT = "".join(
+    f"{line}\n"
+    for line in [
+        ":020000040800F2",
+        ":1001C000E9450008E9450008E9450008E945000857",
+        ":0451A0008943000837",
+        ":040000050800459911",
+        ":00000001FF",
+    ]
+)
+
+
+def test_from_file_path_streams(tmp_path: Path) -> None:
+    """It should parse lines as they are consumed and report progress."""
+    path = tmp_path / "firmware.hex"
+    path.write_text(HEX_TEXT)
+    subject = hex_file.HexRecordProcessor.from_file_path(path)
+
+    assert subject.total_size == len(HEX_TEXT)
+    assert subject.progress == 0
+
+    chunks = subject.process(16)
+    first = next(chunks)
+    assert first == hex_file.Chunk(
+        address=0x080001C0, data=list(bytes.fromhex("E9450008") * 4)
+    )
+    assert 0 < subject.progress < 1
+
+    assert list(chunks) == [
+        hex_file.Chunk(address=0x080051A0, data=[0x89, 0x43, 0x00, 0x08])
+    ]
+    assert subject.progress == 1
+    assert subject.start_address == 0x08004599
+
+
+def test_from_file_unknown_size() -> None:
+    """It should not report progress for a source of unknown size."""
+    source = io.StringIO(HEX_TEXT)
+    source.name = "in-memory.hex"
+    subject = hex_file.HexRecordProcessor.from_file(source)
+
+    assert subject.total_size is None
+    assert len(list(subject.process(16))) == 2
+    assert subject.progress == 0
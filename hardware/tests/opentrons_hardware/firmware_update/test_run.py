@@ -117,6 +117,7 @@ async def test_run_update(
         hex_processor=mock_hex_record_processor,
         ack_wait_seconds=11,
         retries=12,
+        window_size=1,
     )
     mock_can_messenger.send.assert_called_once_with(
         node_id=target.bootloader_node, message=FirmwareUpdateStartApp()
@@ -181,6 +182,7 @@ async def test_run_updates(
                 hex_processor=mock_hex_record_processor,
                 ack_wait_seconds=5,
                 retries=3,
+                window_size=1,
             ),
             mock.call().__aiter__(),
             mock.call(
@@ -188,6 +190,7 @@ async def test_run_updates(
                 hex_processor=mock_hex_record_processor,
                 ack_wait_seconds=5,
                 retries=3,
+                window_size=1,
             ),
             mock.call().__aiter__(),
         ]
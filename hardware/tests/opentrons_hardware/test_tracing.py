@@ -0,0 +1,107 @@
+"""Tests for hardware span tracing."""
+import asyncio
+import io
+import json
+
+import pytest
+
+from opentrons_hardware.tracing import Tracer
+
+
+def test_span_records_nesting() -> None:
+    """Nested spans record their depth and contain each other in time."""
+    subject = Tracer(capacity=10)
+    with subject.span("outer", node="head"):
+        with subject.span("inner", category="can"):
+            pass
+
+    inner, outer = subject.records()
+    assert outer.name == "outer"
+    assert outer.depth == 0
+    assert outer.args == {"node": "head"}
+    assert inner.name == "inner"
+    assert inner.category == "can"
+    assert inner.depth == 1
+    assert outer.start_ns <= inner.start_ns
+    assert inner.start_ns + inner.duration_ns <= outer.start_ns + outer.duration_ns
+
+
+def test_ring_buffer_keeps_latest() -> None:
+    """Once full, the oldest spans are dropped."""
+    subject = Tracer(capacity=3)
+    for i in range(5):
+        with subject.span(f"span-{i}"):
+            pass
+    assert [r.name for r in subject.records()] == ["span-2", "span-3", "span-4"]
+    assert subject.dropped == 2
+
+    subject.configure(capacity=2)
+    assert [r.name for r in subject.records()] == ["span-3", "span-4"]
+
+
+def test_disabled_records_nothing() -> None:
+    """A disabled tracer hands out no-op spans."""
+    subject = Tracer(enabled=False)
+
+    @subject.traced()
+    def _func() -> int:
+        return 1
+
+    with subject.span("ignored") as s:
+        s.set_arg("key", "value")
+    assert _func() == 1
+    assert subject.records() == []
+
+
+def test_span_records_errors() -> None:
+    """A span that exits with an exception notes the exception type."""
+    subject = Tracer()
+    with pytest.raises(KeyError):
+        with subject.span("failing"):
+            raise KeyError("oops")
+    assert subject.records()[0].args == {"error": "KeyError"}
+
+
+async def test_traced_coroutines() -> None:
+    """Decorated coroutines nest per task."""
+    subject = Tracer()
+
+    class _Thing:
+        @subject.traced(category="motion")
+        async def child(self) -> None:
+            await asyncio.sleep(0)
+
+        @subject.traced()
+        async def parent(self) -> str:
+            await asyncio.gather(self.child(), self.child())
+            return "done"
+
+    assert await _Thing().parent() == "done"
+    records = subject.records()
+    assert [r.name for r in records] == [
+        "test_traced_coroutines.<locals>._Thing.child",
+        "test_traced_coroutines.<locals>._Thing.child",
+        "test_traced_coroutines.<locals>._Thing.parent",
+    ]
+    assert [r.depth for r in records] == [1, 1, 0]
+    # gathered children run in their own tasks
+    assert len({r.task_id for r in records}) == 3
+
+
+def test_chrome_trace_export() -> None:
+    """Spans export as Chrome complete events."""
+    subject = Tracer()
+    with subject.span("outer", group=1):
+        with subject.span("inner"):
+            pass
+
+    out = io.StringIO()
+    subject.dump_chrome_trace(out)
+    trace = json.loads(out.getvalue())
+    events = trace["traceEvents"]
+    assert [e["name"] for e in events] == ["outer", "inner"]
+    assert all(e["ph"] == "X" for e in events)
+    assert events[0]["args"] == {"group": 1}
+    assert events[0]["ts"] <= events[1]["ts"]
+    assert events[0]["dur"] >= events[1]["dur"]
+    assert events[0]["tid"] == events[1]["tid"]
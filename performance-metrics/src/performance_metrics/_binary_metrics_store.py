@@ -0,0 +1,409 @@
+"""Interface for storing performance metrics data to a fixed-size binary ring buffer.
+
+The file is preallocated to hold a fixed number of fixed-width records, so it
+never grows past its configured size. Once full, the oldest records are
+overwritten.
+
+File layout:
+- A header of HEADER_SIZE bytes: magic, format version, record size, record
+  capacity, total number of records ever written, and a JSON schema
+  describing the record fields.
+- `capacity` records of `record_size` bytes each, packed with `struct`.
+
+Records are written with a single positional write per `store()` call and the
+record count in the header is updated afterwards. Syncing to disk happens on a
+background thread so that callers never wait on fsync.
+"""
+
+import dataclasses
+import functools
+import json
+import logging
+import os
+import struct
+import threading
+import typing
+from pathlib import Path
+
+from ._data_shapes import MetricsMetadata, CSVStorageBase
+from ._logging_config import LOGGER_NAME
+from ._types import StorableData
+
+logger = logging.getLogger(LOGGER_NAME)
+
+T = typing.TypeVar("T", bound=CSVStorageBase)
+
+MAGIC: typing.Final[bytes] = b"OTPMRING"
+FORMAT_VERSION: typing.Final[int] = 1
+HEADER_SIZE: typing.Final[int] = 4096
+DEFAULT_MAX_STORAGE_BYTES: typing.Final[int] = 8 * 1024 * 1024
+DEFAULT_SYNC_INTERVAL: typing.Final[float] = 5.0
+DEFAULT_STRING_WIDTH: typing.Final[int] = 64
+
+# magic, version, record size, capacity, write count, schema length
+_HEADER_STRUCT = struct.Struct("<8sHIIQI")
+_WRITE_COUNT_OFFSET: typing.Final[int] = struct.calcsize("<8sHII")
+_WRITE_COUNT_STRUCT = struct.Struct("<Q")
+
+
+class BinaryStorageError(Exception):
+    """A binary metrics file could not be read or written."""
+
+    ...
+
+
+@dataclasses.dataclass(frozen=True)
+class RecordField:
+    """A single fixed-width field in a binary record."""
+
+    name: str
+    format: str  # a struct format code, e.g. "q", "d" or "64s"
+
+    @property
+    def is_string(self) -> bool:
+        """Whether the field holds text."""
+        return self.format.endswith("s")
+
+
+@dataclasses.dataclass(frozen=True)
+class RecordSchema:
+    """Describes how records are packed into bytes."""
+
+    fields: typing.Tuple[RecordField, ...]
+
+    @functools.cached_property
+    def _struct(self) -> struct.Struct:
+        return struct.Struct("<" + "".join(field.format for field in self.fields))
+
+    @property
+    def record_size(self) -> int:
+        """The size of a packed record in bytes."""
+        return self._struct.size
+
+    @property
+    def headers(self) -> typing.Tuple[str, ...]:
+        """The field names, in order."""
+        return tuple(field.name for field in self.fields)
+
+    @classmethod
+    def for_dataclass(cls, data_class: typing.Type[CSVStorageBase]) -> "RecordSchema":
+        """Build a schema from a storage dataclass.
+
+        Integer fields are stored as signed 64 bit integers and float fields as
+        doubles. Text fields are stored as fixed-width UTF-8, truncated to
+        `DEFAULT_STRING_WIDTH` bytes unless the field's metadata sets `max_bytes`.
+        """
+        hints = typing.get_type_hints(data_class)
+        fields = []
+        for field in dataclasses.fields(data_class):
+            field_type = hints[field.name]
+            if field_type is int:
+                code = "q"
+            elif field_type is float:
+                code = "d"
+            elif field_type is str or typing.get_origin(field_type) is typing.Literal:
+                code = f"{field.metadata.get('max_bytes', DEFAULT_STRING_WIDTH)}s"
+            else:
+                raise BinaryStorageError(
+                    f"Cannot store field {field.name} of type {field_type} in a binary record."
+                )
+            fields.append(RecordField(name=field.name, format=code))
+        return cls(fields=tuple(fields))
+
+    @classmethod
+    def from_json(cls, raw: bytes) -> "RecordSchema":
+        """Load a schema written by `to_json`."""
+        return cls(
+            fields=tuple(
+                RecordField(name=field["name"], format=field["format"])
+                for field in json.loads(raw)
+            )
+        )
+
+    def to_json(self) -> bytes:
+        """Serialize the schema for the file header."""
+        return json.dumps(
+            [{"name": field.name, "format": field.format} for field in self.fields]
+        ).encode()
+
+    def pack(self, row: typing.Sequence[StorableData]) -> bytes:
+        """Pack a row of values into a record."""
+        values = [
+            str(value).encode("utf-8") if field.is_string else value
+            for field, value in zip(self.fields, row)
+        ]
+        return self._struct.pack(*values)
+
+    def unpack(self, record: bytes) -> typing.Tuple[StorableData, ...]:
+        """Unpack a record into a row of values."""
+        values = self._struct.unpack(record)
+        return tuple(
+            value.rstrip(b"\0").decode("utf-8", errors="ignore")
+            if field.is_string
+            else value
+            for field, value in zip(self.fields, values)
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class _Header:
+    record_size: int
+    capacity: int
+    write_count: int
+    schema: RecordSchema
+
+
+def _read_header(fd: int) -> _Header:
+    raw = os.pread(fd, HEADER_SIZE, 0)
+    if len(raw) < _HEADER_STRUCT.size:
+        raise BinaryStorageError("File is too short to be a binary metrics file.")
+    (
+        magic,
+        version,
+        record_size,
+        capacity,
+        write_count,
+        schema_len,
+    ) = _HEADER_STRUCT.unpack_from(raw)
+    if magic != MAGIC:
+        raise BinaryStorageError("File is not a binary metrics file.")
+    if version != FORMAT_VERSION:
+        raise BinaryStorageError(f"Unsupported binary metrics format {version}.")
+    schema_start = _HEADER_STRUCT.size
+    schema = RecordSchema.from_json(raw[schema_start : schema_start + schema_len])
+    return _Header(
+        record_size=record_size,
+        capacity=capacity,
+        write_count=write_count,
+        schema=schema,
+    )
+
+
+def _write_header(fd: int, header: _Header) -> None:
+    schema_json = header.schema.to_json()
+    if _HEADER_STRUCT.size + len(schema_json) > HEADER_SIZE:
+        raise BinaryStorageError("Record schema does not fit in the file header.")
+    packed = _HEADER_STRUCT.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        header.record_size,
+        header.capacity,
+        header.write_count,
+        len(schema_json),
+    )
+    os.pwrite(fd, (packed + schema_json).ljust(HEADER_SIZE, b"\0"), 0)
+
+
+def read_binary_metrics(
+    path: Path,
+) -> typing.Tuple[RecordSchema, typing.Iterator[typing.Tuple[StorableData, ...]]]:
+    """Read a binary metrics file.
+
+    Returns:
+        The file's record schema, and an iterator over its rows from oldest
+        to newest.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        header = _read_header(fd)
+        stored = min(header.write_count, header.capacity)
+        first = header.write_count - stored
+        size = header.record_size
+        # Read the (at most two) contiguous regions of the ring in order.
+        start_slot = first % header.capacity if header.capacity else 0
+        head_count = min(stored, header.capacity - start_slot)
+        chunks = [
+            os.pread(fd, head_count * size, HEADER_SIZE + start_slot * size),
+            os.pread(fd, (stored - head_count) * size, HEADER_SIZE),
+        ]
+    finally:
+        os.close(fd)
+
+    def _rows() -> typing.Iterator[typing.Tuple[StorableData, ...]]:
+        for chunk in chunks:
+            for offset in range(0, len(chunk) - size + 1, size):
+                yield header.schema.unpack(chunk[offset : offset + size])
+
+    return header.schema, _rows()
+
+
+class _SyncThread(threading.Thread):
+    """Syncs a file descriptor to disk periodically while there are unsynced writes."""
+
+    def __init__(self, fd: int, interval: float) -> None:
+        super().__init__(name="binary-metrics-sync", daemon=True)
+        self._fd = fd
+        self._interval = interval
+        self._dirty = threading.Event()
+        self._stopping = threading.Event()
+
+    def mark_dirty(self) -> None:
+        self._dirty.set()
+
+    def run(self) -> None:
+        while not self._stopping.is_set():
+            self._dirty.wait()
+            self._stopping.wait(self._interval)
+            self._sync()
+
+    def _sync(self) -> None:
+        if not self._dirty.is_set():
+            return
+        self._dirty.clear()
+        try:
+            os.fsync(self._fd)
+        except OSError:
+            logger.exception("Failed to sync binary metrics file")
+
+    def stop(self) -> None:
+        self._stopping.set()
+        self._dirty.set()
+        self.join()
+        self._sync()
+
+
+class BinaryMetricsStore(typing.Generic[T]):
+    """Stores data for tracking robot activity in a fixed-size binary ring buffer."""
+
+    def __init__(
+        self,
+        metadata: MetricsMetadata,
+        data_class: typing.Type[T],
+        max_storage_bytes: int = DEFAULT_MAX_STORAGE_BYTES,
+        sync_interval: float = DEFAULT_SYNC_INTERVAL,
+    ) -> None:
+        """Initialize the metrics store.
+
+        Args:
+            metadata: Where and under what name to store the data.
+            data_class: The dataclass of the stored rows.
+            max_storage_bytes: The size limit of the data file, header included.
+            sync_interval: How often, in seconds, unsynced writes are synced to disk.
+        """
+        self.metadata = metadata
+        self._schema = RecordSchema.for_dataclass(data_class)
+        self._capacity = (max_storage_bytes - HEADER_SIZE) // self._schema.record_size
+        if self._capacity <= 0:
+            raise BinaryStorageError(
+                f"{max_storage_bytes} bytes is too small to hold any {data_class.__name__} records."
+            )
+        self._sync_interval = sync_interval
+        self._data_store: typing.List[T] = []
+        self._lock = threading.Lock()
+        self._fd: typing.Optional[int] = None
+        self._write_count = 0
+        self._sync_thread: typing.Optional[_SyncThread] = None
+
+    @property
+    def data_file_location(self) -> Path:
+        """The location of the binary data file."""
+        return self.metadata.data_file_location.with_suffix(".bin")
+
+    @property
+    def capacity(self) -> int:
+        """The number of records the file holds before overwriting the oldest."""
+        return self._capacity
+
+    def add(self, data: T) -> None:
+        """Add data to the store."""
+        self._data_store.append(data)
+
+    def add_all(self, data: typing.Iterable[T]) -> None:
+        """Add data to the store."""
+        self._data_store.extend(data)
+
+    def setup(self) -> None:
+        """Open or create the preallocated data file.
+
+        An existing file with a different schema or size is moved aside to
+        `<name>.bin.old` rather than overwritten.
+        """
+        logger.info(
+            f"Setting up binary metrics store for {self.metadata.name} at {self.metadata.storage_dir}"
+        )
+        self.metadata.storage_dir.mkdir(parents=True, exist_ok=True)
+        path = self.data_file_location
+        expected = _Header(
+            record_size=self._schema.record_size,
+            capacity=self._capacity,
+            write_count=0,
+            schema=self._schema,
+        )
+        if path.exists():
+            fd = os.open(path, os.O_RDWR)
+            try:
+                existing = _read_header(fd)
+            except BinaryStorageError:
+                existing = None
+            if (
+                existing is not None
+                and existing.schema == self._schema
+                and existing.capacity == self._capacity
+            ):
+                self._fd = fd
+                self._write_count = existing.write_count
+            else:
+                os.close(fd)
+                logger.warning(
+                    f"{path} does not match the current record layout; moving it aside."
+                )
+                path.replace(path.with_suffix(".bin.old"))
+        if self._fd is None:
+            fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+            total_size = HEADER_SIZE + self._capacity * self._schema.record_size
+            try:
+                os.posix_fallocate(fd, 0, total_size)
+            except (AttributeError, OSError):
+                os.ftruncate(fd, total_size)
+            _write_header(fd, expected)
+            os.fsync(fd)
+            self._fd = fd
+            self._write_count = 0
+        self._sync_thread = _SyncThread(self._fd, self._sync_interval)
+        self._sync_thread.start()
+
+    def store(self) -> None:
+        """Clear the pending data and write it into the ring buffer.
+
+        The data reaches the OS page cache immediately; syncing it to disk is
+        left to the background sync thread.
+        """
+        with self._lock:
+            stored_data = self._data_store
+            self._data_store = []
+            if not stored_data or self._fd is None:
+                return
+            # Only the newest `capacity` records can survive a single write.
+            pending = [
+                self._schema.pack(data.csv_row())
+                for data in stored_data[-self._capacity :]
+            ]
+            size = self._schema.record_size
+            slot = self._write_count % self._capacity
+            while pending:
+                run = pending[: self._capacity - slot]
+                pending = pending[len(run) :]
+                os.pwrite(self._fd, b"".join(run), HEADER_SIZE + slot * size)
+                self._write_count += len(run)
+                slot = 0
+            os.pwrite(
+                self._fd,
+                _WRITE_COUNT_STRUCT.pack(self._write_count),
+                _WRITE_COUNT_OFFSET,
+            )
+            logger.debug(
+                f"Stored records up to {self._write_count} in {self.data_file_location}"
+            )
+        if self._sync_thread is not None:
+            self._sync_thread.mark_dirty()
+
+    def close(self) -> None:
+        """Write pending data, sync it to disk and close the file."""
+        self.store()
+        with self._lock:
+            if self._sync_thread is not None:
+                self._sync_thread.stop()
+                self._sync_thread = None
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
@@ -58,7 +58,7 @@ class ProcessResourceUsageSnapshot(CSVStorageBase):
     """
 
     query_time: int  # nanoseconds
-    command: str
+    command: str = dataclasses.field(metadata={"max_bytes": 256})
     running_since: float  # seconds
     user_cpu_time: float  # seconds
     system_cpu_time: float  # seconds
@@ -3,8 +3,10 @@
 import csv
 import typing
 import logging
+from ._binary_metrics_store import BinaryMetricsStore, DEFAULT_MAX_STORAGE_BYTES
 from ._data_shapes import MetricsMetadata, CSVStorageBase
 from ._logging_config import LOGGER_NAME
+from ._types import StorageFormat
 
 logger = logging.getLogger(LOGGER_NAME)
 
@@ -48,3 +50,28 @@ class MetricsStore(typing.Generic[T]):
             )
             writer = csv.writer(storage_file, quoting=csv.QUOTE_ALL)
             writer.writerows(rows_to_write)
+
+    def close(self) -> None:
+        """Write any remaining data to the storage file."""
+        self.store()
+
+
+def build_metrics_store(
+    metadata: MetricsMetadata,
+    data_class: typing.Type[T],
+    storage_format: StorageFormat = "csv",
+    max_storage_bytes: int = DEFAULT_MAX_STORAGE_BYTES,
+) -> typing.Union["MetricsStore[T]", BinaryMetricsStore[T]]:
+    """Build the store for the requested storage format.
+
+    Args:
+        metadata: Where and under what name to store the data.
+        data_class: The dataclass of the stored rows.
+        storage_format: "csv" to append to an unbounded CSV file, or "binary"
+            to write into a fixed-size binary ring buffer.
+        max_storage_bytes: The size limit of the binary ring buffer file.
+            Ignored for CSV storage.
+    """
+    if storage_format == "binary":
+        return BinaryMetricsStore[T](metadata, data_class, max_storage_bytes)
+    return MetricsStore[T](metadata)
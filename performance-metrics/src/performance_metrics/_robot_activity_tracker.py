@@ -7,9 +7,10 @@ from functools import wraps
 from time import perf_counter_ns
 import typing
 
-from ._metrics_store import MetricsStore
+from ._binary_metrics_store import DEFAULT_MAX_STORAGE_BYTES
+from ._metrics_store import build_metrics_store
 from ._data_shapes import RawActivityData, MetricsMetadata
-from ._types import SupportsTracking, RobotActivityState
+from ._types import SupportsTracking, RobotActivityState, StorageFormat
 from ._util import get_timing_function
 
 _UnderlyingFunctionParameters = typing.ParamSpec("_UnderlyingFunctionParameters")
@@ -29,14 +30,30 @@ class RobotActivityTracker(SupportsTracking):
         typing.Literal["robot_activity_data"]
     ] = "robot_activity_data"
 
-    def __init__(self, storage_location: Path, should_track: bool) -> None:
-        """Initializes the RobotActivityTracker with an empty storage list."""
-        self._store = MetricsStore[RawActivityData](
+    def __init__(
+        self,
+        storage_location: Path,
+        should_track: bool,
+        storage_format: StorageFormat = "csv",
+        max_storage_bytes: int = DEFAULT_MAX_STORAGE_BYTES,
+    ) -> None:
+        """Initializes the RobotActivityTracker with an empty storage list.
+
+        Args:
+            storage_location: The directory to store tracked data in.
+            should_track: Whether to track anything at all.
+            storage_format: "csv" or "binary". See `build_metrics_store`.
+            max_storage_bytes: The size limit of binary storage.
+        """
+        self._store = build_metrics_store(
             MetricsMetadata(
                 name=self.METADATA_NAME,
                 storage_dir=storage_location,
                 headers=RawActivityData.headers(),
-            )
+            ),
+            RawActivityData,
+            storage_format=storage_format,
+            max_storage_bytes=max_storage_bytes,
         )
         self._should_track = should_track
 
@@ -134,3 +151,9 @@ class RobotActivityTracker(SupportsTracking):
         if not self._should_track:
             return
         self._store.store()
+
+    def close(self) -> None:
+        """Write any remaining data and release the storage."""
+        if not self._should_track:
+            return
+        self._store.close()
@@ -41,5 +41,11 @@ class SupportsTracking(typing.Protocol):
         """Store the tracked data."""
         ...
 
+    def close(self) -> None:
+        """Store any remaining tracked data and release the storage."""
+        ...
+
 
 StorableData = typing.Union[int, float, str]
+
+StorageFormat = typing.Literal["csv", "binary"]
@@ -0,0 +1 @@
+"""Binary metrics export package."""
@@ -0,0 +1,49 @@
+"""Export a binary metrics file.
+
+Usage:
+    python -m performance_metrics.binary_export <source.bin> <destination> [--format csv|columnar]
+"""
+
+import argparse
+import typing
+from pathlib import Path
+
+from ._export import export_csv, export_columnar
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> None:
+    """Main function."""
+    parser = argparse.ArgumentParser(
+        prog="python -m performance_metrics.binary_export",
+        description="Convert a binary performance metrics file to CSV or columnar files.",
+    )
+    parser.add_argument("source", type=Path, help="The .bin file to read.")
+    parser.add_argument(
+        "destination",
+        type=Path,
+        help="The CSV file, or the directory for columnar output, to write.",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("csv", "columnar"),
+        default="csv",
+        help="The output format.",
+    )
+    parser.add_argument(
+        "--no-headers",
+        action="store_true",
+        help="Do not write a header row to CSV output.",
+    )
+    args = parser.parse_args(argv)
+
+    if args.format == "csv":
+        count = export_csv(
+            args.source, args.destination, include_headers=not args.no_headers
+        )
+    else:
+        count = export_columnar(args.source, args.destination)
+    print(f"Exported {count} rows to {args.destination}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Convert binary ring-buffer metrics files into CSV or columnar files."""
+
+import array
+import csv
+import json
+import sys
+import typing
+from pathlib import Path
+
+from .._binary_metrics_store import RecordSchema, read_binary_metrics
+from .._types import StorableData
+
+ExportFormat = typing.Literal["csv", "columnar"]
+
+_ARRAY_TYPECODES: typing.Final[typing.Dict[str, str]] = {"q": "q", "d": "d"}
+
+
+def export_csv(source: Path, destination: Path, include_headers: bool = True) -> int:
+    """Write the rows of a binary metrics file to a CSV file.
+
+    The rows are quoted the same way `MetricsStore` writes them.
+
+    Returns:
+        The number of rows written.
+    """
+    schema, rows = read_binary_metrics(source)
+    count = 0
+    with open(destination, "w", newline="") as out:
+        writer = csv.writer(out, quoting=csv.QUOTE_ALL)
+        if include_headers:
+            writer.writerow(schema.headers)
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+def _columns(
+    schema: RecordSchema, rows: typing.Iterable[typing.Tuple[StorableData, ...]]
+) -> typing.Dict[str, typing.List[StorableData]]:
+    columns: typing.Dict[str, typing.List[StorableData]] = {
+        name: [] for name in schema.headers
+    }
+    appenders = [columns[name].append for name in schema.headers]
+    for row in rows:
+        for append, value in zip(appenders, row):
+            append(value)
+    return columns
+
+
+def export_columnar(source: Path, destination: Path) -> int:
+    """Write the rows of a binary metrics file as one file per column.
+
+    The destination directory gets a `schema.json` describing the columns,
+    then for each column either
+    - `<name>.values`: a little-endian array of int64 or float64, or
+    - `<name>.offsets` and `<name>.data`: uint32 end offsets into a blob of
+      concatenated UTF-8 strings, for text columns.
+
+    Returns:
+        The number of rows written.
+    """
+    schema, rows = read_binary_metrics(source)
+    columns = _columns(schema, rows)
+    destination.mkdir(parents=True, exist_ok=True)
+    row_count = 0
+    manifest = []
+    for field in schema.fields:
+        values = columns[field.name]
+        row_count = len(values)
+        if field.is_string:
+            data = bytearray()
+            offsets = array.array("I")
+            for value in values:
+                data += str(value).encode("utf-8")
+                offsets.append(len(data))
+            _write_little_endian(destination / f"{field.name}.offsets", offsets)
+            (destination / f"{field.name}.data").write_bytes(bytes(data))
+            manifest.append({"name": field.name, "type": "utf8"})
+        else:
+            typecode = _ARRAY_TYPECODES[field.format]
+            _write_little_endian(
+                destination / f"{field.name}.values",
+                array.array(typecode, typing.cast(typing.List[typing.Any], values)),
+            )
+            manifest.append(
+                {"name": field.name, "type": "int64" if typecode == "q" else "float64"}
+            )
+    (destination / "schema.json").write_text(
+        json.dumps({"rows": row_count, "columns": manifest}, indent=2)
+    )
+    return row_count
+
+
+def _write_little_endian(path: Path, values: "array.array[typing.Any]") -> None:
+    if sys.byteorder != "little":
+        values = array.array(values.typecode, values)
+        values.byteswap()
+    path.write_bytes(values.tobytes())
+
+
+def read_columnar(source: Path) -> typing.Dict[str, typing.List[StorableData]]:
+    """Read a directory written by `export_columnar` back into columns."""
+    manifest = json.loads((source / "schema.json").read_text())
+    columns: typing.Dict[str, typing.List[StorableData]] = {}
+    for column in manifest["columns"]:
+        name = column["name"]
+        if column["type"] == "utf8":
+            offsets = array.array("I")
+            offsets.frombytes((source / f"{name}.offsets").read_bytes())
+            data = (source / f"{name}.data").read_bytes()
+            start = 0
+            strings: typing.List[StorableData] = []
+            for end in offsets:
+                strings.append(data[start:end].decode("utf-8"))
+                start = end
+            columns[name] = strings
+        else:
+            values = array.array("q" if column["type"] == "int64" else "d")
+            values.frombytes((source / f"{name}.values").read_bytes())
+            columns[name] = list(values)
+    return columns
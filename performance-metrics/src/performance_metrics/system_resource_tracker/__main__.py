@@ -33,6 +33,7 @@ def main() -> None:
     except Exception:
         logger.error("Exception occurred: ", exc_info=True)
     finally:
+        tracker.close()
         logger.info("System resource tracker is stopping.")
 
 
@@ -3,7 +3,9 @@ import typing
 import dataclasses
 from pathlib import Path, PurePosixPath
 import logging
+from .._binary_metrics_store import DEFAULT_MAX_STORAGE_BYTES, HEADER_SIZE
 from .._logging_config import LOGGER_NAME
+from .._types import StorageFormat
 
 
 logger = logging.getLogger(LOGGER_NAME)
@@ -15,6 +17,10 @@ PROCESS_FILTERS_ENV_VAR_NAME: typing.Final[str] = f"{_ENV_VAR_PREFIX}_PROCESS_FI
 REFRESH_INTERVAL_ENV_VAR_NAME: typing.Final[str] = f"{_ENV_VAR_PREFIX}_REFRESH_INTERVAL"
 STORAGE_DIR_ENV_VAR_NAME: typing.Final[str] = f"{_ENV_VAR_PREFIX}_STORAGE_DIR"
 LOGGING_LEVEL_ENV_VAR_NAME: typing.Final[str] = f"{_ENV_VAR_PREFIX}_LOGGING_LEVEL"
+STORAGE_FORMAT_ENV_VAR_NAME: typing.Final[str] = f"{_ENV_VAR_PREFIX}_STORAGE_FORMAT"
+MAX_STORAGE_BYTES_ENV_VAR_NAME: typing.Final[
+    str
+] = f"{_ENV_VAR_PREFIX}_MAX_STORAGE_BYTES"
 
 
 def default_filters() -> typing.Tuple[str, str]:
@@ -123,6 +129,46 @@ def _eval_logging_level(value: str) -> str:
     return value
 
 
+def _eval_storage_format(value: str) -> StorageFormat:
+    """Parse the storage format environment variable.
+
+    Returns:
+        StorageFormat: The parsed value.
+    """
+    if value not in ("csv", "binary"):
+        raise EnvironmentParseError(
+            f"{STORAGE_FORMAT_ENV_VAR_NAME} environment variable must be 'csv' or 'binary'. "
+            f"You specified: {value}"
+        )
+
+    logger.debug(f"Storage format: {value}")
+    return typing.cast(StorageFormat, value)
+
+
+def _eval_max_storage_bytes(value: str) -> int:
+    """Parse the max storage bytes environment variable.
+
+    Returns:
+        int: The parsed value.
+    """
+    try:
+        coerced_max_storage_bytes = int(value)
+    except ValueError:
+        raise EnvironmentParseError(
+            f"{MAX_STORAGE_BYTES_ENV_VAR_NAME} environment variable must be an integer. "
+            f"You specified: {value}"
+        )
+
+    if coerced_max_storage_bytes <= HEADER_SIZE:
+        raise EnvironmentParseError(
+            f"{MAX_STORAGE_BYTES_ENV_VAR_NAME} environment variable must be greater than {HEADER_SIZE}. "
+            f"You specified: {value}"
+        )
+
+    logger.debug(f"Max storage bytes: {coerced_max_storage_bytes}")
+    return coerced_max_storage_bytes
+
+
 @dataclasses.dataclass(frozen=True)
 class SystemResourceTrackerConfiguration:
     """Environment variables for the system resource tracker."""
@@ -134,6 +180,8 @@ class SystemResourceTrackerConfiguration:
     refresh_interval: float = 10.0
     storage_dir: Path = Path("/data/performance_metrics_data/")
     logging_level: str = "INFO"
+    storage_format: StorageFormat = "csv"
+    max_storage_bytes: int = DEFAULT_MAX_STORAGE_BYTES
 
     def __str__(self) -> str:
         """Get a string representation of the configuration."""
@@ -144,6 +192,8 @@ class SystemResourceTrackerConfiguration:
             f"refresh_interval={self.refresh_interval}\n"
             f"storage_dir={self.storage_dir}\n"
             f"logging_level={self.logging_level}\n"
+            f"storage_format={self.storage_format}\n"
+            f"max_storage_bytes={self.max_storage_bytes}\n"
         )
 
     @classmethod
@@ -174,4 +224,12 @@ class SystemResourceTrackerConfiguration:
         if (logging_level := os.environ.get(LOGGING_LEVEL_ENV_VAR_NAME)) is not None:
             kwargs["logging_level"] = _eval_logging_level(logging_level)
 
+        if (storage_format := os.environ.get(STORAGE_FORMAT_ENV_VAR_NAME)) is not None:
+            kwargs["storage_format"] = _eval_storage_format(storage_format)
+
+        if (
+            max_storage_bytes := os.environ.get(MAX_STORAGE_BYTES_ENV_VAR_NAME)
+        ) is not None:
+            kwargs["max_storage_bytes"] = _eval_max_storage_bytes(max_storage_bytes)
+
         return cls(**kwargs)
@@ -9,7 +9,7 @@ from ._config import SystemResourceTrackerConfiguration
 from .._logging_config import LOGGER_NAME
 from .._util import format_command, get_timing_function
 from .._data_shapes import ProcessResourceUsageSnapshot, MetricsMetadata
-from .._metrics_store import MetricsStore
+from .._metrics_store import build_metrics_store
 
 _timing_function = get_timing_function()
 
@@ -25,12 +25,15 @@ class SystemResourceTracker:
         self._processes: typing.List[
             psutil.Process
         ]  # intentionally not public as process.kill can be called
-        self._store = MetricsStore[ProcessResourceUsageSnapshot](
+        self._store = build_metrics_store(
             MetricsMetadata(
                 name="system_resource_data",
                 storage_dir=self.config.storage_dir,
                 headers=ProcessResourceUsageSnapshot.headers(),
-            )
+            ),
+            ProcessResourceUsageSnapshot,
+            storage_format=self.config.storage_format,
+            max_storage_bytes=self.config.max_storage_bytes,
         )
         self._store.setup()
         self.refresh_processes()
@@ -100,3 +103,7 @@ class SystemResourceTracker:
             self.refresh_processes()
             self._store.add_all(self.snapshots)
             self._store.store()
+
+    def close(self) -> None:
+        """Write any remaining data and release the storage."""
+        self._store.close()
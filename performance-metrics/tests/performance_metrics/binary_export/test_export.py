@@ -0,0 +1,89 @@
+"""Tests for exporting binary metrics files."""
+
+import csv
+from pathlib import Path
+
+import pytest
+
+from performance_metrics._binary_metrics_store import BinaryMetricsStore
+from performance_metrics._data_shapes import (
+    MetricsMetadata,
+    ProcessResourceUsageSnapshot,
+)
+from performance_metrics.binary_export._export import (
+    export_csv,
+    export_columnar,
+    read_columnar,
+)
+from performance_metrics.binary_export.__main__ import main
+
+SNAPSHOTS = [
+    ProcessResourceUsageSnapshot(
+        query_time=i,
+        command=f"python3 -m robot_server {i}",
+        running_since=1.5 * i,
+        user_cpu_time=0.25 * i,
+        system_cpu_time=0.5 * i,
+        memory_percent=0.1 * i,
+    )
+    for i in range(5)
+]
+
+
+@pytest.fixture
+def binary_file(tmp_path: Path) -> Path:
+    """A binary metrics file holding SNAPSHOTS."""
+    store = BinaryMetricsStore[ProcessResourceUsageSnapshot](
+        MetricsMetadata(
+            name="system_resource_data",
+            storage_dir=tmp_path,
+            headers=ProcessResourceUsageSnapshot.headers(),
+        ),
+        ProcessResourceUsageSnapshot,
+    )
+    store.setup()
+    store.add_all(SNAPSHOTS)
+    store.close()
+    return store.data_file_location
+
+
+def test_export_csv(binary_file: Path, tmp_path: Path) -> None:
+    """CSV output has a header row and one row per record."""
+    destination = tmp_path / "out.csv"
+    assert export_csv(binary_file, destination) == len(SNAPSHOTS)
+
+    with open(destination, newline="") as f:
+        header, *rows = list(csv.reader(f))
+    assert tuple(header) == ProcessResourceUsageSnapshot.headers()
+    assert [
+        ProcessResourceUsageSnapshot(
+            int(row[0]),
+            row[1],
+            float(row[2]),
+            float(row[3]),
+            float(row[4]),
+            float(row[5]),
+        )
+        for row in rows
+    ] == SNAPSHOTS
+
+
+def test_export_columnar(binary_file: Path, tmp_path: Path) -> None:
+    """Columnar output round-trips through read_columnar."""
+    destination = tmp_path / "columns"
+    assert export_columnar(binary_file, destination) == len(SNAPSHOTS)
+
+    columns = read_columnar(destination)
+    assert columns["query_time"] == [s.query_time for s in SNAPSHOTS]
+    assert columns["command"] == [s.command for s in SNAPSHOTS]
+    assert columns["memory_percent"] == [s.memory_percent for s in SNAPSHOTS]
+
+
+def test_cli(binary_file: Path, tmp_path: Path) -> None:
+    """The command line entrypoint writes the requested format."""
+    main([str(binary_file), str(tmp_path / "out.csv"), "--no-headers"])
+    with open(tmp_path / "out.csv", newline="") as f:
+        assert len(list(csv.reader(f))) == len(SNAPSHOTS)
+
+    main([str(binary_file), str(tmp_path / "columns"), "--format", "columnar"])
+    assert (tmp_path / "columns" / "schema.json").exists()
@@ -8,6 +8,8 @@ from performance_metrics.system_resource_tracker._config import (
     _eval_refresh_interval,
     _eval_storage_dir,
     _eval_logging_level,
+    _eval_storage_format,
+    _eval_max_storage_bytes,
     SystemResourceTrackerConfiguration,
     EnvironmentParseError,
     ENABLED_ENV_VAR_NAME,
@@ -15,6 +17,8 @@ from performance_metrics.system_resource_tracker._config import (
     REFRESH_INTERVAL_ENV_VAR_NAME,
     STORAGE_DIR_ENV_VAR_NAME,
     LOGGING_LEVEL_ENV_VAR_NAME,
+    STORAGE_FORMAT_ENV_VAR_NAME,
+    MAX_STORAGE_BYTES_ENV_VAR_NAME,
 )
 
 
@@ -63,6 +67,23 @@ def test_eval_logging_level() -> None:
         _eval_logging_level("INVALID")
 
 
+def test_eval_storage_format() -> None:
+    """Test parsing of the storage format environment variable."""
+    assert _eval_storage_format("csv") == "csv"
+    assert _eval_storage_format("binary") == "binary"
+    with pytest.raises(EnvironmentParseError):
+        _eval_storage_format("parquet")
+
+
+def test_eval_max_storage_bytes() -> None:
+    """Test parsing of the max storage bytes environment variable."""
+    assert _eval_max_storage_bytes("1048576") == 1048576
+    with pytest.raises(EnvironmentParseError):
+        _eval_max_storage_bytes("invalid")
+    with pytest.raises(EnvironmentParseError):
+        _eval_max_storage_bytes("10")
+
+
 def test_system_resource_tracker_configuration_from_env(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -72,6 +93,8 @@ def test_system_resource_tracker_configuration_from_env(
     monkeypatch.setenv(REFRESH_INTERVAL_ENV_VAR_NAME, "10.5")
     monkeypatch.setenv(STORAGE_DIR_ENV_VAR_NAME, "/data/performance_metrics_data")
     monkeypatch.setenv(LOGGING_LEVEL_ENV_VAR_NAME, "INFO")
+    monkeypatch.setenv(STORAGE_FORMAT_ENV_VAR_NAME, "binary")
+    monkeypatch.setenv(MAX_STORAGE_BYTES_ENV_VAR_NAME, "1048576")
 
     config = SystemResourceTrackerConfiguration.from_env()
 
@@ -80,6 +103,8 @@ def test_system_resource_tracker_configuration_from_env(
     assert config.refresh_interval == 10.5
     assert config.storage_dir == Path("/data/performance_metrics_data")
     assert config.logging_level == "INFO"
+    assert config.storage_format == "binary"
+    assert config.max_storage_bytes == 1048576
 
 
 def test_system_resource_tracker_configuration_from_env_defaults(
@@ -93,6 +118,7 @@ def test_system_resource_tracker_configuration_from_env_defaults(
     assert config.refresh_interval == 10.0
     assert config.storage_dir == Path("/data/performance_metrics_data/")
     assert config.logging_level == "INFO"
+    assert config.storage_format == "csv"
 
 
 def test_eval_enabled_invalid(monkeypatch: pytest.MonkeyPatch) -> None:
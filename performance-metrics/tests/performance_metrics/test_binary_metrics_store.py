@@ -0,0 +1,194 @@
+"""Tests for the binary ring-buffer metrics store."""
+
+import dataclasses
+from pathlib import Path
+
+import pytest
+
+from performance_metrics._binary_metrics_store import (
+    BinaryMetricsStore,
+    BinaryStorageError,
+    HEADER_SIZE,
+    RecordSchema,
+    read_binary_metrics,
+)
+from performance_metrics._data_shapes import (
+    MetricsMetadata,
+    ProcessResourceUsageSnapshot,
+    RawActivityData,
+)
+from performance_metrics._metrics_store import MetricsStore, build_metrics_store
+
+
+def _metadata(tmp_path: Path) -> MetricsMetadata:
+    return MetricsMetadata(
+        name="robot_activity_data",
+        storage_dir=tmp_path,
+        headers=RawActivityData.headers(),
+    )
+
+
+def _activity(i: int) -> RawActivityData:
+    return RawActivityData(state="ANALYZING_PROTOCOL", func_start=i, duration=i * 10)
+
+
+def _build_store(tmp_path: Path, capacity: int) -> BinaryMetricsStore[RawActivityData]:
+    record_size = RecordSchema.for_dataclass(RawActivityData).record_size
+    return BinaryMetricsStore[RawActivityData](
+        _metadata(tmp_path),
+        RawActivityData,
+        max_storage_bytes=HEADER_SIZE + capacity * record_size,
+    )
+
+
+def test_schema_from_dataclass() -> None:
+    """Field types map to fixed-width struct codes."""
+    schema = RecordSchema.for_dataclass(ProcessResourceUsageSnapshot)
+    assert [field.format for field in schema.fields] == [
+        "q",
+        "256s",
+        "d",
+        "d",
+        "d",
+        "d",
+    ]
+    assert schema.headers == ProcessResourceUsageSnapshot.headers()
+    assert RecordSchema.from_json(schema.to_json()) == schema
+
+
+def test_schema_rejects_unsupported_types() -> None:
+    """Only ints, floats and strings can be stored."""
+
+    @dataclasses.dataclass(frozen=True)
+    class _Unsupported(RawActivityData):
+        extra: bytes = b""
+
+    with pytest.raises(BinaryStorageError):
+        RecordSchema.for_dataclass(_Unsupported)
+
+
+def test_file_is_preallocated(tmp_path: Path) -> None:
+    """The data file is created at its final size."""
+    subject = _build_store(tmp_path, capacity=10)
+    subject.setup()
+    try:
+        record_size = RecordSchema.for_dataclass(RawActivityData).record_size
+        assert subject.data_file_location.stat().st_size == (
+            HEADER_SIZE + 10 * record_size
+        )
+    finally:
+        subject.close()
+
+
+def test_store_and_read_back(tmp_path: Path) -> None:
+    """Stored rows can be read back in order."""
+    subject = _build_store(tmp_path, capacity=10)
+    subject.setup()
+    subject.add(_activity(1))
+    subject.add_all([_activity(2), _activity(3)])
+    subject.store()
+
+    schema, rows = read_binary_metrics(subject.data_file_location)
+    assert schema.headers == RawActivityData.headers()
+    assert [RawActivityData.from_csv_row(row) for row in rows] == [
+        _activity(1),
+        _activity(2),
+        _activity(3),
+    ]
+    subject.close()
+
+
+def test_ring_buffer_wraps(tmp_path: Path) -> None:
+    """Once full, the oldest rows are overwritten and the file does not grow."""
+    subject = _build_store(tmp_path, capacity=4)
+    subject.setup()
+    size = subject.data_file_location.stat().st_size
+    for i in range(3):
+        subject.add(_activity(i))
+        subject.store()
+    subject.add_all([_activity(i) for i in range(3, 10)])
+    subject.store()
+    subject.close()
+
+    _, rows = read_binary_metrics(subject.data_file_location)
+    assert [row[1] for row in rows] == [6, 7, 8, 9]
+    assert subject.data_file_location.stat().st_size == size
+
+
+def test_reopen_resumes(tmp_path: Path) -> None:
+    """An existing file with the same layout is appended to."""
+    first = _build_store(tmp_path, capacity=3)
+    first.setup()
+    first.add_all([_activity(1), _activity(2)])
+    first.close()
+
+    second = _build_store(tmp_path, capacity=3)
+    second.setup()
+    second.add_all([_activity(3), _activity(4)])
+    second.close()
+
+    _, rows = read_binary_metrics(second.data_file_location)
+    assert [row[1] for row in rows] == [2, 3, 4]
+
+
+def test_mismatched_file_is_moved_aside(tmp_path: Path) -> None:
+    """A file with a different capacity is kept as .old instead of being reused."""
+    first = _build_store(tmp_path, capacity=3)
+    first.setup()
+    first.add(_activity(1))
+    first.close()
+
+    second = _build_store(tmp_path, capacity=5)
+    second.setup()
+    second.close()
+
+    _, rows = read_binary_metrics(second.data_file_location)
+    assert list(rows) == []
+    _, old_rows = read_binary_metrics(second.data_file_location.with_suffix(".bin.old"))
+    assert [row[1] for row in old_rows] == [1]
+
+
+def test_long_strings_are_truncated(tmp_path: Path) -> None:
+    """Strings longer than their field are cut to the field width."""
+    store = BinaryMetricsStore[ProcessResourceUsageSnapshot](
+        MetricsMetadata(
+            name="system_resource_data",
+            storage_dir=tmp_path,
+            headers=ProcessResourceUsageSnapshot.headers(),
+        ),
+        ProcessResourceUsageSnapshot,
+    )
+    store.setup()
+    store.add(
+        ProcessResourceUsageSnapshot(
+            query_time=1,
+            command="x" * 1000,
+            running_since=2.0,
+            user_cpu_time=3.0,
+            system_cpu_time=4.0,
+            memory_percent=5.0,
+        )
+    )
+    store.close()
+    _, rows = read_binary_metrics(store.data_file_location)
+    (row,) = list(rows)
+    assert row == (1, "x" * 256, 2.0, 3.0, 4.0, 5.0)
+
+
+def test_too_small_limit(tmp_path: Path) -> None:
+    """A size limit that cannot hold a record is rejected."""
+    with pytest.raises(BinaryStorageError):
+        BinaryMetricsStore[RawActivityData](
+            _metadata(tmp_path), RawActivityData, max_storage_bytes=HEADER_SIZE
+        )
+
+
+def test_build_metrics_store(tmp_path: Path) -> None:
+    """The factory picks the backend by storage format."""
+    assert isinstance(
+        build_metrics_store(_metadata(tmp_path), RawActivityData), MetricsStore
+    )
+    assert isinstance(
+        build_metrics_store(_metadata(tmp_path), RawActivityData, "binary"),
+        BinaryMetricsStore,
+    )
@@ -3,6 +3,10 @@
 import asyncio
 from pathlib import Path
 import pytest
+from performance_metrics._binary_metrics_store import (
+    BinaryMetricsStore,
+    read_binary_metrics,
+)
 from performance_metrics._robot_activity_tracker import RobotActivityTracker
 from time import sleep, time_ns
 from unittest.mock import patch
@@ -275,6 +279,26 @@ def test_sync_exception_handling_when_not_tracking(tmp_path: Path) -> None:
         error_prone_operation()
 
 
+def test_close_writes_binary_data(tmp_path: Path) -> None:
+    """Closing a binary tracker should write its remaining data and stop syncing."""
+    robot_activity_tracker = RobotActivityTracker(
+        tmp_path, should_track=True, storage_format="binary"
+    )
+
+    @robot_activity_tracker.track(state="CALIBRATING")
+    def calibrating_robot() -> None:
+        pass
+
+    calibrating_robot()
+    robot_activity_tracker.close()
+
+    store = robot_activity_tracker._store
+    assert isinstance(store, BinaryMetricsStore)
+    _, rows = read_binary_metrics(store.data_file_location)
+    assert [row[0] for row in rows] == ["CALIBRATING"]
+    assert store._sync_thread is None
+
+
 @patch(
     "performance_metrics._util.get_timing_function",
     return_value=time_ns,
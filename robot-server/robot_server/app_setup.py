@@ -18,6 +18,7 @@ from .persistence.fastapi_dependencies import (
     start_initializing_persistence,
     clean_up_persistence,
 )
+from .protocols.analysis_worker_pool import set_up_analysis_worker_pool
 from .router import router
 from .service.logging import initialize_logging
 from .service.task_runner import set_up_task_runner
@@ -48,6 +49,9 @@ async def _lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
         initialize_logging()
 
+        # Set up before the task runner, so that on shutdown, analysis tasks are
+        # cancelled before their worker processes are stopped.
+        await exit_stack.enter_async_context(set_up_analysis_worker_pool(app.state))
         await exit_stack.enter_async_context(set_up_task_runner(app.state))
 
         blinker = FrontButtonLightBlinker()
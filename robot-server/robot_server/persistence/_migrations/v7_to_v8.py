@@ -0,0 +1,226 @@
+"""Migrate the persistence directory from schema 7 to 8.
+
+Summary of changes from schema 7:
+
+- Replaces the "completed_analysis" column of analysis_table with a compressed
+  "completed_analysis_summary" column that omits the analysis's commands,
+  and a "command_count" column.
+- Adds an analysis_command_page_table that stores each analysis's commands
+  as compressed pages.
+- Compresses the "command" column of run_command_table.
+"""
+
+import enum
+import json
+from pathlib import Path
+from contextlib import ExitStack
+from typing import Final
+
+import sqlalchemy
+
+from ..compression import compress_json
+from ..database import sql_engine_ctx, sqlite_rowid
+from ..tables import schema_7, schema_8
+from .._folder_migrator import Migration
+
+from ._util import copy_rows_unmodified, copy_if_exists, copytree_if_exists
+from ..file_and_directory_names import (
+    DECK_CONFIGURATION_FILE,
+    PROTOCOLS_DIRECTORY,
+    DATA_FILES_DIRECTORY,
+    DB_FILE,
+)
+
+# This must match CompletedAnalysisStore's page size,
+# because readers find a command's page from the command's index.
+_COMMANDS_PER_PAGE: Final = 200
+
+
+class Migration7to8(Migration):  # noqa: D101
+    def migrate(self, source_dir: Path, dest_dir: Path) -> None:
+        """Migrate the persistence directory from schema 7 to 8."""
+        # Copy over unmodified directories and files to new version
+        copy_if_exists(
+            source_dir / DECK_CONFIGURATION_FILE, dest_dir / DECK_CONFIGURATION_FILE
+        )
+        copytree_if_exists(
+            source_dir / PROTOCOLS_DIRECTORY, dest_dir / PROTOCOLS_DIRECTORY
+        )
+        copytree_if_exists(
+            source_dir / DATA_FILES_DIRECTORY, dest_dir / DATA_FILES_DIRECTORY
+        )
+
+        source_db_file = source_dir / DB_FILE
+        dest_db_file = dest_dir / DB_FILE
+
+        with ExitStack() as exit_stack:
+            source_engine = exit_stack.enter_context(sql_engine_ctx(source_db_file))
+
+            dest_engine = exit_stack.enter_context(sql_engine_ctx(dest_db_file))
+            schema_8.metadata.create_all(dest_engine)
+
+            source_transaction = exit_stack.enter_context(source_engine.begin())
+            dest_transaction = exit_stack.enter_context(dest_engine.begin())
+
+            _migrate_db_with_changes(source_transaction, dest_transaction)
+
+
+def _migrate_db_with_changes(
+    source_transaction: sqlalchemy.engine.Connection,
+    dest_transaction: sqlalchemy.engine.Connection,
+) -> None:
+    _copy_rows_with_enums(
+        schema_7.protocol_table,
+        schema_8.protocol_table,
+        source_transaction,
+        dest_transaction,
+        order_by_rowid=True,
+    )
+    copy_rows_unmodified(
+        schema_7.data_files_table,
+        schema_8.data_files_table,
+        source_transaction,
+        dest_transaction,
+        order_by_rowid=True,
+    )
+    _migrate_analysis_table_into_summaries_and_pages(
+        source_transaction,
+        dest_transaction,
+    )
+    _copy_rows_with_enums(
+        schema_7.analysis_primitive_type_rtp_table,
+        schema_8.analysis_primitive_type_rtp_table,
+        source_transaction,
+        dest_transaction,
+        order_by_rowid=True,
+    )
+    copy_rows_unmodified(
+        schema_7.analysis_csv_rtp_table,
+        schema_8.analysis_csv_rtp_table,
+        source_transaction,
+        dest_transaction,
+        order_by_rowid=True,
+    )
+    copy_rows_unmodified(
+        schema_7.run_table,
+        schema_8.run_table,
+        source_transaction,
+        dest_transaction,
+        order_by_rowid=True,
+    )
+    copy_rows_unmodified(
+        schema_7.action_table,
+        schema_8.action_table,
+        source_transaction,
+        dest_transaction,
+        order_by_rowid=True,
+    )
+    _migrate_command_table_with_compressed_commands(
+        source_transaction,
+        dest_transaction,
+    )
+    copy_rows_unmodified(
+        schema_7.run_csv_rtp_table,
+        schema_8.run_csv_rtp_table,
+        source_transaction,
+        dest_transaction,
+        order_by_rowid=True,
+    )
+    _copy_rows_with_enums(
+        schema_7.boolean_setting_table,
+        schema_8.boolean_setting_table,
+        source_transaction,
+        dest_transaction,
+        order_by_rowid=False,
+    )
+
+
+def _copy_rows_with_enums(
+    source_table: sqlalchemy.Table,
+    dest_table: sqlalchemy.Table,
+    source_transaction: sqlalchemy.engine.Connection,
+    dest_transaction: sqlalchemy.engine.Connection,
+    order_by_rowid: bool,
+) -> None:
+    """Like `copy_rows_unmodified()`, but for tables with enum columns.
+
+    Each schema defines its own enum classes, so schema 7's enum members
+    have to be passed to schema 8 by value.
+    """
+    select = sqlalchemy.select(source_table).order_by(
+        sqlite_rowid if order_by_rowid else None
+    )
+    insert = sqlalchemy.insert(dest_table)
+    for row in source_transaction.execute(select).mappings():
+        dest_transaction.execute(
+            insert,
+            {
+                key: value.value if isinstance(value, enum.Enum) else value
+                for key, value in row.items()
+            },
+        )
+
+
+def _migrate_analysis_table_into_summaries_and_pages(
+    source_transaction: sqlalchemy.engine.Connection,
+    dest_transaction: sqlalchemy.engine.Connection,
+) -> None:
+    """Split each completed analysis into a compressed summary and command pages."""
+    select_old_analysis_ids = sqlalchemy.select(schema_7.analysis_table.c.id).order_by(
+        sqlite_rowid
+    )
+    insert_new_analysis = sqlalchemy.insert(schema_8.analysis_table)
+    insert_new_command_page = sqlalchemy.insert(schema_8.analysis_command_page_table)
+
+    # Analyses can be huge, so only load one into memory at a time.
+    old_analysis_ids = [
+        row.id for row in source_transaction.execute(select_old_analysis_ids).all()
+    ]
+    for old_analysis_id in old_analysis_ids:
+        old_row = source_transaction.execute(
+            sqlalchemy.select(schema_7.analysis_table).where(
+                schema_7.analysis_table.c.id == old_analysis_id
+            )
+        ).one()
+        completed_analysis = json.loads(old_row.completed_analysis)
+        commands = completed_analysis.pop("commands", [])
+        dest_transaction.execute(
+            insert_new_analysis,
+            id=old_row.id,
+            protocol_id=old_row.protocol_id,
+            analyzer_version=old_row.analyzer_version,
+            completed_analysis_summary=compress_json(json.dumps(completed_analysis)),
+            command_count=len(commands),
+        )
+        for page_index, page_start in enumerate(
+            range(0, len(commands), _COMMANDS_PER_PAGE)
+        ):
+            dest_transaction.execute(
+                insert_new_command_page,
+                analysis_id=old_row.id,
+                page_index=page_index,
+                commands=compress_json(
+                    json.dumps(commands[page_start : page_start + _COMMANDS_PER_PAGE])
+                ),
+            )
+
+
+def _migrate_command_table_with_compressed_commands(
+    source_transaction: sqlalchemy.engine.Connection,
+    dest_transaction: sqlalchemy.engine.Connection,
+) -> None:
+    """Compress the "command" column of run_command_table."""
+    select_old_commands = sqlalchemy.select(schema_7.run_command_table).order_by(
+        sqlite_rowid
+    )
+    insert_new_command = sqlalchemy.insert(schema_8.run_command_table)
+    for old_row in source_transaction.execute(select_old_commands).all():
+        dest_transaction.execute(
+            insert_new_command,
+            row_id=old_row.row_id,
+            run_id=old_row.run_id,
+            index_in_run=old_row.index_in_run,
+            command_id=old_row.command_id,
+            command=compress_json(old_row.command),
+            command_intent=old_row.command_intent,
+        )
@@ -0,0 +1,85 @@
+"""Compress JSON documents for storing in the SQL database.
+
+Compressed documents start with a one-byte format tag, so that the format (for example,
+the preset dictionary) can change in the future without a schema migration.
+"""
+
+import zlib
+from typing import Final
+
+
+class UnknownCompressionFormatError(ValueError):
+    """Raised when a stored document has a format tag that we don't recognize."""
+
+
+_FORMAT_DEFLATE_DICT_V1: Final = 1
+
+# A preset dictionary for deflate, seeded with strings that show up in almost every
+# Protocol Engine command and analysis. Most individual commands are small, so without
+# a shared dictionary, deflate has little history to find matches in and barely
+# shrinks them.
+#
+# Deflate finds matches closer to the end of the dictionary more cheaply, so the most
+# common strings come last. This must never change once released; to use a different
+# dictionary, add a new format tag.
+_DICT_V1: Final = (
+    b'"definition": {"otSharedSchema": "module/schemas/2", "moduleType": '
+    b'"labwareOffset": {"x": 0.0, "y": 0.0, "z": 0.0}, "dimensions": '
+    b'"calibrationPoint": "quirks": [], "slotTransforms": "compatibleWith": [], '
+    b'"gripperOffsets": {}, "displayName": "serialNumber": "model": '
+    b'"wellDefinitions": "totalLiquidVolume": "shape": "circular", "diameter": '
+    b'"tipRackLinkedIds": "errors": [], "liquids": [], "runTimeParameters": [], '
+    b'"labware": [], "modules": [], "pipettes": [], "robotType": "OT-3 Standard", '
+    b'"result": "ok", "status": "completed", '
+    b'"commandType": "loadLabware", "params": {"location": {"slotName": "D1"}, '
+    b'"loadName": "opentrons_flex_96_tiprack_1000ul", "namespace": "opentrons", '
+    b'"version": 1, "labwareId": "offsetId": null}, "result": {"labwareId": '
+    b'"commandType": "loadPipette", "params": {"pipetteName": "flex_1channel_1000", '
+    b'"mount": "left", "pipetteId": "liquidPresenceDetection": false}, '
+    b'"commandType": "loadModule", "params": {"moduleId": '
+    b'"commandType": "home", "params": {}, "result": {}, '
+    b'"commandType": "moveToAddressableAreaForDropTip", "addressableAreaName": '
+    b'"commandType": "dropTipInPlace", "commandType": "dropTip", '
+    b'"commandType": "pickUpTip", "tipVolume": 1000.0, "tipLength": 85.0, '
+    b'"tipDiameter": 5.47, "commandType": "moveToWell", "commandType": "touchTip", '
+    b'"commandType": "blowout", "commandType": "comment", "params": {"message": '
+    b'"commandType": "waitForDuration", "commandType": "custom", "legacyCommandText": '
+    b'"commandType": "aspirate", "commandType": "dispense", "flowRate": 160.0, '
+    b'"pushOut": "volume": 100.0, "wellName": "A1", "wellLocation": {"origin": '
+    b'"top", "offset": {"x": 0.0, "y": 0.0, "z": 0.0}}, "position": '
+    b'{"x": 0.0, "y": 0.0, "z": 0.0}}, "notes": [], '
+    b'"intent": "protocol", "error": null, "failedCommandId": '
+    b'"status": "succeeded", "startedAt": "2024-01-01T00:00:00.000000+00:00", '
+    b'"completedAt": "2024-01-01T00:00:00.000000+00:00"}, '
+    b'{"id": "createdAt": "2024-01-01T00:00:00.000000+00:00", "key": '
+)
+
+
+def compress_json(json_str: str) -> bytes:
+    """Compress a JSON document."""
+    compressor = zlib.compressobj(
+        level=zlib.Z_DEFAULT_COMPRESSION,
+        wbits=-zlib.MAX_WBITS,  # Raw deflate: our format tag replaces zlib's header.
+        zdict=_DICT_V1,
+    )
+    return (
+        bytes([_FORMAT_DEFLATE_DICT_V1])
+        + compressor.compress(json_str.encode("utf-8"))
+        + compressor.flush()
+    )
+
+
+def decompress_json(data: bytes) -> str:
+    """Decompress a JSON document that was compressed with `compress_json()`.
+
+    Raises:
+        UnknownCompressionFormatError: If `data` was not made by any version of
+            `compress_json()` that we know about.
+    """
+    format_tag = data[0] if data else None
+    if format_tag != _FORMAT_DEFLATE_DICT_V1:
+        raise UnknownCompressionFormatError(
+            f"Unknown compressed document format {format_tag}."
+        )
+    decompressor = zlib.decompressobj(wbits=-zlib.MAX_WBITS, zdict=_DICT_V1)
+    return (decompressor.decompress(data[1:]) + decompressor.flush()).decode("utf-8")
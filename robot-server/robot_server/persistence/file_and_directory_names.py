@@ -8,9 +8,10 @@ v2/deck_configuration.json, etc.
 
 from typing import Final
 
-LATEST_VERSION_DIRECTORY: Final = "7.1"
+LATEST_VERSION_DIRECTORY: Final = "8"
 
 DECK_CONFIGURATION_FILE: Final = "deck_configuration.json"
 PROTOCOLS_DIRECTORY: Final = "protocols"
+PROTOCOL_SOURCE_CACHE_FILE: Final = "protocol_sources.json"
 DATA_FILES_DIRECTORY: Final = "data_files"
 DB_FILE: Final = "robot_server.db"
@@ -4,6 +4,8 @@ import json
 from typing import Type, TypeVar, List, Sequence
 from pydantic import BaseModel, parse_raw_as, parse_obj_as
 
+from .compression import compress_json, decompress_json
+
 
 _BaseModelT = TypeVar("_BaseModelT", bound=BaseModel)
 
@@ -18,6 +20,11 @@ def pydantic_to_json(obj: BaseModel) -> str:
     )
 
 
+def pydantic_to_compressed_json(obj: BaseModel) -> bytes:
+    """Like `pydantic_to_json()`, but compress the result with `compress_json()`."""
+    return compress_json(pydantic_to_json(obj))
+
+
 def pydantic_list_to_json(obj_list: Sequence[BaseModel]) -> str:
     """Serialize a list of Pydantic objects for storing in the SQL database."""
     return json.dumps([obj.dict(by_alias=True, exclude_none=True) for obj in obj_list])
@@ -31,3 +38,8 @@ def json_to_pydantic(model: Type[_BaseModelT], json_str: str) -> _BaseModelT:
 def json_to_pydantic_list(model: Type[_BaseModelT], json_str: str) -> List[_BaseModelT]:
     """Parse a list of Pydantic objects stored in the SQL database."""
     return [parse_obj_as(model, obj_dict) for obj_dict in json.loads(json_str)]
+
+
+def compressed_json_to_pydantic(model: Type[_BaseModelT], data: bytes) -> _BaseModelT:
+    """Parse a Pydantic object stored with `pydantic_to_compressed_json()`."""
+    return json_to_pydantic(model, decompress_json(data))
@@ -1,10 +1,11 @@
 """SQL database schemas."""
 
 # Re-export the latest schema.
-from .schema_7 import (
+from .schema_8 import (
     metadata,
     protocol_table,
     analysis_table,
+    analysis_command_page_table,
     analysis_primitive_type_rtp_table,
     analysis_csv_rtp_table,
     run_table,
@@ -23,6 +24,7 @@ __all__ = [
     "metadata",
     "protocol_table",
     "analysis_table",
+    "analysis_command_page_table",
     "analysis_primitive_type_rtp_table",
     "analysis_csv_rtp_table",
     "run_table",
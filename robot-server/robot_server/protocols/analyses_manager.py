@@ -14,6 +14,7 @@ from robot_server.protocols.analysis_models import (
     AnalysisSummary,
 )
 from robot_server.protocols.analysis_store import AnalysisStore
+from robot_server.protocols.analysis_worker_pool import AnalysisWorkerPool
 from robot_server.protocols import protocol_analyzer
 from robot_server.protocols.protocol_store import ProtocolResource
 from robot_server.service.task_runner import TaskRunner
@@ -31,9 +32,15 @@ class FailedToInitializeAnalyzer(Exception):
 class AnalysesManager:
     """A Collaborator that manages and provides an interface to Protocol Analyzers."""
 
-    def __init__(self, analysis_store: AnalysisStore, task_runner: TaskRunner) -> None:
+    def __init__(
+        self,
+        analysis_store: AnalysisStore,
+        task_runner: TaskRunner,
+        analysis_worker_pool: AnalysisWorkerPool,
+    ) -> None:
         self._analysis_store = analysis_store
         self._task_runner = task_runner
+        self._analysis_worker_pool = analysis_worker_pool
 
     async def initialize_analyzer(
         self,
@@ -49,6 +56,9 @@ class AnalysesManager:
         See `RunOrchestrator.get_run_time_parameters()` for details of which RTPs get
         saved in the analysis when such a failure occurs.
 
+        If analyses run in worker processes, this only validates the run time parameters
+        here. The worker process loads the protocol for the analysis itself.
+
         Returns: the successfully initialized analyzer that is ready to start analyzing.
         Raises: FailedToInitializeAnalyzer if initialization failed due to error in creating
                 the protocol runner or loading the protocol resource or
@@ -59,10 +69,16 @@ class AnalysesManager:
             protocol_resource=protocol_resource,
         )
         try:
-            await analyzer.load_orchestrator(
-                run_time_param_values=run_time_param_values,
-                run_time_param_paths=run_time_param_paths,
-            )
+            if self._analysis_worker_pool.uses_worker_processes:
+                await analyzer.validate_run_time_parameters(
+                    run_time_param_values=run_time_param_values,
+                    run_time_param_paths=run_time_param_paths,
+                )
+            else:
+                await analyzer.load_orchestrator(
+                    run_time_param_values=run_time_param_values,
+                    run_time_param_paths=run_time_param_paths,
+                )
         except Exception as error:
             internal_error = em.map_unexpected_error(error)
             await self._analysis_store.save_initialization_failed_analysis(
@@ -94,8 +110,9 @@ class AnalysesManager:
             run_time_parameters=run_time_parameters,
         )
         self._task_runner.run(
-            analyzer.analyze,
+            self._analysis_worker_pool.analyze,
             analysis_id=analysis_id,
+            analyzer=analyzer,
         )
         return AnalysisSummary(
             id=analysis_id,
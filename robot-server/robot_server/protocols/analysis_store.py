@@ -14,6 +14,7 @@ from opentrons.protocol_engine.types import (
 )
 from opentrons.protocol_engine import (
     Command,
+    CommandSlice,
     ErrorOccurrence,
     LoadedPipette,
     LoadedLabware,
@@ -287,6 +288,41 @@ class AnalysisStore:
         else:
             raise AnalysisNotFoundError(analysis_id=analysis_id)
 
+    async def get_summary_as_document(self, analysis_id: str) -> str:
+        """Like `get_as_document()`, but leave out the analysis's commands.
+
+        Raises:
+            AnalysisNotFoundError: If there is no completed analysis with the given ID.
+        """
+        summary_document = await self._completed_store.get_summary_by_id_as_document(
+            analysis_id=analysis_id
+        )
+        if summary_document is not None:
+            return summary_document
+        else:
+            raise AnalysisNotFoundError(analysis_id=analysis_id)
+
+    async def get_commands_slice(
+        self, analysis_id: str, cursor: int, length: int
+    ) -> CommandSlice:
+        """Get a slice of a protocol analysis's commands.
+
+        A pending analysis has no commands yet, so its slice is empty.
+
+        Raises:
+            AnalysisNotFoundError: If there is no analysis with the given ID.
+        """
+        if self._pending_store.get(analysis_id=analysis_id) is not None:
+            return CommandSlice(commands=[], cursor=0, total_length=0)
+
+        command_slice = await self._completed_store.get_commands_slice(
+            analysis_id=analysis_id, cursor=cursor, length=length
+        )
+        if command_slice is not None:
+            return command_slice
+        else:
+            raise AnalysisNotFoundError(analysis_id=analysis_id)
+
     def get_summaries_by_protocol(self, protocol_id: str) -> List[AnalysisSummary]:
         """Get summaries of all analyses for a protocol, in order from oldest first.
 
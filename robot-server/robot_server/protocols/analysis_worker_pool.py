@@ -0,0 +1,222 @@
+"""Run protocol analyses in worker processes, so they don't stall the server.
+
+An analysis simulates the whole protocol, which for a long protocol can keep the
+event loop busy for a long time. In the server's own process, that holds up every
+other endpoint until the analysis is done.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import multiprocessing
+import threading
+from multiprocessing.connection import Connection
+from multiprocessing.context import SpawnContext
+from typing import Annotated, AsyncGenerator, List, Optional, Set
+
+from fastapi import Depends
+
+from server_utils.fastapi_utils.app_state import (
+    AppState,
+    AppStateAccessor,
+    get_app_state,
+)
+
+from robot_server.settings import get_settings
+from .protocol_analyzer import (
+    AnalysisJob,
+    AnalysisOutcome,
+    ProtocolAnalyzer,
+    analyze_job,
+)
+
+log = logging.getLogger(__name__)
+
+_analysis_worker_pool_accessor = AppStateAccessor["AnalysisWorkerPool"](
+    "analysis_worker_pool"
+)
+
+
+class AnalysisTimedOutError(Exception):
+    """Raised when an analysis in a worker process takes too long."""
+
+    def __init__(self, timeout: float) -> None:
+        super().__init__(f"Analysis did not finish within {timeout} seconds.")
+
+
+class AnalysisWorkerCrashedError(Exception):
+    """Raised when a worker process exits in the middle of an analysis."""
+
+    def __init__(self) -> None:
+        super().__init__("The analysis worker process exited unexpectedly.")
+
+
+def _worker_main(connection: Connection) -> None:
+    """Analyze jobs from the server, one at a time, until the server goes away."""
+    while True:
+        try:
+            job = connection.recv()
+        except EOFError:
+            return
+        connection.send(asyncio.run(analyze_job(job)))
+
+
+class _Worker:
+    """One worker process, and our end of the pipe to it."""
+
+    def __init__(self, context: SpawnContext) -> None:
+        self._connection, child_connection = context.Pipe()
+        self._process = context.Process(
+            target=_worker_main,
+            args=(child_connection,),
+            name="analysis-worker",
+            # Don't outlive the server, even if it exits without cleaning up.
+            daemon=True,
+        )
+        self._process.start()
+        child_connection.close()
+        # Held while a thread is receiving from the connection, so that kill()
+        # doesn't close it out from under that thread.
+        self._receive_lock = threading.Lock()
+
+    async def analyze(self, job: AnalysisJob) -> AnalysisOutcome:
+        self._connection.send(job)
+        try:
+            # Receiving can take as long as the whole analysis, so do it in a thread.
+            # If we kill the process in the meantime, this raises EOFError.
+            outcome: AnalysisOutcome = await asyncio.to_thread(self._receive)
+        except EOFError as e:
+            raise AnalysisWorkerCrashedError() from e
+        return outcome
+
+    def _receive(self) -> AnalysisOutcome:
+        with self._receive_lock:
+            outcome: AnalysisOutcome = self._connection.recv()
+            return outcome
+
+    def kill(self) -> None:
+        self._process.kill()
+        self._process.join()
+        # With the process gone, a thread still in _receive() gets EOFError
+        # right away, so this doesn't wait long.
+        with self._receive_lock:
+            self._connection.close()
+
+
+class AnalysisWorkerPool:
+    """A bounded pool of processes to run protocol analyses in.
+
+    With a `worker_count` of 1, there are no worker processes. Analyses run in the
+    server's own process instead, as they're requested, and nothing limits how many
+    of them run at once.
+    """
+
+    def __init__(self, worker_count: int, timeout: Optional[float]) -> None:
+        """Initialize the pool. Worker processes are started as they're needed.
+
+        Args:
+            worker_count: The maximum number of analyses to run at once in worker
+                processes, or 1 to run them in the server's own process.
+            timeout: How many seconds an analysis in a worker process may take
+                before it's stopped and recorded as failed. `None` for no limit.
+                Analyses in the server's own process can't time out.
+        """
+        self._worker_count = worker_count
+        self._timeout = timeout
+        self._context = multiprocessing.get_context("spawn")
+        self._slots = asyncio.Semaphore(worker_count)
+        self._idle_workers: List[_Worker] = []
+        self._busy_workers: Set[_Worker] = set()
+
+    @property
+    def uses_worker_processes(self) -> bool:
+        """Whether analyses run in worker processes, not the server's own process."""
+        return self._worker_count > 1
+
+    async def analyze(self, analysis_id: str, analyzer: ProtocolAnalyzer) -> None:
+        """Run the analyzer's analysis and store the result.
+
+        If this is cancelled, the worker process running the analysis is stopped,
+        and the analysis stays pending.
+        """
+        if not self.uses_worker_processes:
+            await analyzer.analyze(analysis_id=analysis_id)
+            return
+
+        try:
+            outcome = await self._analyze_in_worker(analyzer.get_analysis_job())
+        except (AnalysisTimedOutError, AnalysisWorkerCrashedError) as error:
+            log.warning(f'Analysis "{analysis_id}" failed: {error}')
+            await analyzer.update_to_failed_analysis(
+                analysis_id=analysis_id,
+                protocol_robot_type=analyzer.protocol_resource.source.robot_type,
+                error=error,
+                run_time_parameters=analyzer.get_verified_run_time_parameters(),
+            )
+        else:
+            log.info(f'Completed analysis "{analysis_id}" in a worker process.')
+            await analyzer.save_outcome(analysis_id=analysis_id, outcome=outcome)
+
+    async def _analyze_in_worker(self, job: AnalysisJob) -> AnalysisOutcome:
+        async with self._slots:
+            worker = (
+                self._idle_workers.pop()
+                if self._idle_workers
+                else _Worker(self._context)
+            )
+            self._busy_workers.add(worker)
+            try:
+                outcome = await asyncio.wait_for(worker.analyze(job), self._timeout)
+            except BaseException as error:
+                # Timed out, crashed, or cancelled. The process might still be
+                # in the middle of the analysis, so it can't take another job.
+                worker.kill()
+                if isinstance(error, asyncio.TimeoutError):
+                    assert self._timeout is not None
+                    raise AnalysisTimedOutError(self._timeout) from error
+                raise
+            else:
+                self._idle_workers.append(worker)
+            finally:
+                self._busy_workers.discard(worker)
+        return outcome
+
+    def close(self) -> None:
+        """Stop all worker processes, including ones in the middle of an analysis."""
+        for worker in [*self._idle_workers, *self._busy_workers]:
+            worker.kill()
+        self._idle_workers.clear()
+        self._busy_workers.clear()
+
+
+@contextlib.asynccontextmanager
+async def set_up_analysis_worker_pool(
+    app_state: AppState,
+) -> AsyncGenerator[None, None]:
+    """Set up the server's global singleton `AnalysisWorkerPool`.
+
+    When this context manager is entered, the pool is set up and stored on the
+    given `AppState` for later access. When it's exited, its worker processes are
+    stopped.
+    """
+    settings = get_settings()
+    analysis_worker_pool = AnalysisWorkerPool(
+        worker_count=settings.analysis_workers,
+        timeout=settings.analysis_timeout,
+    )
+    try:
+        _analysis_worker_pool_accessor.set_on(app_state, analysis_worker_pool)
+        yield
+    finally:
+        analysis_worker_pool.close()
+        _analysis_worker_pool_accessor.set_on(app_state, None)
+
+
+def get_analysis_worker_pool(
+    app_state: Annotated[AppState, Depends(get_app_state)]
+) -> AnalysisWorkerPool:
+    """Get the server's global singleton `AnalysisWorkerPool`."""
+    analysis_worker_pool = _analysis_worker_pool_accessor.get_from(app_state)
+    assert analysis_worker_pool, "Analysis worker pool was not initialized"
+    return analysis_worker_pool
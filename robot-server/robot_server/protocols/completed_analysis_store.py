@@ -2,21 +2,29 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Dict, List, Optional, Union, Mapping
+from typing import Dict, Iterable, List, Optional, Sequence, Union, Mapping
 from logging import getLogger
 from dataclasses import dataclass
 
 import sqlalchemy
 import anyio
+from opentrons.protocol_engine import CommandSlice
+from opentrons.protocol_engine.commands import Command
 from opentrons.protocols.parameters.types import PrimitiveAllowedTypes
 
+from robot_server.persistence.compression import compress_json, decompress_json
 from robot_server.persistence.database import sqlite_rowid
 from robot_server.persistence.tables import (
     analysis_table,
+    analysis_command_page_table,
     analysis_primitive_type_rtp_table,
     analysis_csv_rtp_table,
 )
-from robot_server.persistence.pydantic import json_to_pydantic, pydantic_to_json
+from robot_server.persistence.pydantic import (
+    json_to_pydantic,
+    json_to_pydantic_list,
+    pydantic_to_json,
+)
 
 from .analysis_models import CompletedAnalysis
 from .analysis_memcache import MemoryCache
@@ -26,6 +34,13 @@ _log = getLogger(__name__)
 
 MAX_ANALYSES_TO_STORE = 5
 
+# Analysis commands are stored in compressed pages of this many commands.
+# Pages that are too small compress poorly; pages that are too large make reading
+# a few commands expensive.
+# Changing this needs a migration, because readers find a command's page from the
+# command's index.
+COMMANDS_PER_PAGE = 200
+
 
 @dataclass
 class CompletedAnalysisResource:
@@ -42,6 +57,9 @@ class CompletedAnalysisResource:
     async def to_sql_values(self) -> Dict[str, object]:
         """Return this data as a dict that can be passed to a SQLALchemy insert.
 
+        This is the row for `analysis_table`. It holds everything except the
+        analysis's commands; see `to_command_page_sql_values()` for those.
+
         This potentially involves heavy serialization, so it's offloaded
         to a worker thread.
 
@@ -50,11 +68,13 @@ class CompletedAnalysisResource:
         Avoid calling this from inside a SQL transaction, since it might be slow.
         """
 
-        def serialize_completed_analysis() -> str:
-            return pydantic_to_json(self.completed_analysis)
+        def serialize_summary() -> bytes:
+            return compress_json(
+                pydantic_to_json(self.completed_analysis.copy(exclude={"commands"}))
+            )
 
-        serialized_analysis = await anyio.to_thread.run_sync(
-            serialize_completed_analysis,
+        serialized_summary = await anyio.to_thread.run_sync(
+            serialize_summary,
             # Cancellation may orphan the worker thread,
             # but that should be harmless in this case.
             cancellable=True,
@@ -63,14 +83,53 @@ class CompletedAnalysisResource:
             "id": self.id,
             "protocol_id": self.protocol_id,
             "analyzer_version": self.analyzer_version,
-            "completed_analysis": serialized_analysis,
+            "completed_analysis_summary": serialized_summary,
+            "command_count": len(self.completed_analysis.commands),
         }
 
+    async def to_command_page_sql_values(self) -> List[Dict[str, object]]:
+        """Return this analysis's commands as rows for `analysis_command_page_table`.
+
+        Like `to_sql_values()`, this is offloaded to a worker thread.
+        """
+        commands = self.completed_analysis.commands
+
+        def serialize_command_pages() -> List[Dict[str, object]]:
+            return [
+                {
+                    "analysis_id": self.id,
+                    "page_index": page_index,
+                    "commands": compress_json(
+                        _join_json_list(
+                            pydantic_to_json(command)
+                            for command in commands[
+                                page_start : page_start + COMMANDS_PER_PAGE
+                            ]
+                        )
+                    ),
+                }
+                for page_index, page_start in enumerate(
+                    range(0, len(commands), COMMANDS_PER_PAGE)
+                )
+            ]
+
+        return await anyio.to_thread.run_sync(
+            serialize_command_pages,
+            # Cancellation may orphan the worker thread,
+            # but that should be harmless in this case.
+            cancellable=True,
+        )
+
     @classmethod
     async def from_sql_row(
-        cls, sql_row: sqlalchemy.engine.Row, current_analyzer_version: str
+        cls,
+        sql_row: sqlalchemy.engine.Row,
+        command_page_rows: Sequence[sqlalchemy.engine.Row],
+        current_analyzer_version: str,
     ) -> CompletedAnalysisResource:
-        """Extract the data from a SQLAlchemy row object.
+        """Extract the data from a SQLAlchemy row object and its command pages.
+
+        `command_page_rows` must be in page order.
 
         This potentially involves heavy parsing, so it's offloaded to a worker thread.
 
@@ -92,7 +151,11 @@ class CompletedAnalysisResource:
         assert isinstance(protocol_id, str)
 
         def parse_completed_analysis() -> CompletedAnalysis:
-            return json_to_pydantic(CompletedAnalysis, sql_row.completed_analysis)
+            document = _assemble_document(
+                sql_row.completed_analysis_summary,
+                [row.commands for row in command_page_rows],
+            )
+            return json_to_pydantic(CompletedAnalysis, document)
 
         completed_analysis = await anyio.to_thread.run_sync(
             parse_completed_analysis,
@@ -109,6 +172,27 @@ class CompletedAnalysisResource:
         )
 
 
+def _join_json_list(json_items: Iterable[str]) -> str:
+    """Join serialized JSON values into a serialized JSON list."""
+    return "[" + ", ".join(json_items) + "]"
+
+
+def _assemble_document(
+    compressed_summary: bytes, compressed_command_pages: Sequence[bytes]
+) -> str:
+    """Rebuild a completed analysis JSON document from its stored parts.
+
+    This splices strings instead of parsing, so it's cheap even for huge analyses.
+    """
+    summary = decompress_json(compressed_summary)
+    # Strip each page's enclosing [ and ].
+    command_lists = (decompress_json(page)[1:-1] for page in compressed_command_pages)
+    commands = _join_json_list(c for c in command_lists if c)
+    # The summary is always a non-empty JSON object, so it ends with "}" and we can
+    # add the commands as its last member.
+    return f'{summary[:-1]}, "commands": {commands}}}'
+
+
 class CompletedAnalysisStore:
     """A SQL-persistent and memory-cached store of protocol analyses that are completed.
 
@@ -164,9 +248,12 @@ class CompletedAnalysisStore:
                     result = transaction.execute(statement).one()
                 except sqlalchemy.exc.NoResultFound:
                     return None
+                command_pages = transaction.execute(
+                    _select_command_pages([analysis_id])
+                ).all()
 
             resource = await CompletedAnalysisResource.from_sql_row(
-                result, self._current_analyzer_version
+                result, command_pages, self._current_analyzer_version
             )
             self._memcache.insert(resource.id, resource)
 
@@ -178,18 +265,130 @@ class CompletedAnalysisStore:
         This is like `get_by_id()`, except it returns the analysis as a pre-serialized JSON
         document.
         """
-        statement = sqlalchemy.select(analysis_table.c.completed_analysis).where(
-            analysis_table.c.id == analysis_id
+        statement = sqlalchemy.select(
+            analysis_table.c.completed_analysis_summary
+        ).where(analysis_table.c.id == analysis_id)
+
+        with self._sql_engine.begin() as transaction:
+            try:
+                summary: bytes = transaction.execute(statement).scalar_one()
+            except sqlalchemy.exc.NoResultFound:
+                # No analysis with this ID.
+                return None
+            command_pages: List[bytes] = [
+                row.commands
+                for row in transaction.execute(
+                    _select_command_pages([analysis_id])
+                ).all()
+            ]
+
+        return await anyio.to_thread.run_sync(
+            _assemble_document,
+            summary,
+            command_pages,
+            # Cancellation may orphan the worker thread,
+            # but that should be harmless in this case.
+            cancellable=True,
+        )
+
+    async def get_summary_by_id_as_document(self, analysis_id: str) -> Optional[str]:
+        """Return the analysis with the given ID, minus its commands, if it exists.
+
+        This is like `get_by_id_as_document()`, except the document has no `commands`.
+        It only reads the analysis's summary, so it's fast no matter how many commands
+        the analysis has.
+        """
+        statement = sqlalchemy.select(
+            analysis_table.c.completed_analysis_summary
+        ).where(analysis_table.c.id == analysis_id)
+
+        with self._sql_engine.begin() as transaction:
+            try:
+                summary: bytes = transaction.execute(statement).scalar_one()
+            except sqlalchemy.exc.NoResultFound:
+                # No analysis with this ID.
+                return None
+
+        return await anyio.to_thread.run_sync(
+            decompress_json,
+            summary,
+            # Cancellation may orphan the worker thread,
+            # but that should be harmless in this case.
+            cancellable=True,
         )
 
+    async def get_commands_slice(
+        self, analysis_id: str, cursor: int, length: int
+    ) -> Optional[CommandSlice]:
+        """Return a slice of the analysis's commands, if the analysis exists.
+
+        Only the command pages that overlap the slice are read and parsed.
+
+        Args:
+            analysis_id: The analysis to pull commands from.
+            cursor: The index of the first command to return.
+                It's clamped to the commands that exist.
+            length: The maximum number of commands to return.
+        """
+        async with self._memcache_lock:
+            try:
+                cached_commands = self._memcache.get(
+                    analysis_id
+                ).completed_analysis.commands
+            except KeyError:
+                pass
+            else:
+                actual_cursor = max(0, min(cursor, len(cached_commands) - 1))
+                return CommandSlice(
+                    cursor=actual_cursor,
+                    total_length=len(cached_commands),
+                    commands=cached_commands[actual_cursor : actual_cursor + length],
+                )
+
+        select_count = sqlalchemy.select(analysis_table.c.command_count).where(
+            analysis_table.c.id == analysis_id
+        )
         with self._sql_engine.begin() as transaction:
             try:
-                document: str = transaction.execute(statement).scalar_one()
+                command_count: int = transaction.execute(select_count).scalar_one()
             except sqlalchemy.exc.NoResultFound:
                 # No analysis with this ID.
                 return None
 
-        return document
+            actual_cursor = max(0, min(cursor, command_count - 1))
+            first_page_index = actual_cursor // COMMANDS_PER_PAGE
+            last_page_index = (actual_cursor + length - 1) // COMMANDS_PER_PAGE
+            select_pages = (
+                sqlalchemy.select(analysis_command_page_table.c.commands)
+                .where(
+                    analysis_command_page_table.c.analysis_id == analysis_id,
+                    analysis_command_page_table.c.page_index >= first_page_index,
+                    analysis_command_page_table.c.page_index <= last_page_index,
+                )
+                .order_by(analysis_command_page_table.c.page_index)
+            )
+            pages: List[bytes] = transaction.execute(select_pages).scalars().all()
+
+        def parse_commands() -> List[Command]:
+            commands: List[Command] = []
+            for page in pages:
+                commands += json_to_pydantic_list(
+                    Command, decompress_json(page)  # type: ignore[arg-type]
+                )
+            start = actual_cursor - first_page_index * COMMANDS_PER_PAGE
+            return commands[start : start + length]
+
+        sliced_commands = await anyio.to_thread.run_sync(
+            parse_commands,
+            # Cancellation may orphan the worker thread,
+            # but that should be harmless in this case.
+            cancellable=True,
+        )
+        return CommandSlice(
+            cursor=actual_cursor,
+            total_length=command_count,
+            commands=sliced_commands,
+        )
 
     async def get_by_protocol(
         self, protocol_id: str
@@ -237,9 +436,18 @@ class CompletedAnalysisStore:
                 )
                 with self._sql_engine.begin() as transaction:
                     results = transaction.execute(statement).all()
+                    command_pages_by_analysis: Dict[
+                        str, List[sqlalchemy.engine.Row]
+                    ] = {analysis_id: [] for analysis_id in uncached_analyses}
+                    for page in transaction.execute(
+                        _select_command_pages(uncached_analyses)
+                    ).all():
+                        command_pages_by_analysis[page.analysis_id].append(page)
                 for r in results:
                     resource = await CompletedAnalysisResource.from_sql_row(
-                        r, self._current_analyzer_version
+                        r,
+                        command_pages_by_analysis[r.id],
+                        self._current_analyzer_version,
                     )
                     local_memcache[resource.id] = resource
                     self._memcache.insert(resource.id, resource)
@@ -339,6 +547,9 @@ class CompletedAnalysisStore:
         delete_csv_rtp_statement = analysis_csv_rtp_table.delete().where(
             analysis_csv_rtp_table.c.analysis_id.in_(analyses_to_delete)
         )
+        delete_command_pages_statement = analysis_command_page_table.delete().where(
+            analysis_command_page_table.c.analysis_id.in_(analyses_to_delete)
+        )
         delete_statement = analysis_table.delete().where(
             analysis_table.c.id.in_(analyses_to_delete)
         )
@@ -346,14 +557,22 @@ class CompletedAnalysisStore:
         insert_statement = analysis_table.insert().values(
             await completed_analysis_resource.to_sql_values()
         )
+        command_page_values = (
+            await completed_analysis_resource.to_command_page_sql_values()
+        )
         insert_rtp_statement = analysis_primitive_type_rtp_table.insert()
         insert_csv_rtp_statement = analysis_csv_rtp_table.insert()
 
         with self._sql_engine.begin() as transaction:
             transaction.execute(delete_primitive_rtp_statement)
             transaction.execute(delete_csv_rtp_statement)
+            transaction.execute(delete_command_pages_statement)
             transaction.execute(delete_statement)
             transaction.execute(insert_statement)
+            if command_page_values:
+                transaction.execute(
+                    analysis_command_page_table.insert(), command_page_values
+                )
             for param in primitive_rtp_resources:
                 transaction.execute(
                     insert_rtp_statement,
@@ -367,3 +586,18 @@ class CompletedAnalysisStore:
         self._memcache.insert(
             completed_analysis_resource.id, completed_analysis_resource
         )
+
+
+def _select_command_pages(analysis_ids: Iterable[str]) -> sqlalchemy.sql.Select:
+    """Select the command pages of the given analyses, in page order."""
+    return (
+        sqlalchemy.select(
+            analysis_command_page_table.c.analysis_id,
+            analysis_command_page_table.c.commands,
+        )
+        .where(analysis_command_page_table.c.analysis_id.in_(analysis_ids))
+        .order_by(
+            analysis_command_page_table.c.analysis_id,
+            analysis_command_page_table.c.page_index,
+        )
+    )
@@ -23,9 +23,13 @@ from robot_server.persistence.fastapi_dependencies import (
     get_sql_engine,
     get_active_persistence_directory,
 )
-from robot_server.persistence.file_and_directory_names import PROTOCOLS_DIRECTORY
+from robot_server.persistence.file_and_directory_names import (
+    PROTOCOLS_DIRECTORY,
+    PROTOCOL_SOURCE_CACHE_FILE,
+)
 from robot_server.settings import get_settings
 from .analyses_manager import AnalysesManager
+from .analysis_worker_pool import AnalysisWorkerPool, get_analysis_worker_pool
 
 from .protocol_auto_deleter import ProtocolAutoDeleter
 from .protocol_store import (
@@ -77,6 +81,7 @@ async def get_protocol_directory(
 async def get_protocol_store(
     app_state: Annotated[AppState, Depends(get_app_state)],
     sql_engine: Annotated[SQLEngine, Depends(get_sql_engine)],
+    persistence_directory: Annotated[Path, Depends(get_active_persistence_directory)],
     protocol_directory: Annotated[Path, Depends(get_protocol_directory)],
     protocol_reader: Annotated[ProtocolReader, Depends(get_protocol_reader)],
 ) -> ProtocolStore:
@@ -88,6 +93,9 @@ async def get_protocol_store(
                 sql_engine=sql_engine,
                 protocols_directory=protocol_directory,
                 protocol_reader=protocol_reader,
+                protocol_source_cache_file=(
+                    persistence_directory / PROTOCOL_SOURCE_CACHE_FILE
+                ),
             )
             _protocol_store_accessor.set_on(app_state, protocol_store)
 
@@ -112,13 +120,18 @@ async def get_analyses_manager(
     app_state: Annotated[AppState, Depends(get_app_state)],
     analysis_store: Annotated[AnalysisStore, Depends(get_analysis_store)],
     task_runner: Annotated[TaskRunner, Depends(get_task_runner)],
+    analysis_worker_pool: Annotated[
+        AnalysisWorkerPool, Depends(get_analysis_worker_pool)
+    ],
 ) -> AnalysesManager:
     """Get a singleton AnalysesManager to keep track of analyzers."""
     analyses_manager = _analyses_manager_accessor.get_from(app_state)
 
     if analyses_manager is None:
         analyses_manager = AnalysesManager(
-            analysis_store=analysis_store, task_runner=task_runner
+            analysis_store=analysis_store,
+            task_runner=task_runner,
+            analysis_worker_pool=analysis_worker_pool,
         )
         _analyses_manager_accessor.set_on(app_state, analyses_manager)
 
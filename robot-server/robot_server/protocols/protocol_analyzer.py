@@ -1,23 +1,38 @@
 """Protocol analysis module."""
 import logging
 import asyncio
+from dataclasses import dataclass
 from typing import Optional, List
 
 from opentrons_shared_data.robot.types import RobotType
 
+from opentrons import protocol_reader
 import opentrons.protocol_runner.create_simulating_orchestrator as simulating_runner
+from opentrons.protocol_api import ParameterContext
+from opentrons.protocol_engine import Command
 from opentrons.protocol_engine.errors import ErrorOccurrence
 from opentrons.util.performance_helpers import TrackingFunctions
 from opentrons.protocol_engine.types import (
     PrimitiveRunTimeParamValuesType,
     RunTimeParameter,
     CSVRuntimeParamPaths,
+    LoadedLabware,
+    LoadedModule,
+    LoadedPipette,
+    Liquid,
 )
 import opentrons.util.helpers as datetime_helper
+from opentrons.protocol_reader import ProtocolSource, PythonProtocolConfig
 from opentrons.protocol_runner import (
     RunOrchestrator,
 )
+from opentrons.protocol_runner.python_protocol_wrappers import (
+    PythonAndLegacyFileReader,
+    PythonProtocolExecutor,
+)
 from opentrons.protocol_runner.run_orchestrator import ParseMode
+from opentrons.protocols.parse import PythonParseMode
+from opentrons.protocols.types import PythonProtocol
 
 
 import robot_server.errors.error_mappers as em
@@ -28,6 +43,29 @@ from robot_server.protocols.analysis_store import AnalysisStore
 log = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class AnalysisJob:
+    """Everything needed to analyze a protocol from scratch, in any process."""
+
+    protocol_source: ProtocolSource
+    run_time_param_values: Optional[PrimitiveRunTimeParamValuesType]
+    run_time_param_paths: Optional[CSVRuntimeParamPaths]
+
+
+@dataclass(frozen=True)
+class AnalysisOutcome:
+    """The result of an analysis, as `AnalysisStore.update()` takes it."""
+
+    robot_type: RobotType
+    run_time_parameters: List[RunTimeParameter]
+    commands: List[Command]
+    labware: List[LoadedLabware]
+    modules: List[LoadedModule]
+    pipettes: List[LoadedPipette]
+    errors: List[ErrorOccurrence]
+    liquids: List[Liquid]
+
+
 class ProtocolAnalyzer:
     """A collaborator to perform an analysis of a protocol and store the result."""
 
@@ -40,6 +78,9 @@ class ProtocolAnalyzer:
         self._analysis_store = analysis_store
         self._protocol_resource = protocol_resource
         self._orchestrator: Optional[RunOrchestrator] = None
+        self._parameter_context: Optional[ParameterContext] = None
+        self._run_time_param_values: Optional[PrimitiveRunTimeParamValuesType] = None
+        self._run_time_param_paths: Optional[CSVRuntimeParamPaths] = None
 
     @property
     def protocol_resource(self) -> ProtocolResource:
@@ -48,8 +89,11 @@ class ProtocolAnalyzer:
 
     def get_verified_run_time_parameters(self) -> List[RunTimeParameter]:
         """Get the validated RTPs with values set by the client."""
-        assert self._orchestrator is not None
-        return self._orchestrator.get_run_time_parameters()
+        if self._orchestrator is not None:
+            return self._orchestrator.get_run_time_parameters()
+        if self._parameter_context is not None:
+            return self._parameter_context.export_parameters_for_analysis()
+        return []
 
     async def load_orchestrator(
         self,
@@ -60,6 +104,8 @@ class ProtocolAnalyzer:
 
         Returns: The RunOrchestrator instance.
         """
+        self._run_time_param_values = run_time_param_values
+        self._run_time_param_paths = run_time_param_paths
         self._orchestrator = await simulating_runner.create_simulating_orchestrator(
             robot_type=self._protocol_resource.source.robot_type,
             protocol_config=self._protocol_resource.source.config,
@@ -71,6 +117,49 @@ class ProtocolAnalyzer:
             run_time_param_paths=run_time_param_paths,
         )
 
+    async def validate_run_time_parameters(
+        self,
+        run_time_param_values: Optional[PrimitiveRunTimeParamValuesType],
+        run_time_param_paths: Optional[CSVRuntimeParamPaths],
+    ) -> None:
+        """Parse the protocol and validate its run time parameter values.
+
+        Unlike `load_orchestrator()`, this doesn't set up a simulated robot,
+        so it's cheap. Use it when a worker process will load and analyze
+        the protocol with `get_analysis_job()`.
+        """
+        self._run_time_param_values = run_time_param_values
+        self._run_time_param_paths = run_time_param_paths
+        protocol_source = self._protocol_resource.source
+        if not isinstance(protocol_source.config, PythonProtocolConfig):
+            # Only Python protocols can define run time parameters.
+            return
+        labware_definitions = await protocol_reader.extract_labware_definitions(
+            protocol_source=protocol_source
+        )
+        protocol = PythonAndLegacyFileReader.read(
+            protocol_source, labware_definitions, PythonParseMode.NORMAL
+        )
+        if isinstance(protocol, PythonProtocol):
+            self._parameter_context = ParameterContext(api_version=protocol.api_level)
+            PythonProtocolExecutor.extract_run_parameters(
+                protocol=protocol,
+                parameter_context=self._parameter_context,
+                run_time_param_overrides=run_time_param_values,
+                run_time_param_file_overrides=run_time_param_paths,
+            )
+
+    def get_analysis_job(self) -> AnalysisJob:
+        """Get a job that repeats this analysis from scratch, for a worker process.
+
+        This method should only be called once the run time parameters are validated.
+        """
+        return AnalysisJob(
+            protocol_source=self._protocol_resource.source,
+            run_time_param_values=self._run_time_param_values,
+            run_time_param_paths=self._run_time_param_paths,
+        )
+
     @TrackingFunctions.track_analysis
     async def analyze(
         self,
@@ -82,31 +171,25 @@ class ProtocolAnalyzer:
         """
         assert self._protocol_resource is not None
         assert self._orchestrator is not None
-        try:
-            result = await self._orchestrator.run(
-                deck_configuration=[],
-            )
-        except BaseException as error:
-            await self.update_to_failed_analysis(
-                analysis_id=analysis_id,
-                protocol_robot_type=self._protocol_resource.source.robot_type,
-                error=error,
-                run_time_parameters=self._orchestrator.get_run_time_parameters(),
-            )
-            return
-
+        outcome = await _run_loaded_orchestrator(
+            orchestrator=self._orchestrator,
+            robot_type=self._protocol_resource.source.robot_type,
+        )
         log.info(f'Completed analysis "{analysis_id}".')
+        await self.save_outcome(analysis_id=analysis_id, outcome=outcome)
 
+    async def save_outcome(self, analysis_id: str, outcome: AnalysisOutcome) -> None:
+        """Complete the pending analysis with the given outcome."""
         await self._analysis_store.update(
             analysis_id=analysis_id,
-            robot_type=self._protocol_resource.source.robot_type,
-            run_time_parameters=result.parameters,
-            commands=result.commands,
-            labware=result.state_summary.labware,
-            modules=result.state_summary.modules,
-            pipettes=result.state_summary.pipettes,
-            errors=result.state_summary.errors,
-            liquids=result.state_summary.liquids,
+            robot_type=outcome.robot_type,
+            run_time_parameters=outcome.run_time_parameters,
+            commands=outcome.commands,
+            labware=outcome.labware,
+            modules=outcome.modules,
+            pipettes=outcome.pipettes,
+            errors=outcome.errors,
+            liquids=outcome.liquids,
         )
 
     async def update_to_failed_analysis(
@@ -117,25 +200,13 @@ class ProtocolAnalyzer:
         run_time_parameters: List[RunTimeParameter],
     ) -> None:
         """Update analysis store with analysis failure."""
-        internal_error = em.map_unexpected_error(error=error)
-        await self._analysis_store.update(
+        await self.save_outcome(
             analysis_id=analysis_id,
-            robot_type=protocol_robot_type,
-            run_time_parameters=run_time_parameters,
-            commands=[],
-            labware=[],
-            modules=[],
-            pipettes=[],
-            errors=[
-                ErrorOccurrence.from_failed(
-                    # TODO(tz, 2-15-24): replace with a different error type
-                    #  when we are able to support different errors.
-                    id="internal-error",
-                    createdAt=datetime_helper.utc_now(),
-                    error=internal_error,
-                )
-            ],
-            liquids=[],
+            outcome=_failed_outcome(
+                robot_type=protocol_robot_type,
+                error=error,
+                run_time_parameters=run_time_parameters,
+            ),
         )
 
     def __del__(self) -> None:
@@ -157,6 +228,85 @@ class ProtocolAnalyzer:
                 )
 
 
+@TrackingFunctions.track_analysis
+async def analyze_job(job: AnalysisJob) -> AnalysisOutcome:
+    """Analyze a protocol from scratch, without storing the result.
+
+    Worker processes use this. Errors are reported in the outcome, not raised.
+    """
+    robot_type = job.protocol_source.robot_type
+    orchestrator = await simulating_runner.create_simulating_orchestrator(
+        robot_type=robot_type,
+        protocol_config=job.protocol_source.config,
+    )
+    try:
+        await orchestrator.load(
+            protocol_source=job.protocol_source,
+            parse_mode=ParseMode.NORMAL,
+            run_time_param_values=job.run_time_param_values,
+            run_time_param_paths=job.run_time_param_paths,
+        )
+    except BaseException as error:
+        return _failed_outcome(
+            robot_type=robot_type,
+            error=error,
+            run_time_parameters=orchestrator.get_run_time_parameters(),
+        )
+    return await _run_loaded_orchestrator(orchestrator, robot_type)
+
+
+async def _run_loaded_orchestrator(
+    orchestrator: RunOrchestrator, robot_type: RobotType
+) -> AnalysisOutcome:
+    try:
+        result = await orchestrator.run(
+            deck_configuration=[],
+        )
+    except BaseException as error:
+        return _failed_outcome(
+            robot_type=robot_type,
+            error=error,
+            run_time_parameters=orchestrator.get_run_time_parameters(),
+        )
+
+    return AnalysisOutcome(
+        robot_type=robot_type,
+        run_time_parameters=result.parameters,
+        commands=result.commands,
+        labware=result.state_summary.labware,
+        modules=result.state_summary.modules,
+        pipettes=result.state_summary.pipettes,
+        errors=result.state_summary.errors,
+        liquids=result.state_summary.liquids,
+    )
+
+
+def _failed_outcome(
+    robot_type: RobotType,
+    error: BaseException,
+    run_time_parameters: List[RunTimeParameter],
+) -> AnalysisOutcome:
+    internal_error = em.map_unexpected_error(error=error)
+    return AnalysisOutcome(
+        robot_type=robot_type,
+        run_time_parameters=run_time_parameters,
+        commands=[],
+        labware=[],
+        modules=[],
+        pipettes=[],
+        errors=[
+            ErrorOccurrence.from_failed(
+                # TODO(tz, 2-15-24): replace with a different error type
+                #  when we are able to support different errors.
+                id="internal-error",
+                createdAt=datetime_helper.utc_now(),
+                error=internal_error,
+            )
+        ],
+        liquids=[],
+    )
+
+
 def create_protocol_analyzer(
     analysis_store: AnalysisStore,
     protocol_resource: ProtocolResource,
@@ -24,17 +24,9 @@ class ProtocolAutoDeleter:  # noqa: D101
 
     def make_room_for_new_protocol(self) -> None:
         """Finds unused protocols and deletes them."""
-        protocols = {
-            p.protocol_id
-            for p in self._protocol_store.get_all()
-            if p.protocol_kind == self._protocol_kind
-        }
-
-        protocol_run_usage_info = [
-            p
-            for p in self._protocol_store.get_usage_info()
-            if p.protocol_id in protocols
-        ]
+        protocol_run_usage_info = self._protocol_store.get_usage_info(
+            protocol_kind=self._protocol_kind
+        )
 
         protocol_ids_to_delete = self._deletion_planner.plan_for_new_protocol(
             existing_protocols=protocol_run_usage_info,
@@ -0,0 +1,218 @@
+"""Persist the `ProtocolSource`s of stored protocols across reboots."""
+
+from __future__ import annotations
+
+import os
+from logging import getLogger
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import anyio
+from pydantic import BaseModel, ValidationError
+
+from opentrons import __version__ as opentrons_version
+from opentrons.protocol_reader import (
+    JsonProtocolConfig,
+    ProtocolFileRole,
+    ProtocolSource,
+    ProtocolSourceFile,
+    ProtocolType,
+    PythonProtocolConfig,
+)
+from opentrons.protocol_reader.protocol_source import ProtocolConfig
+from opentrons.protocols.api_support.types import APIVersion
+from opentrons_shared_data.robot.types import RobotType
+
+
+# Bump this whenever the cache file's format changes.
+#
+# Version History
+#     * "1": initial
+_CACHE_FORMAT_VERSION = "1"
+
+# A `ProtocolSource` computed by one version of the software can differ from one
+# computed by another, even for the same files. For example, a new version might
+# parse metadata differently. So records are only trusted under the exact software
+# version that wrote them.
+_CURRENT_READER_VERSION = f"{_CACHE_FORMAT_VERSION}:{opentrons_version}"
+
+
+_log = getLogger(__name__)
+
+
+class _CachedFile(BaseModel):
+    name: str
+    role: ProtocolFileRole
+
+
+class _CachedProtocolSource(BaseModel):
+    content_hash: str
+    main_file: str
+    files: List[_CachedFile]
+    metadata: Dict[str, Any]
+    robot_type: RobotType
+    protocol_type: ProtocolType
+    schema_version: Optional[int]
+    api_version: Optional[str]
+
+
+class _CacheContents(BaseModel):
+    reader_version: str
+    sources: Dict[str, _CachedProtocolSource]
+
+
+class ProtocolSourceCache:
+    """A file of `ProtocolSource` records, one per stored protocol.
+
+    Computing a `ProtocolSource` means parsing the protocol's files, which is
+    slow enough to dominate boot times when there are many stored protocols.
+    A record can stand in for that as long as the protocol's files still have
+    the content hash that the record was made from, and the record was made by
+    this version of the software.
+
+    Records don't store absolute paths, so they stay valid if the protocol's
+    directory moves, like it does when the persistence directory is migrated.
+    """
+
+    def __init__(self, cache_file: Path) -> None:
+        """Initialize the cache. Call `load()` to read what's already in the file.
+
+        Params:
+            cache_file: Where to store records. It's okay if this doesn't exist.
+        """
+        self._cache_file = cache_file
+        self._records: Dict[str, _CachedProtocolSource] = {}
+
+    async def load(self) -> None:
+        """Read records from the cache file.
+
+        A missing, unreadable, or outdated cache file is treated as empty.
+        """
+        try:
+            contents = await anyio.to_thread.run_sync(
+                _CacheContents.parse_file, self._cache_file
+            )
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, ValidationError):
+            _log.warning(
+                f"Ignoring unreadable protocol source cache {self._cache_file}.",
+                exc_info=True,
+            )
+            return
+
+        if contents.reader_version != _CURRENT_READER_VERSION:
+            _log.info(
+                f"Ignoring protocol source cache from version"
+                f' "{contents.reader_version}".'
+            )
+            return
+
+        self._records = contents.sources
+
+    def get(
+        self, protocol_id: str, directory: Path, content_hash: str
+    ) -> Optional[ProtocolSource]:
+        """Return the cached `ProtocolSource` for a protocol, if it's still valid.
+
+        Params:
+            protocol_id: The protocol's ID.
+            directory: The directory that currently holds the protocol's files.
+            content_hash: The current content hash of the protocol's files,
+                as computed by `FileHasher`.
+
+        Returns:
+            The cached `ProtocolSource`, with paths inside `directory`,
+            or `None` if there's no record or the files have changed since.
+        """
+        record = self._records.get(protocol_id)
+        if record is None or record.content_hash != content_hash:
+            return None
+        return _record_to_source(record, directory)
+
+    async def save(self, sources_by_id: Dict[str, ProtocolSource]) -> None:
+        """Replace the cache file's records with the given `ProtocolSource`s.
+
+        This does nothing if the records haven't changed since they were loaded.
+        """
+        records = {
+            protocol_id: _source_to_record(source)
+            for protocol_id, source in sources_by_id.items()
+        }
+        if records == self._records:
+            return
+
+        contents = _CacheContents(
+            reader_version=_CURRENT_READER_VERSION, sources=records
+        ).json()
+        try:
+            await anyio.to_thread.run_sync(
+                _write_atomically, self._cache_file, contents
+            )
+        except OSError:
+            # The cache is only an optimization, so losing it is not worth failing over.
+            _log.warning(
+                f"Could not write protocol source cache {self._cache_file}.",
+                exc_info=True,
+            )
+            return
+        self._records = records
+
+
+def _source_to_record(source: ProtocolSource) -> _CachedProtocolSource:
+    config = source.config
+    return _CachedProtocolSource(
+        content_hash=source.content_hash,
+        main_file=source.main_file.name,
+        files=[_CachedFile(name=f.path.name, role=f.role) for f in source.files],
+        metadata=source.metadata,
+        robot_type=source.robot_type,
+        protocol_type=config.protocol_type,
+        schema_version=(
+            config.schema_version if isinstance(config, JsonProtocolConfig) else None
+        ),
+        api_version=(
+            str(config.api_version)
+            if isinstance(config, PythonProtocolConfig)
+            else None
+        ),
+    )
+
+
+def _record_to_source(
+    record: _CachedProtocolSource, directory: Path
+) -> Optional[ProtocolSource]:
+    if record.protocol_type == ProtocolType.JSON and record.schema_version is not None:
+        config: ProtocolConfig = JsonProtocolConfig(
+            schema_version=record.schema_version
+        )
+    elif record.protocol_type == ProtocolType.PYTHON and record.api_version is not None:
+        config = PythonProtocolConfig(
+            api_version=APIVersion.from_string(record.api_version)
+        )
+    else:
+        return None
+
+    return ProtocolSource(
+        directory=directory,
+        main_file=directory / record.main_file,
+        content_hash=record.content_hash,
+        files=[
+            ProtocolSourceFile(path=directory / f.name, role=f.role)
+            for f in record.files
+        ],
+        metadata=record.metadata,
+        robot_type=record.robot_type,
+        config=config,
+    )
+
+
+def _write_atomically(path: Path, contents: str) -> None:
+    # Write to a temporary file and then rename it over the real one, so the cache
+    # file is never left half-written if we lose power partway through.
+    temp_path = path.with_name(f"{path.name}.tmp")
+    with open(temp_path, "w", encoding="utf-8") as temp_file:
+        temp_file.write(contents)
+        temp_file.flush()
+        os.fsync(temp_file.fileno())
+    os.replace(temp_path, path)
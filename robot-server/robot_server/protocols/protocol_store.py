@@ -13,12 +13,18 @@ from anyio import Path as AsyncPath, create_task_group
 import sqlalchemy
 
 from opentrons.protocols.parse import PythonParseMode
-from opentrons.protocol_reader import ProtocolReader, ProtocolSource
+from opentrons.protocol_reader import (
+    FileHasher,
+    FileReaderWriter,
+    ProtocolReader,
+    ProtocolSource,
+)
 
 from robot_server.data_files.models import DataFile
 from robot_server.persistence.database import sqlite_rowid
 from robot_server.persistence.tables import (
     analysis_table,
+    analysis_command_page_table,
     protocol_table,
     run_table,
     analysis_primitive_type_rtp_table,
@@ -28,6 +34,7 @@ from robot_server.persistence.tables import (
     ProtocolKindSQLEnum,
 )
 from robot_server.protocols.protocol_models import ProtocolKind
+from robot_server.protocols.protocol_source_cache import ProtocolSourceCache
 
 
 _CACHE_ENTRIES = 32
@@ -130,6 +137,7 @@ class ProtocolStore:
         sql_engine: sqlalchemy.engine.Engine,
         protocols_directory: Path,
         protocol_reader: ProtocolReader,
+        protocol_source_cache_file: Optional[Path] = None,
     ) -> ProtocolStore:
         """Return a new ProtocolStore, picking up where a former one left off.
 
@@ -148,6 +156,9 @@ class ProtocolStore:
                 named after its protocol ID.
             protocol_reader: An interface to compute `ProtocolSource`s from protocol
                 files while rehydrating.
+            protocol_source_cache_file: Where to persist computed `ProtocolSource`s,
+                so the next rehydration only needs to compute them for protocols
+                that have changed. See `ProtocolSourceCache`.
         """
         # The SQL database is the canonical source of which protocols
         # have been added successfully.
@@ -155,12 +166,21 @@ class ProtocolStore:
             r.protocol_id for r in cls._sql_get_all_from_engine(sql_engine=sql_engine)
         )
 
+        protocol_source_cache = None
+        if protocol_source_cache_file is not None:
+            protocol_source_cache = ProtocolSourceCache(protocol_source_cache_file)
+            await protocol_source_cache.load()
+
         sources_by_id = await _compute_protocol_sources(
             expected_protocol_ids=expected_ids,
             protocols_directory=AsyncPath(protocols_directory),
             protocol_reader=protocol_reader,
+            protocol_source_cache=protocol_source_cache,
         )
 
+        if protocol_source_cache is not None:
+            await protocol_source_cache.save(sources_by_id)
+
         return ProtocolStore(
             _sql_engine=sql_engine,
             _sources_by_id=sources_by_id,
@@ -273,16 +293,26 @@ class ProtocolStore:
     # Note that this is NOT cached like the other getters because we would need
     # to invalidate the cache whenever the runs table changes, which is not something
     # that this class can easily monitor.
-    def get_usage_info(self) -> List[ProtocolUsageInfo]:
+    def get_usage_info(
+        self, protocol_kind: Optional[ProtocolKind] = None
+    ) -> List[ProtocolUsageInfo]:
         """Return information about which protocols are currently being used by runs.
 
         See the `runs` module for information about runs.
 
+        Args:
+            protocol_kind: If given, only return protocols of this kind.
+
         Results are ordered with the oldest-added protocol first.
         """
         select_all_protocol_ids = sqlalchemy.select(protocol_table.c.id).order_by(
             sqlite_rowid
         )
+        if protocol_kind is not None:
+            select_all_protocol_ids = select_all_protocol_ids.where(
+                protocol_table.c.protocol_kind
+                == _http_protocol_kind_to_sql(protocol_kind)
+            )
         select_used_protocol_ids = sqlalchemy.select(run_table.c.protocol_id).where(
             run_table.c.protocol_id.is_not(None)
         )
@@ -412,6 +442,13 @@ class ProtocolStore:
         ).where(
             analysis_csv_rtp_table.c.analysis_id.in_(select_referencing_analysis_ids)
         )
+        delete_analysis_command_pages_statement = sqlalchemy.delete(
+            analysis_command_page_table
+        ).where(
+            analysis_command_page_table.c.analysis_id.in_(
+                select_referencing_analysis_ids
+            )
+        )
         delete_analyses_statement = sqlalchemy.delete(analysis_table).where(
             analysis_table.c.protocol_id == protocol_id
         )
@@ -420,8 +457,8 @@ class ProtocolStore:
         )
 
         with self._sql_engine.begin() as transaction:
-            # TODO(mm, 2022-04-28): Deleting analyses, and any RTP tables that reference
-            #  those analyses, from the table is enough to avoid a SQL foreign key conflict.
+            # TODO(mm, 2022-04-28): Deleting analyses, and any RTP and command page tables
+            #  that reference those analyses, from the table is enough to avoid a SQL foreign key conflict.
             #  But, if this protocol had any *pending* analyses, they'll be left behind
             #  in the AnalysisStore, orphaned, since they're stored independently of this SQL table.
             #
@@ -432,6 +469,7 @@ class ProtocolStore:
             try:
                 transaction.execute(delete_analysis_rtps_statement)
                 transaction.execute(delete_analysis_csv_rtps_statement)
+                transaction.execute(delete_analysis_command_pages_statement)
                 transaction.execute(delete_analyses_statement)
                 result = transaction.execute(delete_protocol_statement)
             except sqlalchemy.exc.IntegrityError as e:
@@ -458,13 +496,15 @@ async def _compute_protocol_sources(
     expected_protocol_ids: Set[str],
     protocols_directory: AsyncPath,
     protocol_reader: ProtocolReader,
+    protocol_source_cache: Optional[ProtocolSourceCache] = None,
 ) -> Dict[str, ProtocolSource]:
     """Compute `ProtocolSource` objects from protocol source files.
 
     We don't store these `ProtocolSource` objects in the SQL database because
     they're big, deep, complex, and unstable, so migrations and compatibility
     would be painful. Instead, we compute them based on the stored files,
-    and keep them in memory.
+    and keep them in memory. Computing them can be skipped for protocols whose
+    files haven't changed since they were stored in `protocol_source_cache`.
 
     Params:
         expected_protocol_ids: The ID of every protocol for which to compute a
@@ -472,6 +512,7 @@ async def _compute_protocol_sources(
         protocols_directory: A directory containing one subdirectory per protocol
             named by protocol ID. Scanned for files to pass to `protocol_reader`.
         protocol_reader: An interface to use to compute `ProtocolSource`s.
+        protocol_source_cache: Previously computed `ProtocolSource`s, if any.
 
     Returns:
         A map from protocol ID to computed `ProtocolSource`.
@@ -514,6 +555,21 @@ async def _compute_protocol_sources(
         #  * We don't try to compute the source of any protocol whose insertion
         #    failed halfway through and left files behind.
         protocol_files = [Path(f) async for f in protocol_subdirectory.iterdir()]
+
+        if protocol_source_cache is not None:
+            # Hashing is much cheaper than the parsing that read_saved() does.
+            content_hash = await FileHasher.hash(
+                await FileReaderWriter.read(protocol_files)
+            )
+            cached_source = protocol_source_cache.get(
+                protocol_id=protocol_id,
+                directory=Path(protocol_subdirectory),
+                content_hash=content_hash,
+            )
+            if cached_source is not None:
+                sources_by_id[protocol_id] = cached_source
+                return
+
         protocol_source = await protocol_reader.read_saved(
             files=protocol_files,
             directory=Path(protocol_subdirectory),
@@ -5,8 +5,9 @@ import logging
 from textwrap import dedent
 from datetime import datetime
 from pathlib import Path
-from typing import Annotated, List, Literal, Optional, Union, Tuple
+from typing import Annotated, Final, List, Literal, Optional, Union, Tuple
 
+from opentrons.protocol_engine import Command
 from opentrons.protocol_engine.types import (
     PrimitiveRunTimeParamValuesType,
     CSVRuntimeParamPaths,
@@ -86,6 +87,8 @@ from .dependencies import (
 
 log = logging.getLogger(__name__)
 
+_DEFAULT_COMMAND_LIST_LENGTH: Final = 20
+
 
 class ProtocolNotFound(ErrorDetails):
     """An error returned when a given protocol cannot be found."""
@@ -917,6 +920,127 @@ async def get_protocol_analysis_as_document(
     return PlainTextResponse(content=analysis, media_type="application/json")
 
 
+@protocols_router.get(
+    path="/protocols/{protocolId}/analyses/{analysisId}/summaryAsDocument",
+    summary=(
+        "[Experimental] Get one of a protocol's analyses, without its commands,"
+        " as a raw document"
+    ),
+    description=(
+        "**Warning:** This endpoint is experimental. We may change or remove it without warning."
+        "\n\n"
+        "This is like `GET /protocols/{protocolId}/analyses/{analysisId}/asDocument`,"
+        " except that the returned analysis has no `commands`."
+        " It responds quickly no matter how many commands the analysis has."
+        " Use `GET /protocols/{protocolId}/analyses/{analysisId}/commands`"
+        " to page through the commands."
+        "\n\n"
+        "For a *pending* analysis, this returns a 404 response."
+    ),
+    responses={
+        status.HTTP_404_NOT_FOUND: {
+            "model": ErrorBody[Union[ProtocolNotFound, AnalysisNotFound]]
+        },
+    },
+)
+async def get_protocol_analysis_summary_as_document(
+    protocolId: str,
+    analysisId: str,
+    protocol_store: Annotated[ProtocolStore, Depends(get_protocol_store)],
+    analysis_store: Annotated[AnalysisStore, Depends(get_analysis_store)],
+) -> PlainTextResponse:
+    """Get a protocol analysis by analysis ID, without its commands.
+
+    Arguments:
+        protocolId: The ID of the protocol, pulled from the URL.
+        analysisId: The ID of the analysis, pulled from the URL.
+        protocol_store: Protocol resource storage.
+        analysis_store: Analysis resource storage.
+    """
+    if not protocol_store.has(protocolId):
+        raise ProtocolNotFound(detail=f"Protocol {protocolId} not found").as_error(
+            status.HTTP_404_NOT_FOUND
+        )
+
+    try:
+        summary = await analysis_store.get_summary_as_document(analysisId)
+    except AnalysisNotFoundError as error:
+        raise AnalysisNotFound(detail=str(error)).as_error(
+            status.HTTP_404_NOT_FOUND
+        ) from error
+
+    return PlainTextResponse(content=summary, media_type="application/json")
+
+
+@PydanticResponse.wrap_route(
+    protocols_router.get,
+    path="/protocols/{protocolId}/analyses/{analysisId}/commands",
+    summary="Get a page of one of a protocol's analysis commands",
+    description=(
+        "Get some of the commands of a protocol analysis,"
+        " in order from first to last."
+        "\n\n"
+        "Only the requested commands are read from storage,"
+        " so this is faster than fetching the whole analysis"
+        " when you only need part of a long protocol."
+        " A pending analysis has no commands yet."
+    ),
+    responses={
+        status.HTTP_200_OK: {"model": SimpleMultiBody[Command]},
+        status.HTTP_404_NOT_FOUND: {
+            "model": ErrorBody[Union[ProtocolNotFound, AnalysisNotFound]]
+        },
+    },
+)
+async def get_protocol_analysis_commands(
+    protocolId: str,
+    analysisId: str,
+    protocol_store: Annotated[ProtocolStore, Depends(get_protocol_store)],
+    analysis_store: Annotated[AnalysisStore, Depends(get_analysis_store)],
+    cursor: Annotated[
+        int,
+        Query(description="The index of the first command in the list to return."),
+    ] = 0,
+    pageLength: Annotated[
+        int,
+        Query(description="The maximum number of commands in the list to return."),
+    ] = _DEFAULT_COMMAND_LIST_LENGTH,
+) -> PydanticResponse[SimpleMultiBody[Command]]:
+    """Get a slice of a protocol analysis's commands.
+
+    Arguments:
+        protocolId: The ID of the protocol, pulled from the URL.
+        analysisId: The ID of the analysis, pulled from the URL.
+        protocol_store: Protocol resource storage.
+        analysis_store: Analysis resource storage.
+        cursor: Cursor index for the collection response.
+        pageLength: Maximum number of items to return.
+    """
+    if not protocol_store.has(protocolId):
+        raise ProtocolNotFound(detail=f"Protocol {protocolId} not found").as_error(
+            status.HTTP_404_NOT_FOUND
+        )
+
+    try:
+        command_slice = await analysis_store.get_commands_slice(
+            analysis_id=analysisId, cursor=cursor, length=pageLength
+        )
+    except AnalysisNotFoundError as error:
+        raise AnalysisNotFound(detail=str(error)).as_error(
+            status.HTTP_404_NOT_FOUND
+        ) from error
+
+    return await PydanticResponse.create(
+        content=SimpleMultiBody.construct(
+            data=command_slice.commands,
+            meta=MultiBodyMeta(
+                cursor=command_slice.cursor,
+                totalLength=command_slice.total_length,
+            ),
+        )
+    )
+
+
 @PydanticResponse.wrap_route(
     protocols_router.get,
     path="/protocols/{protocolId}/dataFiles",
@@ -2,7 +2,9 @@
 from fastapi import APIRouter
 
 from .control.router import control_router
+from .trace_router import trace_router
 
 robot_router = APIRouter()
 
 robot_router.include_router(router=control_router)
+robot_router.include_router(router=trace_router)
@@ -0,0 +1,63 @@
+"""Router for the /robot/hardwareTrace endpoint."""
+import json
+from typing import Annotated, Any, Dict
+
+from fastapi import APIRouter, Depends, Query, Response, status
+
+from opentrons_shared_data.robot.types import RobotType
+
+from robot_server.errors.error_responses import ErrorBody
+from robot_server.errors.robot_errors import NotSupportedOnOT2
+from robot_server.hardware import get_robot_type
+
+trace_router = APIRouter()
+
+
+def _get_chrome_trace(clear: bool) -> Dict[str, Any]:
+    try:
+        from opentrons_hardware import tracing
+    except ImportError as exception:
+        raise NotSupportedOnOT2(detail=str(exception)).as_error(
+            status.HTTP_403_FORBIDDEN
+        ) from exception
+    tracer = tracing.get_tracer()
+    trace = tracer.to_chrome_trace()
+    if clear:
+        tracer.clear()
+    return trace
+
+
+@trace_router.get(
+    path="/robot/hardwareTrace",
+    summary="Get the hardware trace",
+    description=(
+        "Get the most recent hardware control spans, like motion planning,"
+        " moves and CAN message exchanges, as Chrome trace-event JSON."
+        " Open it in chrome://tracing or https://ui.perfetto.dev."
+        "\n\n"
+        "Only a fixed number of the most recent spans are kept."
+        " The number of older spans that were dropped is in"
+        " `otherData.droppedSpans`."
+    ),
+    responses={
+        status.HTTP_200_OK: {"content": {"application/json": {}}},
+        status.HTTP_403_FORBIDDEN: {"model": ErrorBody[NotSupportedOnOT2]},
+    },
+)
+async def get_hardware_trace(
+    robot_type: Annotated[RobotType, Depends(get_robot_type)],
+    clear: Annotated[
+        bool,
+        Query(description="Whether to drop the returned spans from the trace."),
+    ] = False,
+) -> Response:
+    """Return the hardware trace as Chrome trace-event JSON."""
+    if robot_type != "OT-3 Standard":
+        raise NotSupportedOnOT2(
+            detail="This route is only available on a Flex."
+        ).as_error(status.HTTP_403_FORBIDDEN)
+    # Span arguments can be anything, so serialize them like the tracer's own dumps.
+    return Response(
+        content=json.dumps(_get_chrome_trace(clear), default=str),
+        media_type="application/json",
+    )
@@ -6,9 +6,7 @@ from robot_server.error_recovery.settings.store import (
     ErrorRecoverySettingStore,
     get_error_recovery_setting_store,
 )
-from robot_server.protocols.dependencies import get_protocol_store
 from robot_server.protocols.protocol_models import ProtocolKind
-from robot_server.protocols.protocol_store import ProtocolStore
 from sqlalchemy.engine import Engine as SQLEngine
 
 from opentrons_shared_data.robot.types import RobotType
@@ -176,12 +174,12 @@ async def get_run_data_manager(
 
 async def get_run_auto_deleter(
     run_store: Annotated[RunStore, Depends(get_run_store)],
-    protocol_store: Annotated[ProtocolStore, Depends(get_protocol_store)],
+    task_runner: Annotated[TaskRunner, Depends(get_task_runner)],
 ) -> RunAutoDeleter:
     """Get an `AutoDeleter` to delete old runs."""
     return RunAutoDeleter(
         run_store=run_store,
-        protocol_store=protocol_store,
+        task_runner=task_runner,
         deletion_planner=RunDeletionPlanner(maximum_runs=get_settings().maximum_runs),
         protocol_kind=ProtocolKind.STANDARD,
     )
@@ -189,12 +187,12 @@ async def get_run_auto_deleter(
 
 async def get_quick_transfer_run_auto_deleter(
     run_store: Annotated[RunStore, Depends(get_run_store)],
-    protocol_store: Annotated[ProtocolStore, Depends(get_protocol_store)],
+    task_runner: Annotated[TaskRunner, Depends(get_task_runner)],
 ) -> RunAutoDeleter:
     """Get an `AutoDeleter` to delete old runs for quick transfer prorotocols."""
     return RunAutoDeleter(
         run_store=run_store,
-        protocol_store=protocol_store,
+        task_runner=task_runner,
         # NOTE: We dont store quick transfer runs, however we need an additional
         # run slot so we can clone an active run.
         deletion_planner=RunDeletionPlanner(maximum_runs=2),
@@ -8,7 +8,7 @@ from pathlib import Path
 from textwrap import dedent
 from typing import Annotated, Callable, Final, Literal, Optional, Union
 
-from fastapi import APIRouter, Depends, status, Query
+from fastapi import APIRouter, Depends, Header, status, Query
 from pydantic import BaseModel, Field
 
 from opentrons_shared_data.errors import ErrorCodes
@@ -38,6 +38,8 @@ from robot_server.service.json_api import (
     ResourceLink,
     PydanticResponse,
     Body,
+    make_etag,
+    etag_matches,
 )
 
 from robot_server.protocols.dependencies import get_protocol_store
@@ -134,6 +136,23 @@ class CurrentStateLinks(BaseModel):
     )
 
 
+def get_current_run_etag(
+    run_data_manager: RunDataManager, run_id: str
+) -> Optional[str]:
+    """Get an entity tag for the current state of a run.
+
+    Call this *before* reading the data that the response will contain.
+    That way, if the run changes in between, the tag is stale rather than
+    claiming newer data than was actually sent.
+
+    Returns:
+        The tag, or `None` if `run_id` is not the current run.
+        Historical runs don't get tags.
+    """
+    version = run_data_manager.get_state_version(run_id)
+    return None if version is None else make_etag(run_id, version)
+
+
 async def get_run_data_from_url(
     runId: str,
     run_data_manager: Annotated[RunDataManager, Depends(get_run_data_manager)],
@@ -335,16 +354,27 @@ async def get_runs(
     },
 )
 async def get_run(
-    run_data: Annotated[Run, Depends(get_run_data_from_url)],
+    runId: str,
+    run_data_manager: Annotated[RunDataManager, Depends(get_run_data_manager)],
+    if_none_match: Annotated[Optional[str], Header()] = None,
 ) -> PydanticResponse[SimpleBody[Union[Run, BadRun]]]:
     """Get a run by its ID.
 
     Args:
-        run_data: Data of the run specified in the runId url parameter.
+        runId: Run ID pulled from URL.
+        run_data_manager: Current and historical run data management.
+        if_none_match: The ETag of the client's copy of the run, if it has one.
     """
+    etag = get_current_run_etag(run_data_manager, runId)
+    if etag is not None and etag_matches(if_none_match, etag):
+        return PydanticResponse.not_modified(etag)
+
+    run_data = await get_run_data_from_url(runId, run_data_manager)
+
     return await PydanticResponse.create(
         content=SimpleBody.construct(data=run_data),
         status_code=status.HTTP_200_OK,
+        headers=None if etag is None else {"ETag": etag},
     )
 
 
@@ -502,6 +532,7 @@ async def get_run_commands_error(
             ),
         ),
     ] = None,
+    if_none_match: Annotated[Optional[str], Header()] = None,
 ) -> PydanticResponse[SimpleMultiBody[pe_errors.ErrorOccurrence]]:
     """Get a summary of a set of command errors in a run.
 
@@ -510,7 +541,12 @@ async def get_run_commands_error(
         cursor: Cursor index for the collection response.
         pageLength: Maximum number of items to return.
         run_data_manager: Run data retrieval interface.
+        if_none_match: The ETag of the client's copy of this page, if it has one.
     """
+    etag = get_current_run_etag(run_data_manager, runId)
+    if etag is not None and etag_matches(if_none_match, etag):
+        return PydanticResponse.not_modified(etag)
+
     try:
         all_errors = run_data_manager.get_command_errors(run_id=runId)
         total_length = len(all_errors)
@@ -542,6 +578,7 @@ async def get_run_commands_error(
             meta=meta,
         ),
         status_code=status.HTTP_200_OK,
+        headers=None if etag is None else {"ETag": etag},
     )
 
 
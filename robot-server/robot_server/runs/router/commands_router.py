@@ -2,7 +2,7 @@
 import textwrap
 from typing import Annotated, Final, Literal, Optional, Union
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Header, Query, status
 
 from opentrons.protocol_engine import (
     CommandPointer,
@@ -16,6 +16,7 @@ from robot_server.service.json_api import (
     MultiBody,
     MultiBodyMeta,
     PydanticResponse,
+    etag_matches,
     SimpleMultiBody,
 )
 from robot_server.robot.control.dependencies import require_estop_in_good_state
@@ -39,7 +40,7 @@ from ..dependencies import (
     get_run_data_manager,
     get_run_store,
 )
-from .base_router import RunNotFound, RunStopped
+from .base_router import RunNotFound, RunStopped, get_current_run_etag
 
 
 _DEFAULT_COMMAND_LIST_LENGTH: Final = 20
@@ -290,6 +291,7 @@ async def get_run_commands(
         description="If `true`, return all commands (protocol, setup, fixit)."
         " If `false`, only return safe commands (protocol, setup).",
     ),
+    if_none_match: Annotated[Optional[str], Header()] = None,
 ) -> PydanticResponse[MultiBody[RunCommandSummary, CommandCollectionLinks]]:
     """Get a summary of a set of commands in a run.
 
@@ -300,7 +302,12 @@ async def get_run_commands(
         run_data_manager: Run data retrieval interface.
         includeFixitCommands: If `true`, return all commands."
             " If `false`, only return safe commands.
+        if_none_match: The ETag of the client's copy of this page, if it has one.
     """
+    etag = get_current_run_etag(run_data_manager, runId)
+    if etag is not None and etag_matches(if_none_match, etag):
+        return PydanticResponse.not_modified(etag)
+
     try:
         command_slice = run_data_manager.get_commands_slice(
             run_id=runId,
@@ -345,6 +352,7 @@ async def get_run_commands(
     return await PydanticResponse.create(
         content=MultiBody.construct(data=data, meta=meta, links=links),
         status_code=status.HTTP_200_OK,
+        headers=None if etag is None else {"ETag": etag},
     )
 
 
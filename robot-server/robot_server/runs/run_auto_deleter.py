@@ -2,10 +2,11 @@
 
 
 from logging import getLogger
+from typing import Set
 
 from robot_server.deletion_planner import RunDeletionPlanner
 from robot_server.protocols.protocol_models import ProtocolKind
-from robot_server.protocols.protocol_store import ProtocolStore
+from robot_server.service.task_runner import TaskRunner
 from .run_store import RunStore
 
 
@@ -16,30 +17,18 @@ class RunAutoDeleter:  # noqa: D101
     def __init__(
         self,
         run_store: RunStore,
-        protocol_store: ProtocolStore,
+        task_runner: TaskRunner,
         deletion_planner: RunDeletionPlanner,
         protocol_kind: ProtocolKind,
     ) -> None:
         self._run_store = run_store
-        self._protocol_store = protocol_store
+        self._task_runner = task_runner
         self._deletion_planner = deletion_planner
         self._protocol_kind = protocol_kind
 
     def make_room_for_new_run(self) -> None:  # noqa: D102
-        protocols = self._protocol_store.get_all()
-        protocol_ids = [p.protocol_id for p in protocols]
-        filtered_protocol_ids = [
-            p.protocol_id for p in protocols if p.protocol_kind == self._protocol_kind
-        ]
-
-        # runs with no protocols first, then oldest to newest.
-        runs = self._run_store.get_all()
-        run_ids = [
-            r.run_id
-            for r in runs
-            if r.protocol_id not in protocol_ids
-            or r.protocol_id in filtered_protocol_ids
-        ]
+        # runs with no protocol or a protocol of our kind, oldest to newest.
+        run_ids = self._run_store.get_ids_by_protocol_kind(self._protocol_kind)
 
         run_ids_to_delete = self._deletion_planner.plan_for_new_run(
             existing_runs=run_ids
@@ -48,5 +37,11 @@ class RunAutoDeleter:  # noqa: D101
             _log.info(
                 f"Auto-deleting these runs to make room for a new one: {run_ids_to_delete}"
             )
-            for id in run_ids_to_delete:
-                self._run_store.remove(run_id=id)
+            # The runs disappear from the store right away, but deleting all of
+            # their commands can take a while, so don't hold up the new run for it.
+            self._run_store.hide_for_removal(run_ids_to_delete)
+            self._task_runner.run(self._remove_runs, run_ids=run_ids_to_delete)
+
+    async def _remove_runs(self, run_ids: Set[str]) -> None:
+        for run_id in run_ids:
+            await self._run_store.remove_in_chunks(run_id=run_id)
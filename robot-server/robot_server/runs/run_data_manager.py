@@ -493,6 +493,31 @@ class RunDataManager:
         # TODO(tz, 8-5-2024): Change this to return the error list from the DB when we implement https://opentrons.atlassian.net/browse/EXEC-655.
         raise RunNotCurrentError()
 
+    def get_state_version(self, run_id: str) -> Optional[int]:
+        """Get a number that increases whenever the current run's data might change.
+
+        Clients can use this to skip re-fetching data that hasn't changed.
+
+        Args:
+            run_id: ID of the run.
+
+        Returns:
+            The version, or `None` if `run_id` is not the current run.
+            Historical runs don't track versions.
+        """
+        if run_id != self._run_orchestrator_store.current_run_id:
+            return None
+
+        engine_version = self._run_orchestrator_store.get_state_version()
+        run_resource = self._run_store.get(run_id=run_id)
+        # The run's actions are stored in the database after the engine has handled
+        # them, so count those too. Both numbers only ever go up, so their sum
+        # changes whenever either of them does.
+        action_count = (
+            len(run_resource.actions) if isinstance(run_resource, RunResource) else 0
+        )
+        return engine_version + action_count
+
     def get_nozzle_maps(self, run_id: str) -> Dict[str, NozzleMap]:
         """Get current nozzle maps keyed by pipette id."""
         if run_id == self._run_orchestrator_store.current_run_id:
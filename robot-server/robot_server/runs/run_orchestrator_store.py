@@ -368,6 +368,10 @@ class RunOrchestratorStore:
         """Get all command errors."""
         return self.run_orchestrator.get_command_errors()
 
+    def get_state_version(self) -> int:
+        """Get a number that increases whenever the run's engine state might have changed."""
+        return self.run_orchestrator.get_state_version()
+
     def get_command_recovery_target(self) -> Optional[CommandPointer]:
         """Get the current error recovery target."""
         return self.run_orchestrator.get_command_recovery_target()
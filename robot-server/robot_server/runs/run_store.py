@@ -1,10 +1,11 @@
 """Runs' on-db store."""
+import asyncio
 import logging
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
 from functools import lru_cache
-from typing import Dict, List, Optional, Literal, Union
+from typing import Dict, Iterable, List, Optional, Literal, Set, Union
 
 import sqlalchemy
 from sqlalchemy import and_
@@ -21,19 +22,25 @@ from opentrons_shared_data.errors.exceptions import (
     InvalidStoredData,
 )
 
+from robot_server.persistence.compression import decompress_json
 from robot_server.persistence.database import sqlite_rowid
 from robot_server.persistence.tables import (
     run_table,
     run_command_table,
     action_table,
     run_csv_rtp_table,
+    protocol_table,
+    ProtocolKindSQLEnum,
 )
 from robot_server.persistence.pydantic import (
+    compressed_json_to_pydantic,
+    pydantic_to_compressed_json,
     json_to_pydantic,
     pydantic_to_json,
     json_to_pydantic_list,
     pydantic_list_to_json,
 )
+from robot_server.protocols.protocol_models import ProtocolKind
 from robot_server.protocols.protocol_store import ProtocolNotFoundError
 
 from .action_models import RunAction, RunActionType
@@ -43,6 +50,9 @@ log = logging.getLogger(__name__)
 
 _CACHE_ENTRIES = 32
 
+# The most commands to delete in one transaction when removing a run in chunks.
+_REMOVAL_CHUNK_SIZE = 500
+
 
 @dataclass(frozen=True)
 class RunResource:
@@ -113,6 +123,7 @@ class RunStore:
     ) -> None:
         """Initialize a RunStore with sql engine and notification client."""
         self._sql_engine = sql_engine
+        self._hidden_run_ids: Set[str] = set()
 
     def update_run_state(
         self,
@@ -175,7 +186,7 @@ class RunStore:
                         "run_id": run_id,
                         "index_in_run": command_index,
                         "command_id": command.id,
-                        "command": pydantic_to_json(command),
+                        "command": pydantic_to_compressed_json(command),
                         "command_intent": str(command.intent.value)
                         if command.intent
                         else CommandIntent.PROTOCOL,
@@ -214,8 +225,10 @@ class RunStore:
 
     def get_all_csv_rtp(self) -> List[CSVParameterRunResource]:
         """Get all of the csv rtp from the run_csv_rtp_table."""
-        select_all_csv_rtp = sqlalchemy.select(run_csv_rtp_table).order_by(
-            sqlite_rowid.asc()
+        select_all_csv_rtp = (
+            sqlalchemy.select(run_csv_rtp_table)
+            .where(run_csv_rtp_table.c.run_id.not_in(self._hidden_run_ids))
+            .order_by(sqlite_rowid.asc())
         )
 
         with self._sql_engine.begin() as transaction:
@@ -307,6 +320,9 @@ class RunStore:
         Raises:
             RunNotFoundError: The given run ID was not found.
         """
+        if run_id in self._hidden_run_ids:
+            raise RunNotFoundError(run_id)
+
         select_run_resource = sqlalchemy.select(*_run_columns).where(
             run_table.c.id == run_id
         )
@@ -340,19 +356,19 @@ class RunStore:
         select_actions = sqlalchemy.select(action_table).order_by(sqlite_rowid.asc())
         actions_by_run_id = defaultdict(list)
 
+        select_visible_runs = sqlalchemy.select(*_run_columns).where(
+            run_table.c.id.not_in(self._hidden_run_ids)
+        )
+
         with self._sql_engine.begin() as transaction:
             if length is not None:
-                select_runs = (
-                    sqlalchemy.select(*_run_columns)
-                    .order_by(sqlite_rowid.desc())
-                    .limit(length)
+                select_runs = select_visible_runs.order_by(sqlite_rowid.desc()).limit(
+                    length
                 )
                 # need to select the last inserted runs and return by asc order
                 runs = list(reversed(transaction.execute(select_runs).all()))
             else:
-                select_runs = sqlalchemy.select(*_run_columns).order_by(
-                    sqlite_rowid.asc()
-                )
+                select_runs = select_visible_runs.order_by(sqlite_rowid.asc())
                 runs = transaction.execute(select_runs).all()
 
             actions = transaction.execute(select_actions).all()
@@ -368,6 +384,26 @@ class RunStore:
             for run_row in runs
         ]
 
+    def get_ids_by_protocol_kind(self, protocol_kind: ProtocolKind) -> List[str]:
+        """Get the IDs of runs that have no protocol, or a protocol of the given kind.
+
+        Results are ordered from oldest to newest.
+        """
+        select_protocol_ids = sqlalchemy.select(protocol_table.c.id).where(
+            protocol_table.c.protocol_kind == ProtocolKindSQLEnum(protocol_kind.value)
+        )
+        select_run_ids = (
+            sqlalchemy.select(run_table.c.id)
+            .where(
+                run_table.c.protocol_id.is_(None)
+                | run_table.c.protocol_id.in_(select_protocol_ids)
+            )
+            .where(run_table.c.id.not_in(self._hidden_run_ids))
+            .order_by(sqlite_rowid)
+        )
+        with self._sql_engine.begin() as transaction:
+            return transaction.execute(select_run_ids).scalars().all()
+
     @lru_cache(maxsize=_CACHE_ENTRIES)
     def get_state_summary(self, run_id: str) -> Union[StateSummary, BadStateSummary]:
         """Get the archived run state summary.
@@ -376,6 +412,9 @@ class RunStore:
         captured when the run was archived. It contains
         status, equipment, and error information.
         """
+        if run_id in self._hidden_run_ids:
+            raise RunNotFoundError(run_id)
+
         select_run_data = sqlalchemy.select(run_table.c.state_summary).where(
             run_table.c.id == run_id
         )
@@ -410,6 +449,9 @@ class RunStore:
         including the values used in the run itself, along with the default value,
         constraints and associated names and descriptions.
         """
+        if run_id in self._hidden_run_ids:
+            raise RunNotFoundError(run_id)
+
         select_run_data = sqlalchemy.select(run_table.c.run_time_parameters).where(
             run_table.c.id == run_id
         )
@@ -501,7 +543,7 @@ class RunStore:
             slice_result = transaction.execute(select_slice).all()
 
         sliced_commands: List[Command] = [
-            json_to_pydantic(Command, row.command)  # type: ignore[arg-type]
+            compressed_json_to_pydantic(Command, row.command)  # type: ignore[arg-type]
             for row in slice_result
         ]
 
@@ -535,7 +577,7 @@ class RunStore:
                     .order_by(run_command_table.c.index_in_run)
                 )
             commands_result = transaction.scalars(select_commands).all()
-        return commands_result
+        return [decompress_json(command) for command in commands_result]
 
     @lru_cache(maxsize=_CACHE_ENTRIES)
     def get_command(self, run_id: str, command_id: str) -> Command:
@@ -565,7 +607,7 @@ class RunStore:
             if command is None:
                 raise CommandNotFoundError(command_id=command_id)
 
-        return json_to_pydantic(Command, command)  # type: ignore[arg-type]
+        return compressed_json_to_pydantic(Command, command)  # type: ignore[arg-type]
 
     def remove(self, run_id: str) -> None:
         """Remove a run by its unique identifier.
@@ -576,6 +618,73 @@ class RunStore:
         Raises:
             RunNotFoundError: The specified run ID was not found.
         """
+        if run_id in self._hidden_run_ids:
+            raise RunNotFoundError(run_id)
+
+        self._delete_run(run_id)
+        self._clear_caches()
+
+    def hide_for_removal(self, run_ids: Iterable[str]) -> None:
+        """Make runs look like they've been removed already.
+
+        The runs stop referring to their protocols and data files right away,
+        so those can be removed without waiting for the runs to be.
+        Use `remove_in_chunks()` to actually remove them afterwards.
+        """
+        run_ids = set(run_ids)
+        detach_protocols = (
+            sqlalchemy.update(run_table)
+            .where(run_table.c.id.in_(run_ids))
+            .values(protocol_id=None)
+        )
+        delete_actions = sqlalchemy.delete(action_table).where(
+            action_table.c.run_id.in_(run_ids)
+        )
+        delete_csv_rtps = sqlalchemy.delete(run_csv_rtp_table).where(
+            run_csv_rtp_table.c.run_id.in_(run_ids)
+        )
+        with self._sql_engine.begin() as transaction:
+            transaction.execute(detach_protocols)
+            transaction.execute(delete_actions)
+            transaction.execute(delete_csv_rtps)
+
+        self._hidden_run_ids.update(run_ids)
+        self._clear_caches()
+
+    async def remove_in_chunks(
+        self, run_id: str, chunk_size: int = _REMOVAL_CHUNK_SIZE
+    ) -> None:
+        """Remove a run hidden by `hide_for_removal()`, a bounded amount at a time.
+
+        A long run's commands can take up most of the database, so they're
+        deleted in transactions of at most `chunk_size` rows, and other tasks get
+        to run in between. The rest of the run is removed last.
+
+        If the run is already gone, this does nothing.
+        """
+        select_command_chunk = (
+            sqlalchemy.select(run_command_table.c.row_id)
+            .where(run_command_table.c.run_id == run_id)
+            .limit(chunk_size)
+        )
+        delete_command_chunk = sqlalchemy.delete(run_command_table).where(
+            run_command_table.c.row_id.in_(select_command_chunk)
+        )
+        while True:
+            with self._sql_engine.begin() as transaction:
+                deleted = transaction.execute(delete_command_chunk).rowcount
+            if deleted < chunk_size:
+                break
+            await asyncio.sleep(0)
+
+        try:
+            self._delete_run(run_id)
+        except RunNotFoundError:
+            pass
+        self._hidden_run_ids.discard(run_id)
+        self._clear_caches()
+
+    def _delete_run(self, run_id: str) -> None:
         delete_run = sqlalchemy.delete(run_table).where(run_table.c.id == run_id)
         delete_actions = sqlalchemy.delete(action_table).where(
             action_table.c.run_id == run_id
@@ -595,11 +704,11 @@ class RunStore:
         if result.rowcount < 1:
             raise RunNotFoundError(run_id)
 
-        self._clear_caches()
-
     def _run_exists(
         self, run_id: str, connection: sqlalchemy.engine.Connection
     ) -> bool:
+        if run_id in self._hidden_run_ids:
+            return False
         result: bool = connection.execute(
             sqlalchemy.select(sqlalchemy.exists().where(run_table.c.id == run_id))
         ).scalar_one()
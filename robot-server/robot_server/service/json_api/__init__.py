@@ -1,3 +1,4 @@
+from .etag import make_etag, etag_matches
 from .request import RequestModel
 from .resource_links import ResourceLink, ResourceLinks, ResourceLinkKey
 from .response import (
@@ -24,6 +25,9 @@ __all__ = [
     "RequestModel",
     # response models
     "PydanticResponse",
+    # conditional requests
+    "make_etag",
+    "etag_matches",
     # response body models
     "BaseResponseBody",
     "Body",
@@ -0,0 +1,27 @@
+"""Entity tags, for conditional GET requests.
+
+A client that polls a resource can send the `ETag` of its last response back in an
+`If-None-Match` request header. If the resource hasn't changed, the server can
+answer with a body-less 304 Not Modified instead of re-serializing it.
+"""
+from typing import Optional
+
+
+def make_etag(*parts: object) -> str:
+    """Build a strong entity tag out of parts that together identify a response."""
+    return '"' + "-".join(str(part) for part in parts) + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an `If-None-Match` request header matches the given entity tag.
+
+    Weak comparison is used, as required for `If-None-Match`, so a `W/` prefix
+    on the client's tags is ignored.
+    """
+    if if_none_match is None:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
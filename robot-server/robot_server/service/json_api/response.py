@@ -14,6 +14,7 @@ from typing import (
 from pydantic import Field, BaseModel
 from pydantic.generics import GenericModel
 from pydantic.typing import get_args
+from fastapi import status
 from fastapi.responses import JSONResponse
 from fastapi.dependencies.utils import get_typed_return_annotation
 from .resource_links import ResourceLinks as DeprecatedResourceLinks
@@ -204,9 +205,10 @@ class PydanticResponse(JSONResponse, Generic[ResponseBodyT]):
         self,
         content: ResponseBodyT,
         status_code: int = 200,
+        headers: Optional[Dict[str, str]] = None,
     ) -> None:
         """Initialize the response object and render the response body."""
-        super().__init__(content, status_code)
+        super().__init__(content, status_code, headers)
         self.content = content
 
     @classmethod
@@ -214,6 +216,7 @@ class PydanticResponse(JSONResponse, Generic[ResponseBodyT]):
         cls,
         content: ResponseBodyT,
         status_code: int = 200,
+        headers: Optional[Dict[str, str]] = None,
     ) -> PydanticResponse[ResponseBodyT]:
         """Asynchronously create a response object.
 
@@ -221,10 +224,26 @@ class PydanticResponse(JSONResponse, Generic[ResponseBodyT]):
         JSON rendering off the main thread. This can help resolve blocking
         issues with large responses.
         """
-        return await to_thread.run_sync(cls, content, status_code)
+        return await to_thread.run_sync(cls, content, status_code, headers)
 
-    def render(self, content: ResponseBodyT) -> bytes:
+    @classmethod
+    def not_modified(cls, etag: str) -> PydanticResponse[Any]:
+        """Create a body-less 304 response, for a client whose copy is up to date.
+
+        Args:
+            etag: The entity tag of the client's copy, which is still current.
+        """
+        # A 304 has no body, which render() represents with None content.
+        return cls(
+            None,  # type: ignore[arg-type]
+            status.HTTP_304_NOT_MODIFIED,
+            {"ETag": etag},
+        )
+
+    def render(self, content: Optional[ResponseBodyT]) -> bytes:
         """Render the response body to JSON bytes."""
+        if content is None:
+            return b""
         return content.json().encode(self.charset)
 
 
@@ -1,8 +1,12 @@
-from fastapi import APIRouter, Query, Response
-from typing import Annotated, Dict
+import zlib
+from fastapi import APIRouter, Header, Query, Response, status
+from fastapi.responses import StreamingResponse
+from typing import Annotated, AsyncIterator, Dict, Optional
 
+from opentrons_shared_data.errors import ErrorCodes
 from opentrons.system import log_control
 
+from robot_server.errors.error_responses import LegacyErrorResponse
 from robot_server.service.legacy.models.logs import LogIdentifier, LogFormat
 
 router = APIRouter()
@@ -17,6 +21,32 @@ IDENTIFIER_TO_SYSLOG_ID: Dict[LogIdentifier, str] = {
 }
 
 
+def _accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    if accept_encoding is None:
+        return False
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.strip().partition(";")
+        if name.strip().lower() == "gzip":
+            return params.replace(" ", "").lower() not in ("q=0", "q=0.0")
+    return False
+
+
+async def _gzip(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    # wbits=31 selects the gzip container.
+    compressor = zlib.compressobj(wbits=31)
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+async def _prepend(first: bytes, rest: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    yield first
+    async for chunk in rest:
+        yield chunk
+
+
 @router.get(
     path="/logs/{log_identifier}",
     summary="Get troubleshooting logs",
@@ -27,7 +57,21 @@ IDENTIFIER_TO_SYSLOG_ID: Dict[LogIdentifier, str] = {
         ' like "aspirated 5 µL from well A1...", you probably want the'
         " *protocol analysis commands* (`GET /protocols/{id}/analyses/{id}`)"
         " or *run commands* (`GET /runs/{id}/commands`) instead."
+        "\n\n"
+        "The logs are streamed as they're read from the journal, gzip-encoded"
+        " if the request's `Accept-Encoding` allows it. To fetch only new"
+        " records, pass `cursor` the last cursor you got: in `text` format,"
+        " it's on the final `-- cursor: ...` line, and in `json` format, it's"
+        " each record's `__CURSOR` field."
+        "\n\n"
+        "If the journal can't be read, like for a `cursor` or `since` that"
+        " journalctl doesn't accept, the response is an error instead. If that"
+        " happens partway through the logs, the stream is cut off before its end."
     ),
+    responses={
+        status.HTTP_400_BAD_REQUEST: {"model": LegacyErrorResponse},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": LegacyErrorResponse},
+    },
 )
 async def get_logs(
     log_identifier: LogIdentifier,
@@ -41,6 +85,21 @@ async def get_logs(
             le=log_control.MAX_RECORDS,
         ),
     ] = log_control.DEFAULT_RECORDS,
+    cursor: Annotated[
+        Optional[str],
+        Query(title="Only retrieve records after this journal cursor"),
+    ] = None,
+    since: Annotated[
+        Optional[str],
+        Query(
+            title="Only retrieve records from this time on",
+            description=(
+                "Any time format that `journalctl --since` accepts,"
+                ' like "2023-08-01 12:00:00" or "-10min".'
+            ),
+        ),
+    ] = None,
+    accept_encoding: Annotated[Optional[str], Header()] = None,
 ) -> Response:
     syslog_id = IDENTIFIER_TO_SYSLOG_ID[log_identifier]
     modes = {
@@ -48,9 +107,33 @@ async def get_logs(
         LogFormat.text: ("short-precise", "text/plain"),
     }
     format_type, media_type = modes[format]
-    output = await log_control.get_records_dumb(syslog_id, records, format_type)
-    return Response(
-        content=output.decode("utf-8"),
+    output = log_control.stream_records(
+        syslog_id, records, format_type, cursor=cursor, since=since
+    )
+    # Read ahead so that if journalctl fails outright, we can still say so in the
+    # status code, before the streamed response commits to a 200.
+    try:
+        first_chunk = await output.__anext__()
+    except StopAsyncIteration:
+        first_chunk = b""
+    except log_control.JournalctlError as e:
+        # journalctl fails outright mostly when it can't parse what it was given.
+        status_code = (
+            status.HTTP_400_BAD_REQUEST
+            if cursor is not None or since is not None
+            else status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+        raise LegacyErrorResponse(
+            message=str(e), errorCode=ErrorCodes.GENERAL_ERROR.value.code
+        ).as_error(status_code) from e
+    output = _prepend(first_chunk, output)
+    headers = dict(response.headers)
+    headers["Vary"] = "Accept-Encoding"
+    if _accepts_gzip(accept_encoding):
+        output = _gzip(output)
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(
+        content=output,
         media_type=media_type,
-        headers=dict(response.headers),
+        headers=headers,
     )
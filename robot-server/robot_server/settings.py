@@ -111,5 +111,28 @@ class RobotServerSettings(BaseSettings):
         ),
     )
 
+    analysis_workers: int = Field(
+        default=1,
+        gt=0,
+        description=(
+            "The maximum number of protocol analyses to run at once in worker"
+            " processes. With 1, there are no worker processes: analyses run"
+            " inside the server's own process, with no limit on how many run at"
+            " once. With more, each analysis runs in a separate worker process,"
+            " so a long analysis doesn't hold up the server's other endpoints,"
+            " at the cost of the memory that each worker process uses."
+        ),
+    )
+
+    analysis_timeout: typing.Optional[float] = Field(
+        default=None,
+        gt=0,
+        description=(
+            "How many seconds an analysis in a worker process may take before it's"
+            " stopped and recorded as failed. No limit if unset."
+            " This has no effect if `analysis_workers` is 1."
+        ),
+    )
+
     class Config:
         env_prefix = "OT_ROBOT_SERVER_"
@@ -0,0 +1,207 @@
+#!/usr/bin/env python
+"""Measure what conditional requests save when polling a long run.
+
+While a run is going, the app polls `GET /runs/{id}`, `GET /runs/{id}/commands`,
+and `GET /runs/{id}/commandErrors` several times a second. Most of those polls
+happen while nothing has changed. This script simulates a long run in a real
+Protocol Engine, serves it through the real run routers, and compares plain polls
+against polls that send back the last response's `ETag` in `If-None-Match`.
+
+Note: robot-server must be importable when you run this.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple, Union
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from opentrons.hardware_control import API
+from opentrons.protocol_engine import (
+    CommandErrorSlice,
+    CommandPointer,
+    CommandSlice,
+    Config,
+    DeckType,
+    ErrorOccurrence,
+    ProtocolEngine,
+    commands as pe_commands,
+)
+from opentrons.protocol_engine.create_protocol_engine import create_protocol_engine
+from opentrons.protocol_engine.error_recovery_policy import never_recover
+from opentrons.protocol_runner import RunOrchestrator
+
+from robot_server.runs.dependencies import get_run_data_manager
+from robot_server.runs.router.base_router import base_router
+from robot_server.runs.router.commands_router import commands_router
+from robot_server.runs.run_data_manager import _build_run
+from robot_server.runs.run_models import BadRun, Run
+from robot_server.runs.run_store import RunResource
+
+_RUN_ID = "polling-benchmark-run"
+
+
+class _EngineRunDataManager:
+    """Just enough of RunDataManager to serve the polled routes from one engine.
+
+    Reads go straight to the engine's state, like they do for the current run on
+    a robot.
+    """
+
+    def __init__(self, engine: ProtocolEngine) -> None:
+        self._engine = engine
+        self._run_resource = RunResource(
+            ok=True,
+            run_id=_RUN_ID,
+            protocol_id=None,
+            created_at=datetime.now(tz=timezone.utc),
+            actions=[],
+        )
+
+    def get_state_version(self, run_id: str) -> Optional[int]:
+        return self._engine.state_view.commands.get_version()
+
+    def get(self, run_id: str) -> Union[Run, BadRun]:
+        return _build_run(
+            run_resource=self._run_resource,
+            state_summary=self._engine.state_view.get_summary(),
+            current=True,
+            run_time_parameters=[],
+        )
+
+    def get_commands_slice(
+        self,
+        run_id: str,
+        cursor: Optional[int],
+        length: int,
+        include_fixit_commands: bool,
+    ) -> CommandSlice:
+        return self._engine.state_view.commands.get_slice(
+            cursor=cursor, length=length, include_fixit_commands=include_fixit_commands
+        )
+
+    def get_current_command(self, run_id: str) -> Optional[CommandPointer]:
+        return self._engine.state_view.commands.get_current()
+
+    def get_recovery_target_command(self, run_id: str) -> Optional[CommandPointer]:
+        return self._engine.state_view.commands.get_recovery_target()
+
+    def get_command_errors(self, run_id: str) -> List[ErrorOccurrence]:
+        return self._engine.state_view.commands.get_all_errors()
+
+    def get_command_error_slice(
+        self, run_id: str, cursor: int, length: int
+    ) -> CommandErrorSlice:
+        return self._engine.state_view.commands.get_errors_slice(
+            cursor=cursor, length=length
+        )
+
+
+async def _simulate_run(command_count: int) -> ProtocolEngine:
+    """Run command_count commands through a simulating Protocol Engine."""
+    hardware_api = await API.build_hardware_simulator()
+    engine = await create_protocol_engine(
+        hardware_api=hardware_api,
+        config=Config(robot_type="OT-2 Standard", deck_type=DeckType.OT2_STANDARD),
+        error_recovery_policy=never_recover,
+    )
+    # The orchestrator starts the engine's queue worker, like it does on a robot.
+    RunOrchestrator.build_orchestrator(
+        hardware_api=hardware_api, protocol_engine=engine, run_id=_RUN_ID
+    ).play()
+    last_command = None
+    for index in range(command_count):
+        last_command = engine.add_command(
+            pe_commands.CommentCreate(
+                params=pe_commands.CommentParams(
+                    message=f"Transferring sample {index} to the destination plate."
+                )
+            )
+        )
+    if last_command is not None:
+        await engine.wait_for_command(last_command.id)
+    return engine
+
+
+def _poll(
+    client: TestClient, url: str, polls: int, conditional: bool
+) -> Tuple[float, float, Dict[int, int]]:
+    """Poll url, returning median milliseconds, mean bytes, and status counts."""
+    etag: Optional[str] = None
+    timings: List[float] = []
+    sizes: List[int] = []
+    statuses: Dict[int, int] = {}
+    for _ in range(polls):
+        headers = {"Opentrons-Version": "*"}
+        if conditional and etag is not None:
+            headers["If-None-Match"] = etag
+        start = time.perf_counter()
+        response = client.get(url, headers=headers)
+        timings.append((time.perf_counter() - start) * 1000)
+        sizes.append(len(response.content))
+        statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+        etag = response.headers.get("ETag", etag)
+    return statistics.median(timings), statistics.mean(sizes), statuses
+
+
+def _benchmark(command_count: int, polls: int) -> None:
+    engine = asyncio.run(_simulate_run(command_count))
+    print(
+        f"Simulated a run of {command_count} commands"
+        f" (state version {engine.state_view.commands.get_version()})."
+    )
+
+    app = FastAPI()
+    app.include_router(base_router)
+    app.include_router(commands_router)
+    run_data_manager = _EngineRunDataManager(engine)
+    app.dependency_overrides[get_run_data_manager] = lambda: run_data_manager
+    client = TestClient(app)
+
+    urls = [
+        f"/runs/{_RUN_ID}",
+        f"/runs/{_RUN_ID}/commands?pageLength=20",
+        f"/runs/{_RUN_ID}/commands?pageLength=200",
+        f"/runs/{_RUN_ID}/commandErrors",
+    ]
+    print(f"{'':<48} {'plain':>16} {'conditional':>16}")
+    for url in urls:
+        plain_ms, plain_bytes, _ = _poll(client, url, polls, conditional=False)
+        cond_ms, cond_bytes, statuses = _poll(client, url, polls, conditional=True)
+        print(url)
+        print(
+            f"  {'median latency (ms)':<46} {plain_ms:>16.3f} {cond_ms:>16.3f}"
+            f" ({cond_ms / plain_ms:.2f}x)"
+        )
+        print(
+            f"  {'mean response size (bytes)':<46} {plain_bytes:>16.0f} {cond_bytes:>16.0f}"
+        )
+        print(f"  {'conditional statuses':<46} {statuses}")
+
+    asyncio.run(engine.finish())
+
+
+def _run_cmdline() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--commands",
+        type=int,
+        default=5000,
+        help="How many commands the simulated run should have.",
+    )
+    parser.add_argument(
+        "--polls",
+        type=int,
+        default=200,
+        help="How many times to poll each route. The median latency is reported.",
+    )
+    args = parser.parse_args()
+    _benchmark(args.commands, args.polls)
+
+
+if __name__ == "__main__":
+    _run_cmdline()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+"""Measure how long it takes to rehydrate a ProtocolStore with many protocols.
+
+On boot, the server rehydrates its ProtocolStore before it can answer any protocol
+requests. This script fills a temporary persistence directory with stored protocols
+and times rehydrating it three ways: without a protocol source cache, with a cache
+that's still empty (the first boot after an update), and with a warm cache.
+
+Note: robot-server must be importable when you run this.
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional
+
+import sqlalchemy
+
+from opentrons.protocol_reader import ProtocolReader
+from opentrons_shared_data import load_shared_data
+
+from robot_server.persistence.database import sql_engine_ctx
+from robot_server.persistence.file_and_directory_names import (
+    DB_FILE,
+    PROTOCOLS_DIRECTORY,
+    PROTOCOL_SOURCE_CACHE_FILE,
+)
+from robot_server.persistence.tables import metadata
+from robot_server.protocols.protocol_models import ProtocolKind
+from robot_server.protocols.protocol_store import ProtocolResource, ProtocolStore
+
+_JSON_PROTOCOL = load_shared_data("protocol/fixtures/8/simpleV8.json")
+
+
+def _python_protocol(index: int, transfers: int) -> str:
+    lines = [
+        f'metadata = {{"protocolName": "Benchmark protocol {index}"}}',
+        'requirements = {"robotType": "Flex", "apiLevel": "2.20"}',
+        "",
+        "def run(ctx):",
+        '    tips = ctx.load_labware("opentrons_flex_96_tiprack_200ul", "A1")',
+        '    plate = ctx.load_labware("nest_96_wellplate_200ul_flat", "B1")',
+        '    pipette = ctx.load_instrument("flex_1channel_1000", "left", tip_racks=[tips])',
+    ]
+    for transfer in range(transfers):
+        lines.append(
+            f'    pipette.transfer({transfer % 100 + 1}, plate["A1"],'
+            f' plate.wells()[{transfer % 96}], new_tip="always")'
+        )
+    return "\n".join(lines) + "\n"
+
+
+async def _store_protocols(
+    persistence_directory: Path,
+    engine: sqlalchemy.engine.Engine,
+    count: int,
+    transfers: int,
+) -> None:
+    protocol_store = ProtocolStore.create_empty(sql_engine=engine)
+    protocols_directory = persistence_directory / PROTOCOLS_DIRECTORY
+    for index in range(count):
+        protocol_directory = protocols_directory / f"protocol-{index}"
+        protocol_directory.mkdir(parents=True)
+        if index % 4 == 0:
+            main_file = protocol_directory / "protocol.json"
+            main_file.write_bytes(_JSON_PROTOCOL)
+        else:
+            main_file = protocol_directory / "protocol.py"
+            main_file.write_text(_python_protocol(index, transfers))
+        protocol_store.insert(
+            ProtocolResource(
+                protocol_id=f"protocol-{index}",
+                created_at=datetime.now(tz=timezone.utc),
+                source=await ProtocolReader().read_saved(
+                    files=[main_file], directory=protocol_directory
+                ),
+                protocol_key=None,
+                protocol_kind=ProtocolKind.STANDARD,
+            )
+        )
+
+
+def _time_rehydrate(
+    persistence_directory: Path,
+    engine: sqlalchemy.engine.Engine,
+    cache_file: Optional[Path],
+    repeat: int,
+    clear_cache: bool,
+) -> float:
+    """Return the median number of milliseconds that rehydrating takes."""
+    timings: List[float] = []
+    for _ in range(repeat):
+        if clear_cache and cache_file is not None:
+            cache_file.unlink(missing_ok=True)
+        start = time.perf_counter()
+        asyncio.run(
+            ProtocolStore.rehydrate(
+                sql_engine=engine,
+                protocols_directory=persistence_directory / PROTOCOLS_DIRECTORY,
+                protocol_reader=ProtocolReader(),
+                protocol_source_cache_file=cache_file,
+            )
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def _benchmark(count: int, transfers: int, repeat: int) -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        persistence_directory = Path(temp_dir)
+        cache_file = persistence_directory / PROTOCOL_SOURCE_CACHE_FILE
+        with sql_engine_ctx(persistence_directory / DB_FILE) as engine:
+            metadata.create_all(engine)
+            asyncio.run(
+                _store_protocols(persistence_directory, engine, count, transfers)
+            )
+            print(f"Rehydrating {count} stored protocols (median of {repeat})")
+            no_cache = _time_rehydrate(
+                persistence_directory, engine, None, repeat, clear_cache=False
+            )
+            cold_cache = _time_rehydrate(
+                persistence_directory, engine, cache_file, repeat, clear_cache=True
+            )
+            warm_cache = _time_rehydrate(
+                persistence_directory, engine, cache_file, repeat, clear_cache=False
+            )
+            print(f"  {'without a cache':<24} {no_cache:>10.1f} ms")
+            print(f"  {'with an empty cache':<24} {cold_cache:>10.1f} ms")
+            print(
+                f"  {'with a warm cache':<24} {warm_cache:>10.1f} ms"
+                f" ({warm_cache / no_cache:.2f}x)"
+            )
+
+
+def _run_cmdline() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--protocols",
+        type=int,
+        default=300,
+        help="How many protocols to store.",
+    )
+    parser.add_argument(
+        "--transfers",
+        type=int,
+        default=200,
+        help="How many transfer() lines each Python protocol should have.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="How many times to repeat each timing. The median is reported.",
+    )
+    args = parser.parse_args()
+    _benchmark(args.protocols, args.transfers, args.repeat)
+
+
+if __name__ == "__main__":
+    _run_cmdline()
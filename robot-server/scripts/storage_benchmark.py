@@ -0,0 +1,321 @@
+#!/usr/bin/env python
+"""Compare database size and read latency between storage schemas 7 and 8.
+
+Schema 7 stores each analysis as one JSON blob and each run command as plain JSON.
+Schema 8 splits analyses into a compressed summary plus compressed command pages,
+and compresses run commands.
+
+Point this at a copy of a robot's persistence directory (for example, one pulled from
+a robot that has run our largest protocols) or at one of the snapshots in
+tests/integration/persistence_snapshots. The directory is copied and migrated in a
+temporary location; the original is left untouched.
+
+Note: robot-server must be importable when you run this.
+"""
+
+import argparse
+import asyncio
+import json
+import shutil
+import sqlite3
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple, TypeVar
+
+from opentrons.protocol_engine import Command
+
+from robot_server.persistence._folder_migrator import MigrationOrchestrator
+from robot_server.persistence._migrations import (
+    up_to_3,
+    v3_to_v4,
+    v4_to_v5,
+    v5_to_v6,
+    v6_to_v7,
+)
+from robot_server.persistence.compression import decompress_json
+from robot_server.persistence.database import sql_engine_ctx
+from robot_server.persistence.file_and_directory_names import DB_FILE
+from robot_server.persistence.persistence_directory import (
+    prepare_active_subdirectory,
+)
+from robot_server.persistence.pydantic import (
+    compressed_json_to_pydantic,
+    json_to_pydantic,
+)
+from robot_server.protocols.analysis_memcache import MemoryCache
+from robot_server.protocols.analysis_models import CompletedAnalysis
+from robot_server.protocols.completed_analysis_store import (
+    CompletedAnalysisResource,
+    CompletedAnalysisStore,
+)
+
+_V7_DIRECTORY = "7.1"
+_COMMAND_PAGE_LENGTH = 20
+
+_T = TypeVar("_T")
+
+
+def _time(func: Callable[[], _T], repeat: int) -> float:
+    """Return the median number of milliseconds that func takes."""
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def _vacuumed_size(db_file: Path) -> int:
+    """Return the size that db_file would have after a VACUUM, without modifying it."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        vacuumed = Path(temp_dir) / DB_FILE
+        connection = sqlite3.connect(db_file)
+        try:
+            connection.execute("VACUUM INTO ?", (str(vacuumed),))
+        finally:
+            connection.close()
+        return vacuumed.stat().st_size
+
+
+def _print_row(label: str, old: float, new: float, unit: str) -> None:
+    print(f"  {label:<36} {old:>12.2f} {new:>12.2f} {unit:<3} ({new / old:.2f}x)")
+
+
+def _largest_analyses(v7_db: sqlite3.Connection, count: int) -> List[Tuple[str, int]]:
+    return [
+        (row[0], row[1])
+        for row in v7_db.execute(
+            "SELECT id, length(completed_analysis) AS size FROM analysis"
+            " ORDER BY size DESC LIMIT ?",
+            (count,),
+        )
+    ]
+
+
+def _largest_runs(v7_db: sqlite3.Connection, count: int) -> List[Tuple[str, int]]:
+    return [
+        (row[0], row[1])
+        for row in v7_db.execute(
+            "SELECT run_id, count(*) AS n FROM run_command"
+            " GROUP BY run_id ORDER BY n DESC LIMIT ?",
+            (count,),
+        )
+    ]
+
+
+def _migrate_to_v7(root: Path) -> None:
+    """Migrate root to schema 7, keeping its output so it can be compared with 8."""
+    MigrationOrchestrator(
+        root=root,
+        migrations=[
+            up_to_3.MigrationUpTo3(subdirectory="3"),
+            v3_to_v4.Migration3to4(subdirectory="4"),
+            v4_to_v5.Migration4to5(subdirectory="5"),
+            v5_to_v6.Migration5to6(subdirectory="6"),
+            v6_to_v7.Migration6to7(subdirectory=_V7_DIRECTORY),
+        ],
+        temp_file_prefix="temp-",
+    ).migrate_to_latest()
+
+
+def _benchmark(root: Path, count: int, repeat: int) -> None:  # noqa: C901
+    _migrate_to_v7(root)
+    v8_dir = asyncio.run(prepare_active_subdirectory(root))
+    v7_db_file = root / _V7_DIRECTORY / DB_FILE
+    v8_db_file = v8_dir / DB_FILE
+
+    print(f"{'':<38} {'schema 7':>12} {'schema 8':>12}")
+    print("Database size")
+    _print_row(
+        "after VACUUM",
+        _vacuumed_size(v7_db_file) / 1024,
+        _vacuumed_size(v8_db_file) / 1024,
+        "KiB",
+    )
+
+    v7_db = sqlite3.connect(v7_db_file)
+    v8_db = sqlite3.connect(v8_db_file)
+
+    with sql_engine_ctx(v8_db_file) as v8_engine:
+        for analysis_id, size in _largest_analyses(v7_db, count):
+            print(f"Analysis {analysis_id} ({size / 1024:.0f} KiB of JSON)")
+
+            def read_v7_document() -> str:
+                row = v7_db.execute(
+                    "SELECT completed_analysis FROM analysis WHERE id = ?",
+                    (analysis_id,),
+                ).fetchone()
+                return str(row[0])
+
+            def read_v8_document() -> str:
+                # A fresh store each time, so that nothing is cached.
+                store = CompletedAnalysisStore(
+                    v8_engine,
+                    MemoryCache(1, str, CompletedAnalysisResource),
+                    current_analyzer_version="",
+                )
+                document = asyncio.run(store.get_by_id_as_document(analysis_id))
+                assert document is not None
+                return document
+
+            def read_v8_resource() -> CompletedAnalysisResource:
+                store = CompletedAnalysisStore(
+                    v8_engine,
+                    MemoryCache(1, str, CompletedAnalysisResource),
+                    current_analyzer_version="",
+                )
+                resource = asyncio.run(store.get_by_id(analysis_id))
+                assert resource is not None
+                return resource
+
+            def read_v7_summary() -> object:
+                return json.loads(read_v7_document())["result"]
+
+            def read_v8_summary() -> object:
+                store = CompletedAnalysisStore(
+                    v8_engine,
+                    MemoryCache(1, str, CompletedAnalysisResource),
+                    current_analyzer_version="",
+                )
+                summary = asyncio.run(store.get_summary_by_id_as_document(analysis_id))
+                assert summary is not None
+                return json.loads(summary)["result"]
+
+            def read_v7_command_page() -> List[Command]:
+                return json_to_pydantic(CompletedAnalysis, read_v7_document()).commands[
+                    :_COMMAND_PAGE_LENGTH
+                ]
+
+            def read_v8_command_page() -> List[Command]:
+                store = CompletedAnalysisStore(
+                    v8_engine,
+                    MemoryCache(1, str, CompletedAnalysisResource),
+                    current_analyzer_version="",
+                )
+                command_slice = asyncio.run(
+                    store.get_commands_slice(
+                        analysis_id, cursor=0, length=_COMMAND_PAGE_LENGTH
+                    )
+                )
+                assert command_slice is not None
+                return command_slice.commands
+
+            _print_row(
+                "read as document",
+                _time(read_v7_document, repeat),
+                _time(read_v8_document, repeat),
+                "ms",
+            )
+            _print_row(
+                "read and parse",
+                _time(
+                    lambda: json_to_pydantic(CompletedAnalysis, read_v7_document()),
+                    repeat,
+                ),
+                _time(read_v8_resource, repeat),
+                "ms",
+            )
+            _print_row(
+                "read summary fields",
+                _time(read_v7_summary, repeat),
+                _time(read_v8_summary, repeat),
+                "ms",
+            )
+            _print_row(
+                f"parse first {_COMMAND_PAGE_LENGTH} commands",
+                _time(read_v7_command_page, repeat),
+                _time(read_v8_command_page, repeat),
+                "ms",
+            )
+
+    for run_id, command_count in _largest_runs(v7_db, count):
+        print(f"Run {run_id} ({command_count} commands)")
+
+        def read_v7_page() -> List[Command]:
+            return [
+                json_to_pydantic(Command, row[0])  # type: ignore[arg-type]
+                for row in v7_db.execute(
+                    "SELECT command FROM run_command WHERE run_id = ?"
+                    " ORDER BY index_in_run DESC LIMIT ?",
+                    (run_id, _COMMAND_PAGE_LENGTH),
+                )
+            ]
+
+        def read_v8_page() -> List[Command]:
+            return [
+                compressed_json_to_pydantic(Command, row[0])  # type: ignore[arg-type]
+                for row in v8_db.execute(
+                    "SELECT command FROM run_command WHERE run_id = ?"
+                    " ORDER BY index_in_run DESC LIMIT ?",
+                    (run_id, _COMMAND_PAGE_LENGTH),
+                )
+            ]
+
+        def read_v7_all() -> List[str]:
+            return [
+                row[0]
+                for row in v7_db.execute(
+                    "SELECT command FROM run_command WHERE run_id = ?"
+                    " ORDER BY index_in_run",
+                    (run_id,),
+                )
+            ]
+
+        def read_v8_all() -> List[str]:
+            return [
+                decompress_json(row[0])
+                for row in v8_db.execute(
+                    "SELECT command FROM run_command WHERE run_id = ?"
+                    " ORDER BY index_in_run",
+                    (run_id,),
+                )
+            ]
+
+        _print_row(
+            f"parse last {_COMMAND_PAGE_LENGTH} commands",
+            _time(read_v7_page, repeat),
+            _time(read_v8_page, repeat),
+            "ms",
+        )
+        _print_row(
+            "read all commands as documents",
+            _time(read_v7_all, repeat),
+            _time(read_v8_all, repeat),
+            "ms",
+        )
+
+    v7_db.close()
+    v8_db.close()
+
+
+def _run_cmdline() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "persistence_directory",
+        type=Path,
+        help="A robot-server persistence directory at schema 7 or older.",
+    )
+    parser.add_argument(
+        "--count",
+        type=int,
+        default=3,
+        help="How many of the largest analyses and runs to time.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=10,
+        help="How many times to repeat each timing. The median is reported.",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir) / "persistence"
+        shutil.copytree(args.persistence_directory, root)
+        _benchmark(root, args.count, args.repeat)
+
+
+if __name__ == "__main__":
+    _run_cmdline()
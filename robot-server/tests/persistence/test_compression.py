@@ -0,0 +1,61 @@
+"""Tests for robot_server.persistence.compression."""
+import json
+
+import pytest
+
+from robot_server.persistence.compression import (
+    UnknownCompressionFormatError,
+    compress_json,
+    decompress_json,
+)
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        "{}",
+        json.dumps({"commandType": "home", "params": {}, "status": "succeeded"}),
+        json.dumps({"message": "non-ASCII text: µL, °C"}),
+        json.dumps([{"id": str(i), "volume": i * 1.5} for i in range(1000)]),
+    ],
+)
+def test_round_trip(document: str) -> None:
+    """It should decompress exactly what was compressed."""
+    assert decompress_json(compress_json(document)) == document
+
+
+def test_compresses_typical_command() -> None:
+    """Thanks to the preset dictionary, even a single small command should shrink."""
+    command = json.dumps(
+        {
+            "id": "d2f2d8b1-0f3f-4b3c-8d7f-8d2c4f8c3e52",
+            "createdAt": "2024-08-01T12:00:00.000000+00:00",
+            "commandType": "aspirate",
+            "key": "d2f2d8b1-0f3f-4b3c-8d7f-8d2c4f8c3e52",
+            "status": "succeeded",
+            "params": {
+                "labwareId": "labware-1",
+                "wellName": "B2",
+                "wellLocation": {
+                    "origin": "top",
+                    "offset": {"x": 0.0, "y": 0.0, "z": -1.0},
+                },
+                "flowRate": 160.0,
+                "volume": 50.0,
+                "pipetteId": "pipette-1",
+            },
+            "result": {"position": {"x": 1.0, "y": 2.0, "z": 3.0}, "volume": 50.0},
+            "startedAt": "2024-08-01T12:00:01.000000+00:00",
+            "completedAt": "2024-08-01T12:00:02.000000+00:00",
+            "intent": "protocol",
+            "notes": [],
+        }
+    )
+    assert len(compress_json(command)) < len(command) / 2
+
+
+@pytest.mark.parametrize("data", [b"", b"\x00abc", b"\xffabc"])
+def test_unknown_format(data: bytes) -> None:
+    """It should refuse to decompress data in a format it doesn't know."""
+    with pytest.raises(UnknownCompressionFormatError):
+        decompress_json(data)
@@ -21,6 +21,7 @@ from robot_server.protocols.analysis_models import (
     AnalysisStatus,
 )
 from robot_server.protocols.analysis_store import AnalysisStore
+from robot_server.protocols.analysis_worker_pool import AnalysisWorkerPool
 from robot_server.protocols.protocol_store import ProtocolResource
 from robot_server.service.task_runner import TaskRunner
 import robot_server.errors.error_mappers as em
@@ -38,6 +39,12 @@ def task_runner(decoy: Decoy) -> TaskRunner:
     return decoy.mock(cls=TaskRunner)
 
 
+@pytest.fixture
+def analysis_worker_pool(decoy: Decoy) -> AnalysisWorkerPool:
+    """Get a mocked out AnalysisWorkerPool."""
+    return decoy.mock(cls=AnalysisWorkerPool)
+
+
 @pytest.fixture(autouse=True)
 def patch_mock_create_protocol_analyzer(
     decoy: Decoy, monkeypatch: pytest.MonkeyPatch
@@ -57,15 +64,24 @@ def patch_mock_map_unexpected_error(
 
 
 @pytest.fixture
-def subject(analysis_store: AnalysisStore, task_runner: TaskRunner) -> AnalysesManager:
+def subject(
+    analysis_store: AnalysisStore,
+    task_runner: TaskRunner,
+    analysis_worker_pool: AnalysisWorkerPool,
+) -> AnalysesManager:
     """Get the Analyses Manager with mocked out dependencies."""
-    return AnalysesManager(analysis_store=analysis_store, task_runner=task_runner)
+    return AnalysesManager(
+        analysis_store=analysis_store,
+        task_runner=task_runner,
+        analysis_worker_pool=analysis_worker_pool,
+    )
 
 
 async def test_initialize_analyzer(
     decoy: Decoy,
     analysis_store: AnalysisStore,
     task_runner: TaskRunner,
+    analysis_worker_pool: AnalysisWorkerPool,
     subject: AnalysesManager,
 ) -> None:
     """It should create analyzer and load its orchestrator."""
@@ -85,6 +101,7 @@ async def test_initialize_analyzer(
         protocol_key="dummy-data-111",
         protocol_kind=ProtocolKind.STANDARD,
     )
+    decoy.when(analysis_worker_pool.uses_worker_processes).then_return(False)
     analyzer = decoy.mock(cls=protocol_analyzer.ProtocolAnalyzer)
     decoy.when(
         protocol_analyzer.create_protocol_analyzer(
@@ -107,10 +124,64 @@ async def test_initialize_analyzer(
     )
 
 
+async def test_initialize_analyzer_for_worker_processes(
+    decoy: Decoy,
+    analysis_store: AnalysisStore,
+    analysis_worker_pool: AnalysisWorkerPool,
+    subject: AnalysesManager,
+) -> None:
+    """It should only validate run time parameters when a worker will analyze."""
+    robot_type: RobotType = "OT-3 Standard"
+    protocol_resource = ProtocolResource(
+        protocol_id="protocol-id",
+        created_at=datetime(year=2021, month=1, day=1),
+        source=ProtocolSource(
+            directory=Path("/dev/null"),
+            main_file=Path("/dev/null/abc.json"),
+            config=JsonProtocolConfig(schema_version=123),
+            files=[],
+            metadata={},
+            robot_type=robot_type,
+            content_hash="abc123",
+        ),
+        protocol_key="dummy-data-111",
+        protocol_kind=ProtocolKind.STANDARD,
+    )
+    analyzer = decoy.mock(cls=protocol_analyzer.ProtocolAnalyzer)
+    decoy.when(
+        protocol_analyzer.create_protocol_analyzer(
+            analysis_store=analysis_store,
+            protocol_resource=protocol_resource,
+        )
+    ).then_return(analyzer)
+    decoy.when(analysis_worker_pool.uses_worker_processes).then_return(True)
+
+    await subject.initialize_analyzer(
+        analysis_id="analysis-id",
+        protocol_resource=protocol_resource,
+        run_time_param_values={"sample_count": 123},
+        run_time_param_paths={"my_file": Path("file-path")},
+    )
+    decoy.verify(
+        await analyzer.validate_run_time_parameters(
+            run_time_param_values={"sample_count": 123},
+            run_time_param_paths={"my_file": Path("file-path")},
+        )
+    )
+    decoy.verify(
+        await analyzer.load_orchestrator(
+            run_time_param_values=matchers.Anything(),
+            run_time_param_paths=matchers.Anything(),
+        ),
+        times=0,
+    )
+
+
 async def test_raises_error_and_saves_result_if_initialization_errors(
     decoy: Decoy,
     analysis_store: AnalysisStore,
     task_runner: TaskRunner,
+    analysis_worker_pool: AnalysisWorkerPool,
     subject: AnalysesManager,
 ) -> None:
     """It should save the result to analysis store and re-raise error when analyzer initialization errors out."""
@@ -135,6 +206,7 @@ async def test_raises_error_and_saves_result_if_initialization_errors(
         code=ErrorCodes.GENERAL_ERROR,
         message="You got me!!",
     )
+    decoy.when(analysis_worker_pool.uses_worker_processes).then_return(False)
     analyzer = decoy.mock(cls=protocol_analyzer.ProtocolAnalyzer)
     decoy.when(
         protocol_analyzer.create_protocol_analyzer(
@@ -180,6 +252,7 @@ async def test_start_analysis(
     decoy: Decoy,
     analysis_store: AnalysisStore,
     task_runner: TaskRunner,
+    analysis_worker_pool: AnalysisWorkerPool,
     subject: AnalysesManager,
 ) -> None:
     """It should start protocol analysis and return summary with run time parameters."""
@@ -224,7 +297,8 @@ async def test_start_analysis(
             run_time_parameters=[bool_parameter],
         ),
         task_runner.run(
-            analyzer.analyze,
+            analysis_worker_pool.analyze,
             analysis_id="analysis-id",
+            analyzer=analyzer,
         ),
     )
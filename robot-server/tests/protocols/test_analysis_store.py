@@ -24,6 +24,7 @@ from opentrons_shared_data.errors import ErrorCodes
 
 from opentrons.types import MountType, DeckSlotName
 from opentrons.protocol_engine import (
+    CommandSlice,
     commands as pe_commands,
     errors as pe_errors,
     types as pe_types,
@@ -181,6 +182,11 @@ async def test_add_pending(
     with pytest.raises(AnalysisNotFoundError, match="analysis-id"):
         # Unlike get(), get_as_document() should raise if the analysis is pending.
         await subject.get_as_document("analysis-id")
+    with pytest.raises(AnalysisNotFoundError, match="analysis-id"):
+        await subject.get_summary_as_document("analysis-id")
+    assert await subject.get_commands_slice(
+        "analysis-id", cursor=0, length=20
+    ) == CommandSlice(commands=[], cursor=0, total_length=0)
 
 
 async def test_returned_in_order_added(
@@ -270,6 +276,7 @@ async def test_update_adds_details_and_completes_analysis(
 
     result = await subject.get("analysis-id")
     result_as_document = await subject.get_as_document("analysis-id")
+    result_summary_as_document = await subject.get_summary_as_document("analysis-id")
 
     assert result == CompletedAnalysis(
         id="analysis-id",
@@ -317,6 +324,49 @@ async def test_update_adds_details_and_completes_analysis(
         "liquids": [],
         "modules": [],
     }
+    assert json.loads(result_summary_as_document) == {
+        key: value
+        for key, value in json.loads(result_as_document).items()
+        if key != "commands"
+    }
+
+
+async def test_get_commands_slice(
+    subject: AnalysisStore, protocol_store: ProtocolStore
+) -> None:
+    """It should return a slice of a completed analysis's commands."""
+    protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
+    commands: List[pe_commands.Command] = [
+        pe_commands.Comment(
+            id=f"command-{i}",
+            key=f"command-key-{i}",
+            status=pe_commands.CommandStatus.SUCCEEDED,
+            createdAt=datetime(year=2024, month=1, day=1, tzinfo=timezone.utc),
+            params=pe_commands.CommentParams(message=f"comment {i}"),
+            result=pe_commands.CommentResult(),
+        )
+        for i in range(3)
+    ]
+    subject.add_pending(
+        protocol_id="protocol-id", analysis_id="analysis-id", run_time_parameters=[]
+    )
+    await subject.update(
+        analysis_id="analysis-id",
+        robot_type="OT-2 Standard",
+        run_time_parameters=[],
+        labware=[],
+        modules=[],
+        pipettes=[],
+        commands=commands,
+        errors=[],
+        liquids=[],
+    )
+
+    assert await subject.get_commands_slice(
+        "analysis-id", cursor=1, length=5
+    ) == CommandSlice(commands=commands[1:], cursor=1, total_length=3)
+    with pytest.raises(AnalysisNotFoundError, match="other-analysis-id"):
+        await subject.get_commands_slice("other-analysis-id", cursor=0, length=5)
 
 
 async def test_update_adds_rtp_values_to_completed_store(
@@ -0,0 +1,165 @@
+"""Tests for the AnalysisWorkerPool interface.
+
+Apart from the in-process fallback, these run real worker processes.
+"""
+import asyncio
+import textwrap
+from pathlib import Path
+
+import pytest
+from decoy import Decoy, matchers
+
+from opentrons.protocol_reader import ProtocolReader
+
+from robot_server.protocols.analysis_worker_pool import (
+    AnalysisTimedOutError,
+    AnalysisWorkerCrashedError,
+    AnalysisWorkerPool,
+)
+from robot_server.protocols.protocol_analyzer import (
+    AnalysisJob,
+    AnalysisOutcome,
+    ProtocolAnalyzer,
+)
+from robot_server.protocols.protocol_store import ProtocolResource
+
+
+async def _make_job(tmp_path: Path, run_body: str) -> AnalysisJob:
+    protocol_file = tmp_path / "protocol.py"
+    protocol_file.write_text(
+        'requirements = {"robotType": "OT-2", "apiLevel": "2.15"}\n'
+        "def run(ctx):\n" + textwrap.indent(textwrap.dedent(run_body), "    ")
+    )
+    protocol_source = await ProtocolReader().read_saved(
+        files=[protocol_file], directory=None
+    )
+    return AnalysisJob(
+        protocol_source=protocol_source,
+        run_time_param_values=None,
+        run_time_param_paths=None,
+    )
+
+
+def _mock_analyzer(decoy: Decoy, job: AnalysisJob) -> ProtocolAnalyzer:
+    analyzer = decoy.mock(cls=ProtocolAnalyzer)
+    protocol_resource = decoy.mock(cls=ProtocolResource)
+    decoy.when(protocol_resource.source).then_return(job.protocol_source)
+    decoy.when(analyzer.protocol_resource).then_return(protocol_resource)
+    decoy.when(analyzer.get_analysis_job()).then_return(job)
+    decoy.when(analyzer.get_verified_run_time_parameters()).then_return([])
+    return analyzer
+
+
+async def test_analyze_in_process(decoy: Decoy) -> None:
+    """With only one worker, it should analyze in the server's own process."""
+    analyzer = decoy.mock(cls=ProtocolAnalyzer)
+    subject = AnalysisWorkerPool(worker_count=1, timeout=None)
+
+    await subject.analyze(analysis_id="analysis-id", analyzer=analyzer)
+
+    decoy.verify(await analyzer.analyze(analysis_id="analysis-id"), times=1)
+    decoy.verify(analyzer.get_analysis_job(), times=0)
+
+
+async def test_analyze_in_worker(decoy: Decoy, tmp_path: Path) -> None:
+    """It should analyze in worker processes, reusing them between analyses."""
+    job = await _make_job(tmp_path, 'ctx.comment("hello")\nctx.comment("world")\n')
+    analyzer = _mock_analyzer(decoy, job)
+    outcome_captor = matchers.Captor()
+    subject = AnalysisWorkerPool(worker_count=2, timeout=None)
+
+    try:
+        await asyncio.gather(
+            subject.analyze(analysis_id="analysis-id-1", analyzer=analyzer),
+            subject.analyze(analysis_id="analysis-id-2", analyzer=analyzer),
+        )
+        await subject.analyze(analysis_id="analysis-id-3", analyzer=analyzer)
+        workers = list(subject._idle_workers)
+        assert len(workers) == 2
+    finally:
+        subject.close()
+
+    assert all(worker._connection.closed for worker in workers)
+
+    decoy.verify(await analyzer.analyze(analysis_id=matchers.Anything()), times=0)
+    decoy.verify(
+        await analyzer.save_outcome(
+            analysis_id=matchers.Anything(), outcome=outcome_captor
+        ),
+        times=3,
+    )
+    for outcome in outcome_captor.values:
+        assert isinstance(outcome, AnalysisOutcome)
+        assert outcome.errors == []
+        assert [c.commandType for c in outcome.commands][-2:] == ["comment", "comment"]
+
+
+@pytest.mark.parametrize(
+    ("run_body", "timeout", "expected_error"),
+    [
+        ("import time\ntime.sleep(60)\n", 2.0, AnalysisTimedOutError),
+        ("import os\nos._exit(1)\n", None, AnalysisWorkerCrashedError),
+    ],
+)
+async def test_analysis_failures(
+    decoy: Decoy,
+    tmp_path: Path,
+    run_body: str,
+    timeout: float,
+    expected_error: type,
+) -> None:
+    """It should record a failed analysis and replace the worker."""
+    job = await _make_job(tmp_path, run_body)
+    analyzer = _mock_analyzer(decoy, job)
+    subject = AnalysisWorkerPool(worker_count=2, timeout=timeout)
+
+    try:
+        await subject.analyze(analysis_id="analysis-id", analyzer=analyzer)
+        assert subject._idle_workers == []
+    finally:
+        subject.close()
+
+    decoy.verify(
+        await analyzer.update_to_failed_analysis(
+            analysis_id="analysis-id",
+            protocol_robot_type="OT-2 Standard",
+            error=matchers.IsA(expected_error),
+            run_time_parameters=[],
+        ),
+        times=1,
+    )
+
+
+async def test_cancel(decoy: Decoy, tmp_path: Path) -> None:
+    """Cancelling an analysis should stop its worker and leave it pending."""
+    job = await _make_job(tmp_path, "import time\ntime.sleep(60)\n")
+    analyzer = _mock_analyzer(decoy, job)
+    subject = AnalysisWorkerPool(worker_count=2, timeout=None)
+
+    task = asyncio.create_task(
+        subject.analyze(analysis_id="analysis-id", analyzer=analyzer)
+    )
+    await asyncio.sleep(1)
+    task.cancel()
+    [worker] = subject._busy_workers
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert worker._connection.closed
+    assert subject._idle_workers == []
+    assert subject._busy_workers == set()
+
+    decoy.verify(
+        await analyzer.save_outcome(
+            analysis_id=matchers.Anything(), outcome=matchers.Anything()
+        ),
+        times=0,
+    )
+    decoy.verify(
+        await analyzer.update_to_failed_analysis(
+            analysis_id=matchers.Anything(),
+            protocol_robot_type=matchers.Anything(),
+            error=matchers.Anything(),
+            run_time_parameters=matchers.Anything(),
+        ),
+        times=0,
+    )
@@ -14,9 +14,11 @@ from robot_server.persistence.tables import (
     analysis_csv_rtp_table,
 )
 from robot_server.protocols.completed_analysis_store import (
+    COMMANDS_PER_PAGE,
     CompletedAnalysisResource,
     CompletedAnalysisStore,
 )
+from opentrons.protocol_engine import CommandSlice, commands as pe_commands
 from opentrons.protocol_reader import (
     ProtocolSource,
     JsonProtocolConfig,
@@ -125,6 +127,20 @@ def _completed_analysis_resource(
     )
 
 
+def _comment_commands(count: int) -> List[pe_commands.Command]:
+    return [
+        pe_commands.Comment(
+            id=f"command-{i}",
+            key=f"command-key-{i}",
+            status=pe_commands.CommandStatus.SUCCEEDED,
+            createdAt=datetime(year=2024, month=1, day=1, tzinfo=timezone.utc),
+            params=pe_commands.CommentParams(message=f"comment {i}"),
+            result=pe_commands.CommentResult(),
+        )
+        for i in range(count)
+    ]
+
+
 async def test_get_by_analysis_id_prefers_cache(
     subject: CompletedAnalysisStore,
     memcache: MemoryCache[str, CompletedAnalysisResource],
@@ -210,6 +226,136 @@ async def test_get_by_analysis_id_as_document(
     }
 
 
+async def test_get_analysis_with_many_commands(
+    subject: CompletedAnalysisStore,
+    memcache: MemoryCache[str, CompletedAnalysisResource],
+    protocol_store: ProtocolStore,
+    decoy: Decoy,
+) -> None:
+    """It should round-trip analyses whose commands span several pages."""
+    commands = _comment_commands(COMMANDS_PER_PAGE * 2 + 1)
+    resource = _completed_analysis_resource("analysis-id", "protocol-id")
+    resource.completed_analysis.commands = commands
+    protocol_store.insert(make_dummy_protocol_resource("protocol-id"))
+    await subject.make_room_and_add(
+        completed_analysis_resource=resource,
+        primitive_rtp_resources=[],
+        csv_rtp_resources=[],
+    )
+    decoy.when(memcache.get("analysis-id")).then_raise(KeyError())
+
+    assert await subject.get_by_id("analysis-id") == resource
+
+    document = await subject.get_by_id_as_document("analysis-id")
+    assert document is not None
+    assert [c["id"] for c in json.loads(document)["commands"]] == [
+        c.id for c in commands
+    ]
+
+
+async def test_get_summary_by_id_as_document(
+    subject: CompletedAnalysisStore,
+    protocol_store: ProtocolStore,
+) -> None:
+    """It should return the analysis without its commands."""
+    resource = _completed_analysis_resource("analysis-id", "protocol-id")
+    resource.completed_analysis.commands = _comment_commands(3)
+    protocol_store.insert(make_dummy_protocol_resource("protocol-id"))
+    await subject.make_room_and_add(
+        completed_analysis_resource=resource,
+        primitive_rtp_resources=[],
+        csv_rtp_resources=[],
+    )
+
+    summary = await subject.get_summary_by_id_as_document("analysis-id")
+    assert summary is not None
+    assert json.loads(summary) == {
+        "id": "analysis-id",
+        "result": "ok",
+        "status": "completed",
+        "errors": [],
+        "liquids": [],
+        "labware": [],
+        "modules": [],
+        "pipettes": [],
+        "runTimeParameters": [],
+    }
+    assert await subject.get_summary_by_id_as_document("other-analysis-id") is None
+
+
+@pytest.mark.parametrize(
+    ("cursor", "length", "expected_cursor", "expected_indices"),
+    [
+        (0, 3, 0, range(0, 3)),
+        # Spanning the boundary between two pages.
+        (COMMANDS_PER_PAGE - 2, 4, COMMANDS_PER_PAGE - 2, range(198, 202)),
+        (COMMANDS_PER_PAGE * 2, 10, COMMANDS_PER_PAGE * 2, range(400, 401)),
+        # Out-of-range cursors are clamped.
+        (-5, 2, 0, range(0, 2)),
+        (99999, 10, COMMANDS_PER_PAGE * 2, range(400, 401)),
+    ],
+)
+async def test_get_commands_slice(
+    subject: CompletedAnalysisStore,
+    memcache: MemoryCache[str, CompletedAnalysisResource],
+    protocol_store: ProtocolStore,
+    decoy: Decoy,
+    cursor: int,
+    length: int,
+    expected_cursor: int,
+    expected_indices: range,
+) -> None:
+    """It should read just the requested commands from their pages."""
+    assert COMMANDS_PER_PAGE == 200, "Update the expected indices."
+    commands = _comment_commands(COMMANDS_PER_PAGE * 2 + 1)
+    resource = _completed_analysis_resource("analysis-id", "protocol-id")
+    resource.completed_analysis.commands = commands
+    protocol_store.insert(make_dummy_protocol_resource("protocol-id"))
+    await subject.make_room_and_add(
+        completed_analysis_resource=resource,
+        primitive_rtp_resources=[],
+        csv_rtp_resources=[],
+    )
+    decoy.when(memcache.get("analysis-id")).then_raise(KeyError())
+
+    result = await subject.get_commands_slice(
+        "analysis-id", cursor=cursor, length=length
+    )
+
+    assert result == CommandSlice(
+        commands=[commands[i] for i in expected_indices],
+        cursor=expected_cursor,
+        total_length=len(commands),
+    )
+
+
+async def test_get_commands_slice_prefers_cache(
+    subject: CompletedAnalysisStore,
+    memcache: MemoryCache[str, CompletedAnalysisResource],
+    decoy: Decoy,
+) -> None:
+    """It should slice a cached analysis's commands without using SQL."""
+    commands = _comment_commands(5)
+    resource = _completed_analysis_resource("analysis-id", "protocol-id")
+    resource.completed_analysis.commands = commands
+    decoy.when(memcache.get("analysis-id")).then_return(resource)
+
+    result = await subject.get_commands_slice("analysis-id", cursor=1, length=2)
+
+    assert result == CommandSlice(commands=commands[1:3], cursor=1, total_length=5)
+
+
+async def test_get_commands_slice_not_found(
+    subject: CompletedAnalysisStore,
+    memcache: MemoryCache[str, CompletedAnalysisResource],
+    decoy: Decoy,
+) -> None:
+    """It should return None if the analysis doesn't exist."""
+    decoy.when(memcache.get("analysis-id")).then_raise(KeyError())
+
+    assert await subject.get_commands_slice("analysis-id", cursor=0, length=20) is None
+
+
 async def test_get_ids_by_protocol(
     subject: CompletedAnalysisStore, protocol_store: ProtocolStore
 ) -> None:
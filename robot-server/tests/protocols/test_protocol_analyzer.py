@@ -1,6 +1,8 @@
 """Tests for the ProtocolAnalyzer."""
+import textwrap
+
 import pytest
-from decoy import Decoy
+from decoy import Decoy, matchers
 from datetime import datetime
 from pathlib import Path
 
@@ -19,6 +21,7 @@ from opentrons.protocol_engine import (
 import opentrons.protocol_runner as protocol_runner
 import opentrons.protocol_runner.create_simulating_orchestrator as simulating_runner
 from opentrons.protocol_reader import (
+    ProtocolReader,
     ProtocolSource,
     JsonProtocolConfig,
     PythonProtocolConfig,
@@ -30,7 +33,7 @@ import opentrons.util.helpers as datetime_helper
 from robot_server.protocols.analysis_store import AnalysisStore
 from robot_server.protocols.protocol_models import ProtocolKind
 from robot_server.protocols.protocol_store import ProtocolResource
-from robot_server.protocols.protocol_analyzer import ProtocolAnalyzer
+from robot_server.protocols.protocol_analyzer import AnalysisJob, ProtocolAnalyzer
 import robot_server.errors.error_mappers as em
 
 from opentrons_shared_data.errors import EnumeratedError, ErrorCodes
@@ -116,6 +119,97 @@ async def test_load_orchestrator(
     )
 
 
+async def _read_python_protocol(tmp_path: Path) -> ProtocolSource:
+    protocol_file = tmp_path / "protocol.py"
+    protocol_file.write_text(
+        textwrap.dedent(
+            """\
+            requirements = {"robotType": "OT-2", "apiLevel": "2.18"}
+
+            def add_parameters(parameters):
+                parameters.add_int(
+                    display_name="Sample count",
+                    variable_name="sample_count",
+                    default=1,
+                    minimum=1,
+                    maximum=10,
+                )
+
+            def run(ctx):
+                pass
+            """
+        )
+    )
+    return await ProtocolReader().read_saved(files=[protocol_file], directory=None)
+
+
+async def test_validate_run_time_parameters(
+    decoy: Decoy,
+    analysis_store: AnalysisStore,
+    tmp_path: Path,
+) -> None:
+    """It should validate run time parameters without loading an orchestrator."""
+    protocol_source = await _read_python_protocol(tmp_path)
+    protocol_resource = ProtocolResource(
+        protocol_id="protocol-id",
+        created_at=datetime(year=2021, month=1, day=1),
+        source=protocol_source,
+        protocol_key="dummy-data-111",
+        protocol_kind=ProtocolKind.STANDARD,
+    )
+    subject = ProtocolAnalyzer(
+        analysis_store=analysis_store, protocol_resource=protocol_resource
+    )
+
+    await subject.validate_run_time_parameters(
+        run_time_param_values={"sample_count": 5},
+        run_time_param_paths={},
+    )
+
+    [parameter] = subject.get_verified_run_time_parameters()
+    assert isinstance(parameter, pe_types.NumberParameter)
+    assert parameter.variableName == "sample_count"
+    assert parameter.value == 5
+    assert subject.get_analysis_job() == AnalysisJob(
+        protocol_source=protocol_source,
+        run_time_param_values={"sample_count": 5},
+        run_time_param_paths={},
+    )
+    decoy.verify(
+        await simulating_runner.create_simulating_orchestrator(
+            robot_type=matchers.Anything(), protocol_config=matchers.Anything()
+        ),
+        times=0,
+    )
+
+
+async def test_validate_invalid_run_time_parameters(
+    analysis_store: AnalysisStore,
+    tmp_path: Path,
+) -> None:
+    """It should raise, keeping the parameters it validated with default values."""
+    protocol_resource = ProtocolResource(
+        protocol_id="protocol-id",
+        created_at=datetime(year=2021, month=1, day=1),
+        source=await _read_python_protocol(tmp_path),
+        protocol_key="dummy-data-111",
+        protocol_kind=ProtocolKind.STANDARD,
+    )
+    subject = ProtocolAnalyzer(
+        analysis_store=analysis_store, protocol_resource=protocol_resource
+    )
+
+    with pytest.raises(Exception):
+        await subject.validate_run_time_parameters(
+            run_time_param_values={"sample_count": 100},
+            run_time_param_paths={},
+        )
+
+    [parameter] = subject.get_verified_run_time_parameters()
+    assert isinstance(parameter, pe_types.NumberParameter)
+    assert parameter.value == 1
+
+
 async def test_analyze(
     decoy: Decoy,
     analysis_store: AnalysisStore,
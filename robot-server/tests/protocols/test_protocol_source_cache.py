@@ -0,0 +1,153 @@
+"""Tests for the ProtocolSourceCache interface."""
+from pathlib import Path
+
+import pytest
+
+from opentrons.protocols.api_support.types import APIVersion
+from opentrons.protocol_reader import (
+    JsonProtocolConfig,
+    ProtocolFileRole,
+    ProtocolSource,
+    ProtocolSourceFile,
+    PythonProtocolConfig,
+)
+
+from robot_server.protocols import protocol_source_cache
+from robot_server.protocols.protocol_source_cache import ProtocolSourceCache
+
+
+def _make_source(directory: Path, content_hash: str = "hash") -> ProtocolSource:
+    return ProtocolSource(
+        directory=directory,
+        main_file=directory / "protocol.py",
+        content_hash=content_hash,
+        files=[
+            ProtocolSourceFile(
+                path=directory / "protocol.py", role=ProtocolFileRole.MAIN
+            ),
+            ProtocolSourceFile(
+                path=directory / "labware.json", role=ProtocolFileRole.LABWARE
+            ),
+        ],
+        metadata={"protocolName": "My protocol", "tags": ["a", "b"]},
+        robot_type="OT-3 Standard",
+        config=PythonProtocolConfig(api_version=APIVersion(2, 20)),
+    )
+
+
+@pytest.fixture
+def cache_file(tmp_path: Path) -> Path:
+    """Return a path for the cache file, which does not exist yet."""
+    return tmp_path / "protocol_sources.json"
+
+
+async def test_round_trip(cache_file: Path, tmp_path: Path) -> None:
+    """It should return saved sources, relocated to the protocol's current directory."""
+    json_source = ProtocolSource(
+        directory=tmp_path / "old" / "json-id",
+        main_file=tmp_path / "old" / "json-id" / "protocol.json",
+        content_hash="json-hash",
+        files=[
+            ProtocolSourceFile(
+                path=tmp_path / "old" / "json-id" / "protocol.json",
+                role=ProtocolFileRole.MAIN,
+            )
+        ],
+        metadata={},
+        robot_type="OT-2 Standard",
+        config=JsonProtocolConfig(schema_version=6),
+    )
+    writer = ProtocolSourceCache(cache_file)
+    await writer.load()
+    await writer.save(
+        {
+            "python-id": _make_source(tmp_path / "old" / "python-id"),
+            "json-id": json_source,
+        }
+    )
+
+    subject = ProtocolSourceCache(cache_file)
+    await subject.load()
+
+    assert subject.get(
+        protocol_id="python-id",
+        directory=tmp_path / "new" / "python-id",
+        content_hash="hash",
+    ) == _make_source(tmp_path / "new" / "python-id")
+    assert (
+        subject.get(
+            protocol_id="json-id",
+            directory=tmp_path / "old" / "json-id",
+            content_hash="json-hash",
+        )
+        == json_source
+    )
+
+
+async def test_get_changed_or_missing(cache_file: Path, tmp_path: Path) -> None:
+    """It should not return records for unknown or changed protocols."""
+    writer = ProtocolSourceCache(cache_file)
+    await writer.save({"protocol-id": _make_source(tmp_path)})
+
+    subject = ProtocolSourceCache(cache_file)
+    await subject.load()
+
+    assert (
+        subject.get(protocol_id="protocol-id", directory=tmp_path, content_hash="new")
+        is None
+    )
+    assert (
+        subject.get(protocol_id="other-id", directory=tmp_path, content_hash="hash")
+        is None
+    )
+
+
+@pytest.mark.parametrize("contents", ["", "{not json", '{"reader_version": 1}'])
+async def test_load_unreadable(cache_file: Path, tmp_path: Path, contents: str) -> None:
+    """It should treat an unreadable cache file as empty, and replace it on save."""
+    cache_file.write_text(contents)
+    subject = ProtocolSourceCache(cache_file)
+    await subject.load()
+
+    assert (
+        subject.get(protocol_id="protocol-id", directory=tmp_path, content_hash="hash")
+        is None
+    )
+
+    await subject.save({"protocol-id": _make_source(tmp_path)})
+    reloaded = ProtocolSourceCache(cache_file)
+    await reloaded.load()
+    assert reloaded.get(
+        protocol_id="protocol-id", directory=tmp_path, content_hash="hash"
+    ) == _make_source(tmp_path)
+
+
+async def test_load_other_version(
+    cache_file: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """It should ignore records written by another software version."""
+    monkeypatch.setattr(protocol_source_cache, "_CURRENT_READER_VERSION", "1:old")
+    writer = ProtocolSourceCache(cache_file)
+    await writer.save({"protocol-id": _make_source(tmp_path)})
+    monkeypatch.undo()
+
+    subject = ProtocolSourceCache(cache_file)
+    await subject.load()
+
+    assert (
+        subject.get(protocol_id="protocol-id", directory=tmp_path, content_hash="hash")
+        is None
+    )
+
+
+async def test_save_unchanged(cache_file: Path, tmp_path: Path) -> None:
+    """It should not rewrite the cache file if nothing has changed."""
+    writer = ProtocolSourceCache(cache_file)
+    await writer.save({"protocol-id": _make_source(tmp_path)})
+    modified_at = cache_file.stat().st_mtime_ns
+
+    subject = ProtocolSourceCache(cache_file)
+    await subject.load()
+    await subject.save({"protocol-id": _make_source(tmp_path / "elsewhere")})
+
+    assert cache_file.stat().st_mtime_ns == modified_at
@@ -4,12 +4,14 @@ import pytest
 from decoy import Decoy
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
 
 from opentrons.protocols.api_support.types import APIVersion
 from opentrons.protocol_reader import (
     ProtocolSource,
     ProtocolSourceFile,
     ProtocolFileRole,
+    ProtocolReader,
     JsonProtocolConfig,
     PythonProtocolConfig,
 )
@@ -250,6 +252,64 @@ async def test_remove_protocol(
         subject.get("protocol-id")
 
 
+class _CountingProtocolReader(ProtocolReader):
+    """A real ProtocolReader that counts how many protocols it's read."""
+
+    read_count = 0
+
+    async def read_saved(self, *args: Any, **kwargs: Any) -> ProtocolSource:
+        self.read_count += 1
+        return await super().read_saved(*args, **kwargs)
+
+
+async def test_rehydrate_with_protocol_source_cache(
+    sql_engine: SQLEngine, tmp_path: Path
+) -> None:
+    """It should only read protocols whose files changed since the last rehydrate."""
+    protocols_directory = tmp_path / "protocols"
+    protocol_directory = protocols_directory / "protocol-id"
+    protocol_directory.mkdir(parents=True)
+    main_file = protocol_directory / "protocol.py"
+    main_file.write_text(
+        'requirements = {"robotType": "OT-2", "apiLevel": "2.15"}\n'
+        "def run(ctx): pass\n"
+    )
+    protocol_source_cache_file = tmp_path / "protocol_sources.json"
+
+    ProtocolStore.create_empty(sql_engine=sql_engine).insert(
+        ProtocolResource(
+            protocol_id="protocol-id",
+            created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+            source=await ProtocolReader().read_saved(
+                files=[main_file], directory=protocol_directory
+            ),
+            protocol_key=None,
+            protocol_kind=ProtocolKind.STANDARD,
+        )
+    )
+
+    async def rehydrate_and_count_reads() -> int:
+        protocol_reader = _CountingProtocolReader()
+        subject = await ProtocolStore.rehydrate(
+            sql_engine=sql_engine,
+            protocols_directory=protocols_directory,
+            protocol_reader=protocol_reader,
+            protocol_source_cache_file=protocol_source_cache_file,
+        )
+        assert subject.get("protocol-id").source == await ProtocolReader().read_saved(
+            files=[main_file], directory=protocol_directory
+        )
+        return protocol_reader.read_count
+
+    assert await rehydrate_and_count_reads() == 1
+    assert protocol_source_cache_file.exists()
+    assert await rehydrate_and_count_reads() == 0
+
+    main_file.write_text(main_file.read_text() + "# Changed.\n")
+    assert await rehydrate_and_count_reads() == 1
+    assert await rehydrate_and_count_reads() == 0
+
+
 def test_remove_missing_protocol_raises(
     subject: ProtocolStore,
 ) -> None:
@@ -290,6 +350,43 @@ def test_remove_protocol_conflict(
         subject.remove("protocol-id")
 
 
+def test_remove_protocol_used_by_hidden_run(
+    run_store: RunStore,
+    subject: ProtocolStore,
+) -> None:
+    """A run that's hidden for removal should not keep its protocol in use."""
+    protocol_resource = ProtocolResource(
+        protocol_id="protocol-id",
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+        source=ProtocolSource(
+            directory=None,
+            main_file=Path("/dev/null"),
+            config=JsonProtocolConfig(schema_version=123),
+            files=[],
+            metadata={},
+            robot_type="OT-2 Standard",
+            content_hash="abc123",
+        ),
+        protocol_key=None,
+        protocol_kind=ProtocolKind.STANDARD,
+    )
+
+    subject.insert(protocol_resource)
+    run_store.insert(
+        run_id="run-id",
+        protocol_id="protocol-id",
+        created_at=datetime(year=2022, month=2, day=2, tzinfo=timezone.utc),
+    )
+    run_store.hide_for_removal({"run-id"})
+
+    assert subject.get_usage_info() == [
+        ProtocolUsageInfo(protocol_id="protocol-id", is_used_by_run=False)
+    ]
+    assert subject.get_referencing_run_ids("protocol-id") == []
+    subject.remove("protocol-id")
+    assert subject.has("protocol-id") is False
+
+
 def test_get_usage_info(
     subject: ProtocolStore,
     run_store: RunStore,
@@ -378,6 +475,41 @@ def test_get_usage_info(
     ]
 
 
+def test_get_usage_info_by_protocol_kind(subject: ProtocolStore) -> None:
+    """It should only return protocols of the given kind, if one is given."""
+    for protocol_id, protocol_kind in [
+        ("protocol-id-1", ProtocolKind.STANDARD),
+        ("protocol-id-2", ProtocolKind.QUICK_TRANSFER),
+        ("protocol-id-3", ProtocolKind.STANDARD),
+    ]:
+        subject.insert(
+            ProtocolResource(
+                protocol_id=protocol_id,
+                created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+                source=ProtocolSource(
+                    directory=None,
+                    main_file=Path("/dev/null"),
+                    config=JsonProtocolConfig(schema_version=123),
+                    files=[],
+                    metadata={},
+                    robot_type="OT-2 Standard",
+                    content_hash="abc123",
+                ),
+                protocol_key=None,
+                protocol_kind=protocol_kind,
+            )
+        )
+
+    assert subject.get_usage_info(protocol_kind=ProtocolKind.STANDARD) == [
+        ProtocolUsageInfo(protocol_id="protocol-id-1", is_used_by_run=False),
+        ProtocolUsageInfo(protocol_id="protocol-id-3", is_used_by_run=False),
+    ]
+    assert subject.get_usage_info(protocol_kind=ProtocolKind.QUICK_TRANSFER) == [
+        ProtocolUsageInfo(protocol_id="protocol-id-2", is_used_by_run=False),
+    ]
+    assert len(subject.get_usage_info()) == 3
+
+
 def test_get_referencing_run_ids(
     subject: ProtocolStore,
     run_store: RunStore,
@@ -8,6 +8,7 @@ from decoy import Decoy, matchers
 from fastapi import HTTPException, UploadFile
 from pathlib import Path
 
+from opentrons.protocol_engine import CommandSlice, commands as pe_commands
 from opentrons.protocol_engine.types import (
     PrimitiveRunTimeParamValuesType,
     NumberParameter,
@@ -76,6 +77,8 @@ from robot_server.protocols.router import (
     get_protocol_analyses,
     get_protocol_analysis_by_id,
     get_protocol_analysis_as_document,
+    get_protocol_analysis_summary_as_document,
+    get_protocol_analysis_commands,
     get_protocol_data_files,
 )
 
@@ -1658,6 +1661,112 @@ async def test_get_protocol_analysis_as_document_analysis_not_found(
     assert exc_info.value.content["errors"][0]["id"] == "AnalysisNotFound"
 
 
+async def test_get_protocol_analysis_summary_as_document(
+    decoy: Decoy,
+    protocol_store: ProtocolStore,
+    analysis_store: AnalysisStore,
+) -> None:
+    """It should get a single analysis's summary by ID."""
+    decoy.when(protocol_store.has("protocol-id")).then_return(True)
+    decoy.when(await analysis_store.get_summary_as_document("analysis-id")).then_return(
+        "foo"
+    )
+
+    result = await get_protocol_analysis_summary_as_document(
+        protocolId="protocol-id",
+        analysisId="analysis-id",
+        protocol_store=protocol_store,
+        analysis_store=analysis_store,
+    )
+
+    assert result.status_code == 200
+    assert result.body.decode(result.charset) == "foo"
+
+
+async def test_get_protocol_analysis_summary_as_document_analysis_not_found(
+    decoy: Decoy,
+    protocol_store: ProtocolStore,
+    analysis_store: AnalysisStore,
+) -> None:
+    """It should 404 if the analysis does not exist."""
+    decoy.when(protocol_store.has("protocol-id")).then_return(True)
+    decoy.when(await analysis_store.get_summary_as_document("analysis-id")).then_raise(
+        AnalysisNotFoundError("oh no")
+    )
+
+    with pytest.raises(ApiError) as exc_info:
+        await get_protocol_analysis_summary_as_document(
+            protocolId="protocol-id",
+            analysisId="analysis-id",
+            protocol_store=protocol_store,
+            analysis_store=analysis_store,
+        )
+
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.content["errors"][0]["id"] == "AnalysisNotFound"
+
+
+async def test_get_protocol_analysis_commands(
+    decoy: Decoy,
+    protocol_store: ProtocolStore,
+    analysis_store: AnalysisStore,
+) -> None:
+    """It should get a page of an analysis's commands."""
+    command = pe_commands.Comment(
+        id="command-id",
+        key="command-key",
+        status=pe_commands.CommandStatus.SUCCEEDED,
+        createdAt=datetime(year=2024, month=1, day=1),
+        params=pe_commands.CommentParams(message="hello"),
+    )
+    decoy.when(protocol_store.has("protocol-id")).then_return(True)
+    decoy.when(
+        await analysis_store.get_commands_slice(
+            analysis_id="analysis-id", cursor=10, length=1
+        )
+    ).then_return(CommandSlice(commands=[command], cursor=10, total_length=50))
+
+    result = await get_protocol_analysis_commands(
+        protocolId="protocol-id",
+        analysisId="analysis-id",
+        protocol_store=protocol_store,
+        analysis_store=analysis_store,
+        cursor=10,
+        pageLength=1,
+    )
+
+    assert result.status_code == 200
+    assert result.content.data == [command]
+    assert result.content.meta == MultiBodyMeta(cursor=10, totalLength=50)
+
+
+async def test_get_protocol_analysis_commands_analysis_not_found(
+    decoy: Decoy,
+    protocol_store: ProtocolStore,
+    analysis_store: AnalysisStore,
+) -> None:
+    """It should 404 if the analysis does not exist."""
+    decoy.when(protocol_store.has("protocol-id")).then_return(True)
+    decoy.when(
+        await analysis_store.get_commands_slice(
+            analysis_id="analysis-id", cursor=0, length=20
+        )
+    ).then_raise(AnalysisNotFoundError("oh no"))
+
+    with pytest.raises(ApiError) as exc_info:
+        await get_protocol_analysis_commands(
+            protocolId="protocol-id",
+            analysisId="analysis-id",
+            protocol_store=protocol_store,
+            analysis_store=analysis_store,
+            cursor=0,
+            pageLength=20,
+        )
+
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.content["errors"][0]["id"] == "AnalysisNotFound"
+
+
 async def test_create_protocol_analyses_with_same_rtp_values(
     decoy: Decoy,
     protocol_store: ProtocolStore,
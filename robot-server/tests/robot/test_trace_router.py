@@ -0,0 +1,44 @@
+"""Tests for the /robot/hardwareTrace endpoint."""
+import json
+import sys
+
+import pytest
+from robot_server.errors.error_responses import ApiError
+
+from robot_server.robot.trace_router import get_hardware_trace
+
+hardware_tracing = pytest.importorskip("opentrons_hardware.tracing")
+
+
+async def test_get_hardware_trace() -> None:
+    """It should return the recorded spans as Chrome trace-event JSON."""
+    tracer = hardware_tracing.get_tracer()
+    tracer.clear()
+    with tracer.span("test-span", "motion", axis="X"):
+        pass
+
+    response = await get_hardware_trace(robot_type="OT-3 Standard", clear=False)
+    [event] = json.loads(response.body)["traceEvents"]
+    assert event["name"] == "test-span"
+    assert event["args"] == {"axis": "X"}
+    assert len(tracer.records()) == 1
+
+    await get_hardware_trace(robot_type="OT-3 Standard", clear=True)
+    assert tracer.records() == []
+
+
+async def test_get_hardware_trace_on_ot2() -> None:
+    """It should not be available on an OT-2."""
+    with pytest.raises(ApiError) as exc_info:
+        await get_hardware_trace(robot_type="OT-2 Standard", clear=False)
+    assert exc_info.value.status_code == 403
+
+
+async def test_get_hardware_trace_without_opentrons_hardware(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """It should not be available without opentrons_hardware."""
+    monkeypatch.setitem(sys.modules, "opentrons_hardware", None)
+    with pytest.raises(ApiError) as exc_info:
+        await get_hardware_trace(robot_type="OT-3 Standard", clear=False)
+    assert exc_info.value.status_code == 403
@@ -419,7 +419,10 @@ async def test_get_run_with_missing_id(
     assert exc_info.value.content["errors"][0]["id"] == "RunNotFound"
 
 
-async def test_get_run() -> None:
+async def test_get_run(
+    decoy: Decoy,
+    mock_run_data_manager: RunDataManager,
+) -> None:
     """It should wrap the run data in a response."""
     run_data = Run(
         id="run-id",
@@ -437,10 +440,57 @@ async def test_get_run() -> None:
         hasEverEnteredErrorRecovery=False,
     )
 
-    result = await get_run(run_data=run_data)
+    decoy.when(mock_run_data_manager.get("run-id")).then_return(run_data)
+
+    result = await get_run(runId="run-id", run_data_manager=mock_run_data_manager)
 
     assert result.content.data == run_data
     assert result.status_code == 200
+    assert "ETag" not in result.headers
+
+
+async def test_get_current_run_etag(
+    decoy: Decoy,
+    mock_run_data_manager: RunDataManager,
+) -> None:
+    """It should tag the current run, and answer 304 if the client's tag matches."""
+    run_data = Run(
+        id="run-id",
+        protocolId=None,
+        createdAt=datetime(year=2021, month=1, day=1),
+        status=pe_types.EngineStatus.RUNNING,
+        current=True,
+        actions=[],
+        errors=[],
+        pipettes=[],
+        modules=[],
+        labware=[],
+        labwareOffsets=[],
+        liquids=[],
+        hasEverEnteredErrorRecovery=False,
+    )
+    decoy.when(mock_run_data_manager.get_state_version("run-id")).then_return(42)
+    decoy.when(mock_run_data_manager.get("run-id")).then_return(run_data)
+
+    result = await get_run(runId="run-id", run_data_manager=mock_run_data_manager)
+    assert result.status_code == 200
+    assert result.headers["ETag"] == '"run-id-42"'
+
+    result = await get_run(
+        runId="run-id",
+        run_data_manager=mock_run_data_manager,
+        if_none_match='"run-id-42"',
+    )
+    assert result.status_code == 304
+    assert result.body == b""
+
+    result = await get_run(
+        runId="run-id",
+        run_data_manager=mock_run_data_manager,
+        if_none_match='"run-id-41"',
+    )
+    assert result.status_code == 200
+    assert result.content.data == run_data
 
 
 async def test_get_runs_empty(
@@ -840,6 +890,26 @@ async def test_get_run_commands_errors_defualt_cursor(
     assert result.status_code == 200
 
 
+async def test_get_run_commands_errors_not_modified(
+    decoy: Decoy,
+    mock_run_data_manager: RunDataManager,
+) -> None:
+    """It should answer 304 without reading errors if the client's copy is current."""
+    decoy.when(mock_run_data_manager.get_state_version("run-id")).then_return(42)
+
+    result = await get_run_commands_error(
+        runId="run-id",
+        run_data_manager=mock_run_data_manager,
+        cursor=None,
+        pageLength=42,
+        if_none_match='"run-id-42"',
+    )
+
+    assert result.status_code == 304
+    assert result.headers["ETag"] == '"run-id-42"'
+    decoy.verify(mock_run_data_manager.get_command_errors("run-id"), times=0)
+
+
 async def test_get_current_state_success(
     decoy: Decoy,
     mock_run_data_manager: RunDataManager,
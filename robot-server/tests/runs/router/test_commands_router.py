@@ -430,6 +430,41 @@ async def test_get_run_commands_empty(
     assert result.status_code == 200
 
 
+async def test_get_run_commands_not_modified(
+    decoy: Decoy,
+    mock_run_data_manager: RunDataManager,
+) -> None:
+    """It should tag the current run's commands, and answer 304 if they're unchanged."""
+    decoy.when(mock_run_data_manager.get_state_version("run-id")).then_return(42)
+    decoy.when(mock_run_data_manager.get_current_command("run-id")).then_return(None)
+    decoy.when(
+        mock_run_data_manager.get_commands_slice(
+            run_id="run-id", cursor=None, length=42, include_fixit_commands=True
+        )
+    ).then_return(CommandSlice(commands=[], cursor=0, total_length=0))
+
+    result = await get_run_commands(
+        runId="run-id",
+        run_data_manager=mock_run_data_manager,
+        cursor=None,
+        pageLength=42,
+        includeFixitCommands=True,
+    )
+    assert result.status_code == 200
+    assert result.headers["ETag"] == '"run-id-42"'
+
+    result = await get_run_commands(
+        runId="run-id",
+        run_data_manager=mock_run_data_manager,
+        cursor=None,
+        pageLength=42,
+        includeFixitCommands=True,
+        if_none_match='"run-id-42"',
+    )
+    assert result.status_code == 304
+    assert result.body == b""
+
+
 async def test_get_run_commands_not_found(
     decoy: Decoy,
     mock_run_data_manager: RunDataManager,
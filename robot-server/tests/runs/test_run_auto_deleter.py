@@ -1,134 +1,170 @@
 """Unit tests for `run_auto_deleter`."""
 
 
-from datetime import datetime
+import asyncio
+from datetime import datetime, timezone
 import logging
-from typing import List, Union
+import time
 
 import pytest
-from decoy import Decoy
+from decoy import Decoy, matchers
+import sqlalchemy
+from sqlalchemy.engine import Engine as SQLEngine
 
-from opentrons.protocol_reader import ProtocolSource
+from opentrons.protocol_engine import StateSummary, EngineStatus, commands
 
 from robot_server.deletion_planner import RunDeletionPlanner
 from robot_server.protocols.protocol_models import ProtocolKind
-from robot_server.protocols.protocol_store import ProtocolResource, ProtocolStore
 from robot_server.runs.run_auto_deleter import RunAutoDeleter
-from robot_server.runs.run_store import RunStore, RunResource, BadRunResource
+from robot_server.persistence.tables import run_command_table
+from robot_server.runs.run_store import RunStore
+from robot_server.service.task_runner import TaskRunner
 
 
-def _make_dummy_run_resource(run_id: str, protocol_id: str) -> RunResource:
-    """Return a RunResource with the given ID."""
-    return RunResource(
-        ok=True,
-        run_id=run_id,
-        protocol_id=protocol_id,
-        created_at=datetime.min,
-        actions=[],
-    )
-
-
-def test_make_room_for_new_run(decoy: Decoy, caplog: pytest.LogCaptureFixture) -> None:
-    """It should get a deletion plan and enact it on the store."""
+async def test_make_room_for_new_run(
+    decoy: Decoy, caplog: pytest.LogCaptureFixture
+) -> None:
+    """It should get a deletion plan and enact it on the store in the background."""
     mock_run_store = decoy.mock(cls=RunStore)
-    mock_protocol_store = decoy.mock(cls=ProtocolStore)
-    mock_protocol_source = decoy.mock(cls=ProtocolSource)
+    mock_task_runner = decoy.mock(cls=TaskRunner)
 
     subject = RunAutoDeleter(
         run_store=mock_run_store,
-        protocol_store=mock_protocol_store,
+        task_runner=mock_task_runner,
         deletion_planner=RunDeletionPlanner(1),
         protocol_kind=ProtocolKind.STANDARD,
     )
 
-    protocol_resources: List[ProtocolResource] = [
-        ProtocolResource(
-            protocol_id=f"protocol-id-{idx}",
-            created_at=datetime.min,
-            source=mock_protocol_source,
-            protocol_key=None,
-            protocol_kind=ProtocolKind.STANDARD,
-        )
-        for idx in range(1, 4)
-    ]
-
-    run_resources: List[Union[RunResource, BadRunResource]] = [
-        _make_dummy_run_resource("run-id-1", "protocol-id-1"),
-        _make_dummy_run_resource("run-id-2", "protocol-id-2"),
-        _make_dummy_run_resource("run-id-3", "protocol-id-3"),
-    ]
-
-    decoy.when(mock_protocol_store.get_all()).then_return(protocol_resources)
-    decoy.when(mock_run_store.get_all()).then_return(run_resources)
+    decoy.when(
+        mock_run_store.get_ids_by_protocol_kind(ProtocolKind.STANDARD)
+    ).then_return(["run-id-1", "run-id-2", "run-id-3"])
 
     # Run the subject, capturing log messages at least as severe as INFO.
     with caplog.at_level(logging.INFO):
         subject.make_room_for_new_run()
 
-    decoy.verify(mock_run_store.remove(run_id="run-id-1"))
-    decoy.verify(mock_run_store.remove(run_id="run-id-2"))
-    decoy.verify(mock_run_store.remove(run_id="run-id-3"))
+    expected_run_ids = {"run-id-1", "run-id-2", "run-id-3"}
+    decoy.verify(mock_run_store.hide_for_removal(expected_run_ids))
 
     # It should log the runs that it deleted.
     assert "run-id-1" in caplog.text
     assert "run-id-2" in caplog.text
     assert "run-id-3" in caplog.text
 
+    # It should leave the actual removal to a background task.
+    decoy.verify(mock_run_store.remove(run_id=matchers.Anything()), times=0)
+    func_captor = matchers.Captor()
+    decoy.verify(mock_task_runner.run(func_captor, run_ids=expected_run_ids), times=1)
+    await func_captor.value(run_ids=expected_run_ids)
 
-def test_quick_transfer_protocol_runs(
-    decoy: Decoy,
-    caplog: pytest.LogCaptureFixture,
-) -> None:
-    """It should delete runs of the specified protocol kind."""
+    decoy.verify(await mock_run_store.remove_in_chunks(run_id="run-id-1"))
+    decoy.verify(await mock_run_store.remove_in_chunks(run_id="run-id-2"))
+    decoy.verify(await mock_run_store.remove_in_chunks(run_id="run-id-3"))
+
+
+def test_make_room_for_new_run_with_room(decoy: Decoy) -> None:
+    """It should not remove anything when there's already room."""
     mock_run_store = decoy.mock(cls=RunStore)
-    mock_protocol_store = decoy.mock(cls=ProtocolStore)
-    mock_protocol_source = decoy.mock(cls=ProtocolSource)
+    mock_task_runner = decoy.mock(cls=TaskRunner)
 
     subject = RunAutoDeleter(
         run_store=mock_run_store,
-        protocol_store=mock_protocol_store,
-        deletion_planner=RunDeletionPlanner(1),
+        task_runner=mock_task_runner,
+        deletion_planner=RunDeletionPlanner(5),
         protocol_kind=ProtocolKind.QUICK_TRANSFER,
     )
 
-    protocol_resources: List[ProtocolResource] = [
-        ProtocolResource(
-            protocol_id=f"protocol-id-{idx}",
-            created_at=datetime.min,
-            source=mock_protocol_source,
-            protocol_key=None,
-            protocol_kind=ProtocolKind.STANDARD
-            if idx not in [2, 5]
-            else ProtocolKind.QUICK_TRANSFER,
-        )
-        for idx in range(1, 6)
-    ]
-
-    run_resources: List[Union[RunResource, BadRunResource]] = [
-        _make_dummy_run_resource("run-id-1", "protocol-id-1"),
-        _make_dummy_run_resource("run-id-2", "protocol-id-2"),
-        _make_dummy_run_resource("run-id-3", "protocol-id-3"),
-        _make_dummy_run_resource("run-id-4", "protocol-id-4"),
-        _make_dummy_run_resource("run-id-5", "protocol-id-5"),
-        _make_dummy_run_resource("run-id-6", "protocol-id-6"),
-    ]
-
-    decoy.when(mock_protocol_store.get_all()).then_return(protocol_resources)
-    decoy.when(mock_run_store.get_all()).then_return(run_resources)
+    decoy.when(
+        mock_run_store.get_ids_by_protocol_kind(ProtocolKind.QUICK_TRANSFER)
+    ).then_return(["run-id-1", "run-id-2"])
 
-    # Run the subject, capturing log messages at least as severe as INFO.
-    with caplog.at_level(logging.INFO):
-        subject.make_room_for_new_run()
+    subject.make_room_for_new_run()
 
-    decoy.verify(mock_run_store.remove(run_id="run-id-2"))
-    decoy.verify(mock_run_store.remove(run_id="run-id-5"))
+    decoy.verify(mock_run_store.hide_for_removal(matchers.Anything()), times=0)
+    decoy.verify(
+        mock_task_runner.run(matchers.Anything(), run_ids=matchers.Anything()),
+        times=0,
+    )
 
-    # It should log the quick-transfer runs deleted
-    assert "run-id-2" in caplog.text
-    assert "run-id-5" in caplog.text
-    # Make sure we delete quick-transfer protocol runs
-    assert "run-id-1" not in caplog.text
-    assert "run-id-3" not in caplog.text
-    assert "run-id-4" not in caplog.text
-    # Make sure we delete runs without a protocol
-    assert "run-id-6" in caplog.text
+
+def _insert_long_run(run_store: RunStore, run_id: str, command_count: int) -> None:
+    run_store.insert(
+        run_id=run_id,
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    run_store.update_run_state(
+        run_id=run_id,
+        summary=StateSummary(
+            status=EngineStatus.SUCCEEDED,
+            errors=[],
+            labware=[],
+            pipettes=[],
+            modules=[],
+            labwareOffsets=[],
+            liquids=[],
+            wells=[],
+            hasEverEnteredErrorRecovery=False,
+        ),
+        commands=[
+            commands.WaitForResume(
+                id=f"{run_id}-command-{index}",
+                key=f"{run_id}-command-{index}",
+                status=commands.CommandStatus.SUCCEEDED,
+                createdAt=datetime(year=2021, month=1, day=1),
+                params=commands.WaitForResumeParams(message="hello world"),
+                result=commands.WaitForResumeResult(),
+            )
+            for index in range(command_count)
+        ],
+        run_time_parameters=[],
+    )
+
+
+async def test_make_room_for_new_run_latency(sql_engine: SQLEngine) -> None:
+    """Making room for a new run at the retention limit should not wait on deletion.
+
+    Removing a long run's commands is the slow part of auto-deletion,
+    so it should happen in the background instead of before the new run is made.
+    """
+    maximum_runs = 5
+    command_count = 5000
+    run_store = RunStore(sql_engine=sql_engine)
+    task_runner = TaskRunner()
+    subject = RunAutoDeleter(
+        run_store=run_store,
+        task_runner=task_runner,
+        deletion_planner=RunDeletionPlanner(maximum_runs),
+        protocol_kind=ProtocolKind.STANDARD,
+    )
+
+    for index in range(maximum_runs + 1):
+        _insert_long_run(run_store, f"run-id-{index}", command_count)
+
+    # What making room used to cost: removing an old run in the same request.
+    start = time.perf_counter()
+    run_store.remove(run_id="run-id-0")
+    synchronous_removal_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    subject.make_room_for_new_run()
+    make_room_time = time.perf_counter() - start
+
+    # The oldest remaining run is gone as soon as room's been made...
+    assert not run_store.has(run_id="run-id-1")
+    assert len(run_store.get_all()) == maximum_runs - 1
+    assert make_room_time < synchronous_removal_time
+
+    # ...and all of it is actually deleted in the background.
+    select_run_ids = sqlalchemy.select(run_command_table.c.run_id).distinct()
+    remaining_run_ids = {f"run-id-{index}" for index in range(2, maximum_runs + 1)}
+    for _ in range(500):
+        with sql_engine.begin() as transaction:
+            run_ids = set(transaction.execute(select_run_ids).scalars().all())
+        if run_ids == remaining_run_ids:
+            break
+        await asyncio.sleep(0.01)
+    assert run_ids == remaining_run_ids
+    assert run_store.get_ids_by_protocol_kind(ProtocolKind.STANDARD) == sorted(
+        remaining_run_ids
+    )
@@ -1,4 +1,5 @@
 """Tests for RunDataManager."""
+from dataclasses import replace
 from datetime import datetime
 from typing import Optional, List, Dict
 from unittest.mock import sentinel
@@ -33,6 +34,7 @@ from robot_server.error_recovery.settings.store import ErrorRecoverySettingStore
 from robot_server.protocols.protocol_models import ProtocolKind
 from robot_server.protocols.protocol_store import ProtocolResource
 from robot_server.runs import error_recovery_mapping
+from robot_server.runs.action_models import RunAction, RunActionType
 from robot_server.runs.error_recovery_models import ErrorRecoveryRule
 from robot_server.runs.run_data_manager import (
     RunDataManager,
@@ -980,6 +982,47 @@ def test_get_current_command_not_current_run(
     assert result is None
 
 
+def test_get_state_version(
+    decoy: Decoy,
+    subject: RunDataManager,
+    mock_run_store: RunStore,
+    mock_run_orchestrator_store: RunOrchestratorStore,
+    run_resource: RunResource,
+) -> None:
+    """It should count engine state changes and recorded run actions."""
+    decoy.when(mock_run_orchestrator_store.current_run_id).then_return("run-id")
+    decoy.when(mock_run_orchestrator_store.get_state_version()).then_return(7)
+    decoy.when(mock_run_store.get("run-id")).then_return(run_resource)
+    version_before_action = subject.get_state_version("run-id")
+
+    # Recording an action in the database, without any engine state change,
+    # should still bump the version.
+    action = RunAction(
+        id="action-id",
+        createdAt=datetime(year=2022, month=2, day=2),
+        actionType=RunActionType.PLAY,
+    )
+    decoy.when(mock_run_store.get("run-id")).then_return(
+        replace(run_resource, actions=[action])
+    )
+    version_after_action = subject.get_state_version("run-id")
+
+    assert version_before_action is not None
+    assert version_after_action is not None
+    assert version_after_action > version_before_action
+
+
+def test_get_state_version_not_current_run(
+    decoy: Decoy,
+    subject: RunDataManager,
+    mock_run_orchestrator_store: RunOrchestratorStore,
+) -> None:
+    """It should not version historical runs."""
+    decoy.when(mock_run_orchestrator_store.current_run_id).then_return("not-run-id")
+
+    assert subject.get_state_version("run-id") is None
+
+
 def test_get_command_from_engine(
     decoy: Decoy,
     subject: RunDataManager,
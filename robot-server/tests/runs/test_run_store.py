@@ -1,4 +1,5 @@
 """Tests for robot_server.runs.run_store."""
+import asyncio
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Optional, Type
@@ -12,7 +13,12 @@ from unittest import mock
 from opentrons_shared_data.pipette.types import PipetteNameType
 from opentrons_shared_data.errors.codes import ErrorCodes
 
-from robot_server.protocols.protocol_store import ProtocolNotFoundError
+from robot_server.protocols.protocol_models import ProtocolKind
+from robot_server.protocols.protocol_store import (
+    ProtocolNotFoundError,
+    ProtocolResource,
+    ProtocolStore,
+)
 from robot_server.runs.run_store import (
     CSVParameterRunResource,
     RunStore,
@@ -33,6 +39,7 @@ from opentrons.protocol_engine import (
     Liquid,
     EngineStatus,
 )
+from opentrons.protocol_reader import ProtocolSource
 from opentrons.types import MountType, DeckSlotName
 
 
@@ -315,6 +322,9 @@ async def test_insert_and_get_csv_rtp(
         )
     ]
 
+    subject.hide_for_removal({"run-id"})
+    assert subject.get_all_csv_rtp() == []
+
 
 def test_update_state_run_not_found(
     subject: RunStore,
@@ -534,6 +544,171 @@ async def test_remove_run(
     )
 
 
+def test_hide_for_removal(subject: RunStore) -> None:
+    """Hidden runs should look like they've already been removed."""
+    for run_id in ["run-id-1", "run-id-2", "run-id-3"]:
+        subject.insert(
+            run_id=run_id,
+            protocol_id=None,
+            created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+        )
+    assert subject.get(run_id="run-id-2").run_id == "run-id-2"
+
+    subject.hide_for_removal({"run-id-2"})
+
+    assert subject.has(run_id="run-id-2") is False
+    with pytest.raises(RunNotFoundError, match="run-id-2"):
+        subject.get(run_id="run-id-2")
+    assert [run.run_id for run in subject.get_all()] == ["run-id-1", "run-id-3"]
+    assert [run.run_id for run in subject.get_all(length=1)] == ["run-id-3"]
+    with pytest.raises(RunNotFoundError, match="run-id-2"):
+        subject.get_commands_slice(
+            run_id="run-id-2", length=10, cursor=0, include_fixit_commands=True
+        )
+    with pytest.raises(RunNotFoundError, match="run-id-2"):
+        subject.get_state_summary(run_id="run-id-2")
+    with pytest.raises(RunNotFoundError, match="run-id-2"):
+        subject.insert_action(
+            run_id="run-id-2",
+            action=RunAction(
+                actionType=RunActionType.PLAY,
+                createdAt=datetime(year=2022, month=2, day=2, tzinfo=timezone.utc),
+                id="action-id",
+            ),
+        )
+    with pytest.raises(RunNotFoundError, match="run-id-2"):
+        subject.remove(run_id="run-id-2")
+
+
+async def test_remove_in_chunks(
+    subject: RunStore,
+    state_summary: StateSummary,
+    protocol_commands: List[pe_commands.Command],
+) -> None:
+    """It should remove a hidden run and all of its commands."""
+    for run_id in ["run-id-1", "run-id-2"]:
+        subject.insert(
+            run_id=run_id,
+            protocol_id=None,
+            created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+        )
+        subject.insert_action(
+            run_id=run_id,
+            action=RunAction(
+                actionType=RunActionType.PLAY,
+                createdAt=datetime(year=2022, month=2, day=2, tzinfo=timezone.utc),
+                id=f"action-id-{run_id}",
+            ),
+        )
+        subject.update_run_state(
+            run_id=run_id,
+            summary=state_summary,
+            commands=protocol_commands,
+            run_time_parameters=[],
+        )
+
+    subject.hide_for_removal({"run-id-1"})
+    await subject.remove_in_chunks(run_id="run-id-1", chunk_size=3)
+
+    assert [run.run_id for run in subject.get_all()] == ["run-id-2"]
+    assert subject.get_ids_by_protocol_kind(ProtocolKind.STANDARD) == ["run-id-2"]
+    assert (
+        subject.get_commands_slice(
+            run_id="run-id-2", length=10, cursor=0, include_fixit_commands=True
+        ).commands
+        == protocol_commands
+    )
+
+    # Removing it again, e.g. if something else got to it first, is harmless.
+    await subject.remove_in_chunks(run_id="run-id-1")
+    assert [run.run_id for run in subject.get_all()] == ["run-id-2"]
+
+
+async def test_remove_in_chunks_lets_other_tasks_run(
+    subject: RunStore,
+    state_summary: StateSummary,
+    protocol_commands: List[pe_commands.Command],
+) -> None:
+    """It should give other tasks a turn between chunks of commands."""
+    subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands,
+        run_time_parameters=[],
+    )
+    subject.hide_for_removal({"run-id"})
+
+    turns = 0
+
+    async def take_turns() -> None:
+        nonlocal turns
+        while True:
+            turns += 1
+            await asyncio.sleep(0)
+
+    other_task = asyncio.create_task(take_turns())
+    await asyncio.sleep(0)
+    turns = 0
+    await subject.remove_in_chunks(run_id="run-id", chunk_size=1)
+    other_task.cancel()
+
+    assert turns >= len(protocol_commands)
+    assert subject.get_all() == []
+
+
+def test_get_ids_by_protocol_kind(sql_engine: Engine, subject: RunStore) -> None:
+    """It should return runs with no protocol or a protocol of the given kind."""
+    protocol_store = ProtocolStore.create_empty(sql_engine=sql_engine)
+    for protocol_id, protocol_kind in [
+        ("standard-protocol-id", ProtocolKind.STANDARD),
+        ("quick-transfer-protocol-id", ProtocolKind.QUICK_TRANSFER),
+    ]:
+        protocol_store.insert(
+            ProtocolResource(
+                protocol_id=protocol_id,
+                created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+                source=mock.Mock(spec=ProtocolSource),
+                protocol_key=None,
+                protocol_kind=protocol_kind,
+            )
+        )
+
+    for run_id, run_protocol_id in [
+        ("run-id-1", "quick-transfer-protocol-id"),
+        ("run-id-2", None),
+        ("run-id-3", "standard-protocol-id"),
+        ("run-id-4", "quick-transfer-protocol-id"),
+        ("run-id-5", "standard-protocol-id"),
+    ]:
+        subject.insert(
+            run_id=run_id,
+            protocol_id=run_protocol_id,
+            created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+        )
+
+    assert subject.get_ids_by_protocol_kind(ProtocolKind.STANDARD) == [
+        "run-id-2",
+        "run-id-3",
+        "run-id-5",
+    ]
+    assert subject.get_ids_by_protocol_kind(ProtocolKind.QUICK_TRANSFER) == [
+        "run-id-1",
+        "run-id-2",
+        "run-id-4",
+    ]
+
+    subject.hide_for_removal({"run-id-3"})
+    assert subject.get_ids_by_protocol_kind(ProtocolKind.STANDARD) == [
+        "run-id-2",
+        "run-id-5",
+    ]
+
+
 def test_remove_run_missing_id(subject: RunStore) -> None:
     """It raises if the run does not exist."""
     with pytest.raises(RunNotFoundError, match="run-id"):
@@ -0,0 +1,23 @@
+import pytest
+from typing import Optional
+
+from robot_server.service.json_api.etag import make_etag, etag_matches
+
+
+def test_make_etag() -> None:
+    assert make_etag("run-id", 42) == '"run-id-42"'
+
+
+@pytest.mark.parametrize(
+    ("if_none_match", "expected"),
+    [
+        (None, False),
+        ('"run-id-41"', False),
+        ('"run-id-42"', True),
+        ('W/"run-id-42"', True),
+        ('"run-id-41", "run-id-42"', True),
+        ("*", True),
+    ],
+)
+def test_etag_matches(if_none_match: Optional[str], expected: bool) -> None:
+    assert etag_matches(if_none_match, '"run-id-42"') is expected
@@ -16,6 +16,7 @@ from robot_server.service.json_api.response import (
     NotifyUnsubscribeBody,
     DeprecatedResponseModel,
     DeprecatedMultiResponseModel,
+    PydanticResponse,
 )
 
 
@@ -127,3 +128,21 @@ RESPONSE_SPECS = [
 @pytest.mark.parametrize(ResponseSpec._fields, RESPONSE_SPECS)
 def test_response_to_dict(subject: BaseModel, expected: Dict[str, Any]) -> None:
     assert subject.dict() == expected
+
+
+async def test_pydantic_response_headers() -> None:
+    subject = await PydanticResponse.create(
+        content=SimpleBody(data=_Resource(id="hello")),
+        headers={"ETag": '"hello-1"'},
+    )
+    assert subject.status_code == 200
+    assert subject.headers["ETag"] == '"hello-1"'
+    assert subject.body == b'{"data": {"id": "hello"}}'
+
+
+def test_pydantic_response_not_modified() -> None:
+    subject = PydanticResponse.not_modified('"hello-1"')
+    assert subject.status_code == 304
+    assert subject.headers["ETag"] == '"hello-1"'
+    assert subject.body == b""
+    assert "content-length" not in subject.headers
@@ -1,102 +1,114 @@
+import gzip
 import json
+import os
+import stat
+import sys
+from pathlib import Path
+from typing import List
 
 import pytest
-from mock import patch
+from fastapi.testclient import TestClient
 
 from opentrons.system.log_control import MAX_RECORDS, DEFAULT_RECORDS
 
+_FAKE_JOURNALCTL = """#!{python}
+import json
+import sys
+
+with open({calls!r}, "a") as calls_file:
+    calls_file.write(json.dumps(sys.argv[1:]) + "\\n")
+with open({output!r}, "rb") as output_file:
+    sys.stdout.buffer.write(output_file.read())
+with open({error!r}) as error_file:
+    error = error_file.read()
+if error:
+    sys.stderr.write(error)
+    sys.exit(1)
+"""
+
+
+class FakeJournalctl:
+    """A `journalctl` on the PATH that prints canned output and records its args."""
+
+    def __init__(self, directory: Path) -> None:
+        self._calls = directory / "calls"
+        self._output = directory / "output"
+        self._error = directory / "error"
+        self.set_output(b"")
+        self.set_error("")
+        script = directory / "journalctl"
+        script.write_text(
+            _FAKE_JOURNALCTL.format(
+                python=sys.executable,
+                calls=str(self._calls),
+                output=str(self._output),
+                error=str(self._error),
+            )
+        )
+        script.chmod(script.stat().st_mode | stat.S_IEXEC)
 
-def test_get_serial_log_with_defaults(api_client):
-    logs = '{"serial": "serial logs"}'
-    res_bytes = logs.encode("utf-8")
-    expected = res_bytes.decode("utf-8")
+    def set_output(self, output: bytes) -> None:
+        self._output.write_bytes(output)
 
-    async def mock_get_records_dumb(identifier, records, format_type):
-        return res_bytes
+    def set_error(self, error: str) -> None:
+        """Make journalctl print this to stderr and fail, if it's not empty."""
+        self._error.write_text(error)
 
-    with patch("opentrons.system.log_control.get_records_dumb") as m:
-        m.side_effect = mock_get_records_dumb
-        response = api_client.get("/logs/serial.log")
-        body = response.text
-        assert response.status_code == 200
-        assert body == expected
-        m.assert_called_once_with("ALL_SERIAL", DEFAULT_RECORDS, "short-precise")
+    def calls(self) -> List[List[str]]:
+        if not self._calls.exists():
+            return []
+        return [json.loads(line) for line in self._calls.read_text().splitlines()]
 
 
-@pytest.mark.parametrize(
-    "format_param, records_param, mode_param",
-    [
-        ("json", MAX_RECORDS - 1, "json"),
-        ("text", MAX_RECORDS - 1, "short-precise"),
-        ("json", 1, "json"),
-        ("text", 1, "short-precise"),
-    ],
-)
-def test_get_serial_log_with_params(
-    api_client, format_param, records_param, mode_param
-):
-    logs = '{"serial": "serial logs"}'
-    res_bytes = logs.encode("utf-8")
-    if format_param == "json":
-        expected = json.loads(res_bytes)
-    else:
-        expected = logs
+@pytest.fixture
+def journalctl(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> FakeJournalctl:
+    fake = FakeJournalctl(tmp_path)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+    return fake
 
-    async def mock_get_records_dumb(identifier, records, mode):
-        return res_bytes
 
-    with patch("opentrons.system.log_control.get_records_dumb") as m:
-        m.side_effect = mock_get_records_dumb
-        response = api_client.get(
-            f"/logs/serial.log?format={format_param}&records={records_param}"
-        )
-        if format_param == "json":
-            body = response.json()
-        else:
-            body = response.text
-        assert body == expected
-        assert response.status_code == 200
-
-        m.assert_called_once_with("ALL_SERIAL", records_param, mode_param)
-
-
-@pytest.mark.parametrize(
-    "format_param, records_param",
-    [("json", 0), ("text", MAX_RECORDS + 1), ("invalid", MAX_RECORDS - 1)],
-)
-def test_get_serial_log_with_invalid_params(api_client, format_param, records_param):
-    logs = '{"serial": "serial logs"}'
-    res_bytes = logs.encode("utf-8")
-
-    async def mock_get_records_dumb(identifier, records, format_type):
-        return res_bytes
+def _expected_args(
+    selectors: List[str], records: int, mode: str, filters: List[str] = []
+) -> List[str]:
+    args = ["--no-pager", *selectors, *filters, "-n", str(records), "-o", mode, "-a"]
+    if mode == "short-precise":
+        args.append("--show-cursor")
+    return args
 
-    with patch("opentrons.system.log_control.get_records_dumb") as m:
-        m.side_effect = mock_get_records_dumb
-        response = api_client.get(
-            f"/logs/serial.log?format={format_param}&records={records_param}"
-        )
-        assert response.status_code == 422
-        m.assert_not_called()
 
+_SERIAL_SELECTORS = [
+    "-t",
+    "opentrons-api-serial",
+    "-t",
+    "opentrons-api-serial-can",
+    "-t",
+    "opentrons-api-serial-usbbin",
+]
 
-def test_get_api_log_with_defaults(api_client):
-    logs = '{"api": "application programing interface logs"}'
-    res_bytes = logs.encode("utf-8")
-    expected = res_bytes.decode("utf-8")
 
-    async def mock_get_records_dumb(identifier, records, format_type):
-        return res_bytes
+def test_get_serial_log_with_defaults(
+    api_client: TestClient, journalctl: FakeJournalctl
+) -> None:
+    logs = '{"serial": "serial logs"}'
+    journalctl.set_output(logs.encode("utf-8"))
 
-    with patch("opentrons.system.log_control.get_records_dumb") as m:
-        m.side_effect = mock_get_records_dumb
-        response = api_client.get("/logs/api.log")
-        body = response.text
-        assert response.status_code == 200
-        assert body == expected
-        m.assert_called_once_with("opentrons-api", DEFAULT_RECORDS, "short-precise")
+    response = api_client.get("/logs/serial.log")
+    assert response.status_code == 200
+    assert response.text == logs
+    assert response.headers["Content-Type"] == "text/plain; charset=utf-8"
+    assert journalctl.calls() == [
+        _expected_args(_SERIAL_SELECTORS, DEFAULT_RECORDS, "short-precise")
+    ]
 
 
+@pytest.mark.parametrize(
+    "log_param, selectors",
+    [
+        ("serial.log", _SERIAL_SELECTORS),
+        ("api.log", ["-t", "opentrons-api"]),
+        ("touchscreen.log", ["-u", "opentrons-robot-app"]),
+    ],
+)
 @pytest.mark.parametrize(
     "format_param, records_param, mode_param",
     [
@@ -106,99 +118,131 @@ def test_get_api_log_with_defaults(api_client):
         ("text", 1, "short-precise"),
     ],
 )
-def test_get_api_log_with_params(api_client, format_param, records_param, mode_param):
+def test_get_log_with_params(
+    api_client: TestClient,
+    journalctl: FakeJournalctl,
+    log_param: str,
+    selectors: List[str],
+    format_param: str,
+    records_param: int,
+    mode_param: str,
+) -> None:
     logs = '{"api": "application programing interface logs"}'
-    res_bytes = logs.encode("utf-8")
+    journalctl.set_output(logs.encode("utf-8"))
+
+    response = api_client.get(
+        f"/logs/{log_param}?format={format_param}&records={records_param}"
+    )
+    assert response.status_code == 200
     if format_param == "json":
-        expected = json.loads(res_bytes)
+        assert response.json() == json.loads(logs)
     else:
-        expected = logs
+        assert response.text == logs
+    assert journalctl.calls() == [_expected_args(selectors, records_param, mode_param)]
 
-    async def mock_get_records_dumb(identifier, records, format_type):
-        return res_bytes
 
-    with patch("opentrons.system.log_control.get_records_dumb") as m:
-        m.side_effect = mock_get_records_dumb
-        response = api_client.get(
-            f"/logs/api.log?format={format_param}&records={records_param}"
+@pytest.mark.parametrize("log_param", ["serial.log", "api.log"])
+@pytest.mark.parametrize(
+    "format_param, records_param",
+    [("json", 0), ("text", MAX_RECORDS + 1), ("invalid", MAX_RECORDS - 1)],
+)
+def test_get_log_with_invalid_params(
+    api_client: TestClient,
+    journalctl: FakeJournalctl,
+    log_param: str,
+    format_param: str,
+    records_param: int,
+) -> None:
+    response = api_client.get(
+        f"/logs/{log_param}?format={format_param}&records={records_param}"
+    )
+    assert response.status_code == 422
+    assert journalctl.calls() == []
+
+
+def test_get_log_after_cursor_and_since(
+    api_client: TestClient, journalctl: FakeJournalctl
+) -> None:
+    journalctl.set_output(b"new records\n-- cursor: s=abc;i=2\n")
+
+    response = api_client.get(
+        "/logs/api.log",
+        params={"cursor": "s=abc;i=1", "since": "2023-08-01 12:00:00", "records": 10},
+    )
+    assert response.status_code == 200
+    assert response.text == "new records\n-- cursor: s=abc;i=2\n"
+    assert journalctl.calls() == [
+        _expected_args(
+            ["-t", "opentrons-api"],
+            10,
+            "short-precise",
+            ["--after-cursor=s=abc;i=1", "--since=2023-08-01 12:00:00"],
         )
-        if format_param == "json":
-            body = response.json()
-        else:
-            body = response.text
-        assert response.status_code == 200
-        assert body == expected
-        m.assert_called_once_with("opentrons-api", records_param, mode_param)
+    ]
 
 
-@pytest.mark.parametrize(
-    "format_param, records_param, mode_param",
-    [
-        ("json", MAX_RECORDS - 1, "json"),
-        ("text", MAX_RECORDS - 1, "short-precise"),
-        ("json", 1, "json"),
-        ("text", 1, "short-precise"),
-    ],
-)
-def test_get_odd_log_with_params(api_client, format_param, records_param, mode_param):
-    logs = '{"odd": "application programing interface logs"}'
-    res_bytes = logs.encode("utf-8")
-    if format_param == "json":
-        expected = json.loads(res_bytes)
-    else:
-        expected = logs
+def test_get_log_with_bad_cursor(
+    api_client: TestClient, journalctl: FakeJournalctl
+) -> None:
+    journalctl.set_error("Failed to seek to cursor: Invalid argument\n")
 
-    async def mock_get_records_dumb(identifier, records, format_type):
-        return res_bytes
+    response = api_client.get("/logs/api.log", params={"cursor": "garbage"})
+    assert response.status_code == 400
+    assert response.json()["message"] == "Failed to seek to cursor: Invalid argument"
+
+
+def test_get_log_journalctl_fails(
+    api_client: TestClient, journalctl: FakeJournalctl
+) -> None:
+    journalctl.set_error("Failed to open journal: No such file or directory\n")
+
+    response = api_client.get("/logs/api.log")
+    assert response.status_code == 500
+    assert (
+        response.json()["message"]
+        == "Failed to open journal: No such file or directory"
+    )
 
-    with patch("opentrons.system.log_control.get_records_dumb") as m:
-        m.side_effect = mock_get_records_dumb
-        response = api_client.get(
-            f"/logs/touchscreen.log?format={format_param}&records={records_param}"
-        )
-        if format_param == "json":
-            body = response.json()
-        else:
-            body = response.text
-        assert response.status_code == 200
-        assert body == expected
-        m.assert_called_once_with("opentrons-robot-app", records_param, mode_param)
 
+def test_get_log_streams_large_output(
+    api_client: TestClient, journalctl: FakeJournalctl
+) -> None:
+    logs = b"".join(
+        f"Aug 01 12:00:00.{i:06d} opentrons-api[1]: record {i}\n".encode()
+        for i in range(20000)
+    )
+    journalctl.set_output(logs)
 
-def test_get_odd_log_with_defaults(api_client):
-    logs = '{"app": "application programing interface logs"}'
-    res_bytes = logs.encode("utf-8")
-    expected = res_bytes.decode("utf-8")
+    response = api_client.get("/logs/api.log", headers={"Accept-Encoding": "identity"})
+    assert response.status_code == 200
+    assert "Content-Encoding" not in response.headers
+    assert response.content == logs
 
-    async def mock_get_records_dumb(identifier, records, format_type):
-        return res_bytes
 
-    with patch("opentrons.system.log_control.get_records_dumb") as m:
-        m.side_effect = mock_get_records_dumb
-        response = api_client.get("/logs/touchscreen.log")
-        body = response.text
+def test_get_log_gzip(api_client: TestClient, journalctl: FakeJournalctl) -> None:
+    logs = b"a log line\n" * 1000
+    journalctl.set_output(logs)
+
+    with api_client.stream(
+        "GET", "/logs/api.log", headers={"Accept-Encoding": "gzip"}
+    ) as response:
         assert response.status_code == 200
-        assert body == expected
-        m.assert_called_once_with(
-            "opentrons-robot-app", DEFAULT_RECORDS, "short-precise"
-        )
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.headers["Vary"] == "Accept-Encoding"
+        compressed = b"".join(response.iter_raw())
 
+    assert len(compressed) < len(logs)
+    assert gzip.decompress(compressed) == logs
 
-@pytest.mark.parametrize(
-    "format_param, records_param",
-    [("json", 0), ("text", MAX_RECORDS + 1), ("invalid", MAX_RECORDS - 1)],
-)
-def test_get_api_log_with_invalid_params(api_client, format_param, records_param):
-    logs = '{"api": "application programing interface logs"}'
-    res_bytes = logs.encode("utf-8")
 
-    async def mock_get_records_dumb(identifier, records, format_type):
-        return res_bytes
+def test_get_log_gzip_refused(
+    api_client: TestClient, journalctl: FakeJournalctl
+) -> None:
+    journalctl.set_output(b"a log line\n")
 
-    with patch("opentrons.system.log_control.get_records_dumb") as m:
-        m.side_effect = mock_get_records_dumb
-        response = api_client.get(
-            f"/logs/api.log?format={format_param}&records={records_param}"
-        )
-        assert response.status_code == 422
-        m.assert_not_called()
+    response = api_client.get(
+        "/logs/api.log", headers={"Accept-Encoding": "gzip;q=0, identity"}
+    )
+    assert response.status_code == 200
+    assert "Content-Encoding" not in response.headers
+    assert response.content == b"a log line\n"
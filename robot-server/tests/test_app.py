@@ -3,7 +3,7 @@ import pytest
 from mock import MagicMock, patch
 from fastapi import status
 from fastapi.testclient import TestClient
-from typing import Iterator
+from typing import AsyncIterator, Iterator
 
 from robot_server.versioning import API_VERSION_HEADER, API_VERSION
 
@@ -11,8 +11,12 @@ from robot_server.versioning import API_VERSION_HEADER, API_VERSION
 @pytest.fixture
 def mock_log_control() -> Iterator[MagicMock]:
     """Patch out the log retrieval logic."""
-    with patch("opentrons.system.log_control.get_records_dumb") as p:
-        p.return_value = b""
+
+    async def no_records(*args: object, **kwargs: object) -> AsyncIterator[bytes]:
+        yield b""
+
+    with patch("opentrons.system.log_control.stream_records") as p:
+        p.side_effect = no_records
         yield p
 
 
@@ -1,4 +1,6 @@
-from typing import List, Tuple
+import math
+from bisect import bisect_left
+from typing import List, Sequence, Tuple
 
 from opentrons_shared_data.pipette.pipette_definition import PipetteFunctionKeyType
 
@@ -31,3 +33,41 @@ def piecewise_volume_conversion(
     # Compatibility with previous implementation of search.
     #  list(filter(lambda x: ul <= x[0], sequence))[0]
     raise IndexError()
+
+
+class PiecewiseVolumeConversion:
+    """A piecewise ul/mm function, compiled for repeated lookups.
+
+    Calling this gives exactly the same results as `piecewise_volume_conversion`
+    with the sequence it was built from, including raising `IndexError` for
+    volumes above the last piece, but finds the piece by bisection instead of
+    scanning the whole sequence.
+    """
+
+    __slots__ = ("_max_volumes", "_slopes", "_intercepts")
+
+    def __init__(self, sequence: Sequence[Sequence[float]]) -> None:
+        self._max_volumes: List[float] = []
+        self._slopes: List[float] = []
+        self._intercepts: List[float] = []
+        # A piece can only be picked if its max volume is above the max volume of
+        # every piece before it; any other piece is shadowed by an earlier one.
+        # Keeping just those makes the max volumes strictly increasing, even if
+        # the sequence isn't sorted.
+        for max_volume, slope, intercept in sequence:
+            if math.isnan(max_volume):
+                # Nothing is less than or equal to NaN, so this piece never matches.
+                continue
+            if not self._max_volumes or max_volume > self._max_volumes[-1]:
+                self._max_volumes.append(max_volume)
+                self._slopes.append(slope)
+                self._intercepts.append(intercept)
+
+    def __call__(self, ul: float) -> float:
+        """Get the ul/mm value for the specified volume."""
+        index = bisect_left(self._max_volumes, ul)
+        # The extra comparison catches volumes that aren't comparable, like NaN,
+        # which bisection would otherwise put in the first piece.
+        if index == len(self._max_volumes) or not ul <= self._max_volumes[index]:
+            raise IndexError()
+        return self._slopes[index] * ul + self._intercepts[index]
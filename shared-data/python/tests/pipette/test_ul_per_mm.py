@@ -0,0 +1,105 @@
+import json
+import math
+import random
+from typing import Iterator, List, Sequence, Tuple
+
+import pytest
+
+from opentrons_shared_data import get_shared_data_root
+from opentrons_shared_data.pipette.ul_per_mm import (
+    PiecewiseVolumeConversion,
+    piecewise_volume_conversion,
+)
+
+_Sequence = List[Tuple[float, float, float]]
+
+
+def _all_shipped_sequences() -> Iterator[Tuple[str, _Sequence]]:
+    liquid_root = get_shared_data_root() / "pipette" / "definitions" / "2" / "liquid"
+    definition_paths = sorted(liquid_root.glob("*/*/*/*.json"))
+    assert definition_paths, "You have a path wrong"
+    for path in definition_paths:
+        definition = json.loads(path.read_text())
+        for tip_type, tip in definition["supportedTips"].items():
+            for action in ["aspirate", "dispense"]:
+                for version, sequence in tip[action]["default"].items():
+                    name = path.relative_to(liquid_root).with_suffix("")
+                    yield f"{name}-{tip_type}-{action}-{version}", [
+                        (float(x[0]), float(x[1]), float(x[2])) for x in sequence
+                    ]
+
+
+def _volumes_to_check(sequence: _Sequence) -> Iterator[float]:
+    """Every breakpoint, its neighbors, the midpoints between them, and others."""
+    seed = random.Random(sum(piece[0] for piece in sequence))
+    yield from [0.0, -0.0, -1.0, math.inf, -math.inf, math.nan]
+    previous = 0.0
+    for max_volume, _, _ in sequence:
+        yield from [
+            max_volume,
+            math.nextafter(max_volume, math.inf),
+            math.nextafter(max_volume, -math.inf),
+            (previous + max_volume) / 2,
+        ]
+        previous = max_volume
+    for _ in range(200):
+        yield seed.uniform(-1, previous * 1.1)
+
+
+def _reference(ul: float, sequence: Sequence[Tuple[float, float, float]]) -> object:
+    try:
+        return piecewise_volume_conversion(ul, list(sequence))
+    except IndexError:
+        return IndexError
+
+
+def _compiled(ul: float, subject: PiecewiseVolumeConversion) -> object:
+    try:
+        return subject(ul)
+    except IndexError:
+        return IndexError
+
+
+def _same(a: object, b: object) -> bool:
+    if isinstance(a, float) and isinstance(b, float) and math.isnan(a):
+        return math.isnan(b)
+    # Compare floats bit-for-bit, so that -0.0 and 0.0 are told apart.
+    return repr(a) == repr(b)
+
+
+@pytest.mark.parametrize(
+    "sequence",
+    [sequence for _, sequence in _all_shipped_sequences()],
+    ids=[name for name, _ in _all_shipped_sequences()],
+)
+def test_compiled_matches_scan_for_shipped_definitions(sequence: _Sequence) -> None:
+    """Compiling a shipped function should not change any of its results."""
+    subject = PiecewiseVolumeConversion(sequence)
+    for ul in _volumes_to_check(sequence):
+        assert _same(_compiled(ul, subject), _reference(ul, sequence)), ul
+
+
+@pytest.mark.parametrize(
+    "sequence",
+    [
+        [],
+        [(10.0, 1.0, 0.0), (5.0, 2.0, 0.0), (20.0, 3.0, 0.0)],
+        [(10.0, 1.0, 0.0), (10.0, 2.0, 0.0), (20.0, 3.0, 0.0)],
+        [(math.nan, 1.0, 0.0), (10.0, 2.0, 0.0), (math.nan, 3.0, 1.0)],
+        [(math.inf, 1.0, 0.0)],
+        [(-math.inf, 1.0, 0.0), (1.0, 2.0, 0.0)],
+    ],
+)
+def test_compiled_matches_scan_for_odd_sequences(sequence: _Sequence) -> None:
+    """Unsorted, repeated, and non-finite breakpoints should match the scan too."""
+    subject = PiecewiseVolumeConversion(sequence)
+    for ul in [-math.inf, -1.0, 0.0, 1.0, 4.0, 5.0, 7.0, 10.0, 15.0, 20.0, 21.0]:
+        assert _same(_compiled(ul, subject), _reference(ul, sequence)), ul
+    assert _compiled(math.nan, subject) is IndexError
+
+
+def test_out_of_range_raises_index_error() -> None:
+    """Volumes past the last piece should raise, like the scan does."""
+    subject = PiecewiseVolumeConversion([(10.0, 1.0, 0.0)])
+    with pytest.raises(IndexError):
+        subject(10.5)
@@ -5,10 +5,9 @@ import time
 from typing import NoReturn
 
 from . import cli, usb_config, usb_monitor, tcp_conn, listener
+from .bridge import SerialBridge
 from .default_config import get_gadget_config, PHY_NAME
 
-from .serial_thread import create_worker_thread
-
 LOG = logging.getLogger(__name__)
 
 
@@ -57,16 +56,16 @@ async def main() -> NoReturn:
 
     monitor.begin()
 
-    thread, queue = create_worker_thread()
-
-    thread.start()
+    bridge = SerialBridge(
+        buffer_limit=args.buffer_limit, serial_write_limit=args.serial_write_limit
+    )
 
     if monitor.host_connected():
         LOG.debug("USB connected on startup")
-        ser = listener.update_ser_handle(config, ser, True, tcp)
+        ser = listener.update_ser_handle(config, ser, True, tcp, bridge)
 
     while True:
-        ser = listener.listen(monitor, config, ser, tcp, queue)
+        ser = listener.listen(monitor, config, ser, tcp, bridge)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,204 @@
+"""Relay data between the serial port and the TCP connection without blocking.
+
+Data read from one side is buffered until the other side can take it. Each side
+is only written to when select() says it's writable, and only read from while
+there is room in the buffer for the other direction. Full buffers therefore push
+back on the sender: the host's serial driver for the serial side, and TCP flow
+control for the TCP side.
+"""
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Deque, List, Optional, Tuple
+
+import serial  # type: ignore[import-untyped]
+
+from .tcp_conn import TCPConnection
+
+LOG = logging.getLogger(__name__)
+
+# The most data to hold for each direction before we stop reading from its source.
+DEFAULT_BUFFER_LIMIT = 64 * 1024
+
+# The most data to hand to the serial port in one write. Many desktop OS serial
+# drivers do not have very large data buffers.
+DEFAULT_SERIAL_WRITE_LIMIT = 2048
+
+
+@dataclass
+class DirectionStats:
+    """Counters for the data flowing in one direction through the bridge."""
+
+    bytes_read: int = 0
+    bytes_written: int = 0
+    writes: int = 0
+    max_buffered: int = 0
+    # The time from reading each chunk of data to writing the last of it.
+    chunks_delivered: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        """The average time from reading a chunk to writing the last of it."""
+        if self.chunks_delivered == 0:
+            return 0.0
+        return self.total_latency / self.chunks_delivered
+
+
+@dataclass
+class BridgeStats:
+    """Counters for both directions through the bridge."""
+
+    serial_to_tcp: DirectionStats
+    tcp_to_serial: DirectionStats
+
+
+class _Pipe:
+    """A bounded buffer of data going in one direction."""
+
+    def __init__(self, limit: int, clock: Callable[[], float]) -> None:
+        self._limit = limit
+        self._clock = clock
+        self._buffer = bytearray()
+        # The offset just past each buffered chunk, and when it was read.
+        self._chunks: Deque[Tuple[int, float]] = deque()
+        self._consumed = 0
+        self.stats = DirectionStats()
+
+    def space(self) -> int:
+        return max(self._limit - len(self._buffer), 0)
+
+    def pending(self) -> bool:
+        return len(self._buffer) > 0
+
+    def peek(self, limit: Optional[int] = None) -> bytes:
+        return bytes(self._buffer[:limit])
+
+    def push(self, data: bytes) -> None:
+        if not data:
+            return
+        self._buffer += data
+        self._chunks.append((self._consumed + len(self._buffer), self._clock()))
+        self.stats.bytes_read += len(data)
+        self.stats.max_buffered = max(self.stats.max_buffered, len(self._buffer))
+
+    def consume(self, count: int) -> None:
+        if count <= 0:
+            return
+        del self._buffer[:count]
+        self._consumed += count
+        self.stats.bytes_written += count
+        self.stats.writes += 1
+        now = self._clock()
+        while self._chunks and self._chunks[0][0] <= self._consumed:
+            _, read_at = self._chunks.popleft()
+            latency = now - read_at
+            self.stats.chunks_delivered += 1
+            self.stats.total_latency += latency
+            self.stats.max_latency = max(self.stats.max_latency, latency)
+
+    def clear(self) -> None:
+        self._consumed += len(self._buffer)
+        self._buffer.clear()
+        self._chunks.clear()
+
+
+class SerialBridge:
+    """Buffers data between the serial port and the TCP connection."""
+
+    def __init__(
+        self,
+        buffer_limit: int = DEFAULT_BUFFER_LIMIT,
+        serial_write_limit: int = DEFAULT_SERIAL_WRITE_LIMIT,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create a SerialBridge with empty buffers.
+
+        Args:
+            buffer_limit: The most data to hold for each direction
+
+            serial_write_limit: The most data to write to the serial port at once
+
+            clock: Monotonic time source for the latency counters
+        """
+        self._serial_write_limit = serial_write_limit
+        self._serial_to_tcp = _Pipe(buffer_limit, clock)
+        self._tcp_to_serial = _Pipe(buffer_limit, clock)
+
+    def readers(self, ser: serial.Serial, tcp: TCPConnection) -> List[Any]:
+        """Get the handles to select() for reading.
+
+        A handle is only read from while there's room to buffer what it sends.
+        """
+        rlist: List[Any] = []
+        if self._serial_to_tcp.space() > 0:
+            rlist.append(ser)
+        if tcp.connected() and self._tcp_to_serial.space() > 0:
+            rlist.append(tcp)
+        return rlist
+
+    def writers(self, ser: serial.Serial, tcp: TCPConnection) -> List[Any]:
+        """Get the handles to select() for writing.
+
+        A handle is only written to while there's data buffered for it.
+        """
+        wlist: List[Any] = []
+        if self._tcp_to_serial.pending():
+            wlist.append(ser)
+        if tcp.connected() and self._serial_to_tcp.pending():
+            wlist.append(tcp)
+        return wlist
+
+    def service(
+        self,
+        ser: serial.Serial,
+        tcp: TCPConnection,
+        readable: List[Any],
+        writable: List[Any],
+    ) -> None:
+        """Move data through the bridge, as far as select() said is possible.
+
+        Args:
+            ser: Handle for the serial port
+
+            tcp: Handle for the socket connection to the internal server
+
+            readable: The handles select() found ready for reading
+
+            writable: The handles select() found ready for writing
+
+        Raises:
+            OSError: The serial port was disconnected.
+        """
+        if ser in readable:
+            size = min(ser.in_waiting, self._serial_to_tcp.space())
+            data = ser.read(size)
+            LOG.debug(f"Received: {data!r}")
+            self._serial_to_tcp.push(data)
+        if ser in writable and self._tcp_to_serial.pending():
+            sent = ser.write(self._tcp_to_serial.peek(self._serial_write_limit))
+            self._tcp_to_serial.consume(sent or 0)
+
+        if not tcp.connected():
+            # There's nowhere to send data from the serial port until the
+            # connection comes back, so drop it.
+            self._serial_to_tcp.clear()
+            return
+        if tcp in readable:
+            self._tcp_to_serial.push(tcp.read(self._tcp_to_serial.space()))
+        if tcp in writable and self._serial_to_tcp.pending():
+            self._serial_to_tcp.consume(tcp.send_some(self._serial_to_tcp.peek()))
+
+    def reset(self) -> None:
+        """Drop any buffered data, like when the USB host disconnects."""
+        self._serial_to_tcp.clear()
+        self._tcp_to_serial.clear()
+
+    def stats(self) -> BridgeStats:
+        """Get the throughput and latency counters for both directions."""
+        return BridgeStats(
+            serial_to_tcp=replace(self._serial_to_tcp.stats),
+            tcp_to_serial=replace(self._tcp_to_serial.stats),
+        )
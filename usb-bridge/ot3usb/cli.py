@@ -2,6 +2,8 @@
 
 import argparse
 
+from .bridge import DEFAULT_BUFFER_LIMIT, DEFAULT_SERIAL_WRITE_LIMIT
+
 
 def build_root_parser() -> argparse.ArgumentParser:
     """Construct a root parser."""
@@ -13,4 +15,18 @@ def build_root_parser() -> argparse.ArgumentParser:
         help="Log level",
         default="info",
     )
+    parser.add_argument(
+        "--buffer-limit",
+        dest="buffer_limit",
+        type=int,
+        help="Most bytes to buffer in each direction before pausing reads",
+        default=DEFAULT_BUFFER_LIMIT,
+    )
+    parser.add_argument(
+        "--serial-write-limit",
+        dest="serial_write_limit",
+        type=int,
+        help="Most bytes to write to the serial port at once",
+        default=DEFAULT_SERIAL_WRITE_LIMIT,
+    )
     return parser
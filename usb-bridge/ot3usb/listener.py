@@ -7,8 +7,8 @@ import serial  # type: ignore[import-untyped]
 
 from . import usb_config, usb_monitor, tcp_conn
 
+from .bridge import SerialBridge
 from .default_config import DEFAULT_IP, DEFAULT_PORT
-from .serial_thread import QUEUE_TYPE, QUEUE_MAX_ITEMS
 
 LOG = logging.getLogger(__name__)
 
@@ -21,6 +21,7 @@ def update_ser_handle(
     ser: Optional[serial.Serial],
     connected: bool,
     tcp: tcp_conn.TCPConnection,
+    bridge: Optional[SerialBridge] = None,
 ) -> Optional[serial.Serial]:
     """Updates the serial handle for connections and disconnections.
 
@@ -34,11 +35,17 @@ def update_ser_handle(
 
         tcp: The TCP Connection handle, which will be connected/disconnected
         based on the serial port presence.
+
+        bridge: The buffers between the serial port and the TCP connection,
+        which are emptied when the serial port goes away.
     """
     if ser and not connected:
         LOG.debug("USB host disconnected")
         ser = None
         tcp.disconnect()
+        if bridge:
+            LOG.debug(f"Bridge stats: {bridge.stats()}")
+            bridge.reset()
     elif connected and not ser:
         LOG.debug("New USB host connected")
         ser = config.get_handle()
@@ -65,7 +72,7 @@ def listen(
     config: usb_config.SerialGadget,
     ser: Optional[serial.Serial],
     tcp: tcp_conn.TCPConnection,
-    worker_queue: QUEUE_TYPE,
+    bridge: SerialBridge,
 ) -> Optional[serial.Serial]:
     """Process any available incoming data.
 
@@ -75,6 +82,9 @@ def listen(
         - The UDEV message stream (usb_monitor)
         - The TCP connection to the NGINX server, if a connection is open
 
+    and write out whatever data the bridge is holding for the serial port and
+    the TCP connection, if they can take it without blocking.
+
     Args:
         monitor: The USB connection monitor
 
@@ -84,34 +94,26 @@ def listen(
 
         tcp: Handle for the socket connection to the internal server
 
-        worker_queue: Handle for queue to the serial worker thread
+        bridge: The buffers between the serial port and the TCP connection
     """
     rlist: List[Any] = [monitor]
+    wlist: List[Any] = []
     if ser is not None:
-        rlist.append(ser)
-        rlist.append(tcp)
+        rlist.extend(bridge.readers(ser, tcp))
+        wlist.extend(bridge.writers(ser, tcp))
 
-    ready = select.select(rlist, [], [], POLL_TIMEOUT)[0]
-    if len(ready) == 0 or monitor in ready:
+    readable, writable, _ = select.select(rlist, wlist, [], POLL_TIMEOUT)
+    if len(readable) + len(writable) == 0 or monitor in readable:
         # Read a new udev messages
-        check_monitor(monitor, monitor in ready)
-        ser = update_ser_handle(config, ser, monitor.host_connected(), tcp)
+        check_monitor(monitor, monitor in readable)
+        ser = update_ser_handle(config, ser, monitor.host_connected(), tcp, bridge)
         # ALWAYS exit early if we had a change in udev messages
         return ser
-    if ser and ser in ready:
-        # Ready serial data
+    if ser:
         try:
-            data = ser.read_all()
-            LOG.debug(f"Received: {data}")
-            tcp.send(data)
+            bridge.service(ser, tcp, readable, writable)
         except OSError:
             LOG.debug("Got an OSError when disconnecting")
             monitor.update_state()
-            ser = update_ser_handle(config, ser, monitor.host_connected(), tcp)
-    if ser and tcp in ready:
-        # Ready TCP data to echo to serial
-        data = tcp.read()
-        worker_queue.put((ser, data))
-        if worker_queue.qsize() >= QUEUE_MAX_ITEMS:
-            LOG.warning("Worker queue appears full")
+            ser = update_ser_handle(config, ser, monitor.host_connected(), tcp, bridge)
     return ser
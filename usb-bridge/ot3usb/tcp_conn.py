@@ -31,6 +31,8 @@ class TCPConnection:
             self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self._host = (ip, port)
             self._sock.connect(self._host)
+            # Reads and writes are driven by select(), so they must never block.
+            self._sock.setblocking(False)
         except Exception as err:
             LOG.error(f"Could not open TCP: {str(err)}")
             self._sock = None
@@ -70,11 +72,18 @@ class TCPConnection:
             return -1
         return self._sock.fileno()
 
-    def read(self) -> bytes:
-        """Read available data over the socket."""
-        if not self._sock:
+    def read(self, max_bytes: int = MAX_BUF) -> bytes:
+        """Read available data over the socket.
+
+        Args:
+            max_bytes: The most data to read
+        """
+        if not self._sock or max_bytes <= 0:
+            return bytes()
+        try:
+            ret = self._sock.recv(max_bytes)
+        except BlockingIOError:
             return bytes()
-        ret = self._sock.recv(MAX_BUF)
         if len(ret) == 0:
             # The socket connection died! Just reconnect to the server.
             self._reconnect()
@@ -92,3 +101,21 @@ class TCPConnection:
         sent = self._sock.send(data)
         LOG.debug(f"Sent [{sent}] bytes")
         return sent == len(data)
+
+    def send_some(self, data: bytes) -> int:
+        """Send as much of some data as the socket can take without blocking.
+
+        Returns the number of bytes sent. If there is no connection, the data is
+        dropped, and counted as sent.
+
+        Args:
+            data: raw data array to send over the socket.
+        """
+        if not self._sock:
+            return len(data)
+        try:
+            sent = self._sock.send(data)
+        except BlockingIOError:
+            return 0
+        LOG.debug(f"Sent [{sent}] bytes")
+        return sent
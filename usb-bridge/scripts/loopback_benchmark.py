@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+"""Measure throughput and latency through the USB bridge's data path.
+
+This stands a pseudo-terminal in for the USB serial gadget and a local TCP echo
+server in for the robot's HTTP server, then drives the bridge between them with
+the same select() loop the bridge uses on a robot. Data written by the "host"
+end of the pseudo-terminal goes through the bridge to the echo server and comes
+back the same way.
+
+Note: ot3usb must be importable when you run this.
+"""
+
+import argparse
+import os
+import select
+import socket
+import statistics
+import threading
+import time
+import tty
+from typing import Any, List
+
+import serial  # type: ignore[import-untyped]
+
+from ot3usb.bridge import (
+    DEFAULT_BUFFER_LIMIT,
+    DEFAULT_SERIAL_WRITE_LIMIT,
+    SerialBridge,
+)
+from ot3usb.tcp_conn import TCPConnection
+
+
+def _start_echo_server() -> int:
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+
+    def serve() -> None:
+        conn, _ = server.accept()
+        with conn:
+            while True:
+                data = conn.recv(65536)
+                if not data:
+                    return
+                conn.sendall(data)
+
+    threading.Thread(target=serve, name="echo server", daemon=True).start()
+    port: int = server.getsockname()[1]
+    return port
+
+
+def _run_bridge(
+    ser: serial.Serial, tcp: TCPConnection, bridge: SerialBridge, stop: threading.Event
+) -> None:
+    while not stop.is_set():
+        rlist: List[Any] = bridge.readers(ser, tcp)
+        wlist: List[Any] = bridge.writers(ser, tcp)
+        readable, writable, _ = select.select(rlist, wlist, [], 0.1)
+        bridge.service(ser, tcp, readable, writable)
+
+
+def _read_exactly(host: int, count: int) -> None:
+    while count > 0:
+        count -= len(os.read(host, count))
+
+
+def _benchmark(
+    total_bytes: int,
+    chunk_size: int,
+    round_trips: int,
+    buffer_limit: int,
+    serial_write_limit: int,
+) -> None:
+    host, gadget = os.openpty()
+    tty.setraw(host)
+    ser = serial.Serial(os.ttyname(gadget))
+    ser.write_timeout = 0
+    ser.nonblocking()
+
+    tcp = TCPConnection()
+    tcp.connect("127.0.0.1", _start_echo_server())
+    bridge = SerialBridge(
+        buffer_limit=buffer_limit, serial_write_limit=serial_write_limit
+    )
+    stop = threading.Event()
+    bridge_thread = threading.Thread(
+        target=_run_bridge, args=(ser, tcp, bridge, stop), name="bridge"
+    )
+    bridge_thread.start()
+
+    try:
+        latencies = []
+        message = b"x" * 64
+        for _ in range(round_trips):
+            start = time.perf_counter()
+            os.write(host, message)
+            _read_exactly(host, len(message))
+            latencies.append((time.perf_counter() - start) * 1_000_000)
+
+        chunk = b"y" * chunk_size
+        chunks = total_bytes // chunk_size
+
+        def write_all() -> None:
+            for _ in range(chunks):
+                view = memoryview(chunk)
+                while view:
+                    view = view[os.write(host, view) :]
+
+        start = time.perf_counter()
+        writer = threading.Thread(target=write_all, name="host writer")
+        writer.start()
+        _read_exactly(host, chunks * chunk_size)
+        elapsed = time.perf_counter() - start
+        writer.join()
+    finally:
+        stop.set()
+        bridge_thread.join()
+        tcp.disconnect()
+        ser.close()
+        os.close(host)
+
+    print(f"{'64 B round trip median (us)':<32} {statistics.median(latencies):>10.1f}")
+    print(f"{'64 B round trip max (us)':<32} {max(latencies):>10.1f}")
+    print(
+        f"{'echo throughput (KiB/s)':<32}"
+        f" {chunks * chunk_size / elapsed / 1024:>10.1f}"
+    )
+    stats = bridge.stats()
+    for label, direction in [
+        ("serial -> tcp", stats.serial_to_tcp),
+        ("tcp -> serial", stats.tcp_to_serial),
+    ]:
+        print(
+            f"{label}: {direction.writes} writes,"
+            f" at most {direction.max_buffered} bytes buffered,"
+            f" mean latency {direction.mean_latency * 1_000_000:.1f} us"
+        )
+
+
+def _run_cmdline() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--total-bytes",
+        type=int,
+        default=4 * 1024 * 1024,
+        help="How much data to stream through the bridge for the throughput test.",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=4096,
+        help="How much data the host writes at once for the throughput test.",
+    )
+    parser.add_argument(
+        "--round-trips",
+        type=int,
+        default=1000,
+        help="How many small messages to time for the latency test.",
+    )
+    parser.add_argument(
+        "--buffer-limit",
+        type=int,
+        default=DEFAULT_BUFFER_LIMIT,
+        help="Most bytes the bridge buffers in each direction.",
+    )
+    parser.add_argument(
+        "--serial-write-limit",
+        type=int,
+        default=DEFAULT_SERIAL_WRITE_LIMIT,
+        help="Most bytes the bridge writes to the serial port at once.",
+    )
+    args = parser.parse_args()
+    _benchmark(
+        args.total_bytes,
+        args.chunk_size,
+        args.round_trips,
+        args.buffer_limit,
+        args.serial_write_limit,
+    )
+
+
+if __name__ == "__main__":
+    _run_cmdline()
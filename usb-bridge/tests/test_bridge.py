@@ -0,0 +1,145 @@
+"""Tests for the buffering between the serial port and the TCP connection."""
+
+import pytest
+import mock
+
+import serial  # type: ignore[import-untyped]
+
+from ot3usb import tcp_conn
+from ot3usb.bridge import SerialBridge
+
+BUFFER_LIMIT = 8
+SERIAL_WRITE_LIMIT = 3
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def subject(clock: FakeClock) -> SerialBridge:
+    return SerialBridge(
+        buffer_limit=BUFFER_LIMIT, serial_write_limit=SERIAL_WRITE_LIMIT, clock=clock
+    )
+
+
+@pytest.fixture
+def ser() -> mock.MagicMock:
+    return mock.MagicMock(serial.Serial)
+
+
+@pytest.fixture
+def tcp() -> mock.MagicMock:
+    tcp = mock.MagicMock(tcp_conn.TCPConnection)
+    tcp.connected.return_value = True
+    return tcp
+
+
+def test_idle(subject: SerialBridge, ser: mock.MagicMock, tcp: mock.MagicMock) -> None:
+    assert subject.readers(ser, tcp) == [ser, tcp]
+    assert subject.writers(ser, tcp) == []
+
+    tcp.connected.return_value = False
+    assert subject.readers(ser, tcp) == [ser]
+
+
+def test_serial_to_tcp(
+    subject: SerialBridge,
+    ser: mock.MagicMock,
+    tcp: mock.MagicMock,
+    clock: FakeClock,
+) -> None:
+    ser.in_waiting = 5
+    ser.read.return_value = b"abcde"
+    subject.service(ser, tcp, [ser], [])
+    ser.read.assert_called_once_with(5)
+    assert subject.writers(ser, tcp) == [tcp]
+
+    # The socket only takes part of the data
+    clock.now = 1.0
+    tcp.send_some.return_value = 2
+    subject.service(ser, tcp, [], [tcp])
+    tcp.send_some.assert_called_once_with(b"abcde")
+    assert subject.writers(ser, tcp) == [tcp]
+
+    clock.now = 3.0
+    tcp.send_some.reset_mock()
+    tcp.send_some.return_value = 3
+    subject.service(ser, tcp, [], [tcp])
+    tcp.send_some.assert_called_once_with(b"cde")
+    assert subject.writers(ser, tcp) == []
+
+    stats = subject.stats().serial_to_tcp
+    assert stats.bytes_read == 5
+    assert stats.bytes_written == 5
+    assert stats.writes == 2
+    assert stats.chunks_delivered == 1
+    assert stats.max_latency == 3.0
+
+
+def test_tcp_to_serial_write_limit(
+    subject: SerialBridge, ser: mock.MagicMock, tcp: mock.MagicMock
+) -> None:
+    tcp.read.return_value = b"abcde"
+    subject.service(ser, tcp, [tcp], [])
+    tcp.read.assert_called_once_with(BUFFER_LIMIT)
+    assert subject.writers(ser, tcp) == [ser]
+
+    ser.write.side_effect = lambda data: len(data)
+    subject.service(ser, tcp, [], [ser])
+    ser.write.assert_called_once_with(b"abc")
+    subject.service(ser, tcp, [], [ser])
+    ser.write.assert_called_with(b"de")
+    assert subject.writers(ser, tcp) == []
+
+
+def test_full_buffer_stops_reads(
+    subject: SerialBridge, ser: mock.MagicMock, tcp: mock.MagicMock
+) -> None:
+    tcp.read.return_value = b"x" * BUFFER_LIMIT
+    subject.service(ser, tcp, [tcp], [])
+    # The serial port can't keep up, so stop reading from the socket
+    assert subject.readers(ser, tcp) == [ser]
+
+    ser.in_waiting = 100
+    ser.read.return_value = b"y" * BUFFER_LIMIT
+    subject.service(ser, tcp, [ser], [])
+    ser.read.assert_called_once_with(BUFFER_LIMIT)
+    assert subject.readers(ser, tcp) == []
+    assert subject.writers(ser, tcp) == [ser, tcp]
+
+    ser.write.return_value = 1
+    subject.service(ser, tcp, [], [ser])
+    assert subject.readers(ser, tcp) == [tcp]
+
+
+def test_tcp_disconnected_drops_serial_data(
+    subject: SerialBridge, ser: mock.MagicMock, tcp: mock.MagicMock
+) -> None:
+    tcp.connected.return_value = False
+    ser.in_waiting = 4
+    ser.read.return_value = b"abcd"
+    subject.service(ser, tcp, [ser], [])
+    tcp.send_some.assert_not_called()
+    assert subject.writers(ser, tcp) == []
+
+
+def test_reset(subject: SerialBridge, ser: mock.MagicMock, tcp: mock.MagicMock) -> None:
+    tcp.read.return_value = b"abcd"
+    ser.in_waiting = 4
+    ser.read.return_value = b"efgh"
+    subject.service(ser, tcp, [ser, tcp], [])
+    assert subject.writers(ser, tcp) == [ser, tcp]
+
+    subject.reset()
+    assert subject.writers(ser, tcp) == []
+    assert subject.readers(ser, tcp) == [ser, tcp]
@@ -5,10 +5,9 @@ import mock
 
 import select
 import serial  # type: ignore[import-untyped]
-from queue import Queue
 
 from ot3usb import usb_config, tcp_conn, usb_monitor, listener
-from ot3usb.serial_thread import QUEUE_TYPE
+from ot3usb.bridge import SerialBridge
 
 FAKE_HANDLE = "Handle Placeholder"
 
@@ -30,8 +29,8 @@ def serial_mock() -> mock.MagicMock:
 
 
 @pytest.fixture
-def worker_queue() -> QUEUE_TYPE:
-    return Queue(0)
+def bridge() -> SerialBridge:
+    return SerialBridge()
 
 
 def test_update_ser_handle() -> None:
@@ -82,15 +81,17 @@ SER_DATA = b"abcd"
 TCP_DATA = b"efgh"
 
 
-def test_listen(monkeypatch: pytest.MonkeyPatch, worker_queue: QUEUE_TYPE) -> None:
+def test_listen(monkeypatch: pytest.MonkeyPatch, bridge: SerialBridge) -> None:
     monitor = monitor_mock()
     config = config_mock()
     tcp = tcp_mock()
     ser = serial_mock()
 
-    ser.read_all.return_value = SER_DATA
+    ser.in_waiting = len(SER_DATA)
+    ser.read.return_value = SER_DATA
     ser.write.return_value = len(TCP_DATA)
     tcp.read.return_value = TCP_DATA
+    tcp.send_some.return_value = len(SER_DATA)
 
     tcp.connected.return_value = False
 
@@ -98,11 +99,11 @@ def test_listen(monkeypatch: pytest.MonkeyPatch, worker_queue: QUEUE_TYPE) -> No
     monkeypatch.setattr("select.select", select_mock)
 
     # FIRST TESTS - NO SERIAL OPEN
-    select_mock.return_value = ([], None, None)
+    select_mock.return_value = ([], [], [])
 
     # No message ready, monitor disconnected
     monitor.host_connected.return_value = False
-    assert listener.listen(monitor, config, None, tcp, worker_queue) is None
+    assert listener.listen(monitor, config, None, tcp, bridge) is None
     monitor.update_state.assert_called_once()
     select_mock.assert_called_with([monitor], [], [], TIMEOUT)
     select_mock.reset_mock()
@@ -110,8 +111,8 @@ def test_listen(monkeypatch: pytest.MonkeyPatch, worker_queue: QUEUE_TYPE) -> No
 
     # Monitor has a message and is connected
     monitor.host_connected.return_value = True
-    select_mock.return_value = ([monitor], None, None)
-    assert listener.listen(monitor, config, None, tcp, worker_queue) is not None
+    select_mock.return_value = ([monitor], [], [])
+    assert listener.listen(monitor, config, None, tcp, bridge) is not None
     # Monitor should be manually updated
     monitor.update_state.assert_not_called()
     select_mock.assert_called_with([monitor], [], [], TIMEOUT)
@@ -121,28 +122,48 @@ def test_listen(monkeypatch: pytest.MonkeyPatch, worker_queue: QUEUE_TYPE) -> No
     # NEXT TESTS - SERIAL IS OPEN
 
     # Nothing ready to read
-    select_mock.return_value = ([], None, None)
+    select_mock.return_value = ([], [], [])
     tcp.connected.return_value = True
     monitor.host_connected.return_value = True
-    assert listener.listen(monitor, config, ser, tcp, worker_queue) == ser
+    assert listener.listen(monitor, config, ser, tcp, bridge) == ser
     select_mock.assert_called_with([monitor, ser, tcp], [], [], TIMEOUT)
     select_mock.reset_mock()
     monitor.reset_mock()
 
     # Serial and TCP ready to read
-    select_mock.return_value = ([ser, tcp], None, None)
-    tcp.connected.return_value = True
-    monitor.host_connected.return_value = True
-    assert listener.listen(monitor, config, ser, tcp, worker_queue) == ser
+    select_mock.return_value = ([ser, tcp], [], [])
+    assert listener.listen(monitor, config, ser, tcp, bridge) == ser
     select_mock.assert_called_with([monitor, ser, tcp], [], [], TIMEOUT)
-    ser.read_all.assert_called_once()
-    tcp.send.assert_called_with(SER_DATA)
+    ser.read.assert_called_once_with(len(SER_DATA))
     tcp.read.assert_called_once()
-    assert not worker_queue.empty()
-    assert worker_queue.get() == (ser, TCP_DATA)
+    # Nothing gets written until select() says it can be
+    ser.write.assert_not_called()
+    tcp.send_some.assert_not_called()
+    select_mock.reset_mock()
+    monitor.reset_mock()
+
+    # Serial and TCP ready to write what was read from the other
+    select_mock.return_value = ([], [ser, tcp], [])
+    assert listener.listen(monitor, config, ser, tcp, bridge) == ser
+    select_mock.assert_called_with([monitor, ser, tcp], [ser, tcp], [], TIMEOUT)
+    ser.write.assert_called_once_with(TCP_DATA)
+    tcp.send_some.assert_called_once_with(SER_DATA)
+    select_mock.reset_mock()
+    monitor.reset_mock()
 
+    # Everything was delivered, so there's nothing left to write
+    select_mock.return_value = ([], [], [])
+    assert listener.listen(monitor, config, ser, tcp, bridge) == ser
+    select_mock.assert_called_with([monitor, ser, tcp], [], [], TIMEOUT)
     ser.reset_mock()
+    tcp.reset_mock()
     select_mock.reset_mock()
     monitor.reset_mock()
 
-    # Check for handling when the serial line disconnecs
+    # Check for handling when the serial line disconnects
+    select_mock.return_value = ([ser], [], [])
+    ser.read.side_effect = OSError()
+    monitor.host_connected.return_value = False
+    assert listener.listen(monitor, config, ser, tcp, bridge) is None
+    monitor.update_state.assert_called_once()
+    tcp.disconnect.assert_called_once()
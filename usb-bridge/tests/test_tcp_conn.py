@@ -102,6 +102,18 @@ def test_read(
     assert data == b""
     reconnect_mock.assert_called_once()
 
+    # Nothing to read yet is not a disconnection
+    socket_driver.reset_mock()
+    reconnect_mock.reset_mock()
+    socket_driver.recv.side_effect = BlockingIOError()
+    assert subject.read() == b""
+    reconnect_mock.assert_not_called()
+
+    # Asking for nothing doesn't touch the socket
+    socket_driver.reset_mock()
+    assert subject.read(0) == b""
+    socket_driver.recv.assert_not_called()
+
 
 def test_send(subject_connected: TCPConnection, socket_driver: mock.Mock) -> None:
     subject = subject_connected
@@ -119,3 +131,21 @@ def test_send_fail(
     assert not subject_disconnected.send(SEND_DATA)
 
     socket_driver.send.assert_not_called()
+
+
+def test_send_some(subject_connected: TCPConnection, socket_driver: mock.Mock) -> None:
+    subject = subject_connected
+    socket_driver.send.return_value = len(SEND_DATA) - 1
+    assert subject.send_some(SEND_DATA) == len(SEND_DATA) - 1
+
+    # A full socket buffer means nothing was sent
+    socket_driver.send.side_effect = BlockingIOError()
+    assert subject.send_some(SEND_DATA) == 0
+
+
+def test_send_some_disconnected(
+    subject_disconnected: TCPConnection, socket_driver: mock.Mock
+) -> None:
+    # With nowhere to send the data, it's dropped
+    assert subject_disconnected.send_some(SEND_DATA) == len(SEND_DATA)
+    socket_driver.send.assert_not_called()